@@ -0,0 +1,86 @@
+"""
+Micro-benchmark for per-call overhead of ``connection_scope``.
+
+Runs the same indexed point lookup (the shape of ``users_repo.get_user_id``)
+through ``connection_scope`` with pooling disabled and enabled, and prints the
+mean cost per repository call. A scratch database is created in a temporary
+directory, so the configured runtime database is never touched.
+
+Usage:
+    python scripts/bench_connection_pool.py --calls 5000 --pool-size 8
+
+Notes:
+- Numbers are wall-clock and machine dependent; compare the two rows rather
+  than reading absolute values.
+- Pool size only affects how many *idle* connections are retained; a single
+  threaded benchmark needs just one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from mud_server.config import config, use_test_database
+from mud_server.db import connection as db_connection
+
+
+def _seed(db_path: Path) -> None:
+    """Create a minimal users table with an indexed username column."""
+    with use_test_database(db_path):
+        conn = db_connection.get_connection()
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT UNIQUE NOT NULL)")
+        conn.executemany(
+            "INSERT INTO users (username) VALUES (?)",
+            [(f"user_{index}",) for index in range(1000)],
+        )
+        conn.commit()
+        conn.close()
+
+
+def _run(db_path: Path, *, calls: int, pool_size: int) -> float:
+    """Return mean microseconds per ``connection_scope`` lookup."""
+    original_pool_size = config.database.pool_size
+    config.database.pool_size = pool_size
+    db_connection.close_connection_pool()
+    try:
+        with use_test_database(db_path):
+            started = time.perf_counter()
+            for index in range(calls):
+                with db_connection.connection_scope() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        "SELECT id FROM users WHERE username = ?", (f"user_{index % 1000}",)
+                    )
+                    cursor.fetchone()
+            elapsed = time.perf_counter() - started
+    finally:
+        db_connection.close_connection_pool()
+        config.database.pool_size = original_pool_size
+    return elapsed / calls * 1_000_000
+
+
+def main() -> None:
+    """Parse CLI arguments and print before/after per-call overhead."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5000, help="Lookups per run.")
+    parser.add_argument("--pool-size", type=int, default=8, help="Pool size for pooled run.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / "bench.db"
+        _seed(db_path)
+
+        unpooled = _run(db_path, calls=args.calls, pool_size=0)
+        pooled = _run(db_path, calls=args.calls, pool_size=args.pool_size)
+
+    print(f"{'calls per run:':<26}{args.calls:>8}")
+    print(f"{'unpooled (pool_size=0):':<26}{unpooled:8.1f} us/call")
+    print(f"{f'pooled (pool_size={args.pool_size}):':<26}{pooled:8.1f} us/call")
+    print(f"{'speedup:':<26}{unpooled / pooled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
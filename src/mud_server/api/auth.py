@@ -5,6 +5,10 @@ This module handles session-based authentication for the MUD server. It provides
 1. Database-backed session storage (source of truth)
 2. Session validation with expiration enforcement
 3. Permission checks for admin endpoints
+4. ``*_async`` validation twins for ``async def`` routes, backed by the
+   aiosqlite repository layer so validation never blocks the event loop
+5. A TTL-bounded LRU cache of validated session records, invalidated
+   synchronously by the repositories that change sessions, users or characters
 
 Session Lifecycle:
 1. Login: New session ID created and stored in the database
@@ -17,6 +21,9 @@ Security Considerations:
 - Sessions expire using a TTL and (optionally) sliding expiration
 - Database is the source of truth (supports restart persistence)
 - Session validation updates activity timestamp to track last action
+  (buffered and flushed in batches when write-behind is enabled)
+- Cached records never outlive a logout, role change or character switch in
+  this process; expiry is re-checked against the database before rejecting
 
 Future Improvements:
 - Implement session refresh tokens ("remember me")
@@ -24,13 +31,169 @@ Future Improvements:
 - Add optional IP/User-Agent tracking for session audits
 """
 
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from fastapi import HTTPException
 
 from mud_server.api.permissions import Permission, has_permission
+from mud_server.config import config
 from mud_server.db import facade as database
 from mud_server.db.errors import DatabaseError
+from mud_server.db.session_invalidation import (
+    SessionInvalidation,
+    add_session_invalidation_listener,
+)
+
+# ============================================================================
+# VALIDATED-SESSION CACHE
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class SessionCacheStats:
+    """
+    Counters for the validated-session cache.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that fell through to the database.
+        evictions: Entries dropped to respect ``session.cache_max_entries``.
+        invalidations: Entries dropped by repository change notifications.
+        size: Entries currently cached.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+
+class _ValidatedSessionCache:
+    """
+    Thread-safe TTL + LRU cache of joined session records keyed by session id.
+
+    Entries are dropped when the configured database path changes, so a
+    test or tool that swaps databases never sees another database's sessions.
+    A generation counter, bumped on every invalidation, keeps a lookup that
+    raced with a write from caching the pre-write record.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_path: str | None = None
+        self.generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, session_id: str) -> dict | None:
+        """Return a copy of the cached record, or None on miss/expiry/disabled."""
+        if config.session.cache_ttl_seconds <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            self._sync_database_path()
+            entry = self._entries.get(session_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[session_id]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self._hits += 1
+            return dict(entry[1])
+
+    def put(self, session_id: str, session: dict, *, generation: int) -> None:
+        """Cache ``session`` unless an invalidation happened since ``generation``."""
+        ttl_seconds = config.session.cache_ttl_seconds
+        if ttl_seconds <= 0:
+            return
+        deadline = time.monotonic() + ttl_seconds
+        max_entries = max(1, config.session.cache_max_entries)
+        with self._lock:
+            self._sync_database_path()
+            if generation != self.generation:
+                return
+            self._entries[session_id] = (deadline, dict(session))
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def discard(self, session_id: str) -> None:
+        """Drop one cached record, if present."""
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def invalidate(self, change: SessionInvalidation) -> None:
+        """Drop every cached record matched by a repository change notification."""
+        with self._lock:
+            self.generation += 1
+            if change.everything:
+                stale = list(self._entries)
+            else:
+                stale = [
+                    session_id
+                    for session_id, (_, session) in self._entries.items()
+                    if session_id == change.session_id
+                    or (change.user_id is not None and session.get("user_id") == change.user_id)
+                    or (change.username is not None and session.get("username") == change.username)
+                    or (
+                        change.character_id is not None
+                        and session.get("character_id") == change.character_id
+                    )
+                ]
+            for session_id in stale:
+                del self._entries[session_id]
+            self._invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def stats(self) -> SessionCacheStats:
+        """Return a snapshot of cache counters."""
+        with self._lock:
+            return SessionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+    def _sync_database_path(self) -> None:
+        """Forget all entries when the configured database changes (lock held)."""
+        db_path = config.database.path
+        if db_path != self._db_path:
+            self._entries.clear()
+            self._db_path = db_path
+            self.generation += 1
+
+
+_session_cache = _ValidatedSessionCache()
+add_session_invalidation_listener(_session_cache.invalidate)
+
+
+def get_session_cache_stats() -> SessionCacheStats:
+    """Return hit/miss/eviction counters for the validated-session cache."""
+    return _session_cache.stats()
+
+
+def clear_session_cache() -> None:
+    """Empty the validated-session cache and reset its counters."""
+    _session_cache.clear()
+
 
 # ============================================================================
 # SESSION LIFECYCLE MANAGEMENT
@@ -99,7 +262,7 @@ def get_username_from_session(session_id: str) -> str | None:
     session = _get_valid_session(session_id)
     if not session:
         return None
-    return database.get_username_by_id(int(session["user_id"]))
+    return session.get("username")
 
 
 def get_username_and_role_from_session(session_id: str) -> tuple[str, str] | None:
@@ -112,13 +275,9 @@ def get_username_and_role_from_session(session_id: str) -> tuple[str, str] | Non
     if not session:
         return None
 
-    user_id = int(session["user_id"])
-    username = database.get_username_by_id(user_id)
-    if not username:
-        return None
-
-    role = database.get_user_role(username)
-    if not role:
+    username = session.get("username")
+    role = session.get("role")
+    if not username or not role:
         return None
 
     return username, role
@@ -144,18 +303,9 @@ def validate_session(session_id: str) -> tuple[int, str, str]:
         if not session:
             raise HTTPException(status_code=401, detail="Invalid or expired session")
 
-        database.update_session_activity(session_id)
+        _touch_session(session_id)
 
-        user_id = int(session["user_id"])
-        username = database.get_username_by_id(user_id)
-        if not username:
-            raise HTTPException(status_code=401, detail="Invalid session user")
-
-        role = database.get_user_role(username)
-        if not role:
-            raise HTTPException(status_code=401, detail="Invalid session user")
-
-        return user_id, username, role
+        return _session_identity(session)
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail="Session store unavailable") from exc
 
@@ -176,39 +326,14 @@ def validate_session_for_game(session_id: str) -> tuple[int, str, str, int, str,
         if not session:
             raise HTTPException(status_code=401, detail="Invalid or expired session")
 
-        database.update_session_activity(session_id)
-
-        user_id = int(session["user_id"])
-        username = database.get_username_by_id(user_id)
-        if not username:
-            raise HTTPException(status_code=401, detail="Invalid session user")
-
-        role = database.get_user_role(username)
-        if not role:
-            raise HTTPException(status_code=401, detail="Invalid session user")
-
-        # Account and character sessions are intentionally separate.
-        # Gameplay access requires an explicit prior character selection.
-        character_id = session.get("character_id")
-        if not character_id:
-            raise HTTPException(
-                status_code=409,
-                detail="No character selected for session. Select a character first.",
-            )
-
-        character_name = database.get_character_name_by_id(int(character_id))
-        if not character_name:
-            raise HTTPException(status_code=409, detail="Selected character not found")
+        _touch_session(session_id)
 
-        character = database.get_character_by_id(int(character_id))
-        if not character or not character.get("world_id"):
-            raise HTTPException(status_code=409, detail="Character world not found")
-
-        world_id = character["world_id"]
+        user_id, username, role = _session_identity(session)
+        character_id, character_name, world_id = _session_character(session)
         if session.get("world_id") != world_id:
-            database.set_session_character(session_id, int(character_id), world_id=world_id)
+            database.set_session_character(session_id, character_id, world_id=world_id)
 
-        return user_id, username, role, int(character_id), character_name, world_id
+        return user_id, username, role, character_id, character_name, world_id
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail="Session store unavailable") from exc
 
@@ -236,6 +361,50 @@ def validate_session_with_permission(
     return user_id, username, role
 
 
+# ============================================================================
+# ASYNC SESSION VALIDATION (aiosqlite-backed, for async routes)
+# ============================================================================
+
+
+async def validate_session_async(session_id: str) -> tuple[int, str, str]:
+    """
+    Async :func:`validate_session` for ``async def`` routes.
+
+    Same return value and HTTP error mapping; all queries run on the aiosqlite
+    pool instead of the event loop thread.
+    """
+    try:
+        _, user_id, username, role = await _validate_session_record_async(session_id)
+        return user_id, username, role
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail="Session store unavailable") from exc
+
+
+async def validate_session_for_game_async(
+    session_id: str,
+) -> tuple[int, str, str, int, str, str]:
+    """
+    Async :func:`validate_session_for_game` for ``async def`` routes.
+
+    Returns:
+        (user_id, username, role, character_id, character_name, world_id)
+
+    Raises:
+        HTTPException(401): If session_id is invalid or expired
+        HTTPException(409): If no character is selected for this session
+    """
+    try:
+        session, user_id, username, role = await _validate_session_record_async(session_id)
+
+        character_id, character_name, world_id = _session_character(session)
+        if session.get("world_id") != world_id:
+            await database.set_session_character_async(session_id, character_id, world_id=world_id)
+
+        return user_id, username, role, character_id, character_name, world_id
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail="Session store unavailable") from exc
+
+
 # ============================================================================
 # INTERNAL HELPERS
 # ============================================================================
@@ -243,23 +412,97 @@ def validate_session_with_permission(
 
 def _get_valid_session(session_id: str) -> dict | None:
     """
-    Return session record if valid and not expired.
+    Return the joined session context if valid and not expired.
 
-    If the session is expired, it is removed from the database so it cannot
-    be reused.
+    The record comes from the validated-session cache or, on a miss, from
+    :func:`~mud_server.db.sessions_repo.get_session_context` (session, user,
+    role and selected character in one query). A cached record that looks
+    expired is re-read, since sliding expiration may have extended it. If the
+    session is expired, it is removed from the database so it cannot be reused.
     """
-    session = database.get_session_by_id(session_id)
+    session = _session_cache.get(session_id)
+    if session is not None and not _session_expired(session):
+        return session
+
+    generation = _session_cache.generation
+    session = database.get_session_context(session_id)
     if not session:
+        _session_cache.discard(session_id)
         return None
 
-    expires_at = session.get("expires_at")
-    if expires_at and _is_expired(expires_at):
+    if _session_expired(session):
         database.remove_session_by_id(session_id)
         return None
 
+    _session_cache.put(session_id, session, generation=generation)
     return session
 
 
+def _session_expired(session: dict) -> bool:
+    """Return True when the session record carries an elapsed expiry."""
+    expires_at = session.get("expires_at")
+    return bool(expires_at) and _is_expired(expires_at)
+
+
+def _touch_session(session_id: str) -> None:
+    """
+    Record request activity, buffered when write-behind is enabled.
+
+    With ``session.activity_flush_seconds`` > 0 the update lands in memory and
+    is written by the next batched flush; otherwise it is written immediately.
+    """
+    if not database.record_session_activity(session_id):
+        database.update_session_activity(session_id)
+
+
+async def _touch_session_async(session_id: str) -> None:
+    """Async :func:`_touch_session`; only the write-through path awaits I/O."""
+    if not database.record_session_activity(session_id):
+        await database.update_session_activity_async(session_id)
+
+
+def _session_identity(session: dict) -> tuple[int, str, str]:
+    """
+    Return ``(user_id, username, role)`` from a session context.
+
+    Raises:
+        HTTPException(401): If the session's user or role is missing.
+    """
+    username = session.get("username")
+    role = session.get("role")
+    if not username or not role:
+        raise HTTPException(status_code=401, detail="Invalid session user")
+    return int(session["user_id"]), username, role
+
+
+def _session_character(session: dict) -> tuple[int, str, str]:
+    """
+    Return ``(character_id, character_name, world_id)`` from a session context.
+
+    Account and character sessions are intentionally separate: gameplay access
+    requires an explicit prior character selection.
+
+    Raises:
+        HTTPException(409): If no character is selected or it cannot be resolved.
+    """
+    character_id = session.get("character_id")
+    if not character_id:
+        raise HTTPException(
+            status_code=409,
+            detail="No character selected for session. Select a character first.",
+        )
+
+    character_name = session.get("character_name")
+    if not character_name:
+        raise HTTPException(status_code=409, detail="Selected character not found")
+
+    world_id = session.get("character_world_id")
+    if not world_id:
+        raise HTTPException(status_code=409, detail="Character world not found")
+
+    return int(character_id), character_name, world_id
+
+
 def _is_expired(expires_at: str) -> bool:
     """
     Check if a stored SQLite timestamp is expired relative to current UTC time.
@@ -274,3 +517,40 @@ def _is_expired(expires_at: str) -> bool:
 
     now = datetime.now(UTC).replace(tzinfo=None)
     return expires_dt <= now
+
+
+async def _validate_session_record_async(session_id: str) -> tuple[dict, int, str, str]:
+    """
+    Shared async validation core: joined session context and activity touch.
+
+    Raises:
+        HTTPException(401): If the session, its user, or the user's role is missing.
+    """
+    session = await _get_valid_session_async(session_id)
+    if not session:
+        raise HTTPException(status_code=401, detail="Invalid or expired session")
+
+    await _touch_session_async(session_id)
+
+    user_id, username, role = _session_identity(session)
+    return session, user_id, username, role
+
+
+async def _get_valid_session_async(session_id: str) -> dict | None:
+    """Async :func:`_get_valid_session`; expired sessions are removed on sight."""
+    session = _session_cache.get(session_id)
+    if session is not None and not _session_expired(session):
+        return session
+
+    generation = _session_cache.generation
+    session = await database.get_session_context_async(session_id)
+    if not session:
+        _session_cache.discard(session_id)
+        return None
+
+    if _session_expired(session):
+        await database.remove_session_by_id_async(session_id)
+        return None
+
+    _session_cache.put(session_id, session, generation=generation)
+    return session
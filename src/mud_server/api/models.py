@@ -53,6 +53,9 @@ OllamaCommandRequest = admin_models.OllamaCommandRequest
 OllamaCommandResponse = admin_models.OllamaCommandResponse
 ServerStopRequest = admin_models.ServerStopRequest
 ServerStopResponse = admin_models.ServerStopResponse
+TranslationEndpointStats = admin_models.TranslationEndpointStats
+TranslationRendererStats = admin_models.TranslationRendererStats
+TranslationStatsResponse = admin_models.TranslationStatsResponse
 UserListResponse = admin_models.UserListResponse
 UserManagementRequest = admin_models.UserManagementRequest
 UserManagementResponse = admin_models.UserManagementResponse
@@ -60,6 +63,8 @@ WorldActiveCharacterSession = admin_models.WorldActiveCharacterSession
 
 ChangePasswordRequest = auth_game_models.ChangePasswordRequest
 CharactersResponse = auth_game_models.CharactersResponse
+ChatMessage = auth_game_models.ChatMessage
+ChatMessagesResponse = auth_game_models.ChatMessagesResponse
 # Canonical condition-axis pipeline models are re-exported here so route
 # modules can continue importing from ``mud_server.api.models`` without
 # splitting import surfaces by feature domain.
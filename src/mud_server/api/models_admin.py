@@ -690,6 +690,89 @@ class OllamaCommandResponse(BaseModel):
     output: str
 
 
+class TranslationRendererStats(BaseModel):
+    """
+    Ollama renderer counters for one world's translation service.
+
+    Attributes:
+        world_id: World the translation service belongs to
+        requests: Requests sent to Ollama
+        failures: Requests that fell back because of a network error or timeout
+        connections_opened: TCP connections opened by the renderer's pool
+        connections_reused: Requests served on an already-open connection
+        mean_latency_ms: Average request latency in milliseconds
+        max_latency_ms: Slowest request latency in milliseconds
+        cache_enabled: Whether the deterministic result cache is on
+        cache_entries: Results held in the cache's memory LRU
+        cache_hits: Translations answered from the cache
+        cache_misses: Cacheable translations that had to call Ollama
+        cache_hit_rate: ``cache_hits / (cache_hits + cache_misses)``
+        endpoint: Ollama ``/api/chat`` URL the world translates through
+        breaker_state: Endpoint circuit breaker: closed, open or half_open
+        queue_depth: Translations currently waiting for an endpoint slot
+    """
+
+    world_id: str
+    requests: int
+    failures: int
+    connections_opened: int
+    connections_reused: int
+    mean_latency_ms: float
+    max_latency_ms: float
+    cache_enabled: bool = False
+    cache_entries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_hit_rate: float = 0.0
+    endpoint: str = ""
+    breaker_state: str = "closed"
+    queue_depth: int = 0
+
+
+class TranslationEndpointStats(BaseModel):
+    """
+    Concurrency limit, wait queue and circuit breaker of one Ollama endpoint.
+
+    Attributes:
+        endpoint: Ollama ``/api/chat`` URL (shared by every world using it)
+        breaker_state: closed, open (failing fast to OOC) or half_open (probing)
+        consecutive_failures: Timeouts/connection errors since the last answer
+        in_flight: Calls currently running against the endpoint
+        queue_depth: Calls waiting for a slot
+        max_concurrency: Configured concurrent-call limit
+        queue_size: Configured wait-queue capacity
+        shed: Calls that fell back because the queue was full or the wait timed out
+        rejected: Calls that fell back because the breaker was open
+        trips: Times the breaker has opened
+    """
+
+    endpoint: str
+    breaker_state: str
+    consecutive_failures: int
+    in_flight: int
+    queue_depth: int
+    max_concurrency: int
+    queue_size: int
+    shed: int
+    rejected: int
+    trips: int
+
+
+class TranslationStatsResponse(BaseModel):
+    """
+    Admin response with per-world translation renderer and cache counters.
+
+    Only worlds that are loaded and have translation enabled are listed.
+
+    Attributes:
+        worlds: One entry per world
+        endpoints: One entry per Ollama endpoint those worlds use
+    """
+
+    worlds: list[TranslationRendererStats]
+    endpoints: list[TranslationEndpointStats] = []
+
+
 class ClearOllamaContextRequest(BaseModel):
     """
     Request to clear Ollama conversation context for the current session.
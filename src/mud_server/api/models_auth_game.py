@@ -367,6 +367,38 @@ class CommandResponse(BaseModel):
     message: str
 
 
+class ChatMessage(BaseModel):
+    """
+    One room chat message as returned by the cursor chat endpoint.
+
+    Attributes:
+        id: Monotonic message id; pass the largest seen as ``since_id``
+        username: Character that sent the message
+        message: Sanitized message text (including [YELL]/[WHISPER] prefixes)
+        timestamp: Storage timestamp (UTC, SQLite format)
+    """
+
+    id: int
+    username: str
+    message: str
+    timestamp: str | None = None
+
+
+class ChatMessagesResponse(BaseModel):
+    """
+    Incremental chat page for ``GET /chat/{session_id}/messages``.
+
+    Attributes:
+        messages: Messages newer than the request's ``since_id``, oldest first
+        cursor: ``since_id`` to send on the next request
+        room: Room the messages were read from (the character's current room)
+    """
+
+    messages: list[ChatMessage]
+    cursor: int
+    room: str | None
+
+
 class StatusResponse(BaseModel):
     """
     Response containing player's current game status.
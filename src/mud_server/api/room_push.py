@@ -0,0 +1,363 @@
+"""Real-time push of room chat and presence to connected play clients.
+
+The play client used to poll ``GET /chat/{session_id}`` every few seconds,
+re-validating the session and re-reading room history even when nothing had
+changed. Clients now hold one WebSocket (see :mod:`mud_server.api.routes.push`)
+and :class:`RoomPushHub` forwards engine events to the sockets subscribed to
+the affected rooms:
+
+- ``CHAT_SAID`` goes to the speaker's room.
+- ``CHAT_YELLED`` goes to every room in ``rooms_reached``.
+- ``CHAT_WHISPERED`` goes to the sender and the target only.
+- ``CHAT_TRANSLATED`` (deferred translation rewrote a stored message) follows
+  the same routing as the message it replaces, as a ``chat_translated``
+  payload carrying the rewritten row ids.
+- ``ROOM_EXITED`` / ``ROOM_ENTERED`` move the mover's subscriptions and tell
+  the other occupants of each room.
+
+Engine commands run on :class:`~mud_server.core.executor.EngineExecutor`
+worker threads, so bus handlers here never touch a queue directly: each
+delivery is handed to the subscriber's event loop with
+``call_soon_threadsafe``. Session changes (logout, kick, role change) are
+forwarded the same way so the socket can re-validate and close.
+
+Long-polling ``GET /chat/{session_id}/messages`` requests subscribe for the
+length of their wait and use any delivery as a wake-up signal.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from mud_server.core.bus import MudBus, MudEvent
+from mud_server.core.events import Events
+from mud_server.db.session_invalidation import (
+    SessionInvalidation,
+    add_session_invalidation_listener,
+)
+
+logger = logging.getLogger(__name__)
+
+# Queue item telling the socket loop to re-validate its session.
+REVALIDATE: dict[str, Any] = {"type": "revalidate"}
+
+
+@dataclass(eq=False, slots=True)
+class RoomSubscriber:
+    """One connected socket and the room it is currently listening to.
+
+    Attributes:
+        session_id: Session token the socket authenticated with.
+        user_id: Owning account id.
+        username: Owning account username.
+        character_id: Selected character id.
+        character_name: Selected character name (what events call ``username``).
+        world_id: World the character is playing in.
+        room_id: Room currently subscribed to (``None`` until known).
+        queue: Outbound messages, drained by the socket's send loop.
+        loop: Event loop that owns ``queue``.
+        dropped: Messages discarded because ``queue`` was full.
+    """
+
+    session_id: str
+    user_id: int
+    username: str
+    character_id: int
+    character_name: str
+    world_id: str
+    room_id: str | None
+    queue: asyncio.Queue[dict[str, Any]]
+    loop: asyncio.AbstractEventLoop
+    dropped: int = field(default=0)
+
+
+@dataclass(frozen=True, slots=True)
+class RoomPushStats:
+    """Point-in-time counters for a :class:`RoomPushHub`.
+
+    Attributes:
+        connections: Sockets currently subscribed.
+        rooms: Distinct ``(world_id, room_id)`` pairs with at least one socket.
+        delivered: Messages handed to subscriber queues since start.
+        dropped: Messages discarded because a subscriber queue was full.
+    """
+
+    connections: int
+    rooms: int
+    delivered: int
+    dropped: int
+
+
+class RoomPushHub:
+    """Thread-safe room subscription registry fed by :class:`MudBus` events."""
+
+    def __init__(self, *, queue_size: int = 256) -> None:
+        self.queue_size = max(1, int(queue_size))
+        self._lock = threading.Lock()
+        self._rooms: dict[tuple[str, str], set[RoomSubscriber]] = {}
+        self._characters: dict[tuple[str, str], set[RoomSubscriber]] = {}
+        self._subscribers: set[RoomSubscriber] = set()
+        self._delivered = 0
+        self._dropped = 0
+        self._attach_lock = threading.Lock()
+        self._bus: MudBus | None = None
+        self._unsubscribes: list[Callable[[], None]] = []
+
+    # ------------------------------------------------------------------
+    # Wiring
+    # ------------------------------------------------------------------
+
+    def attach(self, bus: MudBus) -> None:
+        """Subscribe to ``bus`` (idempotent; re-binds if the singleton changed)."""
+        # Separate from ``_lock``: emit() holds the bus lock while our handlers
+        # take ``_lock``, so registry state must never wait on the bus.
+        with self._attach_lock:
+            if self._bus is bus:
+                return
+            for unsubscribe in self._unsubscribes:
+                unsubscribe()
+            self._unsubscribes = [
+                bus.on(Events.CHAT_SAID, self._on_chat_said),
+                bus.on(Events.CHAT_YELLED, self._on_chat_yelled),
+                bus.on(Events.CHAT_WHISPERED, self._on_chat_whispered),
+                bus.on(Events.CHAT_TRANSLATED, self._on_chat_translated),
+                bus.on(Events.ROOM_EXITED, self._on_room_exited),
+                bus.on(Events.ROOM_ENTERED, self._on_room_entered),
+            ]
+            self._bus = bus
+        add_session_invalidation_listener(self._on_sessions_changed)
+
+    def subscribe(
+        self,
+        *,
+        session_id: str,
+        user_id: int,
+        username: str,
+        character_id: int,
+        character_name: str,
+        world_id: str,
+        room_id: str | None,
+    ) -> RoomSubscriber:
+        """Register a socket; must be called from the loop that will drain it."""
+        subscriber = RoomSubscriber(
+            session_id=session_id,
+            user_id=user_id,
+            username=username,
+            character_id=character_id,
+            character_name=character_name,
+            world_id=world_id,
+            room_id=room_id,
+            queue=asyncio.Queue(maxsize=self.queue_size),
+            loop=asyncio.get_running_loop(),
+        )
+        with self._lock:
+            self._subscribers.add(subscriber)
+            self._characters.setdefault((world_id, character_name), set()).add(subscriber)
+            if room_id is not None:
+                self._rooms.setdefault((world_id, room_id), set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: RoomSubscriber) -> None:
+        """Remove a socket from every index (unknown subscribers are ignored)."""
+        with self._lock:
+            if subscriber not in self._subscribers:
+                return
+            self._subscribers.discard(subscriber)
+            self._discard(
+                self._characters, (subscriber.world_id, subscriber.character_name), subscriber
+            )
+            if subscriber.room_id is not None:
+                self._discard(self._rooms, (subscriber.world_id, subscriber.room_id), subscriber)
+
+    def stats(self) -> RoomPushStats:
+        """Return connection and delivery counters."""
+        with self._lock:
+            return RoomPushStats(
+                connections=len(self._subscribers),
+                rooms=len(self._rooms),
+                delivered=self._delivered,
+                dropped=self._dropped,
+            )
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def relocate(self, world_id: str, character_name: str, room_id: str) -> None:
+        """Move every socket playing ``character_name`` to ``room_id``."""
+        with self._lock:
+            for subscriber in self._characters.get((world_id, character_name), ()):
+                if subscriber.room_id == room_id:
+                    continue
+                if subscriber.room_id is not None:
+                    self._discard(self._rooms, (world_id, subscriber.room_id), subscriber)
+                subscriber.room_id = room_id
+                self._rooms.setdefault((world_id, room_id), set()).add(subscriber)
+                self._deliver(subscriber, {"type": "room", "room": room_id})
+
+    def publish_to_rooms(
+        self,
+        world_id: str,
+        room_ids: Iterable[str],
+        payload: dict[str, Any],
+        *,
+        exclude: str | None = None,
+    ) -> None:
+        """Send ``payload`` once to every socket in any of ``room_ids``."""
+        with self._lock:
+            targets: set[RoomSubscriber] = set()
+            for room_id in room_ids:
+                targets.update(self._rooms.get((world_id, room_id), ()))
+            for subscriber in targets:
+                if exclude is None or subscriber.character_name != exclude:
+                    self._deliver(subscriber, payload)
+
+    def publish_to_characters(
+        self, world_id: str, character_names: Iterable[str], payload: dict[str, Any]
+    ) -> None:
+        """Send ``payload`` once to every socket playing any of ``character_names``."""
+        with self._lock:
+            targets: set[RoomSubscriber] = set()
+            for name in character_names:
+                targets.update(self._characters.get((world_id, name), ()))
+            for subscriber in targets:
+                self._deliver(subscriber, payload)
+
+    # ------------------------------------------------------------------
+    # Bus handlers (run on the emitting thread)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _chat_payload(detail: dict[str, Any], channel: str, room: str) -> dict[str, Any]:
+        """Shape one chat event as the client-facing message."""
+        return {
+            "type": "chat",
+            "channel": channel,
+            "username": detail["username"],
+            "message": detail["message"],
+            "room": room,
+        }
+
+    def _on_chat_said(self, event: MudEvent) -> None:
+        detail = event.detail
+        self.publish_to_rooms(
+            detail["world_id"], (detail["room"],), self._chat_payload(detail, "say", detail["room"])
+        )
+
+    def _on_chat_yelled(self, event: MudEvent) -> None:
+        detail = event.detail
+        self.publish_to_rooms(
+            detail["world_id"],
+            detail["rooms_reached"],
+            self._chat_payload(detail, "yell", detail["origin_room"]),
+        )
+
+    def _on_chat_whispered(self, event: MudEvent) -> None:
+        detail = event.detail
+        self.publish_to_characters(
+            detail["world_id"],
+            (detail["username"], detail["target"]),
+            self._chat_payload(detail, "whisper", detail["room"]),
+        )
+
+    def _on_chat_translated(self, event: MudEvent) -> None:
+        detail = event.detail
+        payload = {
+            **self._chat_payload(detail, detail["channel"], detail["room"]),
+            "type": "chat_translated",
+            "message_ids": detail["message_ids"],
+        }
+        if detail["channel"] == "whisper":
+            self.publish_to_characters(
+                detail["world_id"], (detail["username"], detail["target"]), payload
+            )
+        else:
+            self.publish_to_rooms(detail["world_id"], detail["rooms"], payload)
+
+    def _on_room_exited(self, event: MudEvent) -> None:
+        detail = event.detail
+        self.publish_to_rooms(
+            detail["world_id"],
+            (detail["room"],),
+            self._presence_payload(detail, "exited"),
+            exclude=detail["username"],
+        )
+
+    def _on_room_entered(self, event: MudEvent) -> None:
+        detail = event.detail
+        self.relocate(detail["world_id"], detail["username"], detail["room"])
+        self.publish_to_rooms(
+            detail["world_id"],
+            (detail["room"],),
+            self._presence_payload(detail, "entered"),
+            exclude=detail["username"],
+        )
+
+    @staticmethod
+    def _presence_payload(detail: dict[str, Any], action: str) -> dict[str, Any]:
+        """Shape one room transition as the client-facing notice."""
+        return {
+            "type": "presence",
+            "action": action,
+            "username": detail["username"],
+            "room": detail["room"],
+            "message": detail.get("message") or "",
+        }
+
+    def _on_sessions_changed(self, change: SessionInvalidation) -> None:
+        """Ask affected sockets to re-validate after a session-affecting write."""
+        with self._lock:
+            for subscriber in self._subscribers:
+                if (
+                    change.everything
+                    or change.session_id == subscriber.session_id
+                    or change.user_id == subscriber.user_id
+                    or change.username == subscriber.username
+                    or change.character_id == subscriber.character_id
+                ):
+                    self._deliver(subscriber, REVALIDATE)
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds ``self._lock``)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _discard(
+        index: dict[tuple[str, str], set[RoomSubscriber]],
+        key: tuple[str, str],
+        subscriber: RoomSubscriber,
+    ) -> None:
+        members = index.get(key)
+        if members is None:
+            return
+        members.discard(subscriber)
+        if not members:
+            del index[key]
+
+    def _deliver(self, subscriber: RoomSubscriber, payload: dict[str, Any]) -> None:
+        """Hand ``payload`` to the subscriber's loop without blocking this thread."""
+        try:
+            subscriber.loop.call_soon_threadsafe(self._enqueue, subscriber, payload)
+        except RuntimeError:
+            # Loop already closed; the socket's own cleanup will unsubscribe.
+            return
+        self._delivered += 1
+
+    def _enqueue(self, subscriber: RoomSubscriber, payload: dict[str, Any]) -> None:
+        """Runs on the subscriber's loop; drops the message if the client is too slow."""
+        try:
+            subscriber.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            subscriber.dropped += 1
+            with self._lock:
+                self._dropped += 1
+            logger.debug("Room push queue full for session %s", subscriber.session_id[:8])
+
+
+room_push_hub = RoomPushHub()
+"""Process-wide hub shared by the push route and the bus handlers."""
@@ -7,7 +7,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
 
-from mud_server.api.auth import remove_session, validate_session
+from mud_server.api.auth import validate_session_async
 from mud_server.api.models import (
     ChangePasswordRequest,
     CharactersResponse,
@@ -478,8 +478,11 @@ def router(engine: GameEngine) -> APIRouter:
     @api.post("/logout")
     async def logout(request: LogoutRequest):
         """Logout user and remove session from database."""
-        _, username, _ = validate_session(request.session_id)
-        remove_session(request.session_id)
+        _, username, _ = await validate_session_async(request.session_id)
+        try:
+            await database.remove_session_by_id_async(request.session_id)
+        except DatabaseError as exc:
+            raise HTTPException(status_code=500, detail="Session store unavailable") from exc
         return {"success": True, "message": f"Goodbye, {username}!"}
 
     @api.get("/characters", response_model=CharactersResponse)
@@ -499,7 +502,7 @@ def router(engine: GameEngine) -> APIRouter:
                 character exists in the result set.
         """
         try:
-            user_id, username, role = validate_session(session_id)
+            user_id, username, role = await validate_session_async(session_id)
             effective_world_id = world_id or database.DEFAULT_WORLD_ID
             if not database.can_user_access_world(user_id, effective_world_id, role=role):
                 raise HTTPException(status_code=403, detail="World access denied")
@@ -523,8 +526,8 @@ def router(engine: GameEngine) -> APIRouter:
     async def select_character(request: SelectCharacterRequest):
         """Select a character for the current session."""
         try:
-            user_id, _, role = validate_session(request.session_id)
-            character = database.get_character_by_id(request.character_id)
+            user_id, _, role = await validate_session_async(request.session_id)
+            character = await database.get_character_by_id_async(request.character_id)
             if not character or character.get("user_id") != user_id:
                 raise HTTPException(status_code=404, detail="Character not found for this user")
 
@@ -538,7 +541,7 @@ def router(engine: GameEngine) -> APIRouter:
             if character.get("world_id") != world_id:
                 raise HTTPException(status_code=409, detail="Character does not belong to world")
 
-            if not database.set_session_character(
+            if not await database.set_session_character_async(
                 request.session_id, request.character_id, world_id=world_id
             ):
                 raise HTTPException(status_code=500, detail="Failed to select character")
@@ -567,7 +570,7 @@ def router(engine: GameEngine) -> APIRouter:
           operations in this phase.
         """
         try:
-            user_id, username, role = validate_session(request.session_id)
+            user_id, username, role = await validate_session_async(request.session_id)
             world_id = request.world_id.strip()
             if not world_id:
                 raise HTTPException(status_code=400, detail="world_id is required")
@@ -641,7 +644,7 @@ def router(engine: GameEngine) -> APIRouter:
         """Change current user's password with policy enforcement."""
         from mud_server.api.password_policy import PolicyLevel, validate_password_strength
 
-        _, username, _ = validate_session(request.session_id)
+        _, username, _ = await validate_session_async(request.session_id)
 
         try:
             # Verify old password
@@ -1,145 +1,215 @@
 """Game interaction endpoints (commands, chat, status)."""
 
-from fastapi import APIRouter, HTTPException
-
-from mud_server.api.auth import validate_session, validate_session_for_game
-from mud_server.api.models import CommandRequest, CommandResponse, StatusResponse
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from mud_server.api.auth import validate_session_async, validate_session_for_game_async
+from mud_server.api.models import (
+    ChatMessagesResponse,
+    CommandRequest,
+    CommandResponse,
+    StatusResponse,
+)
 from mud_server.api.permissions import Permission, has_permission
+from mud_server.api.room_push import room_push_hub
+from mud_server.config import config
+from mud_server.core.bus import MudBus
 from mud_server.core.engine import GameEngine
+from mud_server.core.executor import get_engine_executor
 from mud_server.db import facade as database
 from mud_server.db.errors import DatabaseError
 
-
-def router(engine: GameEngine) -> APIRouter:
-    """Build the game router with access to the game engine."""
-    api = APIRouter()
-
-    @api.post("/command", response_model=CommandResponse)
-    async def execute_command(request: CommandRequest):
-        """
-        Execute a game command.
-
-        Parses command string and delegates to appropriate engine method.
-        Commands can start with "/" or not. Command verb is case-insensitive
-        but arguments (like player names) preserve case.
-        """
-        try:
-            _, _, role, _, character_name, world_id = validate_session_for_game(request.session_id)
-
-            command = request.command.strip()
-
-            if not command:
-                return CommandResponse(success=False, message="Enter a command.")
-
-            # Strip leading slash if present (support both /command and command)
-            if command.startswith("/"):
-                command = command[1:]
-
-            # Parse command (only lowercase the verb, keep args case-sensitive)
-            parts = command.split(maxsplit=1)
-            cmd = parts[0].lower()
-            args = parts[1] if len(parts) > 1 else ""
-
-            if cmd in [
-                "n",
-                "north",
-                "s",
-                "south",
-                "e",
-                "east",
-                "w",
-                "west",
-                "u",
-                "up",
-                "d",
-                "down",
-            ]:
-                direction_map = {
-                    "n": "north",
-                    "s": "south",
-                    "e": "east",
-                    "w": "west",
-                    "u": "up",
-                    "d": "down",
-                }
-                direction = direction_map.get(cmd, cmd)
-                success, message = engine.move(character_name, direction, world_id=world_id)
-                return CommandResponse(success=success, message=message)
-
-            if cmd in ["look", "l"]:
-                message = engine.look(character_name, world_id=world_id)
-                return CommandResponse(success=True, message=message)
-
-            if cmd in ["inventory", "inv", "i"]:
-                message = engine.get_inventory(character_name, world_id=world_id)
-                return CommandResponse(success=True, message=message)
-
-            if cmd in ["get", "take"]:
-                if not args:
-                    return CommandResponse(success=False, message="Get what?")
-                success, message = engine.pickup_item(character_name, args, world_id=world_id)
-                return CommandResponse(success=success, message=message)
-
-            if cmd == "drop":
-                if not args:
-                    return CommandResponse(success=False, message="Drop what?")
-                success, message = engine.drop_item(character_name, args, world_id=world_id)
-                return CommandResponse(success=success, message=message)
-
-            if cmd in ["say", "chat"]:
-                if not args:
-                    return CommandResponse(success=False, message="Say what?")
-                success, message = engine.chat(character_name, args, world_id=world_id)
+CHAT_LONG_POLL_MAX_SECONDS = 30.0
+"""Upper bound for the ``wait`` parameter of ``GET /chat/{session_id}/messages``."""
+
+DISCONNECT_POLL_SECONDS = 0.25
+"""How often an async chat command checks whether its client went away."""
+
+
+def _parse_command(command: str) -> tuple[str, str]:
+    """Split a command into its lowercased verb and case-preserving arguments."""
+    command = command.strip()
+    # Strip leading slash if present (support both /command and command)
+    if command.startswith("/"):
+        command = command[1:]
+    parts = command.split(maxsplit=1)
+    if not parts:
+        return "", ""
+    return parts[0].lower(), parts[1] if len(parts) > 1 else ""
+
+
+def _async_chat_call(
+    engine: GameEngine, command: str, *, character_name: str, world_id: str
+) -> Callable[[], Awaitable[tuple[bool, str]]] | None:
+    """Return the async engine call for a well-formed say/yell/whisper, else ``None``.
+
+    Used in ``ollama_translation.mode = async``; every other command, and
+    chat commands missing their arguments, go through :func:`_execute_command`.
+    """
+    cmd, args = _parse_command(command)
+    if cmd in ["say", "chat", "yell"] and args:
+        chat = engine.yell_async if cmd == "yell" else engine.chat_async
+        return lambda: chat(character_name, args, world_id=world_id)
+    # "w" is west (movement is matched first in _execute_command).
+    if cmd == "whisper":
+        whisper_parts = args.split(maxsplit=1)
+        if len(whisper_parts) == 2:
+            target, msg = whisper_parts
+            return lambda: engine.whisper_async(character_name, target, msg, world_id=world_id)
+    return None
+
+
+async def _run_until_disconnected(
+    http_request: Request, call: Callable[[], Awaitable[tuple[bool, str]]]
+) -> CommandResponse:
+    """Await an async chat command, cancelling it if the client disconnects.
+
+    Cancelling aborts an in-flight Ollama call; the message is only stored
+    after translation, so nothing is written for a cancelled command.
+    """
+    task = asyncio.ensure_future(call())
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                success, message = task.result()
                 return CommandResponse(success=success, message=message)
-
-            if cmd == "yell":
-                if not args:
-                    return CommandResponse(success=False, message="Yell what?")
-                success, message = engine.yell(character_name, args, world_id=world_id)
-                return CommandResponse(success=success, message=message)
-
-            if cmd in ["whisper", "w"]:
-                if not args:
-                    return CommandResponse(
-                        success=False, message="Whisper to whom? Usage: /whisper <player> <message>"
-                    )
-                whisper_parts = args.split(maxsplit=1)
-                if len(whisper_parts) < 2:
-                    return CommandResponse(
-                        success=False, message="Whisper what? Usage: /whisper <player> <message>"
-                    )
-                target = whisper_parts[0]
-                msg = whisper_parts[1]
-                success, message = engine.whisper(character_name, target, msg, world_id=world_id)
-                return CommandResponse(success=success, message=message)
-
-            if cmd in ["recall", "flee", "scurry"]:
-                success, message = engine.recall(character_name, world_id=world_id)
-                return CommandResponse(success=success, message=message)
-
-            if cmd == "who":
-                players = engine.get_active_players(world_id=world_id)
-                if not players:
-                    message = "No other players online."
-                else:
-                    message = "Active players:\n" + "\n".join(f"  - {p}" for p in players)
-                return CommandResponse(success=True, message=message)
-
-            if cmd == "kick":
-                if not has_permission(role, Permission.KICK_USERS):
-                    return CommandResponse(
-                        success=False,
-                        message="Insufficient permissions. /kick is admin/superuser only.",
-                    )
-                if not args:
-                    return CommandResponse(
-                        success=False, message="Kick whom? Usage: /kick <character>"
-                    )
-                success, message = engine.kick_character(character_name, args, world_id=world_id)
-                return CommandResponse(success=success, message=message)
-
-            if cmd in ["help", "?"]:
-                help_text = """
+            if await http_request.is_disconnected():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+                return CommandResponse(
+                    success=False, message="Command cancelled: client disconnected."
+                )
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def _execute_command(
+    engine: GameEngine, command: str, *, role: str, character_name: str, world_id: str
+) -> CommandResponse:
+    """
+    Parse and run one game command on an engine worker thread.
+
+    Runs synchronously inside :class:`~mud_server.core.executor.EngineExecutor`
+    so blocking engine work (SQLite, Ollama translation) never stalls the
+    event loop. The unit of work is entered here, in the worker thread, so the
+    whole command shares one connection and one commit.
+    """
+    # One connection and one commit for everything the command touches.
+    with database.unit_of_work():
+
+        if not command.strip():
+            return CommandResponse(success=False, message="Enter a command.")
+
+        # Parse command (only lowercase the verb, keep args case-sensitive)
+        cmd, args = _parse_command(command)
+
+        if cmd in [
+            "n",
+            "north",
+            "s",
+            "south",
+            "e",
+            "east",
+            "w",
+            "west",
+            "u",
+            "up",
+            "d",
+            "down",
+        ]:
+            direction_map = {
+                "n": "north",
+                "s": "south",
+                "e": "east",
+                "w": "west",
+                "u": "up",
+                "d": "down",
+            }
+            direction = direction_map.get(cmd, cmd)
+            success, message = engine.move(character_name, direction, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd in ["look", "l"]:
+            message = engine.look(character_name, world_id=world_id)
+            return CommandResponse(success=True, message=message)
+
+        if cmd in ["inventory", "inv", "i"]:
+            message = engine.get_inventory(character_name, world_id=world_id)
+            return CommandResponse(success=True, message=message)
+
+        if cmd in ["get", "take"]:
+            if not args:
+                return CommandResponse(success=False, message="Get what?")
+            success, message = engine.pickup_item(character_name, args, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd == "drop":
+            if not args:
+                return CommandResponse(success=False, message="Drop what?")
+            success, message = engine.drop_item(character_name, args, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd in ["say", "chat"]:
+            if not args:
+                return CommandResponse(success=False, message="Say what?")
+            success, message = engine.chat(character_name, args, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd == "yell":
+            if not args:
+                return CommandResponse(success=False, message="Yell what?")
+            success, message = engine.yell(character_name, args, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd in ["whisper", "w"]:
+            if not args:
+                return CommandResponse(
+                    success=False,
+                    message="Whisper to whom? Usage: /whisper <player> <message>",
+                )
+            whisper_parts = args.split(maxsplit=1)
+            if len(whisper_parts) < 2:
+                return CommandResponse(
+                    success=False,
+                    message="Whisper what? Usage: /whisper <player> <message>",
+                )
+            target = whisper_parts[0]
+            msg = whisper_parts[1]
+            success, message = engine.whisper(character_name, target, msg, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd in ["recall", "flee", "scurry"]:
+            success, message = engine.recall(character_name, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd == "who":
+            players = engine.get_active_players(world_id=world_id)
+            if not players:
+                message = "No other players online."
+            else:
+                message = "Active players:\n" + "\n".join(f"  - {p}" for p in players)
+            return CommandResponse(success=True, message=message)
+
+        if cmd == "kick":
+            if not has_permission(role, Permission.KICK_USERS):
+                return CommandResponse(
+                    success=False,
+                    message="Insufficient permissions. /kick is admin/superuser only.",
+                )
+            if not args:
+                return CommandResponse(success=False, message="Kick whom? Usage: /kick <character>")
+            success, message = engine.kick_character(character_name, args, world_id=world_id)
+            return CommandResponse(success=success, message=message)
+
+        if cmd in ["help", "?"]:
+            help_text = """
 [Available Commands]
 Movement:
   /north, /n, /south, /s, /east, /e, /west, /w - Move in a direction
@@ -164,11 +234,104 @@ Other:
 
 Note: Commands can be used with or without the / prefix
             """
-                return CommandResponse(success=True, message=help_text)
+            return CommandResponse(success=True, message=help_text)
+
+        return CommandResponse(
+            success=False,
+            message=f"Unknown command: {cmd}. Type 'help' for available commands.",
+        )
+
+
+async def _wait_for_room_messages(
+    *,
+    session: tuple[int, str, str, int, str, str],
+    session_id: str,
+    room: str | None,
+    since_id: int,
+    limit: int,
+    wait: float,
+) -> tuple[str | None, list[dict[str, Any]]]:
+    """
+    Long-poll for messages newer than ``since_id`` for up to ``wait`` seconds.
+
+    Subscribes to :data:`~mud_server.api.room_push.room_push_hub` for the wait,
+    so the request wakes on the next chat or movement event instead of
+    re-querying on a timer. The engine commits chat rows before emitting, so
+    the re-read after a wake-up sees them. Follows the character if it moves.
+
+    Returns:
+        ``(room, messages)`` where ``room`` is the room finally read.
+    """
+    user_id, username, _, character_id, character_name, world_id = session
+    room_push_hub.attach(MudBus())
+    subscriber = room_push_hub.subscribe(
+        session_id=session_id,
+        user_id=user_id,
+        username=username,
+        character_id=character_id,
+        character_name=character_name,
+        world_id=world_id,
+        room_id=room,
+    )
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    try:
+        while True:
+            # Read after subscribing so a message committed in between is not
+            # left waiting for the timeout.
+            messages: list[dict[str, Any]] = []
+            if subscriber.room_id is not None:
+                messages = await database.get_room_messages_since_async(
+                    subscriber.room_id,
+                    since_id=since_id,
+                    limit=limit,
+                    character_name=character_name,
+                    world_id=world_id,
+                )
+            remaining = deadline - loop.time()
+            if messages or remaining <= 0:
+                return subscriber.room_id, messages
+            with suppress(TimeoutError):
+                await asyncio.wait_for(subscriber.queue.get(), timeout=remaining)
+    finally:
+        room_push_hub.unsubscribe(subscriber)
+
+
+def router(engine: GameEngine) -> APIRouter:
+    """Build the game router with access to the game engine."""
+    api = APIRouter()
+
+    @api.post("/command", response_model=CommandResponse)
+    async def execute_command(request: CommandRequest, http_request: Request):
+        """
+        Execute a game command.
+
+        Parses command string and delegates to appropriate engine method.
+        Commands can start with "/" or not. Command verb is case-insensitive
+        but arguments (like player names) preserve case.
 
-            return CommandResponse(
-                success=False,
-                message=f"Unknown command: {cmd}. Type 'help' for available commands.",
+        With ``ollama_translation.mode = async``, say/yell/whisper await their
+        translation on the event loop and are cancelled if the client
+        disconnects first.
+        """
+        try:
+            _, _, role, _, character_name, world_id = await validate_session_for_game_async(
+                request.session_id
+            )
+            if config.ollama_translation.mode == "async":
+                chat_call = _async_chat_call(
+                    engine, request.command, character_name=character_name, world_id=world_id
+                )
+                if chat_call is not None:
+                    return await _run_until_disconnected(http_request, chat_call)
+            return await get_engine_executor().run(
+                world_id,
+                _execute_command,
+                engine,
+                request.command,
+                role=role,
+                character_name=character_name,
+                world_id=world_id,
             )
         except DatabaseError as exc:
             raise HTTPException(status_code=500, detail="Game database operation failed.") from exc
@@ -177,27 +340,78 @@ Note: Commands can be used with or without the / prefix
     async def get_chat(session_id: str):
         """Get recent chat messages from current room."""
         try:
-            _, _, _, _, character_name, world_id = validate_session_for_game(session_id)
-            chat = engine.get_room_chat(character_name, world_id=world_id)
+            _, _, _, _, character_name, world_id = await validate_session_for_game_async(session_id)
+            chat = await engine.get_room_chat_async(character_name, world_id=world_id)
             return {"chat": chat}
         except DatabaseError as exc:
             raise HTTPException(status_code=500, detail="Chat history unavailable.") from exc
 
+    @api.get("/chat/{session_id}/messages", response_model=ChatMessagesResponse)
+    async def get_chat_messages(
+        session_id: str,
+        since_id: int | None = Query(default=None, ge=0),
+        limit: int = Query(default=50, ge=1, le=100),
+        wait: float = Query(default=0.0, ge=0.0, le=CHAT_LONG_POLL_MAX_SECONDS),
+    ):
+        """
+        Incremental room chat for clients that cannot hold a WebSocket.
+
+        Without ``since_id`` returns the newest ``limit`` messages. With it,
+        returns only messages whose id is greater, oldest first. When there are
+        none and ``wait`` > 0 the request is held until a message arrives or
+        ``wait`` seconds pass. Send the returned ``cursor`` as the next
+        ``since_id``.
+        """
+        try:
+            session = await validate_session_for_game_async(session_id)
+            character_name, world_id = session[4], session[5]
+            room = await database.get_character_room_async(character_name, world_id=world_id)
+            messages: list[dict[str, Any]] = []
+            if room is not None:
+                messages = await database.get_room_messages_since_async(
+                    room,
+                    since_id=since_id,
+                    limit=limit,
+                    character_name=character_name,
+                    world_id=world_id,
+                )
+            if not messages and since_id is not None and wait > 0:
+                room, messages = await _wait_for_room_messages(
+                    session=session,
+                    session_id=session_id,
+                    room=room,
+                    since_id=since_id,
+                    limit=limit,
+                    wait=wait,
+                )
+        except DatabaseError as exc:
+            raise HTTPException(status_code=500, detail="Chat history unavailable.") from exc
+
+        cursor = max((message["id"] for message in messages), default=since_id or 0)
+        return ChatMessagesResponse(messages=messages, cursor=cursor, room=room)
+
     @api.post("/ping/{session_id}")
     async def heartbeat(session_id: str):
         """Heartbeat to update session activity without other actions."""
-        validate_session(session_id)
+        await validate_session_async(session_id)
         return {"ok": True}
 
     @api.get("/status/{session_id}", response_model=StatusResponse)
     async def get_status(session_id: str):
         """Get player status."""
         try:
-            _, _, _, _, character_name, world_id = validate_session_for_game(session_id)
+            _, _, _, _, character_name, world_id = await validate_session_for_game_async(session_id)
 
-            current_room = database.get_character_room(character_name, world_id=world_id)
-            inventory = engine.get_inventory(character_name, world_id=world_id)
-            active_players = engine.get_active_players(world_id=world_id)
+            current_room = await database.get_character_room_async(
+                character_name, world_id=world_id
+            )
+            executor = get_engine_executor()
+            inventory = await executor.run(
+                world_id, engine.get_inventory, character_name, world_id=world_id
+            )
+            active_players = await executor.run(
+                world_id, engine.get_active_players, world_id=world_id
+            )
 
             return StatusResponse(
                 active_players=active_players,
@@ -1,7 +1,9 @@
 """Health and root endpoints.
 
 Provides the root ``/`` endpoint (API identity and version) and the
-``/health`` endpoint (liveness check with active session count).
+``/health`` endpoint (liveness check with the startup warm-up readiness flag,
+active session count, the engine worker queue depth, validated-session cache
+counters and room-push connection counters).
 
 The version string is read from ``mud_server.__version__`` which is
 resolved at import time via ``importlib.metadata`` — the single source
@@ -11,7 +13,10 @@ of truth is ``pyproject.toml``, bumped automatically by release-please.
 from fastapi import APIRouter
 
 from mud_server import __version__
-from mud_server.api.auth import get_active_session_count
+from mud_server.api.auth import get_active_session_count, get_session_cache_stats
+from mud_server.api.room_push import room_push_hub
+from mud_server.core.executor import get_engine_executor
+from mud_server.core.warmup import warmup_state
 
 router = APIRouter()
 
@@ -28,5 +33,36 @@ async def root():
 
 @router.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "ok", "active_players": get_active_session_count()}
+    """Health check endpoint.
+
+    ``ready`` turns true once the startup world warm-up has finished; before
+    that the server answers requests but the first player into a world may
+    wait for it to load.
+    ``engine_queue_depth`` counts engine calls waiting for a worker thread or
+    a per-world slot; a persistently non-zero value means the pool is saturated.
+    ``session_cache`` hit/miss counters help size ``session.cache_max_entries``.
+    ``room_push.dropped`` counts chat/presence messages discarded for clients
+    that stopped reading their WebSocket.
+    """
+    engine_stats = get_engine_executor().stats()
+    cache_stats = get_session_cache_stats()
+    push_stats = room_push_hub.stats()
+    return {
+        "status": "ok",
+        "ready": warmup_state.ready,
+        "active_players": get_active_session_count(),
+        "engine_queue_depth": engine_stats.queued,
+        "engine_running": engine_stats.running,
+        "session_cache": {
+            "hits": cache_stats.hits,
+            "misses": cache_stats.misses,
+            "evictions": cache_stats.evictions,
+            "size": cache_stats.size,
+        },
+        "room_push": {
+            "connections": push_stats.connections,
+            "rooms": push_stats.rooms,
+            "delivered": push_stats.delivered,
+            "dropped": push_stats.dropped,
+        },
+    }
@@ -8,13 +8,16 @@ from mud_server.api.models import (
     ClearOllamaContextResponse,
     OllamaCommandRequest,
     OllamaCommandResponse,
+    TranslationEndpointStats,
+    TranslationRendererStats,
+    TranslationStatsResponse,
 )
 from mud_server.api.permissions import Permission
 from mud_server.core.engine import GameEngine
 
 
-def router(_engine: GameEngine) -> APIRouter:
-    """Build the Ollama router (engine unused, kept for signature symmetry)."""
+def router(engine: GameEngine) -> APIRouter:
+    """Build the Ollama router."""
     api = APIRouter()
 
     ollama_conversation_history: dict[str, list[dict[str, str]]] = {}
@@ -195,6 +198,49 @@ def router(_engine: GameEngine) -> APIRouter:
         except Exception as e:
             return OllamaCommandResponse(success=False, output=f"Error: {str(e)}")
 
+    @api.get("/admin/ollama/translation-stats", response_model=TranslationStatsResponse)
+    async def get_translation_stats(session_id: str):
+        """Per-world Ollama latency, cache hits and endpoint breaker state (Admin only)."""
+        _, _, _ = validate_session_with_permission(session_id, Permission.VIEW_LOGS)
+        worlds = []
+        endpoints: dict[str, TranslationEndpointStats] = {}
+        for world_id, stats in sorted(engine.world_registry.translation_stats().items()):
+            renderer, cache, guard = stats.renderer, stats.cache, stats.guard
+            worlds.append(
+                TranslationRendererStats(
+                    world_id=world_id,
+                    requests=renderer.requests,
+                    failures=renderer.failures,
+                    connections_opened=renderer.connections_opened,
+                    connections_reused=renderer.connections_reused,
+                    mean_latency_ms=renderer.mean_latency_seconds * 1000,
+                    max_latency_ms=renderer.max_latency_seconds * 1000,
+                    cache_enabled=cache is not None,
+                    cache_entries=cache.entries if cache else 0,
+                    cache_hits=cache.hits if cache else 0,
+                    cache_misses=cache.misses if cache else 0,
+                    cache_hit_rate=cache.hit_rate if cache else 0.0,
+                    endpoint=guard.endpoint,
+                    breaker_state=guard.state,
+                    queue_depth=guard.queue_depth,
+                )
+            )
+            endpoints[guard.endpoint] = TranslationEndpointStats(
+                endpoint=guard.endpoint,
+                breaker_state=guard.state,
+                consecutive_failures=guard.consecutive_failures,
+                in_flight=guard.in_flight,
+                queue_depth=guard.queue_depth,
+                max_concurrency=guard.max_concurrency,
+                queue_size=guard.queue_size,
+                shed=guard.shed,
+                rejected=guard.rejected,
+                trips=guard.trips,
+            )
+        return TranslationStatsResponse(
+            worlds=worlds, endpoints=[endpoints[url] for url in sorted(endpoints)]
+        )
+
     @api.post("/admin/ollama/clear-context", response_model=ClearOllamaContextResponse)
     async def clear_ollama_context(request: ClearOllamaContextRequest):
         """
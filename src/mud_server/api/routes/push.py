@@ -0,0 +1,118 @@
+"""WebSocket push channel for room chat and presence.
+
+``/ws/{session_id}`` replaces chat polling for the play client. After the
+session is validated the socket is subscribed to the character's current room
+in :data:`~mud_server.api.room_push.room_push_hub` and receives JSON messages:
+
+- ``{"type": "room", "room": ...}`` on connect and whenever the character moves.
+- ``{"type": "chat", "channel": "say"|"yell"|"whisper", "username", "message", "room"}``
+- ``{"type": "presence", "action": "entered"|"exited", "username", "message", "room"}``
+- ``{"type": "ping"}`` when idle for :data:`KEEPALIVE_SECONDS`.
+
+Each keepalive re-validates the session, which also records activity, so an
+open socket keeps its session alive the way polling did. Anything the client
+sends is ignored. The socket closes with :data:`CLOSE_SESSION_INVALID` when
+the session is unknown, expired, revoked or switched to another character.
+"""
+
+import asyncio
+from contextlib import suppress
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+
+from mud_server.api.auth import validate_session_for_game_async
+from mud_server.api.room_push import REVALIDATE, RoomSubscriber, room_push_hub
+from mud_server.core.bus import MudBus
+from mud_server.db import facade as database
+from mud_server.db.errors import DatabaseError
+
+CLOSE_SESSION_INVALID = 4401
+"""Application close code: re-authenticate instead of reconnecting."""
+
+KEEPALIVE_SECONDS = 30.0
+"""Idle interval between session re-validations and ``ping`` frames."""
+
+router = APIRouter()
+
+
+async def _receive_until_closed(websocket: WebSocket) -> None:
+    """Discard client frames until the client disconnects."""
+    with suppress(WebSocketDisconnect):
+        while True:
+            await websocket.receive_text()
+
+
+async def _session_still_valid(subscriber: RoomSubscriber) -> bool:
+    """Return False when the socket's session no longer plays the same character."""
+    try:
+        _, _, _, character_id, _, world_id = await validate_session_for_game_async(
+            subscriber.session_id
+        )
+    except HTTPException as exc:
+        # A store outage is not a revocation; keep the socket and retry later.
+        return exc.status_code >= 500
+    return character_id == subscriber.character_id and world_id == subscriber.world_id
+
+
+@router.websocket("/ws/{session_id}")
+async def room_push(websocket: WebSocket, session_id: str):
+    """Stream room chat and presence for the session's character."""
+    try:
+        (
+            user_id,
+            username,
+            _,
+            character_id,
+            character_name,
+            world_id,
+        ) = await validate_session_for_game_async(session_id)
+        room_id = await database.get_character_room_async(character_name, world_id=world_id)
+    except (HTTPException, DatabaseError):
+        await websocket.close(code=CLOSE_SESSION_INVALID)
+        return
+
+    await websocket.accept()
+    room_push_hub.attach(MudBus())
+    subscriber = room_push_hub.subscribe(
+        session_id=session_id,
+        user_id=user_id,
+        username=username,
+        character_id=character_id,
+        character_name=character_name,
+        world_id=world_id,
+        room_id=room_id,
+    )
+    closed = asyncio.create_task(_receive_until_closed(websocket))
+    try:
+        await websocket.send_json({"type": "room", "room": room_id})
+        while not closed.done():
+            next_item = asyncio.create_task(subscriber.queue.get())
+            done, _ = await asyncio.wait(
+                {next_item, closed},
+                timeout=KEEPALIVE_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if next_item not in done:
+                next_item.cancel()
+                if closed in done:
+                    break
+                if not await _session_still_valid(subscriber):
+                    await websocket.close(code=CLOSE_SESSION_INVALID)
+                    break
+                await websocket.send_json({"type": "ping"})
+                continue
+
+            payload = next_item.result()
+            if payload is REVALIDATE:
+                if not await _session_still_valid(subscriber):
+                    await websocket.close(code=CLOSE_SESSION_INVALID)
+                    break
+                continue
+            await websocket.send_json(payload)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        room_push_hub.unsubscribe(subscriber)
+        closed.cancel()
+        with suppress(asyncio.CancelledError):
+            await closed
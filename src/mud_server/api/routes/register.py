@@ -7,7 +7,18 @@ splitting implementation into focused router modules.
 
 from fastapi import FastAPI
 
-from mud_server.api.routes import admin, auth, game, health, lab, ollama, pipeline, policies, policy
+from mud_server.api.routes import (
+    admin,
+    auth,
+    game,
+    health,
+    lab,
+    ollama,
+    pipeline,
+    policies,
+    policy,
+    push,
+)
 from mud_server.core.engine import GameEngine
 
 
@@ -15,7 +26,7 @@ def register_routes(app: FastAPI, engine: GameEngine) -> None:
     """Register all API routes with the FastAPI app.
 
     Registration order is intentional:
-    - baseline auth/game/admin/lab routes first for existing clients
+    - baseline auth/game/push/admin/lab routes first for existing clients
     - pipeline routes after base modules to keep new primitives additive
 
     Args:
@@ -25,6 +36,8 @@ def register_routes(app: FastAPI, engine: GameEngine) -> None:
     app.include_router(health.router)
     app.include_router(auth.router(engine))
     app.include_router(game.router(engine))
+    # WebSocket room push (/ws/{session_id}) for play clients.
+    app.include_router(push.router)
     app.include_router(admin.router(engine))
     app.include_router(ollama.router(engine))
     app.include_router(lab.router(engine))
@@ -24,6 +24,7 @@ Configuration:
 
 import asyncio
 import socket
+import sqlite3
 from contextlib import asynccontextmanager, suppress
 from copy import deepcopy
 from typing import Any
@@ -34,8 +35,19 @@ from fastapi.middleware.cors import CORSMiddleware
 from mud_server import __version__
 from mud_server.api.routes.register import register_routes
 from mud_server.config import config, print_config_summary
+from mud_server.core.deferred_translation import shutdown_deferred_translator
 from mud_server.core.engine import GameEngine
+from mud_server.core.executor import shutdown_engine_executor
+from mud_server.core.sweeper import SweepReport, sweep_expired_rows
+from mud_server.core.warmup import WarmupReport, warm_up_worlds, warmup_state
 from mud_server.db import facade as database
+from mud_server.db.async_connection import close_async_connection_pool
+from mud_server.db.connection import (
+    checkpoint_wal,
+    close_connection_pool,
+    resolve_sqlite_profile,
+)
+from mud_server.db.errors import DatabaseError
 from mud_server.web.routes import ADMIN_ASSET_VERSION, register_web_routes
 
 # Prefix all server-process log lines so tmux panes are identifiable at a glance.
@@ -79,41 +91,142 @@ async def lifespan(app: FastAPI):
     Handle server startup and shutdown tasks.
 
     Startup:
-        - Clears any stale sessions from previous runs to ensure a clean state.
-        - These may exist if the server crashed or was killed without proper shutdown.
+        - Sweeps expired sessions and guest accounts left by previous runs
+          (e.g. after a crash) so stale tokens cannot be reused.
+
+    Background:
+        - Warms up worlds once (``server.warmup_parallelism`` at a time):
+          bootstraps every world's axis policy, builds every active world and
+          prints per-world timings. ``/health`` reports ``ready`` when done.
+        - Sweeps expired sessions and guest accounts every
+          ``session.sweep_interval_seconds`` in chunks of
+          ``session.sweep_chunk_size`` rows per transaction.
+        - Runs a PASSIVE WAL checkpoint every
+          ``database.checkpoint_interval_seconds`` so the WAL file stays small
+          without stalling readers or writers.
+        - Flushes buffered session activity every
+          ``session.activity_flush_seconds`` in one batched transaction.
 
     Shutdown:
-        - Currently no cleanup needed (sessions cleared on next startup).
+        - Stops background tasks, the engine worker pool and the deferred
+          translator, closes async Ollama clients, writes any buffered
+          session activity, truncates the WAL, and closes pooled SQLite
+          connections (sync and aiosqlite).
     """
-    # Startup: Remove expired sessions so stale tokens cannot be reused
-    removed = database.cleanup_expired_sessions()
-    if removed > 0:
-        _service_info(f"Removed {removed} expired session(s) from previous run")
-
-    # Startup: Delete expired guest accounts.
-    removed_visitors = database.cleanup_expired_guest_accounts()
-    if removed_visitors > 0:
-        _service_info(f"Deleted {removed_visitors} expired guest account(s) on startup")
+    sweep_chunk_size = config.session.sweep_chunk_size
+
+    def report_sweep(report: SweepReport, when: str) -> None:
+        """Log rows purged and time spent by one sweep, if it removed anything."""
+        if report.rows_removed > 0:
+            _service_info(
+                f"Sweep {when}: removed {report.sessions_removed} expired session(s) and "
+                f"{report.guest_accounts_removed} guest account(s) in "
+                f"{report.elapsed_seconds * 1000:.1f} ms ({report.chunks} chunk(s))"
+            )
+
+    # Startup: Remove expired sessions/guests so stale tokens cannot be reused
+    report_sweep(await sweep_expired_rows(chunk_size=sweep_chunk_size), "on startup")
     _service_info(f"Admin WebUI asset version: {ADMIN_ASSET_VERSION}")
 
-    async def temporary_account_sweeper() -> None:
-        """Periodic cleanup for expired guest accounts."""
+    def report_warmup(report: WarmupReport) -> None:
+        """Log per-world policy and load timings from one warm-up run."""
+        for world in report.worlds:
+            if world.error is not None:
+                _service_info(f"Warm-up failed for world {world.world_id}: {world.error}")
+                continue
+            load = (
+                f"load {world.load_seconds * 1000:.1f} ms"
+                if world.load_seconds is not None
+                else "inactive, not loaded"
+            )
+            _service_info(
+                f"Warmed up world {world.world_id}: policy "
+                f"{world.policy_seconds * 1000:.1f} ms, {load}"
+            )
+        _service_info(
+            f"World warm-up complete: {len(report.worlds)} world(s) in "
+            f"{report.elapsed_seconds * 1000:.1f} ms ({len(report.failed)} failed)"
+        )
+
+    async def world_warmer(parallelism: int) -> None:
+        """One-shot parallel warm-up of world policies and worlds."""
+        report = await asyncio.to_thread(warm_up_worlds, engine, parallelism=parallelism)
+        report_warmup(report)
+        warmup_state.mark_ready(report)
+
+    async def expired_row_sweeper(interval_seconds: int) -> None:
+        """Periodic chunked purge of expired sessions and guest accounts."""
         while True:
-            await asyncio.sleep(24 * 60 * 60)
-            removed_temp = database.cleanup_expired_guest_accounts()
-            if removed_temp > 0:
-                _service_info(f"Deleted {removed_temp} expired guest account(s)")
-
-    sweeper_task = asyncio.create_task(temporary_account_sweeper())
+            await asyncio.sleep(interval_seconds)
+            try:
+                report = await sweep_expired_rows(chunk_size=sweep_chunk_size)
+            except DatabaseError as exc:
+                _service_info(f"Sweep failed: {exc}")
+                continue
+            report_sweep(report, "complete")
+
+    async def wal_checkpointer(interval_seconds: int) -> None:
+        """Periodic PASSIVE checkpoint off the event loop."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                result = await asyncio.to_thread(checkpoint_wal, "PASSIVE")
+            except sqlite3.Error as exc:
+                _service_info(f"WAL checkpoint failed: {exc}")
+                continue
+            if result.busy:
+                _service_info(
+                    f"WAL checkpoint busy ({result.checkpointed_frames}/"
+                    f"{result.log_frames} frames copied)"
+                )
+
+    async def session_activity_flusher(interval_seconds: int) -> None:
+        """Periodic write-behind flush of session activity off the event loop."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(database.flush_session_activity)
+            except DatabaseError as exc:
+                _service_info(f"Session activity flush failed: {exc}")
+
+    background_tasks = []
+    warmup_state.reset()
+    warmup_parallelism = config.server.warmup_parallelism
+    if warmup_parallelism > 0:
+        background_tasks.append(asyncio.create_task(world_warmer(warmup_parallelism)))
+    else:
+        warmup_state.mark_ready()
+    sweep_interval = config.session.sweep_interval_seconds
+    if sweep_interval > 0:
+        background_tasks.append(asyncio.create_task(expired_row_sweeper(sweep_interval)))
+    activity_interval = config.session.activity_flush_seconds
+    if activity_interval > 0:
+        background_tasks.append(asyncio.create_task(session_activity_flusher(activity_interval)))
+    wal_enabled = resolve_sqlite_profile().journal_mode == "wal"
+    interval = config.database.checkpoint_interval_seconds
+    if wal_enabled and interval > 0:
+        background_tasks.append(asyncio.create_task(wal_checkpointer(interval)))
 
     try:
         yield  # Server runs here
     finally:
-        sweeper_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await sweeper_task
-
-    # Shutdown: (nothing to do - sessions will be cleared on next startup)
+        for task in background_tasks:
+            task.cancel()
+        for task in background_tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        shutdown_engine_executor()
+        shutdown_deferred_translator()
+        await engine.world_registry.aclose_translation_clients()
+        try:
+            database.flush_session_activity()
+        except DatabaseError as exc:
+            _service_info(f"Session activity flush failed on shutdown: {exc}")
+        await close_async_connection_pool()
+        if wal_enabled:
+            with suppress(sqlite3.Error):
+                checkpoint_wal("TRUNCATE")
+        close_connection_pool()
 
 
 # ============================================================================
@@ -160,7 +273,9 @@ app.add_middleware(
 # - Player actions (movement, inventory, chat)
 # - Database connections for persistence
 # The engine is passed to all route handlers that need game logic
-engine = GameEngine()
+# With warm-up enabled, axis policies are bootstrapped by the lifespan warm-up
+# (in parallel) instead of serially here.
+engine = GameEngine(bootstrap_policies=config.server.warmup_parallelism <= 0)
 
 
 # ============================================================================
@@ -5,6 +5,7 @@ Provides CLI commands for server management:
 - init-db: Initialize the database schema
 - create-superuser: Create a superuser account interactively or via environment variables
 - import-policy-artifact: Import a published artifact into canonical policy DB rows
+- compile-worlds: Prebuild compiled world snapshots (e.g. during deploy)
 - run: Start the MUD server (API and web UI)
 
 Usage:
@@ -12,6 +13,7 @@ Usage:
     mud-server init-db --skip-policy-import
     mud-server create-superuser
     mud-server import-policy-artifact --artifact-path PATH
+    mud-server compile-worlds [--world-id WORLD_ID] [--force]
     mud-server run [--port PORT] [--host HOST]
 
 Environment Variables:
@@ -618,6 +620,71 @@ def _run_api_server_on_port(host: str, port: int) -> None:
     start_server(host=host, port=port, auto_discover=False)
 
 
+def cmd_compile_worlds(args: argparse.Namespace) -> int:
+    """
+    Prebuild compiled world snapshots so the first request skips parsing.
+
+    Compiles every world package under ``worlds_root`` (or only the worlds
+    given with ``--world-id``). Snapshots that still match their package are
+    left alone unless ``--force`` is set.
+
+    Returns:
+        0 on success, 1 if any world failed to compile
+    """
+    from pathlib import Path
+
+    from mud_server.config import config
+    from mud_server.core.world_registry import load_world_package
+    from mud_server.core.world_snapshot import load_snapshot, resolve_snapshot_dir, snapshot_path
+    from mud_server.db import facade as database
+
+    snapshot_dir = resolve_snapshot_dir()
+    if snapshot_dir is None:
+        print("World snapshots are disabled ([worlds] snapshots_enabled = false).", file=sys.stderr)
+        return 1
+
+    worlds_root = Path(config.worlds.worlds_root)
+    if args.world_ids:
+        world_ids = [str(world_id).strip() for world_id in args.world_ids]
+    elif worlds_root.is_dir():
+        world_ids = sorted(
+            path.name for path in worlds_root.iterdir() if (path / "world.json").is_file()
+        )
+    else:
+        world_ids = []
+    if not world_ids:
+        print(f"No world packages found under {worlds_root}.")
+        return 0
+
+    # Axis and translation setup read canonical policy state during a load.
+    database.init_database(skip_superuser=True)
+
+    failures = 0
+    for world_id in world_ids:
+        world_root = worlds_root / world_id
+        if not (world_root / "world.json").is_file():
+            failures += 1
+            print(f"World package not found: {world_root}", file=sys.stderr)
+            continue
+        if not args.force and load_snapshot(snapshot_dir, world_root) is not None:
+            print(f"{world_id}: snapshot up to date")
+            continue
+        try:
+            snapshot_path(snapshot_dir, world_id).unlink(missing_ok=True)
+            load_world_package(world_root, snapshot_dir=snapshot_dir)
+        except Exception as exc:
+            failures += 1
+            print(f"{world_id}: failed to load world package: {exc}", file=sys.stderr)
+            continue
+        if load_snapshot(snapshot_dir, world_root) is None:
+            failures += 1
+            print(f"{world_id}: snapshot could not be written to {snapshot_dir}", file=sys.stderr)
+            continue
+        print(f"{world_id}: compiled {snapshot_path(snapshot_dir, world_id)}")
+
+    return 1 if failures else 0
+
+
 def cmd_run(args: argparse.Namespace) -> int:
     """
     Run the MUD server (API + WebUI).
@@ -804,6 +871,28 @@ def main() -> int:
     import_artifact_parser.set_defaults(activate=True)
     import_artifact_parser.set_defaults(func=cmd_import_policy_artifact)
 
+    compile_worlds_parser = subparsers.add_parser(
+        "compile-worlds",
+        help="Prebuild compiled world snapshots",
+        description=(
+            "Parse world packages and write their compiled snapshots to the "
+            "configured snapshot directory, so servers started afterwards load "
+            "each world with a single read."
+        ),
+    )
+    compile_worlds_parser.add_argument(
+        "--world-id",
+        action="append",
+        dest="world_ids",
+        help="World package to compile (repeatable). Defaults to every package.",
+    )
+    compile_worlds_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild snapshots even when they still match their package.",
+    )
+    compile_worlds_parser.set_defaults(func=cmd_compile_worlds)
+
     # run command
     run_parser = subparsers.add_parser(
         "run",
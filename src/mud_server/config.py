@@ -22,14 +22,22 @@ Usage:
 Environment Variable Mapping:
     MUD_HOST           -> server.host
     MUD_PORT           -> server.port
+    MUD_ENGINE_WORKERS -> server.engine_workers
+    MUD_WARMUP_PARALLELISM -> server.warmup_parallelism
     MUD_PRODUCTION     -> security.production
     MUD_CORS_ORIGINS   -> security.cors_origins
     MUD_DB_PATH        -> database.path
+    MUD_DB_POOL_SIZE   -> database.pool_size
+    MUD_DB_PROFILE     -> database.profile
+    MUD_CHAT_ROOM_BUFFER_SIZE -> chat.room_buffer_size
     MUD_LOG_LEVEL      -> logging.level
     MUD_SESSION_TTL_MINUTES         -> session.ttl_minutes
     MUD_SESSION_SLIDING_EXPIRATION  -> session.sliding_expiration
     MUD_SESSION_ALLOW_MULTIPLE      -> session.allow_multiple_sessions
     MUD_SESSION_ACTIVE_WINDOW_MINUTES -> session.active_window_minutes
+    MUD_SESSION_CACHE_TTL_SECONDS   -> session.cache_ttl_seconds
+    MUD_SESSION_ACTIVITY_FLUSH_SECONDS -> session.activity_flush_seconds
+    MUD_SESSION_SWEEP_INTERVAL_SECONDS -> session.sweep_interval_seconds
     MUD_CHAR_DEFAULT_SLOTS          -> characters.default_slots
     MUD_CHAR_MAX_SLOTS              -> characters.max_slots
     MUD_ENTITY_STATE_ENABLED        -> integrations.entity_state_enabled
@@ -45,9 +53,22 @@ Environment Variable Mapping:
     MUD_CHAR_CREATE_DEFAULT_MODE    -> character_creation.default_creation_mode
     MUD_CHAR_CREATE_DEFAULT_NAMING  -> character_creation.default_naming_mode
     MUD_CHAR_CREATE_DEFAULT_SLOT_LIMIT -> character_creation.default_world_slot_limit
+    MUD_WORLD_SNAPSHOTS_ENABLED     -> worlds.snapshots_enabled
+    MUD_WORLD_SNAPSHOT_DIR          -> worlds.snapshot_dir
+    MUD_WORLD_LAZY_ZONES            -> worlds.lazy_zones
+    MUD_WORLD_MAX_LOADED_ZONES      -> worlds.max_loaded_zones
+    MUD_WORLD_MAX_ZONE_MEMORY_MB    -> worlds.max_zone_memory_mb
     MUD_TRANSLATION_ENABLED         -> ollama_translation.enabled
     MUD_TRANSLATION_OLLAMA_URL      -> ollama_translation.base_url
     MUD_TRANSLATION_TIMEOUT         -> ollama_translation.timeout_seconds
+    MUD_TRANSLATION_MODE            -> ollama_translation.mode
+    MUD_TRANSLATION_DEFERRED_WORKERS -> ollama_translation.deferred_workers
+    MUD_TRANSLATION_MAX_CONCURRENCY -> ollama_translation.max_concurrency
+    MUD_TRANSLATION_QUEUE_SIZE      -> ollama_translation.queue_size
+    MUD_TRANSLATION_QUEUE_TIMEOUT   -> ollama_translation.queue_timeout_seconds
+    MUD_TRANSLATION_BREAKER_THRESHOLD -> ollama_translation.breaker_failure_threshold
+    MUD_TRANSLATION_BREAKER_RESET   -> ollama_translation.breaker_reset_seconds
+    MUD_TRANSLATION_BREAKER_PROBES  -> ollama_translation.breaker_half_open_probes
 """
 
 import configparser
@@ -80,6 +101,9 @@ class ServerSettings:
 
     host: str = "0.0.0.0"  # nosec B104 - intentional for server binding
     port: int = 8000
+    engine_workers: int = 8  # Threads running blocking GameEngine calls for async routes
+    engine_world_concurrency: int = 4  # Max in-flight engine calls per world (0 = unbounded)
+    warmup_parallelism: int = 4  # Worlds warmed up at once at startup (0 = load on first use)
 
 
 @dataclass
@@ -102,6 +126,11 @@ class SessionSettings:
     sliding_expiration: bool = True  # Extend expiry on each validated request
     allow_multiple_sessions: bool = False  # False = single session per user
     active_window_minutes: int = 30  # Active if last_activity within this window
+    cache_ttl_seconds: int = 30  # Validated-session cache lifetime (0 disables)
+    cache_max_entries: int = 4096  # LRU bound for the validated-session cache
+    activity_flush_seconds: int = 5  # Write-behind interval for activity (0 = write-through)
+    sweep_interval_seconds: int = 300  # Expired session/guest sweep cadence (0 = startup only)
+    sweep_chunk_size: int = 500  # Rows deleted per sweep transaction
 
 
 @dataclass
@@ -109,6 +138,18 @@ class DatabaseSettings:
     """Database configuration."""
 
     path: str = "data/mud.db"
+    pool_size: int = 8  # Idle connections retained by connection_scope (0 disables)
+    pool_health_check: bool = True  # Ping pooled connections on checkout
+    # Durability/concurrency preset (see ``mud_server.db.connection.SQLITE_PROFILES``).
+    # Individual pragma fields below override the preset when set.
+    profile: Literal["durable", "throughput"] = "durable"
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    cache_size: int | None = None
+    mmap_size: int | None = None
+    temp_store: str | None = None
+    wal_autocheckpoint: int | None = None
+    checkpoint_interval_seconds: int = 300  # Background WAL checkpoint cadence (0 disables)
 
     @property
     def absolute_path(self) -> Path:
@@ -119,6 +160,13 @@ class DatabaseSettings:
         return PROJECT_ROOT / p
 
 
+@dataclass
+class ChatSettings:
+    """Room chat configuration."""
+
+    room_buffer_size: int = 200  # Recent messages cached per room (0 disables)
+
+
 @dataclass
 class LoggingSettings:
     """Logging configuration."""
@@ -221,6 +269,11 @@ class WorldSettings:
     worlds_root: str = "data/worlds"
     default_world_id: str = "pipeworks_web"
     allow_multi_world_characters: bool = False
+    snapshots_enabled: bool = True
+    snapshot_dir: str = ""  # Empty = world_snapshots/ next to the database file
+    lazy_zones: bool = False  # Load zones on first reference instead of at world load
+    max_loaded_zones: int = 0  # Lazy zones kept before idle ones are evicted (0 = no limit)
+    max_zone_memory_mb: int = 0  # Lazy zone file MB kept before eviction (0 = no limit)
 
 
 @dataclass
@@ -248,6 +301,15 @@ class OllamaTranslationSettings:
     enabled: bool = True
     base_url: str = "http://localhost:11434"
     timeout_seconds: float = 10.0
+    mode: Literal["sync", "async", "deferred"] = "sync"  # see server.example.ini
+    deferred_workers: int = 2  # background translation threads in deferred mode
+    # Per-endpoint admission control (see translation/guard.py)
+    max_concurrency: int = 2  # Ollama calls in flight per endpoint
+    queue_size: int = 8  # callers allowed to wait for a slot; beyond this → OOC fallback
+    queue_timeout_seconds: float = 5.0  # longest wait for a slot before falling back
+    breaker_failure_threshold: int = 3  # consecutive timeouts/connect errors that open it
+    breaker_reset_seconds: float = 30.0  # open time before half-open probing
+    breaker_half_open_probes: int = 1  # concurrent probe calls while half-open
 
 
 @dataclass
@@ -263,6 +325,7 @@ class ServerConfig:
     security: SecuritySettings = field(default_factory=SecuritySettings)
     session: SessionSettings = field(default_factory=SessionSettings)
     database: DatabaseSettings = field(default_factory=DatabaseSettings)
+    chat: ChatSettings = field(default_factory=ChatSettings)
     logging: LoggingSettings = field(default_factory=LoggingSettings)
     rate_limit: RateLimitSettings = field(default_factory=RateLimitSettings)
     characters: CharacterSettings = field(default_factory=CharacterSettings)
@@ -350,6 +413,36 @@ def _parse_naming_mode(
     return default
 
 
+# Keyword pragma values accepted from config; anything else falls back to the preset.
+_JOURNAL_MODES = {"delete", "truncate", "persist", "memory", "wal", "off"}
+_SYNCHRONOUS_MODES = {"off", "normal", "full", "extra"}
+_TEMP_STORE_MODES = {"default", "file", "memory"}
+_TRANSLATION_MODES = {"sync", "async", "deferred"}
+
+
+def _parse_db_profile(
+    value: str, *, default: Literal["durable", "throughput"]
+) -> Literal["durable", "throughput"]:
+    """Parse the SQLite durability profile name and fallback on invalid values."""
+    normalized = value.strip().lower()
+    if normalized in {"durable", "throughput"}:
+        return normalized  # type: ignore[return-value]
+    return default
+
+
+def _parse_pragma_keyword(value: str, *, allowed: set[str]) -> str | None:
+    """
+    Parse a keyword-valued SQLite pragma override.
+
+    Unknown values return ``None`` so the active profile preset applies instead
+    of interpolating arbitrary text into a ``PRAGMA`` statement.
+    """
+    normalized = value.strip().lower()
+    if normalized in allowed:
+        return normalized
+    return None
+
+
 def _load_from_ini(parser: configparser.ConfigParser, cfg: ServerConfig) -> None:
     """Load configuration from parsed INI file into ServerConfig."""
     # Server section
@@ -358,6 +451,14 @@ def _load_from_ini(parser: configparser.ConfigParser, cfg: ServerConfig) -> None
             cfg.server.host = parser.get("server", "host")
         if parser.has_option("server", "port"):
             cfg.server.port = parser.getint("server", "port")
+        if parser.has_option("server", "engine_workers"):
+            cfg.server.engine_workers = max(1, parser.getint("server", "engine_workers"))
+        if parser.has_option("server", "engine_world_concurrency"):
+            cfg.server.engine_world_concurrency = max(
+                0, parser.getint("server", "engine_world_concurrency")
+            )
+        if parser.has_option("server", "warmup_parallelism"):
+            cfg.server.warmup_parallelism = max(0, parser.getint("server", "warmup_parallelism"))
 
     # Security section
     if parser.has_section("security"):
@@ -396,11 +497,64 @@ def _load_from_ini(parser: configparser.ConfigParser, cfg: ServerConfig) -> None
             )
         if parser.has_option("session", "active_window_minutes"):
             cfg.session.active_window_minutes = parser.getint("session", "active_window_minutes")
+        if parser.has_option("session", "cache_ttl_seconds"):
+            cfg.session.cache_ttl_seconds = max(0, parser.getint("session", "cache_ttl_seconds"))
+        if parser.has_option("session", "cache_max_entries"):
+            cfg.session.cache_max_entries = max(1, parser.getint("session", "cache_max_entries"))
+        if parser.has_option("session", "activity_flush_seconds"):
+            cfg.session.activity_flush_seconds = max(
+                0, parser.getint("session", "activity_flush_seconds")
+            )
+        if parser.has_option("session", "sweep_interval_seconds"):
+            cfg.session.sweep_interval_seconds = max(
+                0, parser.getint("session", "sweep_interval_seconds")
+            )
+        if parser.has_option("session", "sweep_chunk_size"):
+            cfg.session.sweep_chunk_size = max(1, parser.getint("session", "sweep_chunk_size"))
 
     # Database section
     if parser.has_section("database"):
         if parser.has_option("database", "path"):
             cfg.database.path = parser.get("database", "path")
+        if parser.has_option("database", "pool_size"):
+            cfg.database.pool_size = max(0, parser.getint("database", "pool_size"))
+        if parser.has_option("database", "pool_health_check"):
+            cfg.database.pool_health_check = _parse_bool(
+                parser.get("database", "pool_health_check")
+            )
+        if parser.has_option("database", "profile"):
+            cfg.database.profile = _parse_db_profile(
+                parser.get("database", "profile"), default=cfg.database.profile
+            )
+        if parser.has_option("database", "journal_mode"):
+            cfg.database.journal_mode = _parse_pragma_keyword(
+                parser.get("database", "journal_mode"), allowed=_JOURNAL_MODES
+            )
+        if parser.has_option("database", "synchronous"):
+            cfg.database.synchronous = _parse_pragma_keyword(
+                parser.get("database", "synchronous"), allowed=_SYNCHRONOUS_MODES
+            )
+        if parser.has_option("database", "cache_size"):
+            cfg.database.cache_size = parser.getint("database", "cache_size")
+        if parser.has_option("database", "mmap_size"):
+            cfg.database.mmap_size = max(0, parser.getint("database", "mmap_size"))
+        if parser.has_option("database", "temp_store"):
+            cfg.database.temp_store = _parse_pragma_keyword(
+                parser.get("database", "temp_store"), allowed=_TEMP_STORE_MODES
+            )
+        if parser.has_option("database", "wal_autocheckpoint"):
+            cfg.database.wal_autocheckpoint = max(
+                0, parser.getint("database", "wal_autocheckpoint")
+            )
+        if parser.has_option("database", "checkpoint_interval_seconds"):
+            cfg.database.checkpoint_interval_seconds = max(
+                0, parser.getint("database", "checkpoint_interval_seconds")
+            )
+
+    # Chat section
+    if parser.has_section("chat"):
+        if parser.has_option("chat", "room_buffer_size"):
+            cfg.chat.room_buffer_size = max(0, parser.getint("chat", "room_buffer_size"))
 
     # Logging section
     if parser.has_section("logging"):
@@ -480,6 +634,16 @@ def _load_from_ini(parser: configparser.ConfigParser, cfg: ServerConfig) -> None
             cfg.worlds.allow_multi_world_characters = _parse_bool(
                 parser.get("worlds", "allow_multi_world_characters")
             )
+        if parser.has_option("worlds", "snapshots_enabled"):
+            cfg.worlds.snapshots_enabled = _parse_bool(parser.get("worlds", "snapshots_enabled"))
+        if parser.has_option("worlds", "snapshot_dir"):
+            cfg.worlds.snapshot_dir = parser.get("worlds", "snapshot_dir")
+        if parser.has_option("worlds", "lazy_zones"):
+            cfg.worlds.lazy_zones = _parse_bool(parser.get("worlds", "lazy_zones"))
+        if parser.has_option("worlds", "max_loaded_zones"):
+            cfg.worlds.max_loaded_zones = max(0, parser.getint("worlds", "max_loaded_zones"))
+        if parser.has_option("worlds", "max_zone_memory_mb"):
+            cfg.worlds.max_zone_memory_mb = max(0, parser.getint("worlds", "max_zone_memory_mb"))
 
     # Integrations section
     if parser.has_section("integrations"):
@@ -522,6 +686,38 @@ def _load_from_ini(parser: configparser.ConfigParser, cfg: ServerConfig) -> None
             cfg.ollama_translation.timeout_seconds = parser.getfloat(
                 "ollama_translation", "timeout_seconds"
             )
+        if parser.has_option("ollama_translation", "mode"):
+            val = parser.get("ollama_translation", "mode").lower()
+            if val in _TRANSLATION_MODES:
+                cfg.ollama_translation.mode = val  # type: ignore[assignment]
+        if parser.has_option("ollama_translation", "deferred_workers"):
+            cfg.ollama_translation.deferred_workers = max(
+                1, parser.getint("ollama_translation", "deferred_workers")
+            )
+        if parser.has_option("ollama_translation", "max_concurrency"):
+            cfg.ollama_translation.max_concurrency = max(
+                1, parser.getint("ollama_translation", "max_concurrency")
+            )
+        if parser.has_option("ollama_translation", "queue_size"):
+            cfg.ollama_translation.queue_size = max(
+                0, parser.getint("ollama_translation", "queue_size")
+            )
+        if parser.has_option("ollama_translation", "queue_timeout_seconds"):
+            cfg.ollama_translation.queue_timeout_seconds = max(
+                0.0, parser.getfloat("ollama_translation", "queue_timeout_seconds")
+            )
+        if parser.has_option("ollama_translation", "breaker_failure_threshold"):
+            cfg.ollama_translation.breaker_failure_threshold = max(
+                1, parser.getint("ollama_translation", "breaker_failure_threshold")
+            )
+        if parser.has_option("ollama_translation", "breaker_reset_seconds"):
+            cfg.ollama_translation.breaker_reset_seconds = max(
+                0.0, parser.getfloat("ollama_translation", "breaker_reset_seconds")
+            )
+        if parser.has_option("ollama_translation", "breaker_half_open_probes"):
+            cfg.ollama_translation.breaker_half_open_probes = max(
+                1, parser.getint("ollama_translation", "breaker_half_open_probes")
+            )
 
     # Per-world character policy sections:
     #   [world_policy.<world_id>]
@@ -567,6 +763,10 @@ def _apply_env_overrides(cfg: ServerConfig) -> None:
         cfg.server.host = env_host
     if env_port := os.getenv("MUD_PORT"):
         cfg.server.port = int(env_port)
+    if env_engine_workers := os.getenv("MUD_ENGINE_WORKERS"):
+        cfg.server.engine_workers = max(1, int(env_engine_workers))
+    if env_warmup := os.getenv("MUD_WARMUP_PARALLELISM"):
+        cfg.server.warmup_parallelism = max(0, int(env_warmup))
 
     # Security settings
     if env_production := os.getenv("MUD_PRODUCTION"):
@@ -577,6 +777,14 @@ def _apply_env_overrides(cfg: ServerConfig) -> None:
     # Database settings
     if env_db := os.getenv("MUD_DB_PATH"):
         cfg.database.path = env_db
+    if env_db_pool_size := os.getenv("MUD_DB_POOL_SIZE"):
+        cfg.database.pool_size = max(0, int(env_db_pool_size))
+    if env_db_profile := os.getenv("MUD_DB_PROFILE"):
+        cfg.database.profile = _parse_db_profile(env_db_profile, default=cfg.database.profile)
+
+    # Chat settings
+    if env_chat_buffer := os.getenv("MUD_CHAT_ROOM_BUFFER_SIZE"):
+        cfg.chat.room_buffer_size = max(0, int(env_chat_buffer))
 
     # Logging settings
     if env_log := os.getenv("MUD_LOG_LEVEL"):
@@ -591,6 +799,12 @@ def _apply_env_overrides(cfg: ServerConfig) -> None:
         cfg.session.allow_multiple_sessions = _parse_bool(env_allow_multiple)
     if env_active_window := os.getenv("MUD_SESSION_ACTIVE_WINDOW_MINUTES"):
         cfg.session.active_window_minutes = int(env_active_window)
+    if env_session_cache_ttl := os.getenv("MUD_SESSION_CACHE_TTL_SECONDS"):
+        cfg.session.cache_ttl_seconds = max(0, int(env_session_cache_ttl))
+    if env_activity_flush := os.getenv("MUD_SESSION_ACTIVITY_FLUSH_SECONDS"):
+        cfg.session.activity_flush_seconds = max(0, int(env_activity_flush))
+    if env_sweep_interval := os.getenv("MUD_SESSION_SWEEP_INTERVAL_SECONDS"):
+        cfg.session.sweep_interval_seconds = max(0, int(env_sweep_interval))
 
     # Character slots
     if env_default_slots := os.getenv("MUD_CHAR_DEFAULT_SLOTS"):
@@ -630,6 +844,16 @@ def _apply_env_overrides(cfg: ServerConfig) -> None:
         cfg.worlds.default_world_id = env_default_world
     if env_allow_multi_world := os.getenv("MUD_ALLOW_MULTI_WORLD_CHARACTERS"):
         cfg.worlds.allow_multi_world_characters = _parse_bool(env_allow_multi_world)
+    if env_snapshots_enabled := os.getenv("MUD_WORLD_SNAPSHOTS_ENABLED"):
+        cfg.worlds.snapshots_enabled = _parse_bool(env_snapshots_enabled)
+    if env_snapshot_dir := os.getenv("MUD_WORLD_SNAPSHOT_DIR"):
+        cfg.worlds.snapshot_dir = env_snapshot_dir
+    if env_lazy_zones := os.getenv("MUD_WORLD_LAZY_ZONES"):
+        cfg.worlds.lazy_zones = _parse_bool(env_lazy_zones)
+    if env_max_zones := os.getenv("MUD_WORLD_MAX_LOADED_ZONES"):
+        cfg.worlds.max_loaded_zones = max(0, int(env_max_zones))
+    if env_max_zone_mb := os.getenv("MUD_WORLD_MAX_ZONE_MEMORY_MB"):
+        cfg.worlds.max_zone_memory_mb = max(0, int(env_max_zone_mb))
 
     # Integration settings
     if env_entity_enabled := os.getenv("MUD_ENTITY_STATE_ENABLED"):
@@ -654,6 +878,23 @@ def _apply_env_overrides(cfg: ServerConfig) -> None:
         cfg.ollama_translation.base_url = env_translation_url
     if env_translation_timeout := os.getenv("MUD_TRANSLATION_TIMEOUT"):
         cfg.ollama_translation.timeout_seconds = float(env_translation_timeout)
+    if env_translation_mode := os.getenv("MUD_TRANSLATION_MODE"):
+        if env_translation_mode.lower() in _TRANSLATION_MODES:
+            cfg.ollama_translation.mode = env_translation_mode.lower()  # type: ignore[assignment]
+    if env_deferred_workers := os.getenv("MUD_TRANSLATION_DEFERRED_WORKERS"):
+        cfg.ollama_translation.deferred_workers = max(1, int(env_deferred_workers))
+    if env_max_concurrency := os.getenv("MUD_TRANSLATION_MAX_CONCURRENCY"):
+        cfg.ollama_translation.max_concurrency = max(1, int(env_max_concurrency))
+    if env_queue_size := os.getenv("MUD_TRANSLATION_QUEUE_SIZE"):
+        cfg.ollama_translation.queue_size = max(0, int(env_queue_size))
+    if env_queue_timeout := os.getenv("MUD_TRANSLATION_QUEUE_TIMEOUT"):
+        cfg.ollama_translation.queue_timeout_seconds = max(0.0, float(env_queue_timeout))
+    if env_breaker_threshold := os.getenv("MUD_TRANSLATION_BREAKER_THRESHOLD"):
+        cfg.ollama_translation.breaker_failure_threshold = max(1, int(env_breaker_threshold))
+    if env_breaker_reset := os.getenv("MUD_TRANSLATION_BREAKER_RESET"):
+        cfg.ollama_translation.breaker_reset_seconds = max(0.0, float(env_breaker_reset))
+    if env_breaker_probes := os.getenv("MUD_TRANSLATION_BREAKER_PROBES"):
+        cfg.ollama_translation.breaker_half_open_probes = max(1, int(env_breaker_probes))
 
 
 def load_config() -> ServerConfig:
@@ -771,15 +1012,31 @@ def print_config_summary(
     print(f"Server:      {effective_host}:{effective_port}")
     print(f"Listener:    {listener_mode}")
     print(f"Access:      {access_guidance}")
+    print(
+        f"Engine pool: workers={config.server.engine_workers} "
+        f"per_world={config.server.engine_world_concurrency}"
+    )
     print(f"Production:  {config.is_production}")
     print(f"CORS origins: {config.security.cors_origins}")
     print(f"Docs enabled: {config.docs_should_be_enabled}")
     print(f"Database:    {config.database.absolute_path}")
+    print(f"DB pool:     size={config.database.pool_size}")
+    print(f"DB profile:  {config.database.profile}")
+    print(f"Chat buffer: {config.chat.room_buffer_size} messages/room")
     print(f"Worlds root: {config.worlds.worlds_root}")
     print(f"Session TTL: {config.session.ttl_minutes} minutes")
     print(f"Sliding Exp: {config.session.sliding_expiration}")
     print(f"Multi-Session: {config.session.allow_multiple_sessions}")
     print(f"Active Window: {config.session.active_window_minutes} minutes")
+    print(
+        f"Session Cache: ttl={config.session.cache_ttl_seconds}s "
+        f"max_entries={config.session.cache_max_entries}"
+    )
+    print(f"Activity Flush: {config.session.activity_flush_seconds}s")
+    print(
+        f"Expiry Sweep: every {config.session.sweep_interval_seconds}s "
+        f"chunk={config.session.sweep_chunk_size}"
+    )
     print(
         "Registration: "
         f"mode={config.registration.account_registration_mode} "
@@ -809,7 +1066,9 @@ def print_config_summary(
         f"Translation: enabled={config.ollama_translation.enabled} "
         "provider=host-ollama "
         f"url={config.ollama_translation.base_url} "
-        f"timeout={config.ollama_translation.timeout_seconds}s"
+        f"timeout={config.ollama_translation.timeout_seconds}s "
+        f"mode={config.ollama_translation.mode} "
+        f"max_concurrency={config.ollama_translation.max_concurrency}"
     )
     print("=" * 60 + "\n")
 
@@ -79,6 +79,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from collections import deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
@@ -105,6 +106,20 @@ EventHandler = SyncHandler | AsyncHandler
 Unsubscribe = Callable[[], None]
 
 
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the event loop running on this thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _resolve_future(future: asyncio.Future[MudEvent], event: MudEvent) -> None:
+    """Complete a wait_for() future unless it was cancelled or timed out."""
+    if not future.done():
+        future.set_result(event)
+
+
 # =============================================================================
 # EVENT METADATA
 # =============================================================================
@@ -247,9 +262,13 @@ class MudBus:
     - Simplifies testing (reset_for_testing method)
 
     Thread Safety:
-    - The current implementation is NOT thread-safe
-    - This is intentional - the MUD server is single-threaded with async
-    - If threading is added later, this class will need locks
+    - Engine commands run on EngineExecutor worker threads, so emit() may be
+      called from several threads at once
+    - emit() and subscription changes are serialized by a re-entrant lock:
+      sequence numbers, log order and handler delivery order always agree,
+      and a handler may emit follow-up events
+    - Sync handlers run on the emitting thread; handlers that touch the event
+      loop must hand off with loop.call_soon_threadsafe()
 
     Key Methods:
     - emit(): Record an event (synchronous, returns committed event)
@@ -334,6 +353,13 @@ class MudBus:
         # When True, logs all emit/subscribe/unsubscribe operations
         self.debug: bool = False
 
+        # =====================================================================
+        # LOCK
+        # =====================================================================
+        # Engine calls emit from worker threads. Re-entrant so a handler can
+        # emit a follow-up event without deadlocking.
+        self._lock = threading.RLock()
+
         # Mark as initialized
         MudBus._initialized = True
         logger.info("MUD Bus initialized")
@@ -385,48 +411,49 @@ class MudBus:
 
             print(event._meta.sequence)  # e.g., 42
         """
-        # =====================================================================
-        # STEP 1: INCREMENT SEQUENCE (deterministic ordering)
-        # =====================================================================
-        # This happens FIRST, before anything else
-        # The sequence number is the source of truth for event order
-        self._sequence += 1
-        current_sequence = self._sequence
-
-        # =====================================================================
-        # STEP 2: CREATE IMMUTABLE EVENT
-        # =====================================================================
-        # The event is frozen (immutable) from this point forward
-        # detail defaults to empty dict if None
-        event = MudEvent(
-            type=event_type,
-            detail=detail if detail is not None else {},
-            _meta=EventMetadata.create(source, current_sequence),
-        )
-
-        # =====================================================================
-        # STEP 3: COMMIT TO LOG (point of no return)
-        # =====================================================================
-        # Once this line executes, the event is part of history
-        # It will appear in get_event_log() and can never be removed
-        self._event_log.append(event)
-
-        if self.debug:
-            logger.debug(f"EMIT [{current_sequence}]: {event.type} from {source}")
-
-        # =====================================================================
-        # STEP 4: NOTIFY HANDLERS
-        # =====================================================================
-        # Handlers are notified in registration order (deterministic)
-        # Sync handlers execute immediately
-        # Async handlers are scheduled for later execution
-        self._notify_handlers(event)
+        with self._lock:
+            # =================================================================
+            # STEP 1: INCREMENT SEQUENCE (deterministic ordering)
+            # =================================================================
+            # This happens FIRST, before anything else
+            # The sequence number is the source of truth for event order
+            self._sequence += 1
+            current_sequence = self._sequence
+
+            # =================================================================
+            # STEP 2: CREATE IMMUTABLE EVENT
+            # =================================================================
+            # The event is frozen (immutable) from this point forward
+            # detail defaults to empty dict if None
+            event = MudEvent(
+                type=event_type,
+                detail=detail if detail is not None else {},
+                _meta=EventMetadata.create(source, current_sequence),
+            )
 
-        # =====================================================================
-        # STEP 5: RESOLVE WAIT PROMISES
-        # =====================================================================
-        # If any async code is waiting for this event type, resolve their futures
-        self._resolve_wait_promises(event)
+            # =================================================================
+            # STEP 3: COMMIT TO LOG (point of no return)
+            # =================================================================
+            # Once this line executes, the event is part of history
+            # It will appear in get_event_log() and can never be removed
+            self._event_log.append(event)
+
+            if self.debug:
+                logger.debug(f"EMIT [{current_sequence}]: {event.type} from {source}")
+
+            # =================================================================
+            # STEP 4: NOTIFY HANDLERS
+            # =================================================================
+            # Handlers are notified in registration order (deterministic)
+            # Sync handlers execute immediately
+            # Async handlers are scheduled for later execution
+            self._notify_handlers(event)
+
+            # =================================================================
+            # STEP 5: RESOLVE WAIT PROMISES
+            # =================================================================
+            # If any async code is waiting for this event type, resolve their futures
+            self._resolve_wait_promises(event)
 
         # =====================================================================
         # RETURN THE COMMITTED EVENT
@@ -457,8 +484,9 @@ class MudBus:
         if event.type not in self._handlers:
             return
 
-        # Iterate in registration order
-        for handler in self._handlers[event.type]:
+        # Iterate in registration order over a snapshot, so handlers that
+        # unsubscribe (e.g. once()) do not shift the list mid-iteration
+        for handler in tuple(self._handlers[event.type]):
             try:
                 if asyncio.iscoroutinefunction(handler):
                     # Async handler - schedule for execution
@@ -514,10 +542,14 @@ class MudBus:
         if event.type not in self._wait_promises:
             return
 
-        # Resolve all waiting futures
+        # Resolve all waiting futures. Futures belong to the loop that called
+        # wait_for(); resolve them on that loop when emitting from a worker.
         for future in self._wait_promises[event.type]:
-            if not future.done():
-                future.set_result(event)
+            loop = future.get_loop()
+            if _running_loop() is loop:
+                _resolve_future(future, event)
+            else:
+                loop.call_soon_threadsafe(_resolve_future, future, event)
 
         # Clear the list - these promises are now resolved
         del self._wait_promises[event.type]
@@ -555,28 +587,30 @@ class MudBus:
             # Later, when done listening:
             unsub()
         """
-        # Create handler list for this event type if it doesn't exist
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
+        with self._lock:
+            # Create handler list for this event type if it doesn't exist
+            if event_type not in self._handlers:
+                self._handlers[event_type] = []
 
-        # Add handler to the list (preserves order)
-        self._handlers[event_type].append(handler)
+            # Add handler to the list (preserves order)
+            self._handlers[event_type].append(handler)
 
-        if self.debug:
-            count = len(self._handlers[event_type])
-            logger.debug(f"SUBSCRIBE: '{event_type}' (total handlers: {count})")
+            if self.debug:
+                count = len(self._handlers[event_type])
+                logger.debug(f"SUBSCRIBE: '{event_type}' (total handlers: {count})")
 
         # Return unsubscribe function
         def unsubscribe() -> None:
             """Remove this handler from the subscription list."""
-            if event_type in self._handlers:
-                try:
-                    self._handlers[event_type].remove(handler)
-                    if self.debug:
-                        logger.debug(f"UNSUBSCRIBE: '{event_type}'")
-                except ValueError:
-                    # Handler already removed, ignore
-                    pass
+            with self._lock:
+                if event_type in self._handlers:
+                    try:
+                        self._handlers[event_type].remove(handler)
+                        if self.debug:
+                            logger.debug(f"UNSUBSCRIBE: '{event_type}'")
+                    except ValueError:
+                        # Handler already removed, ignore
+                        pass
 
         return unsubscribe
 
@@ -664,9 +698,10 @@ class MudBus:
         future: asyncio.Future[MudEvent] = loop.create_future()
 
         # Register the future
-        if event_type not in self._wait_promises:
-            self._wait_promises[event_type] = []
-        self._wait_promises[event_type].append(future)
+        with self._lock:
+            if event_type not in self._wait_promises:
+                self._wait_promises[event_type] = []
+            self._wait_promises[event_type].append(future)
 
         # Wait for the future, with optional timeout
         if timeout_ms is not None:
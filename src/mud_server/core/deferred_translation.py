@@ -0,0 +1,165 @@
+"""Background OOC→IC upgrade of chat that was stored before translating.
+
+With ``[ollama_translation] mode = deferred`` a say, yell or whisper does not
+wait for Ollama. The engine prepares the translation (profile and prompt, read
+in the command's own unit of work), stores and announces the escaped OOC text,
+and hands a :class:`DeferredTranslation` to :class:`DeferredTranslator`. A
+worker thread then:
+
+1. calls Ollama through the world's blocking renderer,
+2. validates the reply, which emits the ``chat.translation`` ledger event
+   exactly as the blocking path does (success or fallback),
+3. on success rewrites the stored row(s) and emits ``CHAT_TRANSLATED``.
+
+On any failure the rows simply keep the OOC text they were stored with, so
+command latency no longer depends on LLM latency and a slow or absent model
+costs nothing but the upgrade.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mud_server.core.bus import MudBus
+from mud_server.core.events import Events
+from mud_server.db import facade as database
+
+if TYPE_CHECKING:
+    from mud_server.translation.service import OOCToICTranslationService, PreparedTranslation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class DeferredTranslation:
+    """One stored message waiting for its in-character text.
+
+    Attributes:
+        world_id: World the message was spoken in.
+        service: The world's translation service.
+        prepared: Translation prepared while the command ran.
+        speaker: Speaking character.
+        channel: ``"say"``, ``"yell"`` or ``"whisper"``.
+        room: Speaker's room.
+        rows: Stored row id per room that received the message.
+        target: Whisper recipient, ``None`` otherwise.
+        stored_text: Builds the stored text from IC dialogue (sanitizing and
+            adding the channel prefix, as the blocking path does).
+    """
+
+    world_id: str
+    service: OOCToICTranslationService
+    prepared: PreparedTranslation
+    speaker: str
+    channel: str
+    room: str
+    rows: dict[str, int]
+    target: str | None
+    stored_text: Callable[[str], str]
+
+
+class DeferredTranslator:
+    """Thread pool that renders deferred translations and patches their rows."""
+
+    def __init__(self, *, max_workers: int) -> None:
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="deferred-translation"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs submitted but not yet finished."""
+        with self._lock:
+            return self._pending
+
+    def submit(self, job: DeferredTranslation) -> None:
+        """Queue ``job``; it is dropped (OOC text kept) if the pool is shut down."""
+        with self._lock:
+            self._pending += 1
+        try:
+            self._pool.submit(self._run, job)
+        except RuntimeError:
+            with self._lock:
+                self._pending -= 1
+            logger.warning("Deferred translation dropped: translator is shut down")
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Stop accepting jobs; queued ones are cancelled unless ``wait``."""
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _run(self, job: DeferredTranslation) -> None:
+        try:
+            translate(job)
+        except Exception:
+            logger.exception("Deferred translation failed for %s in %s", job.speaker, job.world_id)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+def translate(job: DeferredTranslation) -> bool:
+    """Render, validate and apply one job; return whether the rows were upgraded."""
+    ic_raw = job.service.render(job.prepared)
+    ic_text = job.service.finish_translation(job.prepared, ic_raw)
+    if ic_text is None:
+        return False
+
+    message = job.stored_text(ic_text)
+    # Outside a unit of work the update commits before the event is emitted,
+    # so listeners that re-read chat_messages see the new text.
+    database.update_chat_messages(list(job.rows.values()), message, world_id=job.world_id)
+    MudBus().emit(
+        Events.CHAT_TRANSLATED,
+        {
+            "username": job.speaker,
+            "channel": job.channel,
+            "message": message,
+            "message_ids": list(job.rows.values()),
+            "room": job.room,
+            "rooms": list(job.rows),
+            "target": job.target,
+            "world_id": job.world_id,
+        },
+    )
+    return True
+
+
+_active_translator: DeferredTranslator | None = None
+_active_translator_lock = threading.Lock()
+
+
+def get_deferred_translator() -> DeferredTranslator:
+    """Return the process-wide translator for ``ollama_translation.deferred_workers``.
+
+    When the setting changes the previous translator is shut down (without
+    waiting) and replaced.
+    """
+    global _active_translator
+    from mud_server.config import config
+
+    workers = max(1, config.ollama_translation.deferred_workers)
+    with _active_translator_lock:
+        translator = _active_translator
+        if translator is not None and translator.max_workers == workers:
+            return translator
+        _active_translator = DeferredTranslator(max_workers=workers)
+    if translator is not None:
+        translator.shutdown()
+    return _active_translator
+
+
+def shutdown_deferred_translator(*, wait: bool = False) -> None:
+    """Shut down and forget the process-wide translator (shutdown/tests)."""
+    global _active_translator
+    with _active_translator_lock:
+        translator, _active_translator = _active_translator, None
+    if translator is not None:
+        translator.shutdown(wait=wait)
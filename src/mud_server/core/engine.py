@@ -29,15 +29,22 @@ Architecture:
 
 import html
 import logging
-from typing import Any, cast
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
 
 from mud_server.core.bus import MudBus
+from mud_server.core.deferred_translation import DeferredTranslation, get_deferred_translator
 from mud_server.core.events import Events
+from mud_server.core.executor import get_engine_executor
 from mud_server.core.world import World
 from mud_server.core.world_registry import WorldRegistry
 from mud_server.db import facade as database
 from mud_server.services.policy.types import AxisPolicyValidationReport
 
+if TYPE_CHECKING:
+    from mud_server.translation.service import PreparedTranslation
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,6 +86,49 @@ def sanitize_chat_message(message: str) -> str:
     return html.escape(message)
 
 
+@dataclass(slots=True)
+class _ChatDraft:
+    """A say/yell/whisper that passed validation and awaits its final text.
+
+    Built by the ``_begin_*`` chat phases and consumed by the matching
+    ``_deliver_*`` phase once the message has been translated and sanitized.
+
+    Attributes:
+        world: World the message is spoken in.
+        world_id: World id.
+        speaker: Resolved speaking character.
+        channel: ``"say"``, ``"yell"`` or ``"whisper"``.
+        message: Raw OOC text.
+        room: Speaker's room.
+        ipc_hash: Axis interaction hash, or ``None``.
+        target: Resolved whisper recipient.
+        target_label: Whisper recipient as typed by the speaker.
+        prepared: Translation prepared for the async or deferred path, if any.
+        stored_rows: Row id per room, collected by ``_deliver_*`` when the
+            translation is deferred (``None`` otherwise).
+    """
+
+    world: World
+    world_id: str
+    speaker: str
+    channel: str
+    message: str
+    room: str
+    ipc_hash: str | None
+    target: str | None = None
+    target_label: str | None = None
+    prepared: "PreparedTranslation | None" = None
+    stored_rows: dict[str, int] | None = None
+
+    def stored_text(self, safe_message: str) -> str:
+        """Return the stored form of a sanitized message (channel prefix added)."""
+        if self.channel == "yell":
+            return f"[YELL] {safe_message}"
+        if self.channel == "whisper":
+            return f"[WHISPER: {self.speaker} → {self.target_label}] {safe_message}"
+        return safe_message
+
+
 class GameEngine:
     """
     Main game engine managing all game logic and mechanics.
@@ -105,13 +155,18 @@ class GameEngine:
         - All game state is persisted to database immediately
     """
 
-    def __init__(self):
+    def __init__(self, *, bootstrap_policies: bool = True):
         """
         Initialize the game engine.
 
         Loads the world data from JSON and initializes the database schema.
         This is called once when the server starts.
 
+        Args:
+            bootstrap_policies: Bootstrap axis policies for every world now.
+                The server passes False when its startup warm-up
+                (:mod:`mud_server.core.warmup`) does this in parallel.
+
         Side Effects:
             - Loads world_data.json into memory
             - Creates database tables if they don't exist
@@ -126,7 +181,8 @@ class GameEngine:
         # Load and validate axis policies, then seed registry tables.
         # This ensures policy readiness is surfaced at startup, and the
         # database mirrors the world-defined axis vocabulary.
-        self._bootstrap_axis_policies()
+        if bootstrap_policies:
+            self._bootstrap_axis_policies()
 
     def _bootstrap_axis_policies(self) -> None:
         """
@@ -134,12 +190,13 @@ class GameEngine:
 
         This is a startup-only routine. It validates canonical activation-driven
         axis policy readiness and keeps the axis registry tables in sync with
-        the effective canonical bundle.
+        the effective canonical bundle. Worlds are bootstrapped one after
+        another; the server's startup warm-up (:mod:`mud_server.core.warmup`)
+        runs :meth:`_bootstrap_world_axis_policy` for several worlds at once
+        instead.
         """
         import logging
 
-        from mud_server.services import policy_service
-
         logger = logging.getLogger(__name__)
 
         # Gather all worlds (including inactive) so policy issues are visible.
@@ -154,60 +211,75 @@ class GameEngine:
                 # Defensive guard: malformed world rows should not block startup.
                 logger.warning("Axis policy bootstrap skipped malformed world row: %s", world)
                 continue
+            self._bootstrap_world_axis_policy(world_id)
 
-            try:
-                resolved_bundle = policy_service.resolve_effective_axis_bundle(
-                    scope=policy_service.ActivationScope(world_id=world_id, client_profile="")
-                )
-                axes_payload = resolved_bundle.axes_payload
-                thresholds_payload = resolved_bundle.thresholds_payload
-                policy_hash = resolved_bundle.policy_hash
-                bundle_version = resolved_bundle.bundle_version
-            except policy_service.PolicyServiceError as exc:
-                if exc.code in {
-                    "POLICY_EFFECTIVE_MANIFEST_NOT_FOUND",
-                    "POLICY_EFFECTIVE_AXIS_BUNDLE_NOT_FOUND",
-                }:
-                    logger.warning(
-                        "Axis policy bootstrap skipped for %s: no effective canonical "
-                        "axis/manifest activation was found. Runtime startup continues, but "
-                        "policy-backed axis features stay unavailable until canonical state "
-                        "is imported. Run "
-                        "'mud-server import-policy-artifact --artifact-path <publish_manifest.json>' "
-                        "or ensure init-db artifact bootstrap has completed for world %s "
-                        "before runtime startup.",
-                        world_id,
-                        world_id,
-                    )
-                    continue
-                else:
-                    logger.warning(
-                        "Axis policy bootstrap skipped for %s: %s (%s)",
-                        world_id,
-                        exc.detail,
-                        exc.code,
-                    )
-                    continue
-
-            payload, report = self._build_axis_policy_report_from_canonical_bundle(
-                world_id=world_id,
-                axes_payload=axes_payload,
-                thresholds_payload=thresholds_payload,
-                policy_hash=policy_hash,
-                version=bundle_version,
-            )
-            self._log_axis_policy_report(logger, report)
+    def _bootstrap_world_axis_policy(self, world_id: str) -> None:
+        """
+        Validate one world's canonical axis policy and seed its registry tables.
 
-            if not report.axes:
-                logger.warning("Axis registry seeding skipped for %s: no axes defined.", world_id)
-                continue
+        Missing or invalid canonical state is logged and skipped, never raised.
 
-            stats = database.seed_axis_registry(
-                world_id=world_id,
-                axes_payload=payload.get("axes") or {},
-                thresholds_payload=payload.get("thresholds") or {},
+        Args:
+            world_id: World to bootstrap
+        """
+        import logging
+
+        from mud_server.services import policy_service
+
+        logger = logging.getLogger(__name__)
+
+        try:
+            resolved_bundle = policy_service.resolve_effective_axis_bundle(
+                scope=policy_service.ActivationScope(world_id=world_id, client_profile="")
             )
-            logger.info("Axis registry seeded for %s: %s", world_id, stats)
+            axes_payload = resolved_bundle.axes_payload
+            thresholds_payload = resolved_bundle.thresholds_payload
+            policy_hash = resolved_bundle.policy_hash
+            bundle_version = resolved_bundle.bundle_version
+        except policy_service.PolicyServiceError as exc:
+            if exc.code in {
+                "POLICY_EFFECTIVE_MANIFEST_NOT_FOUND",
+                "POLICY_EFFECTIVE_AXIS_BUNDLE_NOT_FOUND",
+            }:
+                logger.warning(
+                    "Axis policy bootstrap skipped for %s: no effective canonical "
+                    "axis/manifest activation was found. Runtime startup continues, but "
+                    "policy-backed axis features stay unavailable until canonical state "
+                    "is imported. Run "
+                    "'mud-server import-policy-artifact --artifact-path <publish_manifest.json>' "
+                    "or ensure init-db artifact bootstrap has completed for world %s "
+                    "before runtime startup.",
+                    world_id,
+                    world_id,
+                )
+            else:
+                logger.warning(
+                    "Axis policy bootstrap skipped for %s: %s (%s)",
+                    world_id,
+                    exc.detail,
+                    exc.code,
+                )
+            return
+
+        payload, report = self._build_axis_policy_report_from_canonical_bundle(
+            world_id=world_id,
+            axes_payload=axes_payload,
+            thresholds_payload=thresholds_payload,
+            policy_hash=policy_hash,
+            version=bundle_version,
+        )
+        self._log_axis_policy_report(logger, report)
+
+        if not report.axes:
+            logger.warning("Axis registry seeding skipped for %s: no axes defined.", world_id)
+            return
+
+        stats = database.seed_axis_registry(
+            world_id=world_id,
+            axes_payload=payload.get("axes") or {},
+            thresholds_payload=payload.get("thresholds") or {},
+        )
+        logger.info("Axis registry seeded for %s: %s", world_id, stats)
 
     @staticmethod
     def _build_axis_policy_report_from_canonical_bundle(
@@ -367,17 +439,16 @@ class GameEngine:
         Handle player movement between rooms.
 
         Validates the move, updates player location in database, and generates
-        appropriate response messages. Also broadcasts movement notifications
-        to other players in the affected rooms (currently stubbed).
+        appropriate response messages. Departure and arrival notices reach the
+        other occupants through ROOM_EXITED / ROOM_ENTERED events.
 
         Movement Process:
         1. Get player's current room from database
         2. Check if move is valid (exit exists, destination valid)
         3. Update player's room in database
         4. Emit PLAYER_MOVED event (the move is now a fact)
-        5. Generate room description for new location
-        6. Broadcast departure message to old room
-        7. Broadcast arrival message to new room
+        5. Emit ROOM_EXITED for the old room and ROOM_ENTERED for the new one
+        6. Generate room description for new location
 
         Args:
             username: Player attempting to move
@@ -395,6 +466,7 @@ class GameEngine:
 
         Events Emitted:
             - PLAYER_MOVED: When movement succeeds
+            - ROOM_EXITED, ROOM_ENTERED: When movement succeeds
             - PLAYER_MOVE_FAILED: When movement fails
 
         Example:
@@ -457,23 +529,24 @@ class GameEngine:
                 "from_room": current_room,
                 "to_room": destination,
                 "direction": direction,
+                "world_id": world_id,
             },
         )
-
-        # Get room description
-        room_desc = world.get_room_description(destination, username, world_id=world_id)
-        message = f"You move {direction}.\n{room_desc}"
-
-        # Movement state changes are authoritative on the event bus.
-        # This broadcast path remains only as a retained no-op compatibility seam.
-        self._emit_deprecated_room_broadcasts(
+        self._emit_room_transition(
             username=username,
-            departure_room=current_room,
+            world_id=world_id,
+            from_room=current_room,
+            to_room=destination,
+            direction=direction,
+            source="movement",
             departure_message=f"{username} leaves {direction}.",
-            destination_room=destination,
             arrival_message=f"{username} arrives from {self._opposite_direction(direction)}.",
         )
 
+        # Get room description
+        room_desc = world.get_room_description(destination, username, world_id=world_id)
+        message = f"You move {direction}.\n{room_desc}"
+
         return True, message
 
     def recall(self, username: str, *, world_id: str) -> tuple[bool, str]:
@@ -497,7 +570,7 @@ class GameEngine:
 
         Side Effects:
             - Updates player's current_room in database
-            - Broadcasts departure/arrival messages (when implemented)
+            - Emits ROOM_EXITED / ROOM_ENTERED with departure/arrival notices
         """
         current_room = database.get_character_room(username, world_id=world_id)
         world = self._get_world(world_id)
@@ -526,11 +599,14 @@ class GameEngine:
         if not database.set_character_room(username, destination, world_id=world_id):
             return False, "Failed to recall."
 
-        self._emit_deprecated_room_broadcasts(
+        self._emit_room_transition(
             username=username,
-            departure_room=current_room,
+            world_id=world_id,
+            from_room=current_room,
+            to_room=destination,
+            direction=None,
+            source="recall",
             departure_message=f"{username} vanishes in a puff of smoke.",
-            destination_room=destination,
             arrival_message=f"{username} appears in a puff of smoke.",
         )
 
@@ -602,6 +678,9 @@ class GameEngine:
         translation_service = world.get_translation_service()
         final_message = message
         if translation_service is not None:
+            # Translation is a slow network call: commit anything the command
+            # has written so far so the SQLite write lock is not held across it.
+            database.commit_unit_of_work()
             ic_text = translation_service.translate(
                 character_name=character_name,
                 ooc_message=message,
@@ -613,20 +692,182 @@ class GameEngine:
 
         return sanitize_chat_message(final_message)
 
-    def _emit_deprecated_room_broadcasts(
+    def _deliver_deferred(
+        self,
+        draft: "_ChatDraft",
+        deliver: Callable[["_ChatDraft", str], tuple[bool, str]],
+    ) -> tuple[bool, str] | None:
+        """Store the OOC text now and queue its translation (``mode = deferred``).
+
+        The translation is prepared in the caller's unit of work, the escaped
+        OOC text is delivered (stored, committed, announced) straight away,
+        and a :class:`DeferredTranslation` is handed to the background
+        translator, which rewrites the rows if Ollama succeeds. Returns
+        ``None`` when translation is not deferred for this world.
+        """
+        from mud_server.config import config
+
+        if config.ollama_translation.mode != "deferred":
+            return None
+        service = draft.world.get_translation_service()
+        if service is None:
+            return None
+
+        draft.prepared = service.prepare_translation(
+            draft.speaker, draft.message, channel=draft.channel, ipc_hash=draft.ipc_hash
+        )
+        draft.stored_rows = {}
+        result = deliver(draft, sanitize_chat_message(draft.message))
+        if result[0] and draft.prepared is not None and draft.stored_rows:
+            get_deferred_translator().submit(
+                DeferredTranslation(
+                    world_id=draft.world_id,
+                    service=service,
+                    prepared=draft.prepared,
+                    speaker=draft.speaker,
+                    channel=draft.channel,
+                    room=draft.room,
+                    rows=dict(draft.stored_rows),
+                    target=draft.target,
+                    stored_text=lambda ic_text: draft.stored_text(sanitize_chat_message(ic_text)),
+                )
+            )
+        return result
+
+    async def _run_chat_async(
+        self,
+        begin: Callable[..., "_ChatDraft | tuple[bool, str]"],
+        deliver: Callable[["_ChatDraft", str], tuple[bool, str]],
+        *args: str,
+        world_id: str,
+    ) -> tuple[bool, str]:
+        """Run one chat command with only the Ollama call on the event loop.
+
+        ``begin`` (validation, axis resolution, translation prompt) and
+        ``deliver`` (validation of the reply, ledger, insert, bus event) each
+        run in their own unit of work on the engine executor; between them
+        the translation is awaited without holding a worker or a per-world
+        slot. Cancelling the awaiting task before ``deliver`` starts stores
+        nothing.
+        """
+        executor = get_engine_executor()
+        draft = await executor.run(
+            world_id, self._begin_chat_async, begin, *args, world_id=world_id
+        )
+        if isinstance(draft, tuple):
+            return draft
+
+        ic_raw = None
+        service = draft.world.get_translation_service()
+        if service is not None and draft.prepared is not None:
+            ic_raw = await service.render_async(draft.prepared)
+        return await executor.run(world_id, self._finish_chat_async, deliver, draft, ic_raw)
+
+    def _begin_chat_async(
+        self,
+        begin: Callable[..., "_ChatDraft | tuple[bool, str]"],
+        *args: str,
+        world_id: str,
+    ) -> "_ChatDraft | tuple[bool, str]":
+        """Worker phase 1: ``begin`` plus the translation's database work."""
+        with database.unit_of_work():
+            draft = begin(*args, world_id=world_id)
+            if isinstance(draft, tuple):
+                return draft
+            service = draft.world.get_translation_service()
+            if service is not None:
+                draft.prepared = service.prepare_translation(
+                    draft.speaker,
+                    draft.message,
+                    channel=draft.channel,
+                    ipc_hash=draft.ipc_hash,
+                )
+            return draft
+
+    def _finish_chat_async(
+        self,
+        deliver: Callable[["_ChatDraft", str], tuple[bool, str]],
+        draft: "_ChatDraft",
+        ic_raw: str | None,
+    ) -> tuple[bool, str]:
+        """Worker phase 2: validate the reply, then ``deliver`` the message."""
+        with database.unit_of_work():
+            final_message = draft.message
+            service = draft.world.get_translation_service()
+            if service is not None and draft.prepared is not None:
+                ic_text = service.finish_translation(draft.prepared, ic_raw)
+                if ic_text is not None:
+                    final_message = ic_text
+            return deliver(draft, sanitize_chat_message(final_message))
+
+    def _emit_room_transition(
         self,
         *,
         username: str,
-        destination_room: str,
+        world_id: str,
+        from_room: str | None,
+        to_room: str,
+        direction: str | None,
+        source: str,
+        departure_message: str,
         arrival_message: str,
-        departure_room: str | None = None,
-        departure_message: str | None = None,
     ) -> None:
-        """Route movement compatibility calls through the deprecated broadcast seam."""
+        """Emit ROOM_EXITED (when leaving a room) then ROOM_ENTERED for a relocation."""
+
+        bus = _get_bus()
+        if from_room:
+            bus.emit(
+                Events.ROOM_EXITED,
+                {
+                    "username": username,
+                    "room": from_room,
+                    "destination": to_room,
+                    "direction": direction,
+                    "world_id": world_id,
+                    "message": departure_message,
+                },
+            )
+        bus.emit(
+            Events.ROOM_ENTERED,
+            {
+                "username": username,
+                "room": to_room,
+                "source": source,
+                "world_id": world_id,
+                "message": arrival_message,
+            },
+        )
+
+    def _emit_chat_event(self, event_type: str, detail: dict[str, Any]) -> None:
+        """Commit the stored chat row(s), then announce them on the bus.
 
-        if departure_room and departure_message:
-            self._broadcast_to_room(departure_room, departure_message, exclude=username)
-        self._broadcast_to_room(destination_room, arrival_message, exclude=username)
+        Listeners (room push, long-polling ``/chat`` readers) may re-read
+        ``chat_messages`` as soon as the event arrives, so the insert must be
+        visible to other connections first.
+        """
+
+        database.commit_unit_of_work()
+        _get_bus().emit(event_type, detail)
+
+    def _store_chat_message(
+        self, draft: "_ChatDraft", message: str, *, recipient: str | None = None
+    ) -> bool:
+        """Insert a say or whisper row, recording its id when translation is deferred."""
+        if draft.stored_rows is None:
+            if recipient is None:
+                return database.add_chat_message(
+                    draft.speaker, message, draft.room, world_id=draft.world_id
+                )
+            return database.add_chat_message(
+                draft.speaker, message, draft.room, recipient=recipient, world_id=draft.world_id
+            )
+        message_id = database.insert_chat_message(
+            draft.speaker, message, draft.room, recipient=recipient, world_id=draft.world_id
+        )
+        if message_id is None:
+            return False
+        draft.stored_rows[draft.room] = message_id
+        return True
 
     def _emit_move_failed(
         self,
@@ -671,6 +912,7 @@ class GameEngine:
         Side Effects:
             - Adds message to chat_messages table with room association
             - Message will appear in other players' chat history
+            - Emits CHAT_SAID so connected clients receive it immediately
 
         Example:
             >>> engine.chat("player1", "Hello everyone!")
@@ -679,6 +921,39 @@ class GameEngine:
         Security Note:
             Messages are sanitized to prevent XSS attacks before storage.
         """
+        draft = self._begin_chat(username, message, world_id=world_id)
+        if isinstance(draft, tuple):
+            return draft
+        deferred = self._deliver_deferred(draft, self._deliver_chat)
+        if deferred is not None:
+            return deferred
+
+        # ── OOC → IC translation ─────────────────────────────────────────────
+        # Translate the raw player message to in-character dialogue.  The
+        # service is non-authoritative and gracefully degrading — see its
+        # docstring.  The ipc_hash (if set above) is forwarded so the service
+        # can arm deterministic rendering and link this event in the ledger.
+        # XSS escaping is applied *after* translation so that the IC output
+        # is cleaned by the same sanitiser as the OOC fallback.
+        safe_message = self._translate_and_sanitize_chat(
+            world=draft.world,
+            character_name=draft.speaker,
+            message=message,
+            channel=draft.channel,
+            ipc_hash=draft.ipc_hash,
+        )
+        return self._deliver_chat(draft, safe_message)
+
+    async def chat_async(self, username: str, message: str, *, world_id: str) -> tuple[bool, str]:
+        """Async :meth:`chat` that awaits the Ollama call on the event loop."""
+        return await self._run_chat_async(
+            self._begin_chat, self._deliver_chat, username, message, world_id=world_id
+        )
+
+    def _begin_chat(
+        self, username: str, message: str, *, world_id: str
+    ) -> "_ChatDraft | tuple[bool, str]":
+        """Validate a say and resolve its axis interaction."""
         room = database.get_character_room(username, world_id=world_id)
         if not room:
             return False, "You are not in a valid room."
@@ -701,35 +976,37 @@ class GameEngine:
             channel="say",
             world_id=world_id,
         )
-
-        # ── OOC → IC translation ─────────────────────────────────────────────
-        # Translate the raw player message to in-character dialogue.  The
-        # service is non-authoritative and gracefully degrading — see its
-        # docstring.  The ipc_hash (if set above) is forwarded so the service
-        # can arm deterministic rendering and link this event in the ledger.
-        # XSS escaping is applied *after* translation so that the IC output
-        # is cleaned by the same sanitiser as the OOC fallback.
-        safe_message = self._translate_and_sanitize_chat(
+        return _ChatDraft(
             world=world,
-            character_name=username,
-            message=message,
+            world_id=world_id,
+            speaker=username,
             channel="say",
+            message=message,
+            room=room,
             ipc_hash=ipc_hash,
         )
 
-        if not database.add_chat_message(username, safe_message, room, world_id=world_id):
+    def _deliver_chat(self, draft: "_ChatDraft", safe_message: str) -> tuple[bool, str]:
+        """Store a say and announce it."""
+        username, room, world_id = draft.speaker, draft.room, draft.world_id
+        if not self._store_chat_message(draft, safe_message):
             return False, "Failed to send message."
 
+        self._emit_chat_event(
+            Events.CHAT_SAID,
+            {"username": username, "message": safe_message, "room": room, "world_id": world_id},
+        )
         return True, f"You say: {safe_message}"
 
     def yell(self, username: str, message: str, *, world_id: str) -> tuple[bool, str]:
         """
-        Yell a message to current room and all adjoining rooms.
+        Yell a message to current room and all nearby rooms.
 
         Unlike regular chat which only reaches the current room, yell sends
         the message to:
         1. The player's current room
-        2. All rooms directly connected via exits
+        2. All rooms within the world's ``yell_radius`` exit hops
+           (default 1: rooms directly connected via exits)
 
         The message is prefixed with [YELL] to distinguish it from normal chat.
 
@@ -748,9 +1025,10 @@ class GameEngine:
             - Database insert failed
 
         Side Effects:
-            - Adds [YELL] message to current room's chat
-            - Adds [YELL] message to all adjoining rooms' chat
+            - Adds [YELL] message to current room's chat and all adjoining
+              rooms' chat in a single transaction
             - Players in multiple affected rooms will see the message
+            - Emits CHAT_YELLED listing every room that received it
 
         Example:
             If player in "spawn" with exits to "forest" and "desert":
@@ -761,13 +1039,42 @@ class GameEngine:
         Security Note:
             Messages are sanitized to prevent XSS attacks before storage.
         """
+        draft = self._begin_yell(username, message, world_id=world_id)
+        if isinstance(draft, tuple):
+            return draft
+        deferred = self._deliver_deferred(draft, self._deliver_yell)
+        if deferred is not None:
+            return deferred
+
+        # ── OOC → IC translation ─────────────────────────────────────────────
+        # Translation occurs before the [YELL] prefix is applied so that the
+        # rendered IC dialogue is wrapped naturally.
+        safe_message = self._translate_and_sanitize_chat(
+            world=draft.world,
+            character_name=draft.speaker,
+            message=message,
+            channel=draft.channel,
+            ipc_hash=draft.ipc_hash,
+        )
+        return self._deliver_yell(draft, safe_message)
+
+    async def yell_async(self, username: str, message: str, *, world_id: str) -> tuple[bool, str]:
+        """Async :meth:`yell` that awaits the Ollama call on the event loop."""
+        return await self._run_chat_async(
+            self._begin_yell, self._deliver_yell, username, message, world_id=world_id
+        )
+
+    def _begin_yell(
+        self, username: str, message: str, *, world_id: str
+    ) -> "_ChatDraft | tuple[bool, str]":
+        """Validate a yell and resolve its axis interaction."""
         current_room_id = database.get_character_room(username, world_id=world_id)
         if not current_room_id:
             return False, "You are not in a valid room."
 
         world = self._get_world(world_id)
 
-        # Get current room to find adjoining rooms
+        # Get current room to find nearby rooms
         current_room = world.get_room(current_room_id)
         if not current_room:
             return False, "Invalid room."
@@ -781,34 +1088,54 @@ class GameEngine:
             channel="yell",
             world_id=world_id,
         )
-
-        # ── OOC → IC translation ─────────────────────────────────────────────
-        # Translation occurs before the [YELL] prefix is applied so that the
-        # rendered IC dialogue is wrapped naturally.
-        safe_message = self._translate_and_sanitize_chat(
+        return _ChatDraft(
             world=world,
-            character_name=username,
-            message=message,
+            world_id=world_id,
+            speaker=username,
             channel="yell",
+            message=message,
+            room=current_room_id,
             ipc_hash=ipc_hash,
         )
 
-        # Add [YELL] prefix to sanitized message
-        yell_message = f"[YELL] {safe_message}"
+    def _deliver_yell(self, draft: "_ChatDraft", safe_message: str) -> tuple[bool, str]:
+        """Store a yell in every room within earshot and announce it."""
+        username, current_room_id, world_id = draft.speaker, draft.room, draft.world_id
 
-        # Send to current room
-        if not database.add_chat_message(
-            username, yell_message, current_room_id, world_id=world_id
-        ):
+        # Add [YELL] prefix to sanitized message
+        yell_message = draft.stored_text(safe_message)
+
+        # One transaction for every room within the world's yell radius;
+        # collect any rooms that could not be written for the diagnostic note.
+        target_rooms = list(draft.world.yell_rooms(current_room_id))
+        if draft.stored_rows is None:
+            rooms_reached = database.add_chat_messages(
+                username, yell_message, target_rooms, world_id=world_id
+            )
+        else:
+            draft.stored_rows.update(
+                database.insert_chat_messages(
+                    username, yell_message, target_rooms, world_id=world_id
+                )
+            )
+            rooms_reached = list(draft.stored_rows)
+        if current_room_id not in rooms_reached:
             return False, "Failed to send message."
 
-        # Send to all adjoining rooms; collect any failures for diagnostic note
-        failed_rooms: list[str] = []
-        for _direction, room_id in current_room.exits.items():
-            if not database.add_chat_message(username, yell_message, room_id, world_id=world_id):
-                logger.warning("yell: failed to insert into adjacent room %r", room_id)
-                failed_rooms.append(room_id)
+        failed_rooms = [room_id for room_id in target_rooms if room_id not in rooms_reached]
+        for room_id in failed_rooms:
+            logger.warning("yell: failed to insert into adjacent room %r", room_id)
 
+        self._emit_chat_event(
+            Events.CHAT_YELLED,
+            {
+                "username": username,
+                "message": yell_message,
+                "origin_room": current_room_id,
+                "rooms_reached": rooms_reached,
+                "world_id": world_id,
+            },
+        )
         note = f" (failed to reach {len(failed_rooms)} room(s))" if failed_rooms else ""
         return True, f"You yell: {safe_message}{note}"
 
@@ -855,6 +1182,7 @@ class GameEngine:
         Side Effects:
             - Adds message to chat_messages with recipient field set
             - Only sender and target can see this message in their chat
+            - Emits CHAT_WHISPERED (pushed to sender and target only)
             - Extensive logging for debugging whisper issues
 
         Security Note:
@@ -869,6 +1197,54 @@ class GameEngine:
             >>> engine.whisper("player1", "Player2", "Hi")
             (False, "Player 'Player2' is not in this room.")
         """
+        draft = self._begin_whisper(username, target, message, world_id=world_id)
+        if isinstance(draft, tuple):
+            return draft
+        deferred = self._deliver_deferred(draft, self._deliver_whisper)
+        if deferred is not None:
+            return deferred
+
+        # ── OOC → IC translation ─────────────────────────────────────────────
+        # Translation occurs before the [WHISPER: ...] prefix is applied so
+        # that the IC dialogue is wrapped naturally.  Whispers are rendered
+        # with channel="whisper" so that the prompt template can lower the
+        # volume/intensity of the voice appropriately.
+        safe_message = self._translate_and_sanitize_chat(
+            world=draft.world,
+            character_name=draft.speaker,
+            message=message,
+            channel=draft.channel,
+            ipc_hash=draft.ipc_hash,
+        )
+        return self._deliver_whisper(draft, safe_message)
+
+    async def whisper_async(
+        self,
+        username: str,
+        target: str,
+        message: str,
+        *,
+        world_id: str,
+    ) -> tuple[bool, str]:
+        """Async :meth:`whisper` that awaits the Ollama call on the event loop."""
+        return await self._run_chat_async(
+            self._begin_whisper,
+            self._deliver_whisper,
+            username,
+            target,
+            message,
+            world_id=world_id,
+        )
+
+    def _begin_whisper(
+        self,
+        username: str,
+        target: str,
+        message: str,
+        *,
+        world_id: str,
+    ) -> "_ChatDraft | tuple[bool, str]":
+        """Validate a whisper's sender and target and resolve its axis interaction."""
         resolved_sender = database.resolve_character_name(username, world_id=world_id)
         sender_name = resolved_sender or username
         sender_room = database.get_character_room(sender_name, world_id=world_id)
@@ -885,9 +1261,7 @@ class GameEngine:
             return False, f"Player '{target}' does not exist."
 
         # Check if target is online (has an active session)
-        active_players = database.get_active_characters(world_id=world_id)
-        logger.info(f"Active players: {active_players}")
-        if resolved_target not in active_players:
+        if not database.is_character_active(resolved_target, world_id=world_id):
             logger.warning(f"Whisper failed: target {target} not online")
             return False, f"Player '{target}' is not online."
 
@@ -909,36 +1283,43 @@ class GameEngine:
             channel="whisper",
             world_id=world_id,
         )
-
-        # ── OOC → IC translation ─────────────────────────────────────────────
-        # Translation occurs before the [WHISPER: ...] prefix is applied so
-        # that the IC dialogue is wrapped naturally.  Whispers are rendered
-        # with channel="whisper" so that the prompt template can lower the
-        # volume/intensity of the voice appropriately.
-        safe_message = self._translate_and_sanitize_chat(
+        return _ChatDraft(
             world=world,
-            character_name=sender_name,
-            message=message,
+            world_id=world_id,
+            speaker=sender_name,
             channel="whisper",
+            message=message,
+            room=sender_room,
             ipc_hash=ipc_hash,
+            target=resolved_target,
+            target_label=target,
         )
 
+    def _deliver_whisper(self, draft: "_ChatDraft", safe_message: str) -> tuple[bool, str]:
+        """Store a whisper for its recipient and announce it."""
+        sender_name, sender_room, world_id = draft.speaker, draft.room, draft.world_id
+        resolved_target, target = draft.target, draft.target_label
+
         # Add whisper message with recipient (include both sender and target for clarity)
-        whisper_message = f"[WHISPER: {sender_name} → {target}] {safe_message}"
-        result = database.add_chat_message(
-            sender_name,
-            whisper_message,
-            sender_room,
-            recipient=resolved_target,
-            world_id=world_id,
-        )
+        whisper_message = draft.stored_text(safe_message)
+        result = self._store_chat_message(draft, whisper_message, recipient=resolved_target)
         logger.info(f"Whisper message save result: {result}")
 
         if not result:
             logger.error("Failed to save whisper to database")
             return False, "Failed to send whisper."
 
-        logger.info(f"Whisper successful: {username} -> {target}: {safe_message}")
+        self._emit_chat_event(
+            Events.CHAT_WHISPERED,
+            {
+                "username": sender_name,
+                "target": resolved_target,
+                "message": whisper_message,
+                "room": sender_room,
+                "world_id": world_id,
+            },
+        )
+        logger.info(f"Whisper successful: {sender_name} -> {target}: {safe_message}")
         return True, f"You whisper to {target}: {safe_message}"
 
     def kick_character(self, actor_name: str, target: str, *, world_id: str) -> tuple[bool, str]:
@@ -1020,6 +1401,27 @@ class GameEngine:
         messages = database.get_room_messages(
             room, limit=limit, username=username, world_id=world_id
         )
+        return self._format_room_chat(messages)
+
+    async def get_room_chat_async(self, username: str, limit: int = 20, *, world_id: str) -> str:
+        """
+        Async :meth:`get_room_chat` for ``async def`` routes.
+
+        Uses the aiosqlite repository layer so polling chat never blocks the
+        event loop. Output format is identical to :meth:`get_room_chat`.
+        """
+        room = await database.get_character_room_async(username, world_id=world_id)
+        if not room:
+            return "No messages."
+
+        messages = await database.get_room_messages_async(
+            room, limit=limit, character_name=username, world_id=world_id
+        )
+        return self._format_room_chat(messages)
+
+    @staticmethod
+    def _format_room_chat(messages: list[dict[str, Any]]) -> str:
+        """Render room chat rows as the player-facing recent-messages block."""
         if not messages:
             return "[No messages in this room yet]"
 
@@ -1113,11 +1515,13 @@ class GameEngine:
         if not matching_item:
             return False, f"There is no '{item_name}' here."
 
-        # Add to inventory
-        inventory = database.get_character_inventory(username, world_id=world_id)
-        if matching_item not in inventory:
-            inventory.append(matching_item)
-            database.set_character_inventory(username, inventory, world_id=world_id)
+        # Add to inventory. The read-modify-write runs in one immediate
+        # transaction so concurrent pickups cannot lose an inventory update.
+        with database.unit_of_work(immediate=True):
+            inventory = database.get_character_inventory(username, world_id=world_id)
+            if matching_item not in inventory:
+                inventory.append(matching_item)
+                database.set_character_inventory(username, inventory, world_id=world_id)
 
         item = world.get_item(matching_item)
         item_name_display = item.name if item else matching_item
@@ -1153,23 +1557,27 @@ class GameEngine:
             >>> engine.drop_item("player1", "sword")
             (False, "You don't have a 'sword'.")
         """
-        inventory = database.get_character_inventory(username, world_id=world_id)
         world = self._get_world(world_id)
 
-        # Find matching item in inventory
-        matching_item = None
-        for item_id in inventory:
-            item = world.get_item(item_id)
-            if item and item.name.lower() == item_name.lower():
-                matching_item = item_id
-                break
+        # Same immediate transaction as pickup_item: the inventory read and the
+        # write-back must not interleave with another command for this character.
+        with database.unit_of_work(immediate=True):
+            inventory = database.get_character_inventory(username, world_id=world_id)
 
-        if not matching_item:
-            return False, f"You don't have a '{item_name}'."
+            # Find matching item in inventory
+            matching_item = None
+            for item_id in inventory:
+                item = world.get_item(item_id)
+                if item and item.name.lower() == item_name.lower():
+                    matching_item = item_id
+                    break
 
-        # Remove from inventory
-        inventory.remove(matching_item)
-        database.set_character_inventory(username, inventory, world_id=world_id)
+            if not matching_item:
+                return False, f"You don't have a '{item_name}'."
+
+            # Remove from inventory
+            inventory.remove(matching_item)
+            database.set_character_inventory(username, inventory, world_id=world_id)
 
         item = world.get_item(matching_item)
         item_name_display = item.name if item else matching_item
@@ -1234,32 +1642,6 @@ class GameEngine:
         """
         return database.get_active_characters(world_id=world_id)
 
-    def _broadcast_to_room(self, room_id: str, message: str, exclude: str | None = None):
-        """
-        Deprecated compatibility hook for room-broadcast notifications.
-
-        Movement and recall are authoritative through emitted events, not this
-        method. The hook remains as a deliberate no-op seam so older call sites
-        can be isolated without implying that room broadcasts are an active
-        delivery mechanism.
-
-        A real implementation would require:
-        - WebSocket connections or message queue system
-        - Per-player message buffers
-        - Push notification mechanism
-
-        Args:
-            room_id: Room to broadcast to
-            message: Message to send
-            exclude: Optional username to exclude from broadcast (usually sender)
-
-        Current Status:
-            Not implemented; retained only as a compatibility stub.
-        """
-        # This would be handled by the server's message queue
-        # TODO: Remove once movement/recall call sites no longer reference it.
-        pass
-
     @staticmethod
     def _opposite_direction(direction: str) -> str:
         """
@@ -144,7 +144,8 @@ class Events:
         "username": str,
         "from_room": str,
         "to_room": str,
-        "direction": str  # "north", "south", "east", "west"
+        "direction": str,  # "north", "south", "east", "west"
+        "world_id": str
     }
     """
 
@@ -173,7 +174,9 @@ class Events:
     Detail: {
         "username": str,
         "room": str,
-        "source": str  # "login", "movement", "teleport"
+        "source": str,  # "login", "movement", "recall", "teleport"
+        "world_id": str,
+        "message": str  # Arrival notice for the room's other occupants
     }
     """
 
@@ -185,7 +188,9 @@ class Events:
         "username": str,
         "room": str,
         "destination": str,  # Where they went (or "logout")
-        "direction": str | None  # Direction if movement, None otherwise
+        "direction": str | None,  # Direction if movement, None otherwise
+        "world_id": str,
+        "message": str  # Departure notice for the room's other occupants
     }
     """
 
@@ -265,7 +270,8 @@ class Events:
     Detail: {
         "username": str,
         "message": str,  # The sanitized message
-        "room": str
+        "room": str,
+        "world_id": str
     }
     """
 
@@ -277,7 +283,8 @@ class Events:
         "username": str,
         "message": str,
         "origin_room": str,
-        "rooms_reached": list[str]  # All rooms that heard it
+        "rooms_reached": list[str],  # All rooms that heard it
+        "world_id": str
     }
     """
 
@@ -289,7 +296,25 @@ class Events:
         "username": str,  # Sender
         "target": str,  # Recipient
         "message": str,
-        "room": str
+        "room": str,
+        "world_id": str
+    }
+    """
+
+    CHAT_TRANSLATED = "chat:translated"
+    """
+    Emitted when deferred translation rewrites an already-announced message
+    with its in-character text (``ollama_translation.mode = deferred``).
+
+    Detail: {
+        "username": str,  # Speaker
+        "channel": str,  # "say", "yell", "whisper"
+        "message": str,  # The stored replacement text (prefix included)
+        "message_ids": list[int],  # Rows rewritten (one per room for a yell)
+        "room": str,  # Speaker's room
+        "rooms": list[str],  # Rooms holding a rewritten row
+        "target": str | None,  # Whisper recipient
+        "world_id": str
     }
     """
 
@@ -0,0 +1,208 @@
+"""Bounded thread pool for blocking game-engine work.
+
+``GameEngine`` methods are synchronous: they run SQLite queries and, for
+``chat``/``yell``/``whisper``, may block on an Ollama translation for up to the
+configured timeout. Calling them directly from an ``async def`` route freezes
+the uvicorn event loop for every connected player. Routes instead await
+:meth:`EngineExecutor.run`, which hands the call to a dedicated, size-limited
+thread pool so a slow call only delays the request that made it.
+
+Two limits apply:
+
+- ``server.engine_workers`` bounds the pool itself.
+- ``server.engine_world_concurrency`` bounds in-flight calls per world, so one
+  busy world cannot occupy every worker. Excess calls wait on the event loop
+  (not on a worker thread) until their world has a free slot.
+
+Calls that are accepted but not yet running on a worker are counted as
+*queued*; :meth:`EngineExecutor.stats` exposes that as a queue-depth gauge.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class EngineExecutorStats:
+    """Point-in-time counters for an :class:`EngineExecutor`.
+
+    Attributes:
+        max_workers: Worker threads in the pool.
+        world_concurrency: Per-world in-flight limit (``0`` = unbounded).
+        queued: Calls accepted but not yet running on a worker.
+        running: Calls currently executing on a worker.
+        queued_by_world: Non-zero queued counts keyed by world id.
+    """
+
+    max_workers: int
+    world_concurrency: int
+    queued: int
+    running: int
+    queued_by_world: dict[str, int]
+
+
+class _Ticket:
+    """Tracks whether one submitted call started or was abandoned while queued."""
+
+    __slots__ = ("started", "abandoned")
+
+    def __init__(self) -> None:
+        self.started = False
+        self.abandoned = False
+
+
+class EngineExecutor:
+    """Thread pool with per-world admission control for engine calls."""
+
+    def __init__(self, *, max_workers: int, world_concurrency: int) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.world_concurrency = max(0, int(world_concurrency))
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mud-engine"
+        )
+        self._lock = threading.Lock()
+        self._queued: Counter[str] = Counter()
+        self._running = 0
+        # Semaphores bind to the loop that first waits on them; rebuild the
+        # map when a different loop (e.g. a new test client) starts using us.
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+        self._world_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def run(self, world_id: str, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``func(*args, **kwargs)`` on a worker thread and await its result.
+
+        The caller's context variables are copied into the worker, matching
+        :func:`asyncio.to_thread`. Exceptions raised by ``func`` propagate to
+        the awaiting coroutine unchanged.
+
+        Args:
+            world_id: World the call belongs to; used for per-world limits.
+            func: Blocking callable to execute.
+        """
+        ticket = _Ticket()
+        with self._lock:
+            self._queued[world_id] += 1
+        try:
+            async with AsyncExitStack() as stack:
+                slot = self._world_slot(world_id)
+                if slot is not None:
+                    await stack.enter_async_context(slot)
+                context = contextvars.copy_context()
+                call = functools.partial(
+                    context.run, self._invoke, ticket, world_id, func, args, kwargs
+                )
+                return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+        finally:
+            with self._lock:
+                if not ticket.started:
+                    ticket.abandoned = True
+                    self._dequeue(world_id)
+
+    def stats(self) -> EngineExecutorStats:
+        """Return a snapshot of queue-depth and activity counters."""
+        with self._lock:
+            queued_by_world = {world: count for world, count in self._queued.items() if count}
+            return EngineExecutorStats(
+                max_workers=self.max_workers,
+                world_concurrency=self.world_concurrency,
+                queued=sum(queued_by_world.values()),
+                running=self._running,
+                queued_by_world=queued_by_world,
+            )
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Stop accepting work and drop calls that have not started yet."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _invoke(
+        self,
+        ticket: _Ticket,
+        world_id: str,
+        func: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        """Worker-side wrapper that moves one call from queued to running."""
+        with self._lock:
+            if not ticket.abandoned:
+                ticket.started = True
+                self._dequeue(world_id)
+            self._running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _dequeue(self, world_id: str) -> None:
+        """Decrement one queued call for ``world_id`` (caller holds the lock)."""
+        self._queued[world_id] -= 1
+        if self._queued[world_id] <= 0:
+            del self._queued[world_id]
+
+    def _world_slot(self, world_id: str) -> asyncio.Semaphore | None:
+        """Return the admission semaphore for ``world_id``, if limits are enabled."""
+        if self.world_concurrency <= 0:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots_loop = loop
+            self._world_slots = {}
+        slot = self._world_slots.get(world_id)
+        if slot is None:
+            slot = asyncio.Semaphore(self.world_concurrency)
+            self._world_slots[world_id] = slot
+        return slot
+
+
+_active_executor: EngineExecutor | None = None
+_active_executor_lock = threading.Lock()
+
+
+def get_engine_executor() -> EngineExecutor:
+    """Return the process-wide engine executor for the current configuration.
+
+    Keyed by ``server.engine_workers`` and ``server.engine_world_concurrency``;
+    when either changes the previous executor is shut down (without waiting)
+    and replaced.
+    """
+    global _active_executor
+    from mud_server.config import config
+
+    settings = config.server
+    with _active_executor_lock:
+        executor = _active_executor
+        if (
+            executor is not None
+            and executor.max_workers == max(1, settings.engine_workers)
+            and executor.world_concurrency == max(0, settings.engine_world_concurrency)
+        ):
+            return executor
+        _active_executor = EngineExecutor(
+            max_workers=settings.engine_workers,
+            world_concurrency=settings.engine_world_concurrency,
+        )
+    if executor is not None:
+        executor.shutdown()
+    return _active_executor
+
+
+def shutdown_engine_executor(*, wait: bool = False) -> None:
+    """Shut down and forget the process-wide engine executor (shutdown/tests)."""
+    global _active_executor
+    with _active_executor_lock:
+        executor, _active_executor = _active_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
@@ -0,0 +1,80 @@
+"""Chunked background purge of expired sessions and guest accounts.
+
+Expired session rows and lapsed guest accounts used to be removed once at
+startup and once a day, each in a single write transaction. Between runs the
+dead rows slowed every session query, and the daily purge held the SQLite write
+lock long enough to stall gameplay.
+
+:func:`sweep_expired_rows` instead deletes at most ``chunk_size`` rows per
+transaction, runs each chunk on a worker thread, and yields to the event loop
+between chunks so request handlers and engine writes can take the write lock.
+The server lifespan calls it at startup and every
+``session.sweep_interval_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from mud_server.db import facade as database
+
+
+@dataclass(frozen=True, slots=True)
+class SweepReport:
+    """Outcome of one :func:`sweep_expired_rows` run.
+
+    Attributes:
+        sessions_removed: Expired session rows deleted.
+        guest_accounts_removed: Expired guest/visitor accounts deleted.
+        chunks: Write transactions used (including the final short chunk).
+        elapsed_seconds: Wall-clock time for the whole run.
+    """
+
+    sessions_removed: int
+    guest_accounts_removed: int
+    chunks: int
+    elapsed_seconds: float
+
+    @property
+    def rows_removed(self) -> int:
+        """Total rows purged across both tables."""
+        return self.sessions_removed + self.guest_accounts_removed
+
+
+async def _drain(cleanup: Callable[..., int], chunk_size: int) -> tuple[int, int]:
+    """Call ``cleanup(limit=chunk_size)`` until a chunk comes back short."""
+    removed = 0
+    chunks = 0
+    while True:
+        chunk_removed = await asyncio.to_thread(cleanup, limit=chunk_size)
+        removed += chunk_removed
+        chunks += 1
+        if chunk_removed < chunk_size:
+            return removed, chunks
+        # Let queued requests (and their writes) run before the next chunk.
+        await asyncio.sleep(0)
+
+
+async def sweep_expired_rows(*, chunk_size: int) -> SweepReport:
+    """Purge expired sessions, then expired guest accounts, in bounded chunks.
+
+    Args:
+        chunk_size: Maximum rows deleted per write transaction (minimum 1).
+
+    Raises:
+        DatabaseError: If a chunk fails; rows removed by earlier chunks stay
+            deleted.
+    """
+    chunk_size = max(1, int(chunk_size))
+    started = time.perf_counter()
+    sessions_removed, session_chunks = await _drain(database.cleanup_expired_sessions, chunk_size)
+    guests_removed, guest_chunks = await _drain(database.cleanup_expired_guest_accounts, chunk_size)
+    return SweepReport(
+        sessions_removed=sessions_removed,
+        guest_accounts_removed=guests_removed,
+        chunks=session_chunks + guest_chunks,
+        elapsed_seconds=time.perf_counter() - started,
+    )
@@ -0,0 +1,152 @@
+"""Parallel startup warm-up of world policies and World instances.
+
+The engine used to bootstrap axis policies for every world one after another
+while it was being constructed, and each ``World`` was then built on the first
+request that needed it, so the first player into a world paid for parsing its
+package and initialising its translation and axis engines.
+
+:func:`warm_up_worlds` instead bootstraps each registered world's axis policy
+and builds every active ``World`` on a small thread pool, timing each world.
+The server lifespan runs it in the background at startup and records the
+outcome in :data:`warmup_state`, whose ``ready`` flag ``/health`` reports.
+Requests that arrive before warm-up finishes still work; they share the
+registry's single-flight world load.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mud_server.core.engine import GameEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class WorldWarmup:
+    """Outcome of warming up one world.
+
+    Attributes:
+        world_id: World that was warmed up.
+        policy_seconds: Time spent bootstrapping its axis policy.
+        load_seconds: Time spent building its ``World`` (``None`` when the
+            world is inactive or failed before loading).
+        error: Failure message, or ``None`` on success.
+    """
+
+    world_id: str
+    policy_seconds: float
+    load_seconds: float | None
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupReport:
+    """Outcome of one :func:`warm_up_worlds` run.
+
+    Attributes:
+        worlds: Per-world results, in registry order.
+        elapsed_seconds: Wall-clock time for the whole run.
+    """
+
+    worlds: tuple[WorldWarmup, ...]
+    elapsed_seconds: float
+
+    @property
+    def failed(self) -> tuple[WorldWarmup, ...]:
+        """Worlds whose warm-up raised."""
+        return tuple(world for world in self.worlds if world.error is not None)
+
+
+class WarmupState:
+    """Thread-safe readiness flag and the last warm-up report."""
+
+    def __init__(self) -> None:
+        self._ready = threading.Event()
+        self._report: WarmupReport | None = None
+
+    @property
+    def ready(self) -> bool:
+        """True once warm-up has finished (or was skipped)."""
+        return self._ready.is_set()
+
+    @property
+    def report(self) -> WarmupReport | None:
+        """The last completed warm-up, if any."""
+        return self._report
+
+    def mark_ready(self, report: WarmupReport | None = None) -> None:
+        """Record a finished (or skipped) warm-up."""
+        self._report = report
+        self._ready.set()
+
+    def reset(self) -> None:
+        """Mark warm-up as pending again (used at startup and in tests)."""
+        self._ready.clear()
+        self._report = None
+
+
+warmup_state = WarmupState()
+"""Process-wide warm-up state reported by ``/health``."""
+
+
+def _warm_world(engine: GameEngine, world_row: dict[str, Any]) -> WorldWarmup:
+    """Bootstrap one world's axis policy and build it if it is active."""
+    world_id = str(world_row["id"])
+    started = time.perf_counter()
+    policy_seconds = 0.0
+    try:
+        engine._bootstrap_world_axis_policy(world_id)
+        policy_seconds = time.perf_counter() - started
+        if not world_row.get("is_active", False):
+            return WorldWarmup(world_id=world_id, policy_seconds=policy_seconds, load_seconds=None)
+        load_started = time.perf_counter()
+        engine.world_registry.get_world(world_id)
+        return WorldWarmup(
+            world_id=world_id,
+            policy_seconds=policy_seconds,
+            load_seconds=time.perf_counter() - load_started,
+        )
+    except Exception as exc:
+        logger.exception("World warm-up failed for %s", world_id)
+        return WorldWarmup(
+            world_id=world_id,
+            policy_seconds=policy_seconds or time.perf_counter() - started,
+            load_seconds=None,
+            error=str(exc) or type(exc).__name__,
+        )
+
+
+def warm_up_worlds(engine: GameEngine, *, parallelism: int) -> WarmupReport:
+    """Bootstrap policies for every registered world and build the active ones.
+
+    Args:
+        engine: Engine whose world registry and policy bootstrap are used.
+        parallelism: Maximum worlds warmed up at once (minimum 1).
+
+    Returns:
+        Per-world timings; failures are reported, never raised.
+    """
+    started = time.perf_counter()
+    rows = engine.world_registry.list_worlds(include_inactive=True)
+    world_rows = []
+    for row in rows:
+        if row.get("id"):
+            world_rows.append(row)
+        else:
+            # Defensive guard: malformed world rows should not block startup.
+            logger.warning("World warm-up skipped malformed world row: %s", row)
+    if not world_rows:
+        logger.warning("World warm-up skipped: no worlds registered.")
+        return WarmupReport(worlds=(), elapsed_seconds=time.perf_counter() - started)
+
+    workers = max(1, min(int(parallelism), len(world_rows)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="world-warmup") as pool:
+        results = tuple(pool.map(lambda row: _warm_world(engine, row), world_rows))
+    return WarmupReport(worlds=results, elapsed_seconds=time.perf_counter() - started)
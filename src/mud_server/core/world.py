@@ -11,6 +11,13 @@ World Structure:
 - Exits: Directional connections between rooms (north, south, east, west, up, down)
 - Zones: Collections of related rooms loaded from separate files
 
+Zone Loading:
+- Eager (default): every zone listed in world.json is loaded up front
+- Lazy: only a catalog of zones and their room IDs is kept up front; a zone
+  is loaded the first time one of its rooms is referenced (the spawn zone, a
+  "zone:room" exit, a character's location) and zones without occupants are
+  evicted least-recently-used first once a :class:`ZoneBudget` is exceeded
+
 Data Storage (Zone-based - preferred):
 - World registry: data/world.json (zone list, global config)
 - Zone files: data/zones/<zone_id>.json (rooms and items per zone)
@@ -30,10 +37,20 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from mud_server.core.world_snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    WorldPackageFingerprint,
+    WorldSnapshot,
+    fingerprint_package,
+    load_snapshot,
+    write_snapshot,
+)
 from mud_server.db import facade as database
 
 if TYPE_CHECKING:
@@ -53,6 +70,10 @@ DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
 WORLD_JSON_PATH = DATA_DIR / "world.json"
 ZONES_DIR = DATA_DIR / "zones"
 
+# Exit hops a yell travels when world.json does not set ``yell_radius``
+# (1 = the current room plus every room directly connected to it).
+DEFAULT_YELL_RADIUS = 1
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -164,6 +185,114 @@ class Zone:
     rooms: list[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class RoomGraph:
+    """
+    Integer-indexed exit graph compiled from a world's loaded rooms.
+
+    Exit strings ("room" or "zone:room") are parsed and resolved once when
+    the graph is compiled, so movement checks and neighbourhood queries are
+    plain list and dict lookups. Exits that point into a zone that is not
+    loaded yet (or at a room that does not exist) stay in ``unresolved`` and
+    go through :meth:`World.resolve_room`, which can lazy-load the zone.
+
+    Attributes:
+        room_ids: Room ID for each index
+        index: Room ID -> index
+        refs: Room ID or exit reference string -> destination index
+        exits: Per room index, direction -> destination index
+        unresolved: Per room index, direction -> raw exit reference
+        neighbours: Per room index, distinct destination indices in exit order
+        neighbourhoods: Cache of (room index, radius) -> room IDs within reach
+        descriptions: Cache of room index -> pre-rendered description template
+    """
+
+    room_ids: tuple[str, ...]
+    index: dict[str, int]
+    refs: dict[str, int]
+    exits: tuple[dict[str, int], ...]
+    unresolved: tuple[dict[str, str], ...]
+    neighbours: tuple[tuple[int, ...], ...]
+    neighbourhoods: dict[tuple[int, int], tuple[str, ...]] = field(default_factory=dict)
+    descriptions: dict[int, RoomDescriptionTemplate] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class RoomDescriptionTemplate:
+    """
+    Pre-rendered static parts of a room description.
+
+    Everything except the occupant list (title, description, items, exit
+    destination names) is fixed once the world is loaded, so it is rendered
+    once per compiled :class:`RoomGraph` and reused by every ``look`` and move.
+
+    Attributes:
+        head: Title, description and items section
+        exits: Exits section ("" when the room has no exits)
+    """
+
+    head: str
+    exits: str
+
+    def render(self, other_players: list[str]) -> str:
+        """
+        Splice the live occupant list between the static sections.
+
+        Args:
+            other_players: Character names to list under "[Players here]"
+
+        Returns:
+            Complete room description
+        """
+        if not other_players:
+            return self.head + self.exits
+        players = "".join(f"  - {player}\n" for player in other_players)
+        return f"{self.head}\n[Players here]:\n{players}{self.exits}"
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneBudget:
+    """
+    Limits on the zones a lazily loaded world keeps in memory.
+
+    Zone size is measured as the size of the zone's JSON file, which tracks
+    the memory its rooms and items take closely enough for budgeting.
+
+    Attributes:
+        max_zones: Loaded zone count that triggers eviction (0 = no limit)
+        max_bytes: Total loaded zone file size that triggers eviction (0 = no limit)
+    """
+
+    max_zones: int = 0
+    max_bytes: int = 0
+
+    def exceeded(self, zones: int, size: int) -> bool:
+        """Return True when ``zones`` loaded zones of ``size`` bytes are over budget."""
+        return (self.max_zones > 0 and zones > self.max_zones) or (
+            self.max_bytes > 0 and size > self.max_bytes
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneLoadStats:
+    """
+    Zone residency counters for one world.
+
+    Attributes:
+        known: Zones in the catalog (listed in world.json or loaded by reference)
+        loaded: Zones currently in memory
+        loaded_bytes: Zone file bytes currently in memory
+        loads: Zone loads since the world was created, including startup
+        evictions: Zones evicted since the world was created
+    """
+
+    known: int
+    loaded: int
+    loaded_bytes: int
+    loads: int
+    evictions: int
+
+
 # ============================================================================
 # WORLD MANAGEMENT CLASS
 # ============================================================================
@@ -185,16 +314,26 @@ class World:
         zones: Dictionary mapping zone IDs to Zone objects
         default_spawn: Tuple of (zone_id, room_id) for new player spawn
         world_name: Name of the world (from world.json)
+        yell_radius: Exit hops a yell travels (from world.json, default 1)
 
     Design Notes:
         - World data is immutable after loading (read-only)
-        - All data kept in memory for fast access
+        - All data kept in memory for fast access, or with ``lazy_zones``
+          only the zones in use (``rooms``/``items``/``zones`` then hold the
+          loaded zones)
         - No database storage for world data (uses JSON files)
         - Changes to JSON require server restart to take effect
         - Zone-based loading allows modular world building
     """
 
-    def __init__(self, *, world_root: Path | None = None):
+    def __init__(
+        self,
+        *,
+        world_root: Path | None = None,
+        snapshot_dir: Path | None = None,
+        lazy_zones: bool = False,
+        zone_budget: ZoneBudget | None = None,
+    ):
         """
         Initialize the World by loading data from JSON files.
 
@@ -203,6 +342,13 @@ class World:
         Args:
             world_root: Optional path to a world package directory. When provided,
                 world.json and zones are loaded relative to this directory.
+            snapshot_dir: Optional directory of compiled world snapshots (see
+                :mod:`mud_server.core.world_snapshot`). When provided together
+                with ``world_root``, a matching snapshot replaces parsing the
+                package files, and a missing or stale one is rebuilt.
+            lazy_zones: Load zones on first reference instead of up front.
+            zone_budget: Eviction limits for lazily loaded zones (default:
+                unlimited). Ignored unless ``lazy_zones`` is set.
 
         Raises:
             FileNotFoundError: If no world data files exist
@@ -210,6 +356,7 @@ class World:
             KeyError: If required fields are missing from JSON
         """
         self._world_root = world_root
+        self._snapshot_dir = snapshot_dir if world_root is not None else None
         if world_root is not None:
             self._world_json_path = world_root / "world.json"
             self._zones_dir = world_root / "zones"
@@ -225,6 +372,27 @@ class World:
         # World metadata
         self.world_name: str = "Unknown World"
         self.default_spawn: tuple[str, str] = ("", "spawn")  # (zone_id, room_id)
+        self.yell_radius: int = DEFAULT_YELL_RADIUS
+
+        # Compiled exit graph — rebuilt by _room_graph() whenever the set of
+        # loaded rooms or zones changes (initial load, lazy zone loads, evictions).
+        self._graph: RoomGraph | None = None
+        self._graph_source: tuple[dict[str, Room], int, int, int] | None = None
+
+        # Zone residency. The catalog and room directory cover every known
+        # zone, loaded or not; the LRU order and sizes cover loaded zones.
+        # _zone_lock serialises zone loads, evictions and graph compiles.
+        self._lazy_zones = lazy_zones
+        self._zone_budget = zone_budget or ZoneBudget()
+        self._zone_catalog: dict[str, Zone] = {}
+        self._room_zones: dict[str, str] = {}
+        self._zone_items: dict[str, tuple[str, ...]] = {}
+        self._zone_sizes: dict[str, int] = {}
+        self._zone_lru: OrderedDict[str, None] = OrderedDict()
+        self._zone_generation = 0
+        self._zone_loads = 0
+        self._zone_evictions = 0
+        self._zone_lock = threading.RLock()
 
         # The world_id is the name of the world package directory.
         # When world_root is None (legacy single-file mode) we have no
@@ -270,7 +438,10 @@ class World:
         Load world data from zone-based file structure.
 
         Reads world.json for the zone registry and global config,
-        then loads each zone file from data/zones/<zone_id>.json.
+        then loads each zone file from data/zones/<zone_id>.json (with
+        ``lazy_zones``, only the zone catalog and the spawn zone). When a
+        snapshot directory is configured, a snapshot that still matches the
+        package files is used instead and a missing or stale one is rebuilt.
 
         File Structure:
             data/world.json - Zone registry and global config
@@ -280,9 +451,24 @@ class World:
             Populates self.rooms, self.items, self.zones dictionaries
             Sets self.world_name and self.default_spawn
         """
-        # Load world registry
-        with open(self._world_json_path) as f:
-            world_data = json.load(f)
+        snapshot = None
+        fingerprint = None
+        if self._snapshot_dir is not None and self._world_root is not None:
+            snapshot = load_snapshot(self._snapshot_dir, self._world_root)
+            if snapshot is not None and snapshot.lazy_zones != self._lazy_zones:
+                logger.info(f"World snapshot for '{self.world_id}' has another zone mode")
+                snapshot = None
+            if snapshot is None:
+                # Fingerprint before parsing: if a file changes mid-load the
+                # snapshot is keyed to the older content and rebuilt next time.
+                fingerprint = fingerprint_package(self._world_root)
+
+        if snapshot is not None:
+            world_data = snapshot.world_data
+        else:
+            # Load world registry
+            with open(self._world_json_path) as f:
+                world_data = json.load(f)
 
         self.world_name = world_data.get("name", "Unknown World")
 
@@ -296,26 +482,28 @@ class World:
         else:
             self.default_spawn = ("", "spawn")
 
-        # Load global items
-        for item_id, item_data in world_data.get("global_items", {}).items():
-            self.items[item_id] = Item(
-                id=item_data["id"],
-                name=item_data["name"],
-                description=item_data["description"],
-            )
+        self.yell_radius = self._parse_yell_radius(world_data.get("yell_radius"))
 
-        # Load each zone
-        zone_ids = world_data.get("zones", [])
-        for zone_id in zone_ids:
-            zone_path = self._zones_dir / f"{zone_id}.json"
-            if zone_path.exists():
-                self._load_zone(zone_path)
-            else:
-                logger.warning(f"Zone file not found: {zone_path}")
+        if snapshot is not None:
+            self._apply_snapshot(snapshot)
+        elif self._lazy_zones:
+            self._load_zone_catalog(world_data)
+        else:
+            self._load_zones(world_data)
+        if snapshot is None and fingerprint is not None:
+            self._write_snapshot(world_data, fingerprint)
+
+        if self._lazy_zones:
+            # Everything else loads on first reference.
+            spawn_zone = self._spawn_zone_id()
+            if spawn_zone:
+                self._ensure_zone(spawn_zone)
 
         logger.info(
-            f"Loaded world '{self.world_name}': "
-            f"{len(self.zones)} zones, {len(self.rooms)} rooms, {len(self.items)} items"
+            f"Loaded world '{self.world_name}'"
+            f"{' from snapshot' if snapshot is not None else ''}: "
+            f"{len(self.zones)} of {len(self._zone_catalog)} zones, "
+            f"{len(self.rooms)} rooms, {len(self.items)} items"
         )
 
         # ── Translation layer ────────────────────────────────────────────────
@@ -339,6 +527,108 @@ class World:
         # (logged, not fatal).
         self._init_axis_engine(world_data)
 
+    def _load_zones(self, world_data: dict) -> None:
+        """
+        Build rooms, items and zones from the package files listed in world.json.
+
+        Args:
+            world_data: The parsed ``world.json`` dict.
+        """
+        self._load_global_items(world_data)
+
+        # Load each zone
+        zone_ids = world_data.get("zones", [])
+        for zone_id in zone_ids:
+            zone_path = self._zones_dir / f"{zone_id}.json"
+            if zone_path.exists():
+                self._load_zone(zone_path)
+            else:
+                logger.warning(f"Zone file not found: {zone_path}")
+
+        # Resolve every exit once now rather than on each move or yell, and
+        # pre-render the static part of each room description.
+        self._warm_description_templates()
+
+    def _load_zone_catalog(self, world_data: dict) -> None:
+        """
+        Catalog the zones listed in world.json without keeping their rooms.
+
+        Each zone file is parsed once to record its metadata and room IDs, so
+        a room can later be mapped to the zone that has to be loaded for it.
+
+        Args:
+            world_data: The parsed ``world.json`` dict.
+        """
+        self._load_global_items(world_data)
+        for zone_id in world_data.get("zones", []):
+            zone_path = self._zones_dir / f"{zone_id}.json"
+            if not zone_path.exists():
+                logger.warning(f"Zone file not found: {zone_path}")
+                continue
+            with open(zone_path) as f:
+                zone_data = json.load(f)
+            self._catalog_zone(self._build_zone(zone_data, self._zone_rooms_map(zone_data)))
+
+    def _apply_snapshot(self, snapshot: WorldSnapshot) -> None:
+        """
+        Install the rooms, items, zones and compiled graph from a snapshot.
+
+        Args:
+            snapshot: Snapshot that matches this world's package files and
+                zone loading mode
+        """
+        self.items = snapshot.items
+        if snapshot.lazy_zones:
+            # Lazy snapshots carry the zone catalog and global items only.
+            for zone in snapshot.zones.values():
+                self._catalog_zone(zone)
+            return
+        self.rooms = snapshot.rooms
+        self.zones = snapshot.zones
+        for zone in self.zones.values():
+            self._catalog_zone(zone)
+            self._zone_lru[zone.id] = None
+        self._graph = snapshot.graph
+        self._graph_source = (
+            self.rooms,
+            len(self.rooms),
+            len(self.zones),
+            self._zone_generation,
+        )
+
+    def _write_snapshot(self, world_data: dict, fingerprint: WorldPackageFingerprint) -> None:
+        """
+        Store the freshly loaded world as a snapshot (best effort).
+
+        Called straight after loading, before any lazy zone load, so the
+        snapshot holds exactly what world.json lists (with ``lazy_zones``,
+        the zone catalog and global items only). A failed write is logged
+        and the server keeps running from the parsed world.
+
+        Args:
+            world_data: The parsed ``world.json`` dict.
+            fingerprint: Package files the world was loaded from
+        """
+        if self._snapshot_dir is None:
+            return
+        try:
+            write_snapshot(
+                self._snapshot_dir,
+                WorldSnapshot(
+                    format_version=SNAPSHOT_FORMAT_VERSION,
+                    world_id=self.world_id,
+                    fingerprint=fingerprint,
+                    world_data=world_data,
+                    lazy_zones=self._lazy_zones,
+                    zones=self._zone_catalog if self._lazy_zones else self.zones,
+                    rooms=self.rooms,
+                    items=self.items,
+                    graph=None if self._lazy_zones else self._room_graph(),
+                ),
+            )
+        except Exception as exc:
+            logger.warning(f"Could not write world snapshot for '{self.world_id}': {exc}")
+
     def _init_translation_service(self, world_data: dict) -> None:
         """Parse the translation_layer block and instantiate the service.
 
@@ -552,28 +842,60 @@ class World:
         """
         return self._axis_engine is not None
 
-    def _load_zone(self, zone_path: Path):
+    def _load_global_items(self, world_data: dict) -> None:
+        """Load the ``global_items`` block of world.json."""
+        for item_id, item_data in world_data.get("global_items", {}).items():
+            self.items[item_id] = Item(
+                id=item_data["id"],
+                name=item_data["name"],
+                description=item_data["description"],
+            )
+
+    @staticmethod
+    def _zone_rooms_map(zone_data: dict) -> dict[str, dict]:
+        """Return a zone's rooms keyed by ID (zone files may use a list or a dict)."""
+        rooms_payload = zone_data.get("rooms", {})
+        if isinstance(rooms_payload, list):
+            return {room["id"]: room for room in rooms_payload}
+        return rooms_payload
+
+    @staticmethod
+    def _build_zone(zone_data: dict, rooms_map: dict[str, dict]) -> Zone:
+        """Create the Zone record for a parsed zone file."""
+        zone_id = zone_data["id"]
+        return Zone(
+            id=zone_id,
+            name=zone_data.get("name", zone_id),
+            description=zone_data.get("description", ""),
+            spawn_room=zone_data.get("spawn_room", "spawn"),
+            rooms=list(rooms_map.keys()),
+        )
+
+    def _catalog_zone(self, zone: Zone) -> None:
+        """Record a zone and its room IDs in the zone catalog."""
+        self._zone_catalog[zone.id] = zone
+        for room_id in zone.rooms:
+            self._room_zones[room_id] = zone.id
+
+    def _load_zone(self, zone_path: Path) -> str:
         """
         Load a single zone from its JSON file.
 
         Args:
             zone_path: Path to the zone JSON file
 
+        Returns:
+            ID of the loaded zone
+
         Side Effects:
-            Adds zone to self.zones
+            Adds zone to self.zones and the zone catalog
             Adds zone's rooms to self.rooms
             Adds zone's items to self.items
         """
-        with open(zone_path) as f:
-            zone_data = json.load(f)
+        payload = zone_path.read_bytes()
+        zone_data = json.loads(payload)
 
-        zone_id = zone_data["id"]
-
-        rooms_payload = zone_data.get("rooms", {})
-        if isinstance(rooms_payload, list):
-            rooms_map = {room["id"]: room for room in rooms_payload}
-        else:
-            rooms_map = rooms_payload
+        rooms_map = self._zone_rooms_map(zone_data)
 
         items_payload = zone_data.get("items", {})
         if isinstance(items_payload, list):
@@ -582,14 +904,10 @@ class World:
             items_map = items_payload
 
         # Create Zone object
-        zone = Zone(
-            id=zone_id,
-            name=zone_data.get("name", zone_id),
-            description=zone_data.get("description", ""),
-            spawn_room=zone_data.get("spawn_room", "spawn"),
-            rooms=list(rooms_map.keys()),
-        )
+        zone = self._build_zone(zone_data, rooms_map)
+        zone_id = zone.id
         self.zones[zone_id] = zone
+        self._catalog_zone(zone)
 
         # Load zone's rooms
         for room_id, room_data in rooms_map.items():
@@ -609,7 +927,112 @@ class World:
                 description=item_data["description"],
             )
 
+        self._zone_items[zone_id] = tuple(items_map)
+        self._zone_sizes[zone_id] = len(payload)
+        self._zone_lru[zone_id] = None
+        self._zone_lru.move_to_end(zone_id)
+        self._zone_generation += 1
+        self._zone_loads += 1
+
         logger.debug(f"Loaded zone '{zone_id}': {len(zone.rooms)} rooms")
+        return zone_id
+
+    def _spawn_zone_id(self) -> str:
+        """Return the zone holding the default spawn room ("" if unknown)."""
+        zone_id, room_id = self.default_spawn
+        return zone_id or self._room_zones.get(room_id, "")
+
+    def _ensure_zone(self, zone_id: str) -> bool:
+        """
+        Make sure a zone is loaded, loading it (and evicting others) if needed.
+
+        Args:
+            zone_id: Zone to load
+
+        Returns:
+            True if the zone is loaded, False if it has no zone file
+        """
+        with self._zone_lock:
+            if zone_id in self.zones:
+                self._touch_zone(zone_id)
+                return True
+            zone_path = self._zones_dir / f"{zone_id}.json"
+            if not zone_path.exists():
+                return False
+            logger.info(f"Lazy-loading zone '{zone_id}'")
+            self._load_zone(zone_path)
+            self._enforce_zone_budget(keep=zone_id)
+            return True
+
+    def _touch_zone(self, zone_id: str | None) -> None:
+        """Mark a loaded zone as most recently used."""
+        if zone_id is None or not self._lazy_zones:
+            return
+        with self._zone_lock:
+            if zone_id in self._zone_lru:
+                self._zone_lru.move_to_end(zone_id)
+
+    def _enforce_zone_budget(self, *, keep: str) -> None:
+        """
+        Evict least-recently-used zones until the world is within its budget.
+
+        The spawn zone, ``keep`` and zones with a character in any of their
+        rooms are never evicted, so the world may stay over budget.
+
+        Args:
+            keep: Zone that was just loaded for the caller
+        """
+        budget = self._zone_budget
+        if not self._lazy_zones or not budget.exceeded(
+            len(self.zones), sum(self._zone_sizes.values())
+        ):
+            return
+        try:
+            occupied = database.get_occupied_rooms(world_id=self.world_id)
+        except Exception as exc:
+            logger.warning(f"Skipping zone eviction for '{self.world_id}': {exc}")
+            return
+
+        pinned = {keep, self._spawn_zone_id()}
+        for zone_id in list(self._zone_lru):
+            if not budget.exceeded(len(self.zones), sum(self._zone_sizes.values())):
+                break
+            zone = self.zones.get(zone_id)
+            if zone is None or zone_id in pinned:
+                continue
+            if any(room_id in occupied for room_id in zone.rooms):
+                continue
+            self._evict_zone(zone_id)
+
+    def _evict_zone(self, zone_id: str) -> None:
+        """Drop a loaded zone's rooms and items; it stays in the catalog."""
+        zone = self.zones.pop(zone_id)
+        for room_id in zone.rooms:
+            if self._room_zones.get(room_id) == zone_id:
+                self.rooms.pop(room_id, None)
+        for item_id in self._zone_items.pop(zone_id, ()):
+            self.items.pop(item_id, None)
+        self._zone_sizes.pop(zone_id, None)
+        self._zone_lru.pop(zone_id, None)
+        self._zone_generation += 1
+        self._zone_evictions += 1
+        logger.info(f"Evicted idle zone '{zone_id}' from world '{self.world_id}'")
+
+    def zone_stats(self) -> ZoneLoadStats:
+        """
+        Return zone residency counters.
+
+        Returns:
+            ZoneLoadStats for this world
+        """
+        with self._zone_lock:
+            return ZoneLoadStats(
+                known=len(self._zone_catalog),
+                loaded=len(self.zones),
+                loaded_bytes=sum(self._zone_sizes.values()),
+                loads=self._zone_loads,
+                evictions=self._zone_evictions,
+            )
 
     def _parse_room_ref(self, room_ref: str) -> tuple[str | None, str]:
         """
@@ -632,13 +1055,185 @@ class World:
             return zone_id, room_id
         return None, room_ref
 
+    @staticmethod
+    def _parse_yell_radius(raw: object) -> int:
+        """
+        Validate the optional ``yell_radius`` value from world.json.
+
+        Args:
+            raw: Value of the ``yell_radius`` key (``None`` when absent)
+
+        Returns:
+            Non-negative hop count; ``DEFAULT_YELL_RADIUS`` when absent or invalid
+        """
+        if raw is None:
+            return DEFAULT_YELL_RADIUS
+        if isinstance(raw, bool) or not isinstance(raw, int):
+            logger.warning(f"Ignoring invalid yell_radius {raw!r}; using {DEFAULT_YELL_RADIUS}")
+            return DEFAULT_YELL_RADIUS
+        return max(0, raw)
+
+    def _room_graph(self) -> RoomGraph:
+        """
+        Return the compiled exit graph, recompiling it if the world changed.
+
+        The graph is rebuilt when zones have been loaded or evicted, rooms or
+        zones have been added, or the rooms dictionary has been replaced.
+
+        Returns:
+            RoomGraph for the currently loaded rooms
+        """
+        graph = self._graph
+        cached = self._graph_source
+        source = (self.rooms, len(self.rooms), len(self.zones), self._zone_generation)
+        if (
+            graph is not None
+            and cached is not None
+            and cached[0] is source[0]
+            and cached[1:] == source[1:]
+        ):
+            return graph
+        with self._zone_lock:
+            source = (self.rooms, len(self.rooms), len(self.zones), self._zone_generation)
+            graph = self._compile_room_graph()
+            self._graph = graph
+            self._graph_source = source
+        return graph
+
+    def _locate(self, room_id: str) -> tuple[RoomGraph, int | None]:
+        """
+        Return the current graph and a room's index in it.
+
+        With ``lazy_zones`` a room whose zone is not loaded has its zone
+        loaded first.
+
+        Args:
+            room_id: Room to find
+
+        Returns:
+            Tuple of (graph, index); index is None if the room doesn't exist
+        """
+        graph = self._room_graph()
+        position = graph.index.get(room_id)
+        if position is None and self._lazy_zones and self.get_room(room_id) is not None:
+            graph = self._room_graph()
+            position = graph.index.get(room_id)
+        return graph, position
+
+    def _compile_room_graph(self) -> RoomGraph:
+        """
+        Resolve every loaded exit into an integer-indexed graph.
+
+        Same-zone and cross-zone references are resolved against the loaded
+        rooms. A "zone:room" exit into a zone that is not loaded yet is left
+        unresolved so that the first move through it can lazy-load the zone.
+
+        Returns:
+            Newly compiled RoomGraph
+        """
+        room_ids = tuple(self.rooms)
+        index = {room_id: position for position, room_id in enumerate(room_ids)}
+        refs = dict(index)
+        exits: list[dict[str, int]] = []
+        unresolved: list[dict[str, str]] = []
+        neighbours: list[tuple[int, ...]] = []
+
+        for room_id in room_ids:
+            resolved_exits: dict[str, int] = {}
+            pending_exits: dict[str, str] = {}
+            for direction, destination_ref in self.rooms[room_id].exits.items():
+                destination = refs.get(destination_ref)
+                if destination is None:
+                    zone_id, dest_id = self._parse_room_ref(destination_ref)
+                    if zone_id is None or zone_id in self.zones:
+                        destination = index.get(dest_id)
+                    if destination is not None:
+                        refs[destination_ref] = destination
+                if destination is None:
+                    pending_exits[direction] = destination_ref
+                else:
+                    resolved_exits[direction] = destination
+            exits.append(resolved_exits)
+            unresolved.append(pending_exits)
+            neighbours.append(tuple(dict.fromkeys(resolved_exits.values())))
+
+        return RoomGraph(
+            room_ids=room_ids,
+            index=index,
+            refs=refs,
+            exits=tuple(exits),
+            unresolved=tuple(unresolved),
+            neighbours=tuple(neighbours),
+        )
+
+    def neighbourhood(self, room_id: str, radius: int) -> tuple[str, ...]:
+        """
+        Return the rooms reachable from a room within ``radius`` exit hops.
+
+        Breadth-first search over the compiled exit graph. Exits into zones
+        that have not been loaded yet are not followed (with ``lazy_zones``,
+        only the starting room's zone is loaded for the search). Results are
+        cached per (room, radius) until the graph is recompiled.
+
+        Args:
+            room_id: Starting room ID
+            radius: Maximum number of exits to follow (0 = the room itself)
+
+        Returns:
+            Room IDs ordered by distance, starting with ``room_id``;
+            empty if the room doesn't exist
+
+        Example:
+            >>> world.neighbourhood("spawn", 1)
+            ('spawn', 'forest_1', 'desert_1')
+        """
+        graph, start = self._locate(room_id)
+        if start is None:
+            return ()
+        radius = max(0, radius)
+        key = (start, radius)
+        cached = graph.neighbourhoods.get(key)
+        if cached is not None:
+            return cached
+
+        # Insertion-ordered set: rooms come out nearest first.
+        reached: dict[int, None] = {start: None}
+        frontier = [start]
+        for _ in range(radius):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for neighbour in graph.neighbours[node]:
+                    if neighbour not in reached:
+                        reached[neighbour] = None
+                        next_frontier.append(neighbour)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        rooms = tuple(graph.room_ids[node] for node in reached)
+        graph.neighbourhoods[key] = rooms
+        return rooms
+
+    def yell_rooms(self, room_id: str) -> tuple[str, ...]:
+        """
+        Return the rooms a yell from ``room_id`` reaches.
+
+        Args:
+            room_id: Room the yell originates from
+
+        Returns:
+            Room IDs within ``yell_radius`` hops, starting with ``room_id``
+        """
+        return self.neighbourhood(room_id, self.yell_radius)
+
     def resolve_room(self, room_ref: str) -> Room | None:
         """
         Resolve a room reference to a Room object.
 
         Handles both simple room IDs and cross-zone references (zone:room).
-        Currently all rooms are stored in a flat namespace, so the zone
-        prefix is parsed but the room is looked up by ID only.
+        References already resolved by the compiled exit graph are a single
+        dict lookup. Otherwise all rooms are stored in a flat namespace, so the
+        zone prefix is parsed but the room is looked up by ID only.
 
         Args:
             room_ref: Room reference (e.g., "spawn" or "docks:east_pier")
@@ -652,22 +1247,26 @@ class World:
             >>> world.resolve_room("docks:east_pier")
             Room(id='east_pier', ...)  # Looks up 'east_pier' in rooms
         """
+        graph = self._room_graph()
+        resolved = graph.refs.get(room_ref)
+        if resolved is not None:
+            return self.get_room(graph.room_ids[resolved])
+
         zone_id, room_id = self._parse_room_ref(room_ref)
 
         # If zone is specified but not loaded, try to load it
         if zone_id and zone_id not in self.zones:
-            zone_path = self._zones_dir / f"{zone_id}.json"
-            if zone_path.exists():
-                logger.info(f"Lazy-loading zone '{zone_id}' for cross-zone exit")
-                self._load_zone(zone_path)
+            self._ensure_zone(zone_id)
 
-        return self.rooms.get(room_id)
+        return self.get_room(room_id)
 
     def get_room(self, room_id: str) -> Room | None:
         """
         Retrieve a room by its ID.
 
         For cross-zone references (zone:room format), use resolve_room() instead.
+        With ``lazy_zones``, a room in a catalogued zone that is not loaded
+        loads its zone.
 
         Args:
             room_id: Unique room identifier (e.g., "spawn", "forest_1")
@@ -681,7 +1280,15 @@ class World:
             >>> world.get_room("nonexistent")
             None
         """
-        return self.rooms.get(room_id)
+        room = self.rooms.get(room_id)
+        if not self._lazy_zones:
+            return room
+        zone_id = self._room_zones.get(room_id)
+        if room is not None:
+            self._touch_zone(zone_id)
+        elif zone_id is not None and self._ensure_zone(zone_id):
+            room = self.rooms.get(room_id)
+        return room
 
     def get_item(self, item_id: str) -> Item | None:
         """
@@ -711,6 +1318,10 @@ class World:
         - Other players in the room (excluding the requesting player)
         - Available exits with destination names
 
+        Everything but the players section comes from a pre-rendered
+        :class:`RoomDescriptionTemplate`; only the occupants are looked up
+        per call.
+
         Args:
             room_id: ID of the room to describe
             username: Username of the player requesting description
@@ -760,37 +1371,86 @@ class World:
         if not room:
             return "Unknown room."
 
-        # Start with room name and description
-        desc = f"\n=== {room.name} ===\n{room.description}\n"
+        # Only the players section is live: query the database for active
+        # players in this room, excluding the requesting player.
+        template = self._description_template(room)
+        other_players = [
+            p for p in database.get_characters_in_room(room_id, world_id=world_id) if p != username
+        ]
+        return template.render(other_players)
+
+    def _description_template(self, room: Room) -> RoomDescriptionTemplate:
+        """
+        Return the cached description template for a room, rendering it if needed.
+
+        Args:
+            room: Room to describe (must be loaded)
 
-        # Add items section if any items are present
+        Returns:
+            RoomDescriptionTemplate for the current room graph
+        """
+        graph = self._room_graph()
+        position = graph.index.get(room.id)
+        template = graph.descriptions.get(position) if position is not None else None
+        if template is not None:
+            return template
+
+        # Rendering may lazy-load a zone for a cross-zone exit, which
+        # recompiles the graph; cache against whichever graph is current.
+        template = self._render_description_template(room)
+        graph = self._room_graph()
+        position = graph.index.get(room.id)
+        if position is not None:
+            graph.descriptions[position] = template
+        return template
+
+    def _render_description_template(self, room: Room) -> RoomDescriptionTemplate:
+        """
+        Render the static sections of a room description.
+
+        Args:
+            room: Room to render
+
+        Returns:
+            RoomDescriptionTemplate with the title, items and exits sections
+        """
+        # Room name and description
+        head = [f"\n=== {room.name} ===\n{room.description}\n"]
+
+        # Items section if any items are present
         if room.items:
-            desc += "\n[Items here]:\n"
+            head.append("\n[Items here]:\n")
             for item_id in room.items:
                 item = self.get_item(item_id)
                 if item:  # Only show if item exists in items dict
-                    desc += f"  - {item.name}\n"
+                    head.append(f"  - {item.name}\n")
 
-        # Add players section (query database for active players in this room)
-        # Exclude the requesting player from the list
-        other_players = [
-            p for p in database.get_characters_in_room(room_id, world_id=world_id) if p != username
-        ]
-        if other_players:
-            desc += "\n[Players here]:\n"
-            for player in other_players:
-                desc += f"  - {player}\n"
-
-        # Add exits section with destination room names
+        # Exits section with destination room names
+        exits = []
         if room.exits:
-            desc += "\n[Exits]:\n"
+            exits.append("\n[Exits]:\n")
             for direction, destination_ref in room.exits.items():
                 # Resolve destination room name (handles cross-zone refs)
                 dest_room = self.resolve_room(destination_ref)
                 dest_name = dest_room.name if dest_room else "Unknown"
-                desc += f"  - {direction}: {dest_name}\n"
+                exits.append(f"  - {direction}: {dest_name}\n")
+
+        return RoomDescriptionTemplate(head="".join(head), exits="".join(exits))
+
+    def _warm_description_templates(self) -> None:
+        """
+        Pre-render description templates for every room at load time.
 
-        return desc
+        Rooms with an unresolved exit (e.g. into a zone that is not loaded
+        yet) are skipped so that loading never lazy-loads zones; they render
+        on first ``look``.
+        """
+        graph = self._room_graph()
+        for position, room_id in enumerate(graph.room_ids):
+            if not graph.unresolved[position]:
+                graph.descriptions[position] = self._render_description_template(
+                    self.rooms[room_id]
+                )
 
     def can_move(self, room_id: str, direction: str) -> tuple[bool, str | None]:
         """
@@ -802,7 +1462,9 @@ class World:
         3. The destination room exists (supports cross-zone exits)
 
         Cross-zone exits use "zone:room" format (e.g., "docks:east_pier").
-        The zone will be lazy-loaded if not already present.
+        The zone will be lazy-loaded if not already present; with
+        ``lazy_zones`` so will the current room's zone and the zone of a
+        plain "room" exit.
 
         Args:
             room_id: Current room ID
@@ -823,16 +1485,20 @@ class World:
             (True, "east_pier")  # Cross-zone exit "docks:east_pier" resolves to "east_pier"
         """
         # Check if current room exists
-        room = self.get_room(room_id)
-        if not room:
+        graph, origin = self._locate(room_id)
+        if origin is None:
             return False, None
 
-        # Check if room has an exit in that direction (case-insensitive)
-        if direction.lower() not in room.exits:
-            return False, None
+        # Exits resolved at compile time (case-insensitive)
+        direction = direction.lower()
+        destination = graph.exits[origin].get(direction)
+        if destination is not None:
+            return True, graph.room_ids[destination]
 
-        # Get destination reference (may be "room_id" or "zone:room_id")
-        destination_ref = room.exits[direction.lower()]
+        # Unresolved destination reference (unloaded zone or unknown room)
+        destination_ref = graph.unresolved[origin].get(direction)
+        if destination_ref is None:
+            return False, None
 
         # Resolve the destination (handles cross-zone refs, lazy-loads zones)
         dest_room = self.resolve_room(destination_ref)
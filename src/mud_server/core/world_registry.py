@@ -6,29 +6,69 @@ The registry is responsible for:
 - Filtering worlds by user permissions
 - Loading world packages from disk on demand
 - Caching World instances for reuse
+- Building worlds with the configured snapshot and zone loading settings
 """
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mud_server.config import config
-from mud_server.core.world import World
+from mud_server.core.world import World, ZoneBudget, ZoneLoadStats
+from mud_server.core.world_snapshot import resolve_snapshot_dir
 from mud_server.db import facade as database
 
+if TYPE_CHECKING:
+    from mud_server.translation.service import TranslationStats
+
+
+def load_world_package(world_root: Path, *, snapshot_dir: Path | None = None) -> World:
+    """
+    Build a World from a package with the ``[worlds]`` loading settings.
+
+    Args:
+        world_root: World package directory
+        snapshot_dir: Snapshot directory; None uses the configured one
+
+    Returns:
+        Loaded World
+    """
+    settings = config.worlds
+    return World(
+        world_root=world_root,
+        snapshot_dir=snapshot_dir or resolve_snapshot_dir(),
+        lazy_zones=settings.lazy_zones,
+        zone_budget=ZoneBudget(
+            max_zones=settings.max_loaded_zones,
+            max_bytes=settings.max_zone_memory_mb * 1024 * 1024,
+        ),
+    )
+
 
 class WorldRegistry:
     """
     World registry with lazy-loading and permission filtering.
 
     This class centralizes access to worlds and avoids repeated disk loads
-    by caching World instances in memory.
+    by caching World instances in memory. Loads are single-flight per world:
+    concurrent callers (e.g. the startup warm-up and an early request) wait
+    for one load instead of each building the world.
     """
 
-    def __init__(self, *, worlds_root: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        worlds_root: str | Path | None = None,
+        snapshot_dir: str | Path | None = None,
+    ) -> None:
         self._worlds_root = Path(worlds_root or config.worlds.worlds_root)
+        # None defers to the [worlds] snapshot settings at load time.
+        self._snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else None
         self._cache: dict[str, World] = {}
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._load_locks_guard = threading.Lock()
 
     def list_worlds(self, *, include_inactive: bool = False) -> list[dict[str, Any]]:
         """Return all worlds in the catalog."""
@@ -47,19 +87,47 @@ class WorldRegistry:
         Raises:
             ValueError: If the world does not exist or is inactive.
         """
-        if world_id in self._cache:
-            return self._cache[world_id]
-
-        world_row = database.get_world_by_id(world_id)
-        if not world_row:
-            raise ValueError(f"Unknown world_id: {world_id}")
-        if not world_row.get("is_active", False):
-            raise ValueError(f"World is inactive: {world_id}")
-
-        world_path = self._worlds_root / world_id
-        world = World(world_root=world_path)
-        self._cache[world_id] = world
-        return world
+        world = self._cache.get(world_id)
+        if world is not None:
+            return world
+
+        with self._load_locks_guard:
+            load_lock = self._load_locks.setdefault(world_id, threading.Lock())
+        with load_lock:
+            world = self._cache.get(world_id)
+            if world is not None:
+                return world
+
+            world_row = database.get_world_by_id(world_id)
+            if not world_row:
+                raise ValueError(f"Unknown world_id: {world_id}")
+            if not world_row.get("is_active", False):
+                raise ValueError(f"World is inactive: {world_id}")
+
+            world_path = self._worlds_root / world_id
+            world = load_world_package(world_path, snapshot_dir=self._snapshot_dir)
+            self._cache[world_id] = world
+            return world
+
+    def zone_stats(self) -> dict[str, ZoneLoadStats]:
+        """Return zone load/evict counters for each loaded world."""
+        return {world_id: world.zone_stats() for world_id, world in list(self._cache.items())}
+
+    def translation_stats(self) -> dict[str, TranslationStats]:
+        """Return renderer and cache counters for each loaded world with translation on."""
+        stats: dict[str, TranslationStats] = {}
+        for world_id, world in list(self._cache.items()):
+            service = world.get_translation_service()
+            if service is not None:
+                stats[world_id] = service.stats()
+        return stats
+
+    async def aclose_translation_clients(self) -> None:
+        """Close the async Ollama clients and cache files of loaded worlds (server shutdown)."""
+        for world in list(self._cache.values()):
+            service = world.get_translation_service()
+            if service is not None:
+                await service.aclose()
 
     def clear_cache(self) -> None:
         """Clear cached world instances (used for tests or hot reloads)."""
@@ -0,0 +1,257 @@
+"""
+Compiled world snapshots.
+
+Loading a world package parses ``world.json`` and every zone file, builds the
+Room/Item/Zone objects, resolves every exit into a :class:`RoomGraph` and
+pre-renders the static room descriptions. None of that changes between
+restarts unless the package files change, so the result is stored as one
+pickled :class:`WorldSnapshot` per world in the snapshot directory and read
+back with a single file read on the next start. Worlds loaded with
+``lazy_zones`` store only their zone catalog and global items, and a
+snapshot written in the other zone mode is rebuilt.
+
+Each snapshot records a SHA-256 content hash of the package files it was
+built from (``world.json`` plus ``zones/*.json``) together with their sizes
+and modification times. A snapshot is used when the files still have the
+recorded sizes and times, or, if they were touched (e.g. a fresh checkout
+during deploy), when their content still hashes to the recorded value.
+Anything else — edited files, added or removed zones, an older snapshot
+format, an unreadable file — is a mismatch and the world is rebuilt from
+the package and the snapshot rewritten.
+
+Snapshots are written only by this server (or ``mud-server compile-worlds``)
+into its own runtime directory and are trusted like the database file.
+
+Configuration (``[worlds]`` in server.ini):
+    snapshots_enabled: Master switch (default true)
+    snapshot_dir: Directory for snapshots; empty means ``world_snapshots/``
+        next to the database file
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mud_server.core.world import Item, Room, RoomGraph, Zone
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever WorldSnapshot or any class it pickles changes shape.
+SNAPSHOT_FORMAT_VERSION = 2
+
+SNAPSHOT_DIRNAME = "world_snapshots"
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# (path relative to the world root, size in bytes, mtime in nanoseconds)
+FileStamp = tuple[str, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class WorldPackageFingerprint:
+    """
+    Identity of the files a world package is loaded from.
+
+    Attributes:
+        content_hash: SHA-256 over each file's relative path and bytes
+        stamps: Per file (relative path, size, mtime_ns), in hashing order
+    """
+
+    content_hash: str
+    stamps: tuple[FileStamp, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class WorldSnapshot:
+    """
+    Parsed and compiled state of one world package.
+
+    Attributes:
+        format_version: ``SNAPSHOT_FORMAT_VERSION`` at write time
+        world_id: World package directory name
+        fingerprint: Package files the snapshot was built from
+        world_data: Parsed ``world.json`` (translation and axis blocks are
+            initialised from it on every load)
+        lazy_zones: Whether the world was loaded with lazy zone loading
+        zones: Zone ID -> Zone (with ``lazy_zones``, the zone catalog)
+        rooms: Room ID -> Room (empty with ``lazy_zones``)
+        items: Item ID -> Item (global items only with ``lazy_zones``)
+        graph: Compiled exit graph with pre-rendered description templates
+            (None with ``lazy_zones``)
+    """
+
+    format_version: int
+    world_id: str
+    fingerprint: WorldPackageFingerprint
+    world_data: dict[str, Any]
+    lazy_zones: bool
+    zones: dict[str, Zone]
+    rooms: dict[str, Room]
+    items: dict[str, Item]
+    graph: RoomGraph | None
+
+
+def resolve_snapshot_dir() -> Path | None:
+    """
+    Return the configured snapshot directory, or None when snapshots are off.
+
+    Returns:
+        Absolute directory path (not necessarily existing yet)
+    """
+    from mud_server.config import PROJECT_ROOT, config
+
+    if not config.worlds.snapshots_enabled:
+        return None
+    raw = config.worlds.snapshot_dir.strip()
+    if not raw:
+        return config.database.absolute_path.parent / SNAPSHOT_DIRNAME
+    path = Path(raw)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def snapshot_path(snapshot_dir: Path, world_id: str) -> Path:
+    """Return the snapshot file path for a world."""
+    return snapshot_dir / f"{world_id}{SNAPSHOT_SUFFIX}"
+
+
+def _package_files(world_root: Path) -> list[Path]:
+    """Files a world load may read: world.json and every zone file."""
+    files = [world_root / "world.json"]
+    zones_dir = world_root / "zones"
+    if zones_dir.is_dir():
+        files.extend(sorted(zones_dir.glob("*.json")))
+    return files
+
+
+def _stamp_files(world_root: Path) -> tuple[FileStamp, ...]:
+    """Return (relative path, size, mtime_ns) for each package file."""
+    stamps: list[FileStamp] = []
+    for path in _package_files(world_root):
+        stat = path.stat()
+        stamps.append((path.relative_to(world_root).as_posix(), stat.st_size, stat.st_mtime_ns))
+    return tuple(stamps)
+
+
+def _hash_files(world_root: Path, stamps: tuple[FileStamp, ...]) -> str:
+    """Hash the contents of the stamped package files."""
+    digest = hashlib.sha256()
+    for relative_path, _size, _mtime in stamps:
+        digest.update(relative_path.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((world_root / relative_path).read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def fingerprint_package(world_root: Path) -> WorldPackageFingerprint:
+    """
+    Fingerprint a world package.
+
+    Raises:
+        FileNotFoundError: If the package has no world.json
+    """
+    stamps = _stamp_files(world_root)
+    return WorldPackageFingerprint(
+        content_hash=_hash_files(world_root, stamps),
+        stamps=stamps,
+    )
+
+
+def load_snapshot(snapshot_dir: Path, world_root: Path) -> WorldSnapshot | None:
+    """
+    Read a world's snapshot if it still matches the package on disk.
+
+    Args:
+        snapshot_dir: Directory holding snapshots
+        world_root: World package directory
+
+    Returns:
+        The snapshot, or None when it is missing, unreadable or stale
+    """
+    world_id = world_root.name
+    path = snapshot_path(snapshot_dir, world_id)
+    try:
+        payload = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        logger.warning(f"Cannot read world snapshot {path}: {exc}")
+        return None
+
+    try:
+        snapshot = pickle.loads(payload)
+    except Exception as exc:
+        logger.warning(f"Ignoring unreadable world snapshot {path}: {exc}")
+        return None
+    if (
+        not isinstance(snapshot, WorldSnapshot)
+        or snapshot.format_version != SNAPSHOT_FORMAT_VERSION
+        or snapshot.world_id != world_id
+    ):
+        logger.info(f"Ignoring world snapshot {path} from another format or world")
+        return None
+
+    try:
+        stamps = _stamp_files(world_root)
+        if stamps == snapshot.fingerprint.stamps:
+            return snapshot
+        # Touched but possibly unchanged (fresh checkout, copied package).
+        same_files = [stamp[0] for stamp in stamps] == [
+            stamp[0] for stamp in snapshot.fingerprint.stamps
+        ]
+        if same_files and _hash_files(world_root, stamps) == snapshot.fingerprint.content_hash:
+            snapshot = replace(
+                snapshot,
+                fingerprint=replace(snapshot.fingerprint, stamps=stamps),
+            )
+            _try_write_snapshot(snapshot_dir, snapshot)
+            return snapshot
+    except OSError as exc:
+        logger.warning(f"Cannot fingerprint world package {world_root}: {exc}")
+        return None
+
+    logger.info(f"World snapshot for '{world_id}' is stale; rebuilding")
+    return None
+
+
+def write_snapshot(snapshot_dir: Path, snapshot: WorldSnapshot) -> Path:
+    """
+    Atomically write a snapshot so readers never see a partial file.
+
+    Args:
+        snapshot_dir: Directory holding snapshots (created if missing)
+        snapshot: Snapshot to store
+
+    Returns:
+        Path of the written snapshot
+
+    Raises:
+        OSError: If the directory or file cannot be written
+    """
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    path = snapshot_path(snapshot_dir, snapshot.world_id)
+    payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    fd, temp_name = tempfile.mkstemp(dir=snapshot_dir, prefix=f".{snapshot.world_id}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _try_write_snapshot(snapshot_dir: Path, snapshot: WorldSnapshot) -> None:
+    """Write a snapshot, logging instead of raising (the load itself succeeded)."""
+    try:
+        write_snapshot(snapshot_dir, snapshot)
+    except Exception as exc:
+        logger.warning(f"Could not write world snapshot for '{snapshot.world_id}': {exc}")
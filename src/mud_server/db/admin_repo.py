@@ -131,13 +131,13 @@ def get_table_rows(
             cursor = conn.cursor()
 
             quoted_table = _quote_identifier(table_name)
-            cursor.execute(f"PRAGMA table_info({quoted_table})")
-            columns = [row[1] for row in cursor.fetchall()]
-
             cursor.execute(
                 f"SELECT * FROM {quoted_table} LIMIT ? OFFSET ?",  # nosec B608
                 (limit, offset),
             )
+            # Headers come from the result set: ``PRAGMA table_info`` omits
+            # generated columns that ``SELECT *`` returns.
+            columns = [str(column[0]) for column in cursor.description]
             rows = [list(row) for row in cursor.fetchall()]
 
             return columns, rows
@@ -173,14 +173,14 @@ def get_all_users_detailed() -> list[dict[str, Any]]:
                            SELECT 1
                            FROM sessions s
                            WHERE s.user_id = u.id
-                             AND (s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now'))
+                             AND s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)
                        ) AS is_online_account,
                        EXISTS(
                            SELECT 1
                            FROM sessions s
                            WHERE s.user_id = u.id
                              AND s.character_id IS NOT NULL
-                             AND (s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now'))
+                             AND s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)
                        ) AS is_online_in_world,
                        (
                            SELECT GROUP_CONCAT(world_id)
@@ -190,9 +190,7 @@ def get_all_users_detailed() -> list[dict[str, Any]]:
                                WHERE s.user_id = u.id
                                  AND s.character_id IS NOT NULL
                                  AND s.world_id IS NOT NULL
-                                 AND (
-                                   s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now')
-                                 )
+                                 AND s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)
                                ORDER BY s.world_id
                            )
                        ) AS online_world_ids_csv
@@ -334,7 +332,7 @@ def get_all_sessions(*, world_id: str | None = None) -> list[dict[str, Any]]:
                     FROM sessions s
                     JOIN users u ON u.id = s.user_id
                     LEFT JOIN characters c ON c.id = s.character_id
-                    WHERE s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now')
+                    WHERE s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)
                     ORDER BY s.created_at DESC
                     """)
             else:
@@ -352,7 +350,7 @@ def get_all_sessions(*, world_id: str | None = None) -> list[dict[str, Any]]:
                     FROM sessions s
                     JOIN users u ON u.id = s.user_id
                     LEFT JOIN characters c ON c.id = s.character_id
-                    WHERE (s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now'))
+                    WHERE s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)
                       AND s.world_id = ?
                     ORDER BY s.created_at DESC
                     """,
@@ -392,10 +390,12 @@ def get_active_connections(*, world_id: str | None = None) -> list[dict[str, Any
         with connection_scope() as conn:
             cursor = conn.cursor()
 
-            where_clauses = ["(s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now'))"]
+            where_clauses = ["s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)"]
             params: list[str] = []
             if config.session.active_window_minutes > 0:
-                where_clauses.append("datetime(s.last_activity) >= datetime('now', ?)")
+                where_clauses.append(
+                    "s.last_activity_epoch >= CAST(strftime('%s', 'now', ?) AS INTEGER)"
+                )
                 params.append(f"-{config.session.active_window_minutes} minutes")
 
             sql = f"""
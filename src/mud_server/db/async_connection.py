@@ -0,0 +1,212 @@
+"""aiosqlite connection primitives for async request handlers.
+
+The sync layer in :mod:`mud_server.db.connection` runs queries on the calling
+thread, which for ``async def`` routes is the event loop itself: one slow query
+(or a 5-second ``busy_timeout`` wait) stalls every connected player. This
+module provides the async counterpart used by :mod:`mud_server.db.async_repo`.
+
+Each aiosqlite connection owns a worker thread, so SQLite work happens off the
+event loop and the route only awaits the result. Connections are pooled the
+same way as the sync layer (bounded idle set, never-blocking checkout, reset on
+release) and are configured with the same per-connection pragmas.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import aiosqlite
+
+from mud_server.db.connection import ConnectionPoolStats, connection_pragma_statements, get_db_path
+
+
+async def open_async_connection(db_path: Path | None = None) -> aiosqlite.Connection:
+    """Open and configure one aiosqlite connection.
+
+    Args:
+        db_path: Database file; defaults to the configured runtime database.
+    """
+    connection = aiosqlite.connect(str(db_path or get_db_path()))
+    # aiosqlite (pinned 0.22.x) runs each connection on a non-daemon worker
+    # thread. An idle pooled connection that is never closed (tests, scripts
+    # that skip the API lifespan) would otherwise block interpreter exit.
+    connection._thread.daemon = True  # noqa: SLF001 - see comment above
+    await connection
+    try:
+        for statement in connection_pragma_statements():
+            await connection.execute(statement)
+    except BaseException:
+        await connection.close()
+        raise
+    return connection
+
+
+class AsyncConnectionPool:
+    """Bounded LIFO pool of configured aiosqlite connections for one database.
+
+    Mirrors :class:`mud_server.db.connection.ConnectionPool`: only *idle*
+    connections are bounded, checkouts never wait, and connections are rolled
+    back on release so a read scope cannot leak uncommitted work. All state is
+    touched from the event loop thread only, so no lock is needed.
+    """
+
+    def __init__(self, *, db_path: Path, max_size: int, health_check: bool = True) -> None:
+        self.db_path = db_path
+        self.max_size = max(0, int(max_size))
+        self.health_check = health_check
+        self._idle: list[aiosqlite.Connection] = []
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    async def acquire(self) -> aiosqlite.Connection:
+        """Check out a healthy connection, opening a new one when none are idle."""
+        while self._idle:
+            connection = self._idle.pop()
+            if await self._reset(connection):
+                self._reused += 1
+                return connection
+            await self._discard(connection)
+        connection = await open_async_connection(self.db_path)
+        self._created += 1
+        return connection
+
+    async def release(self, connection: aiosqlite.Connection) -> None:
+        """Return a connection to the pool, closing it when it cannot be reused."""
+        if not await self._reset(connection):
+            await self._discard(connection)
+            return
+        if not self._closed and len(self._idle) < self.max_size:
+            self._idle.append(connection)
+            return
+        await self._discard(connection)
+
+    async def close(self) -> None:
+        """Close all idle connections and stop retaining released ones."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await _close_quietly(connection)
+
+    def stats(self) -> ConnectionPoolStats:
+        """Return a snapshot of pool counters."""
+        return ConnectionPoolStats(
+            db_path=str(self.db_path),
+            max_size=self.max_size,
+            idle=len(self._idle),
+            created=self._created,
+            reused=self._reused,
+            discarded=self._discarded,
+        )
+
+    async def _reset(self, connection: aiosqlite.Connection) -> bool:
+        """Roll back leftover transaction state and optionally ping the handle."""
+        try:
+            if connection.in_transaction:
+                await connection.rollback()
+            if self.health_check:
+                async with connection.execute("SELECT 1") as cursor:
+                    await cursor.fetchone()
+        except (aiosqlite.Error, ValueError):
+            # ValueError: aiosqlite raises it for operations on a closed connection.
+            return False
+        return True
+
+    async def _discard(self, connection: aiosqlite.Connection) -> None:
+        """Close one connection and count it as discarded."""
+        await _close_quietly(connection)
+        self._discarded += 1
+
+
+async def _close_quietly(connection: aiosqlite.Connection) -> None:
+    """Close a connection, ignoring errors from already-broken handles."""
+    try:
+        await connection.close()
+    except (aiosqlite.Error, ValueError):
+        pass
+
+
+_active_async_pool: AsyncConnectionPool | None = None
+
+
+async def get_async_connection_pool() -> AsyncConnectionPool | None:
+    """Return the process-wide async pool for the configured database, if enabled.
+
+    Keyed by database path, size and health-check setting like the sync pool;
+    when any of them changes the previous pool is closed and replaced.
+
+    Returns:
+        Active pool, or ``None`` when ``database.pool_size`` is ``0``.
+    """
+    global _active_async_pool
+    from mud_server.config import config
+
+    settings = config.database
+    if settings.pool_size <= 0:
+        await close_async_connection_pool()
+        return None
+
+    db_path = get_db_path()
+    pool = _active_async_pool
+    if (
+        pool is not None
+        and pool.db_path == db_path
+        and pool.max_size == settings.pool_size
+        and pool.health_check == settings.pool_health_check
+    ):
+        return pool
+
+    _active_async_pool = AsyncConnectionPool(
+        db_path=db_path,
+        max_size=settings.pool_size,
+        health_check=settings.pool_health_check,
+    )
+    if pool is not None:
+        await pool.close()
+    return _active_async_pool
+
+
+async def close_async_connection_pool() -> None:
+    """Close and forget the process-wide async pool (shutdown/tests)."""
+    global _active_async_pool
+    pool, _active_async_pool = _active_async_pool, None
+    if pool is not None:
+        await pool.close()
+
+
+@asynccontextmanager
+async def async_connection_scope(*, write: bool = False) -> AsyncIterator[aiosqlite.Connection]:
+    """Async twin of :func:`mud_server.db.connection.connection_scope`.
+
+    Args:
+        write: When True, commit on success and rollback on exceptions.
+
+    Yields:
+        Configured aiosqlite connection.
+
+    Note:
+        Async scopes never join a sync ``unit_of_work()``; they are meant for
+        short, self-contained route lookups and writes.
+    """
+    pool = await get_async_connection_pool()
+    connection = await pool.acquire() if pool is not None else await open_async_connection()
+    try:
+        yield connection
+        if write:
+            await connection.commit()
+    except Exception:
+        if write:
+            try:
+                await connection.rollback()
+            except (aiosqlite.Error, ValueError):
+                # Preserve the original exception while best-effort rolling back.
+                pass
+        raise
+    finally:
+        if pool is not None:
+            await pool.release(connection)
+        else:
+            await connection.close()
@@ -0,0 +1,463 @@
+"""Async counterparts of the hot session, user, character and chat queries.
+
+These coroutines back the ``async def`` game and auth routes so request
+handling never blocks the event loop on SQLite I/O. Each function mirrors the
+sync repository function of the same name (``<name>_async``): same SQL (shared
+module constants where the statement is non-trivial), same return shapes, and
+the same typed ``DatabaseReadError``/``DatabaseWriteError`` wrapping with the
+same stable operation identifiers.
+
+Only request-path functions live here. Admin, provisioning and bootstrap code
+keeps using the sync repositories.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NoReturn
+
+import aiosqlite
+
+from mud_server.db.async_connection import async_connection_scope
+from mud_server.db.characters_repo import (
+    _CHARACTER_BY_ID_SQL,
+    _character_row_to_dict,
+)
+from mud_server.db.chat_repo import (
+    _CHAT_MESSAGE_TIMESTAMP_SQL,
+    _INSERT_CHAT_MESSAGE_SQL,
+    _ROOM_BUFFER_SQL,
+    _ROOM_MESSAGES_FOR_CHARACTER_SQL,
+    _ROOM_MESSAGES_SQL,
+    _buffered_read,
+    _buffered_to_dicts,
+    _BufferedChatMessage,
+    _cursor_messages_from_rows,
+    _messages_from_rows,
+    _messages_since_params,
+    _room_chat_buffers,
+)
+from mud_server.db.errors import (
+    DatabaseError,
+    DatabaseOperationContext,
+    DatabaseReadError,
+    DatabaseWriteError,
+)
+from mud_server.db.presence import _WORLD_PRESENCE_SQL, _occupants_from_rows, room_presence
+from mud_server.db.session_invalidation import notify_sessions_changed
+from mud_server.db.sessions_repo import (
+    _SESSION_BY_ID_SQL,
+    _SESSION_CONTEXT_SQL,
+    _session_activity_statement,
+    _session_context_row_to_dict,
+    _session_row_to_dict,
+)
+
+
+def _raise_read_error(operation: str, exc: Exception, *, details: str | None = None) -> NoReturn:
+    """Raise a typed repository read error while preserving chained cause."""
+    if isinstance(exc, DatabaseError):
+        raise exc
+    raise DatabaseReadError(
+        context=DatabaseOperationContext(operation=operation, details=details),
+        cause=exc,
+    ) from exc
+
+
+def _raise_write_error(operation: str, exc: Exception, *, details: str | None = None) -> NoReturn:
+    """Raise a typed repository write error while preserving chained cause."""
+    if isinstance(exc, DatabaseError):
+        raise exc
+    raise DatabaseWriteError(
+        context=DatabaseOperationContext(operation=operation, details=details),
+        cause=exc,
+    ) from exc
+
+
+async def _fetchone(
+    conn: aiosqlite.Connection, sql: str, params: tuple[Any, ...]
+) -> aiosqlite.Row | None:
+    """Execute one statement and return its first row."""
+    async with conn.execute(sql, params) as cursor:
+        return await cursor.fetchone()
+
+
+async def _fetchall(
+    conn: aiosqlite.Connection, sql: str, params: tuple[Any, ...]
+) -> list[aiosqlite.Row]:
+    """Execute one statement and return all rows."""
+    async with conn.execute(sql, params) as cursor:
+        return list(await cursor.fetchall())
+
+
+async def _execute_rowcount(conn: aiosqlite.Connection, sql: str, params: tuple[Any, ...]) -> int:
+    """Execute one write statement and return the affected row count."""
+    async with conn.execute(sql, params) as cursor:
+        return int(cursor.rowcount or 0)
+
+
+async def _resolve_character_id(
+    conn: aiosqlite.Connection, name: str, *, world_id: str
+) -> int | None:
+    """Resolve a world-scoped character name to its id."""
+    row = await _fetchone(
+        conn,
+        "SELECT id FROM characters WHERE name = ? AND world_id = ? LIMIT 1",
+        (name, world_id),
+    )
+    return int(row[0]) if row else None
+
+
+async def _viewer_character_id(
+    conn: aiosqlite.Connection, name: str, *, world_id: str
+) -> int | None:
+    """:func:`_resolve_character_id` through the chat buffers' viewer cache."""
+    character_id = _room_chat_buffers.viewer_id(world_id, name)
+    if character_id is None:
+        character_id = await _resolve_character_id(conn, name, world_id=world_id)
+        if character_id is not None:
+            _room_chat_buffers.remember_viewer(world_id, name, character_id)
+    return character_id
+
+
+async def _read_room_buffer(
+    conn: aiosqlite.Connection,
+    room: str,
+    *,
+    world_id: str,
+    since_id: int | None,
+    limit: int,
+    character_id: int | None,
+) -> list[_BufferedChatMessage] | None:
+    """Async :func:`mud_server.db.chat_repo._read_room_buffer`."""
+    snapshot = _room_chat_buffers.snapshot(world_id, room)
+    if snapshot is None:
+        token = _room_chat_buffers.begin_hydrate(world_id, room)
+        if token is None:
+            return None
+        rows = await _fetchall(conn, _ROOM_BUFFER_SQL, (world_id, room, token[0]))
+        snapshot = _room_chat_buffers.finish_hydrate(world_id, room, rows, token)
+    return _buffered_read(snapshot, since_id=since_id, limit=limit, character_id=character_id)
+
+
+# ============================================================================
+# SESSIONS
+# ============================================================================
+
+
+async def get_session_by_id_async(session_id: str) -> dict[str, Any] | None:
+    """Async :func:`mud_server.db.sessions_repo.get_session_by_id`."""
+    try:
+        async with async_connection_scope() as conn:
+            row = await _fetchone(conn, _SESSION_BY_ID_SQL, (session_id,))
+        return _session_row_to_dict(row) if row else None
+    except Exception as exc:
+        _raise_read_error(
+            "sessions.get_session_by_id",
+            exc,
+            details=f"session_id={session_id!r}",
+        )
+
+
+async def get_session_context_async(session_id: str) -> dict[str, Any] | None:
+    """Async :func:`mud_server.db.sessions_repo.get_session_context`."""
+    try:
+        async with async_connection_scope() as conn:
+            row = await _fetchone(conn, _SESSION_CONTEXT_SQL, (session_id,))
+        return _session_context_row_to_dict(row) if row else None
+    except Exception as exc:
+        _raise_read_error(
+            "sessions.get_session_context",
+            exc,
+            details=f"session_id={session_id!r}",
+        )
+
+
+async def update_session_activity_async(session_id: str) -> bool:
+    """Async :func:`mud_server.db.sessions_repo.update_session_activity`."""
+    try:
+        async with async_connection_scope(write=True) as conn:
+            sql, params = _session_activity_statement(session_id)
+            return await _execute_rowcount(conn, sql, params) > 0
+    except Exception as exc:
+        _raise_write_error(
+            "sessions.update_session_activity",
+            exc,
+            details=f"session_id={session_id!r}",
+        )
+
+
+async def remove_session_by_id_async(session_id: str) -> bool:
+    """Async :func:`mud_server.db.sessions_repo.remove_session_by_id`."""
+    try:
+        async with async_connection_scope(write=True) as conn:
+            removed = await _execute_rowcount(
+                conn, "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+        notify_sessions_changed(session_id=session_id)
+        return removed > 0
+    except Exception as exc:
+        _raise_write_error(
+            "sessions.remove_session_by_id",
+            exc,
+            details=f"session_id={session_id!r}",
+        )
+
+
+async def set_session_character_async(session_id: str, character_id: int, *, world_id: str) -> bool:
+    """Async :func:`mud_server.db.sessions_repo.set_session_character`."""
+    try:
+        async with async_connection_scope(write=True) as conn:
+            updated = await _execute_rowcount(
+                conn,
+                "UPDATE sessions SET character_id = ?, world_id = ? WHERE session_id = ?",
+                (character_id, world_id, session_id),
+            )
+        notify_sessions_changed(session_id=session_id)
+        return updated > 0
+    except Exception as exc:
+        _raise_write_error(
+            "sessions.set_session_character",
+            exc,
+            details=f"session_id={session_id!r}, character_id={character_id}",
+        )
+
+
+# ============================================================================
+# USERS
+# ============================================================================
+
+
+async def get_username_by_id_async(user_id: int) -> str | None:
+    """Async :func:`mud_server.db.users_repo.get_username_by_id`."""
+    try:
+        async with async_connection_scope() as conn:
+            row = await _fetchone(conn, "SELECT username FROM users WHERE id = ?", (user_id,))
+        return row[0] if row else None
+    except Exception as exc:
+        _raise_read_error("users.get_username_by_id", exc, details=f"user_id={user_id}")
+
+
+async def get_user_role_async(username: str) -> str | None:
+    """Async :func:`mud_server.db.users_repo.get_user_role`."""
+    try:
+        async with async_connection_scope() as conn:
+            row = await _fetchone(conn, "SELECT role FROM users WHERE username = ?", (username,))
+        return row[0] if row else None
+    except Exception as exc:
+        _raise_read_error("users.get_user_role", exc, details=f"username={username!r}")
+
+
+# ============================================================================
+# CHARACTERS
+# ============================================================================
+
+
+async def get_character_by_id_async(character_id: int) -> dict[str, Any] | None:
+    """Async :func:`mud_server.db.characters_repo.get_character_by_id`."""
+    try:
+        async with async_connection_scope() as conn:
+            row = await _fetchone(conn, _CHARACTER_BY_ID_SQL, (character_id,))
+        return _character_row_to_dict(row) if row else None
+    except Exception as exc:
+        _raise_read_error(
+            "characters.get_character_by_id",
+            exc,
+            details=f"character_id={character_id}",
+        )
+
+
+async def get_character_name_by_id_async(character_id: int) -> str | None:
+    """Async :func:`mud_server.db.characters_repo.get_character_name_by_id`."""
+    try:
+        async with async_connection_scope() as conn:
+            row = await _fetchone(conn, "SELECT name FROM characters WHERE id = ?", (character_id,))
+        return row[0] if row else None
+    except Exception as exc:
+        _raise_read_error(
+            "characters.get_character_name_by_id",
+            exc,
+            details=f"character_id={character_id}",
+        )
+
+
+async def get_character_room_async(name: str, *, world_id: str) -> str | None:
+    """Async :func:`mud_server.db.characters_repo.get_character_room`."""
+    try:
+        async with async_connection_scope() as conn:
+            character_id = await _resolve_character_id(conn, name, world_id=world_id)
+            if character_id is None:
+                return None
+            row = await _fetchone(
+                conn,
+                "SELECT room_id FROM character_locations WHERE character_id = ? AND world_id = ?",
+                (character_id, world_id),
+            )
+        return row[0] if row else None
+    except Exception as exc:
+        _raise_read_error(
+            "characters.get_character_room",
+            exc,
+            details=f"name={name!r}, world_id={world_id!r}",
+        )
+
+
+async def get_characters_in_room_async(room: str, *, world_id: str) -> list[str]:
+    """Async :func:`mud_server.db.characters_repo.get_characters_in_room`."""
+    occupants = room_presence.characters_in_room(world_id, room)
+    if occupants is not None:
+        return occupants
+    try:
+        async with async_connection_scope() as conn:
+            token = room_presence.begin_load(world_id)
+            rows = await _fetchall(conn, _WORLD_PRESENCE_SQL, (world_id,))
+        room_presence.finish_load(world_id, rows, token)
+        return _occupants_from_rows(rows, room)
+    except Exception as exc:
+        _raise_read_error(
+            "characters.get_characters_in_room",
+            exc,
+            details=f"room={room!r}, world_id={world_id!r}",
+        )
+
+
+# ============================================================================
+# CHAT
+# ============================================================================
+
+
+async def add_chat_message_async(
+    character_name: str,
+    message: str,
+    room: str,
+    recipient_character_name: str | None = None,
+    *,
+    world_id: str,
+) -> bool:
+    """Async :func:`mud_server.db.chat_repo.add_chat_message`.
+
+    The legacy ``recipient`` alias is intentionally not carried over.
+    """
+    try:
+        async with async_connection_scope(write=True) as conn:
+            sender_row = await _fetchone(
+                conn,
+                "SELECT id, user_id FROM characters WHERE name = ? AND world_id = ?",
+                (character_name, world_id),
+            )
+            if not sender_row:
+                return False
+
+            recipient_id: int | None = None
+            if recipient_character_name:
+                recipient_id = await _resolve_character_id(
+                    conn, recipient_character_name, world_id=world_id
+                )
+
+            async with conn.execute(
+                _INSERT_CHAT_MESSAGE_SQL,
+                (int(sender_row[0]), sender_row[1], message, world_id, room, recipient_id),
+            ) as cursor:
+                message_id = int(cursor.lastrowid or 0)
+            timestamp_row = await _fetchone(conn, _CHAT_MESSAGE_TIMESTAMP_SQL, (message_id,))
+        _room_chat_buffers.append(
+            world_id,
+            room,
+            _BufferedChatMessage(
+                id=message_id,
+                username=character_name,
+                message=message,
+                timestamp=timestamp_row[0] if timestamp_row else None,
+                sender_id=int(sender_row[0]),
+                recipient_id=recipient_id,
+            ),
+        )
+        return True
+    except Exception as exc:
+        _raise_write_error(
+            "chat.add_chat_message",
+            exc,
+            details=f"character_name={character_name!r}, world_id={world_id!r}, room={room!r}",
+        )
+
+
+async def get_room_messages_async(
+    room: str,
+    *,
+    limit: int = 50,
+    character_name: str | None = None,
+    world_id: str,
+) -> list[dict[str, Any]]:
+    """Async :func:`mud_server.db.chat_repo.get_room_messages`.
+
+    With ``character_name`` the result includes public messages plus whispers
+    to or from that character; an unknown character yields ``[]``.
+    """
+    try:
+        async with async_connection_scope() as conn:
+            character_id: int | None = None
+            if character_name:
+                character_id = await _viewer_character_id(conn, character_name, world_id=world_id)
+                if character_id is None:
+                    return []
+            buffered = await _read_room_buffer(
+                conn,
+                room,
+                world_id=world_id,
+                since_id=None,
+                limit=limit,
+                character_id=character_id,
+            )
+            if buffered is not None:
+                return _buffered_to_dicts(buffered, with_ids=False)
+            if character_id is not None:
+                rows = await _fetchall(
+                    conn,
+                    _ROOM_MESSAGES_FOR_CHARACTER_SQL,
+                    (world_id, room, character_id, character_id, limit),
+                )
+            else:
+                rows = await _fetchall(conn, _ROOM_MESSAGES_SQL, (world_id, room, limit))
+        return _messages_from_rows(rows)
+    except Exception as exc:
+        _raise_read_error(
+            "chat.get_room_messages",
+            exc,
+            details=f"world_id={world_id!r}, room={room!r}, limit={limit}",
+        )
+
+
+async def get_room_messages_since_async(
+    room: str,
+    *,
+    since_id: int | None,
+    limit: int = 50,
+    character_name: str,
+    world_id: str,
+) -> list[dict[str, Any]]:
+    """Async :func:`mud_server.db.chat_repo.get_room_messages_since`."""
+    try:
+        async with async_connection_scope() as conn:
+            character_id = await _viewer_character_id(conn, character_name, world_id=world_id)
+            if character_id is None:
+                return []
+            buffered = await _read_room_buffer(
+                conn,
+                room,
+                world_id=world_id,
+                since_id=since_id,
+                limit=limit,
+                character_id=character_id,
+            )
+            if buffered is not None:
+                return _buffered_to_dicts(buffered, with_ids=True)
+            sql, params = _messages_since_params(
+                room, since_id=since_id, limit=limit, character_id=character_id, world_id=world_id
+            )
+            rows = await _fetchall(conn, sql, params)
+        return _cursor_messages_from_rows(rows, newest_first=since_id is None)
+    except Exception as exc:
+        _raise_read_error(
+            "chat.get_room_messages_since",
+            exc,
+            details=f"world_id={world_id!r}, room={room!r}, since_id={since_id}, limit={limit}",
+        )
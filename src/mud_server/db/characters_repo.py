@@ -10,13 +10,15 @@ import json
 import sqlite3
 from typing import Any, NoReturn, cast
 
-from mud_server.db.connection import connection_scope
+from mud_server.db.connection import connection_scope, run_after_commit
 from mud_server.db.errors import (
     DatabaseError,
     DatabaseOperationContext,
     DatabaseReadError,
     DatabaseWriteError,
 )
+from mud_server.db.presence import _occupants_from_rows, _read_world_presence, room_presence
+from mud_server.db.session_invalidation import notify_sessions_changed
 
 
 def _raise_read_error(operation: str, exc: Exception, *, details: str | None = None) -> NoReturn:
@@ -53,6 +55,28 @@ def _count_user_characters_in_world(cursor: Any, *, user_id: int, world_id: str)
     return int(row[0]) if row else 0
 
 
+# SQL and row mapping shared with ``mud_server.db.async_repo``.
+_CHARACTER_BY_ID_SQL = """
+    SELECT id, user_id, name, world_id, inventory, is_guest_created, created_at, updated_at
+    FROM characters
+    WHERE id = ?
+"""
+
+
+def _character_row_to_dict(row: Any) -> dict[str, Any]:
+    """Map a ``_CHARACTER_BY_ID_SQL`` row to the public character dict shape."""
+    return {
+        "id": int(row[0]),
+        "user_id": row[1],
+        "name": row[2],
+        "world_id": row[3],
+        "inventory": row[4],
+        "is_guest_created": bool(row[5]),
+        "created_at": row[6],
+        "updated_at": row[7],
+    }
+
+
 def _resolve_character_name(cursor: Any, name: str, *, world_id: str) -> str | None:
     """Resolve a character name strictly by character identity in an explicit world."""
     cursor.execute(
@@ -65,6 +89,13 @@ def _resolve_character_name(cursor: Any, name: str, *, world_id: str) -> str | N
     return None
 
 
+def _clear_room_chat_buffers_after_commit() -> None:
+    """Reload buffered room chat once a sender name change or removal commits."""
+    from mud_server.db.chat_repo import clear_room_chat_buffers
+
+    run_after_commit(clear_room_chat_buffers)
+
+
 def _generate_default_character_name(cursor: Any, username: str) -> str:
     """Generate a unique compatibility default character name for a username."""
     base = f"{username}_char"
@@ -303,27 +334,11 @@ def get_character_by_id(character_id: int) -> dict[str, Any] | None:
     try:
         with connection_scope() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT id, user_id, name, world_id, inventory, is_guest_created, created_at, updated_at
-                FROM characters
-                WHERE id = ?
-                """,
-                (character_id,),
-            )
+            cursor.execute(_CHARACTER_BY_ID_SQL, (character_id,))
             row = cursor.fetchone()
         if not row:
             return None
-        return {
-            "id": int(row[0]),
-            "user_id": row[1],
-            "name": row[2],
-            "world_id": row[3],
-            "inventory": row[4],
-            "is_guest_created": bool(row[5]),
-            "created_at": row[6],
-            "updated_at": row[7],
-        }
+        return _character_row_to_dict(row)
     except Exception as exc:
         _raise_read_error(
             "characters.get_character_by_id",
@@ -404,7 +419,9 @@ def tombstone_character(character_id: int) -> bool:
                 """,
                 (tombstone_name, character_id),
             )
-            return True
+        notify_sessions_changed(character_id=character_id)
+        _clear_room_chat_buffers_after_commit()
+        return True
     except Exception as exc:
         _raise_write_error(
             "characters.tombstone_character",
@@ -420,7 +437,9 @@ def delete_character(character_id: int) -> bool:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM characters WHERE id = ?", (character_id,))
             deleted = cursor.rowcount > 0
-            return deleted
+        notify_sessions_changed(character_id=character_id)
+        _clear_room_chat_buffers_after_commit()
+        return deleted
     except Exception as exc:
         _raise_write_error(
             "characters.delete_character",
@@ -484,7 +503,8 @@ def set_character_room(name: str, room: str, *, world_id: str) -> bool:
                 """,
                 (character_id, world_id, room),
             )
-            return True
+        run_after_commit(lambda: room_presence.move(world_id, resolved_name, room))
+        return True
     except Exception as exc:
         _raise_write_error(
             "characters.set_character_room",
@@ -494,25 +514,18 @@ def set_character_room(name: str, room: str, *, world_id: str) -> bool:
 
 
 def get_characters_in_room(room: str, *, world_id: str) -> list[str]:
-    """Return active character names in a room for the selected world."""
+    """Return active character names in a room for the selected world.
+
+    Served from the in-memory presence index; the world is loaded from SQLite
+    on first use or after a session change.
+    """
+    occupants = room_presence.characters_in_room(world_id, room)
+    if occupants is not None:
+        return occupants
     try:
         with connection_scope() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT DISTINCT c.name
-                FROM characters c
-                JOIN character_locations l ON c.id = l.character_id
-                JOIN sessions s ON s.character_id = c.id
-                WHERE l.world_id = ?
-                  AND l.room_id = ?
-                  AND (s.world_id IS NULL OR s.world_id = ?)
-                  AND (s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now'))
-                """,
-                (world_id, room, world_id),
-            )
-            rows = cursor.fetchall()
-        return [row[0] for row in rows]
+            rows = _read_world_presence(conn.cursor(), world_id)
+        return _occupants_from_rows(rows, room)
     except Exception as exc:
         _raise_read_error(
             "characters.get_characters_in_room",
@@ -521,6 +534,26 @@ def get_characters_in_room(room: str, *, world_id: str) -> list[str]:
         )
 
 
+def get_occupied_rooms(*, world_id: str) -> set[str]:
+    """Return the rooms holding at least one active character in the world.
+
+    Served from the in-memory presence index like :func:`get_characters_in_room`.
+    """
+    occupied = room_presence.occupied_rooms(world_id)
+    if occupied is not None:
+        return occupied
+    try:
+        with connection_scope() as conn:
+            rows = _read_world_presence(conn.cursor(), world_id)
+        return {room_id for _, room_id, _ in rows if room_id is not None}
+    except Exception as exc:
+        _raise_read_error(
+            "characters.get_occupied_rooms",
+            exc,
+            details=f"world_id={world_id!r}",
+        )
+
+
 def get_character_inventory(name: str, *, world_id: str) -> list[str]:
     """Return character inventory as a JSON-decoded list for an explicit world."""
     try:
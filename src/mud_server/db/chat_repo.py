@@ -2,13 +2,26 @@
 
 This module isolates room/whisper chat persistence from the compatibility
 facade in ``mud_server.db.database``.
+
+Recent room history is served from bounded in-memory buffers, one per
+``(world_id, room)``, holding the last ``chat.room_buffer_size`` messages with
+their whisper sender/recipient ids. A buffer is loaded from SQLite the first
+time its room is read, and writes are appended once they commit. Reads that
+reach further back than a buffer holds fall back to SQLite, which remains the
+durable store.
 """
 
 from __future__ import annotations
 
+import sqlite3
+import threading
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
 from typing import Any, NoReturn
 
-from mud_server.db.connection import connection_scope
+from mud_server.db.connection import connection_scope, get_db_path, run_after_commit
 from mud_server.db.errors import (
     DatabaseError,
     DatabaseOperationContext,
@@ -37,6 +50,424 @@ def _raise_write_error(operation: str, exc: Exception, *, details: str | None =
     ) from exc
 
 
+# SQL and row mapping shared with ``mud_server.db.async_repo``.
+_INSERT_CHAT_MESSAGE_SQL = """
+    INSERT INTO chat_messages (
+        character_id,
+        user_id,
+        message,
+        world_id,
+        room,
+        recipient_character_id
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_ROOM_MESSAGES_FOR_CHARACTER_SQL = """
+    SELECT c.name, m.message, m.timestamp
+    FROM chat_messages m
+    JOIN characters c ON c.id = m.character_id
+    WHERE m.world_id = ? AND m.room = ? AND (
+        m.recipient_character_id IS NULL OR
+        m.recipient_character_id = ? OR
+        m.character_id = ?
+    )
+    ORDER BY m.timestamp DESC, m.id DESC
+    LIMIT ?
+"""
+
+_ROOM_MESSAGES_SQL = """
+    SELECT c.name, m.message, m.timestamp
+    FROM chat_messages m
+    JOIN characters c ON c.id = m.character_id
+    WHERE m.world_id = ? AND m.room = ?
+    ORDER BY m.timestamp DESC, m.id DESC
+    LIMIT ?
+"""
+
+
+# Cursor reads: ``m.id`` is the rowid, so ``(world_id, room)`` equality plus
+# ``m.id > ?`` is a range scan on ``idx_chat_messages_world_room``.
+_ROOM_MESSAGES_AFTER_ID_SQL = """
+    SELECT m.id, c.name, m.message, m.timestamp
+    FROM chat_messages m
+    JOIN characters c ON c.id = m.character_id
+    WHERE m.world_id = ? AND m.room = ? AND m.id > ? AND (
+        m.recipient_character_id IS NULL OR
+        m.recipient_character_id = ? OR
+        m.character_id = ?
+    )
+    ORDER BY m.id
+    LIMIT ?
+"""
+
+_LATEST_ROOM_MESSAGES_SQL = """
+    SELECT m.id, c.name, m.message, m.timestamp
+    FROM chat_messages m
+    JOIN characters c ON c.id = m.character_id
+    WHERE m.world_id = ? AND m.room = ? AND (
+        m.recipient_character_id IS NULL OR
+        m.recipient_character_id = ? OR
+        m.character_id = ?
+    )
+    ORDER BY m.id DESC
+    LIMIT ?
+"""
+
+
+# Buffer hydration: newest ``limit`` rows with the ids needed for whisper
+# visibility, so buffered reads never need the join again.
+_ROOM_BUFFER_SQL = """
+    SELECT m.id, c.name, m.message, m.timestamp, m.character_id, m.recipient_character_id
+    FROM chat_messages m
+    JOIN characters c ON c.id = m.character_id
+    WHERE m.world_id = ? AND m.room = ?
+    ORDER BY m.id DESC
+    LIMIT ?
+"""
+
+_CHAT_MESSAGE_TIMESTAMP_SQL = "SELECT timestamp FROM chat_messages WHERE id = ?"
+
+_CHAT_MESSAGE_RANGE_SQL = """
+    SELECT id, room, timestamp
+    FROM chat_messages
+    WHERE id BETWEEN ? AND ?
+    ORDER BY id
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class _BufferedChatMessage:
+    """One room message as held by a :class:`_RoomChatBuffers` buffer."""
+
+    id: int
+    username: str
+    message: str
+    timestamp: str | None
+    sender_id: int | None
+    recipient_id: int | None
+
+    def visible_to(self, character_id: int | None) -> bool:
+        """Whispers are visible to their two parties; ``None`` sees everything."""
+        return (
+            character_id is None
+            or self.recipient_id is None
+            or character_id in (self.recipient_id, self.sender_id)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _RoomChatSnapshot:
+    """Copy of one room buffer.
+
+    Attributes:
+        messages: Buffered messages, oldest first.
+        floor_id: Every room message with an id above this is in ``messages``
+            (``0`` when the buffer holds the room's whole history).
+    """
+
+    messages: tuple[_BufferedChatMessage, ...]
+    floor_id: int
+
+    def latest(self, limit: int, character_id: int | None) -> list[_BufferedChatMessage] | None:
+        """Newest ``limit`` visible messages, or ``None`` if SQLite may hold more."""
+        visible = [m for m in self.messages if m.visible_to(character_id)]
+        if len(visible) >= limit:
+            return visible[len(visible) - limit :]
+        return visible if self.floor_id == 0 else None
+
+    def after(
+        self, since_id: int, limit: int, character_id: int | None
+    ) -> list[_BufferedChatMessage] | None:
+        """Visible messages with ``id > since_id``, or ``None`` if older than the buffer."""
+        if since_id < self.floor_id:
+            return None
+        newer = (m for m in self.messages if m.id > since_id and m.visible_to(character_id))
+        return [m for _, m in zip(range(limit), newer, strict=False)]
+
+
+class _RoomChatBuffers:
+    """Thread-safe per-room ring buffers of recent chat.
+
+    Hydration reads SQLite outside the lock. A write that commits to a room
+    while it is being loaded bumps that room's version (a prune or clear bumps
+    the epoch), and the stale load is then returned to its caller but not
+    installed. The buffers are dropped when the database path or the configured
+    size changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rooms: dict[tuple[str, str], deque[_BufferedChatMessage]] = {}
+        self._floors: dict[tuple[str, str], int] = {}
+        self._versions: dict[tuple[str, str], int] = {}
+        self._viewers: dict[tuple[str, str], int] = {}
+        self._epoch = 0
+        self._db_path: Path | None = None
+        self._capacity = 0
+
+    def capacity(self) -> int:
+        """Configured messages per room (``0`` when buffering is disabled)."""
+        from mud_server.config import config
+
+        return max(0, config.chat.room_buffer_size)
+
+    def _sync_target_locked(self) -> int:
+        """Drop every buffer if the database or size changed; return the size."""
+        capacity = self.capacity()
+        db_path = get_db_path()
+        if db_path != self._db_path or capacity != self._capacity:
+            self._clear_locked()
+            self._db_path = db_path
+            self._capacity = capacity
+        return capacity
+
+    def _clear_locked(self) -> None:
+        self._rooms.clear()
+        self._floors.clear()
+        self._versions.clear()
+        self._viewers.clear()
+        self._epoch += 1
+
+    def clear(self) -> None:
+        """Forget every buffer and cached viewer id."""
+        with self._lock:
+            self._clear_locked()
+
+    def discard(self, *, world_id: str | None = None, room: str | None = None) -> None:
+        """Drop buffers for one room, one world, or (no filters) everything."""
+        with self._lock:
+            for key in list(self._rooms):
+                if (world_id is None or key[0] == world_id) and (room is None or key[1] == room):
+                    del self._rooms[key]
+                    del self._floors[key]
+            # Loads already in flight may have read the rows being removed.
+            self._epoch += 1
+
+    def viewer_id(self, world_id: str, character_name: str) -> int | None:
+        """Cached character id for a reader, if one has been looked up."""
+        with self._lock:
+            self._sync_target_locked()
+            return self._viewers.get((world_id, character_name))
+
+    def remember_viewer(self, world_id: str, character_name: str, character_id: int) -> None:
+        """Cache a reader's character id for visibility checks."""
+        with self._lock:
+            if self._sync_target_locked() > 0:
+                self._viewers[(world_id, character_name)] = character_id
+
+    def snapshot(self, world_id: str, room: str) -> _RoomChatSnapshot | None:
+        """Copy of the room's buffer, or ``None`` if not loaded."""
+        with self._lock:
+            self._sync_target_locked()
+            buffer = self._rooms.get((world_id, room))
+            if buffer is None:
+                return None
+            return _RoomChatSnapshot(tuple(buffer), self._floors[(world_id, room)])
+
+    def begin_hydrate(self, world_id: str, room: str) -> tuple[int, int, int] | None:
+        """Return a load token for :meth:`finish_hydrate`, or ``None`` if disabled."""
+        with self._lock:
+            capacity = self._sync_target_locked()
+            if capacity == 0:
+                return None
+            return capacity, self._epoch, self._versions.get((world_id, room), 0)
+
+    def finish_hydrate(
+        self,
+        world_id: str,
+        room: str,
+        rows: list[Any],
+        token: tuple[int, int, int],
+        *,
+        install: bool = True,
+    ) -> _RoomChatSnapshot:
+        """Build a snapshot from newest-first :data:`_ROOM_BUFFER_SQL` rows.
+
+        The snapshot is kept as the room's buffer when ``install`` is set and
+        nothing invalidated the load since :meth:`begin_hydrate`.
+        """
+        capacity, epoch, version = token
+        messages = [
+            _BufferedChatMessage(
+                id=int(message_id),
+                username=name,
+                message=message,
+                timestamp=timestamp,
+                sender_id=sender_id,
+                recipient_id=recipient_id,
+            )
+            for message_id, name, message, timestamp, sender_id, recipient_id in reversed(rows)
+        ]
+        floor_id = messages[0].id - 1 if len(messages) >= capacity else 0
+        key = (world_id, room)
+        with self._lock:
+            if (
+                install
+                and self._sync_target_locked() == capacity
+                and self._epoch == epoch
+                and self._versions.get(key, 0) == version
+                and key not in self._rooms
+            ):
+                self._rooms[key] = deque(messages, maxlen=capacity)
+                self._floors[key] = floor_id
+        return _RoomChatSnapshot(tuple(messages), floor_id)
+
+    def append(self, world_id: str, room: str, message: _BufferedChatMessage) -> None:
+        """Add a committed message to a loaded buffer, keeping id order."""
+        key = (world_id, room)
+        with self._lock:
+            self._sync_target_locked()
+            buffer = self._rooms.get(key)
+            if buffer is None:
+                # Invalidate any load of this room that started before the commit.
+                self._versions[key] = self._versions.get(key, 0) + 1
+                return
+            if not buffer or message.id > buffer[-1].id:
+                ordered = [*buffer, message]
+            elif any(m.id == message.id for m in buffer):
+                return  # A load that overlapped the commit already has it.
+            else:
+                # Two writers committed out of order.
+                ordered = sorted([*buffer, message], key=lambda m: m.id)
+            if len(ordered) > self._capacity:
+                self._floors[key] = max(self._floors[key], ordered[0].id)
+            buffer.clear()
+            buffer.extend(ordered)
+
+    def replace_text(self, world_id: str, message_ids: Sequence[int], message: str) -> None:
+        """Swap the text of committed messages held in any loaded buffer of a world."""
+        targets = set(message_ids)
+        with self._lock:
+            self._sync_target_locked()
+            for key, buffer in self._rooms.items():
+                if key[0] != world_id:
+                    continue
+                for index, item in enumerate(buffer):
+                    if item.id in targets:
+                        buffer[index] = replace(item, message=message)
+
+            # Rows a load read before the update would carry the old text.
+            self._epoch += 1
+
+
+_room_chat_buffers = _RoomChatBuffers()
+
+
+def clear_room_chat_buffers() -> None:
+    """Drop all in-memory room chat so it reloads from SQLite.
+
+    Called after writes that change how stored chat reads, such as renaming or
+    deleting a character.
+    """
+    _room_chat_buffers.clear()
+
+
+def _buffered_to_dicts(
+    messages: list[_BufferedChatMessage], *, with_ids: bool
+) -> list[dict[str, Any]]:
+    """Map buffered messages to the public dict shapes of the SQL readers."""
+    if with_ids:
+        return [
+            {"id": m.id, "username": m.username, "message": m.message, "timestamp": m.timestamp}
+            for m in messages
+        ]
+    return [
+        {"username": m.username, "message": m.message, "timestamp": m.timestamp} for m in messages
+    ]
+
+
+def _buffered_read(
+    snapshot: _RoomChatSnapshot,
+    *,
+    since_id: int | None,
+    limit: int,
+    character_id: int | None,
+) -> list[_BufferedChatMessage] | None:
+    """Answer a latest-page or cursor read from a snapshot, if it covers it."""
+    if since_id is None:
+        return snapshot.latest(limit, character_id)
+    return snapshot.after(since_id, limit, character_id)
+
+
+def _viewer_character_id(cursor: Any, character_name: str, *, world_id: str) -> int | None:
+    """Return the reader's character id, cached alongside the room buffers."""
+    character_id = _room_chat_buffers.viewer_id(world_id, character_name)
+    if character_id is not None:
+        return character_id
+    cursor.execute(
+        "SELECT id FROM characters WHERE name = ? AND world_id = ?",
+        (character_name, world_id),
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+    character_id = int(row[0])
+    if not cursor.connection.in_transaction:
+        _room_chat_buffers.remember_viewer(world_id, character_name, character_id)
+    return character_id
+
+
+def _read_room_buffer(
+    cursor: Any,
+    room: str,
+    *,
+    world_id: str,
+    since_id: int | None,
+    limit: int,
+    character_id: int | None,
+) -> list[_BufferedChatMessage] | None:
+    """Serve a read from the room buffer, loading it first if needed.
+
+    Returns ``None`` when buffering is disabled or the read reaches past the
+    buffer; the caller then runs its SQL query.
+    """
+    snapshot = _room_chat_buffers.snapshot(world_id, room)
+    if snapshot is None:
+        token = _room_chat_buffers.begin_hydrate(world_id, room)
+        if token is None:
+            return None
+        cursor.execute(_ROOM_BUFFER_SQL, (world_id, room, token[0]))
+        snapshot = _room_chat_buffers.finish_hydrate(
+            world_id,
+            room,
+            cursor.fetchall(),
+            token,
+            # Inside a unit of work with pending writes the rows may still roll back.
+            install=not cursor.connection.in_transaction,
+        )
+    return _buffered_read(snapshot, since_id=since_id, limit=limit, character_id=character_id)
+
+
+def _messages_since_params(
+    room: str, *, since_id: int | None, limit: int, character_id: int, world_id: str
+) -> tuple[str, tuple[Any, ...]]:
+    """Pick the cursor or latest-page statement and bind its parameters."""
+    if since_id is None:
+        return _LATEST_ROOM_MESSAGES_SQL, (world_id, room, character_id, character_id, limit)
+    return (
+        _ROOM_MESSAGES_AFTER_ID_SQL,
+        (world_id, room, since_id, character_id, character_id, limit),
+    )
+
+
+def _cursor_messages_from_rows(rows: list[Any], *, newest_first: bool) -> list[dict[str, Any]]:
+    """Map ``(id, name, message, timestamp)`` rows to oldest-first dicts with ids."""
+    ordered = reversed(rows) if newest_first else rows
+    return [
+        {"id": int(message_id), "username": name, "message": message, "timestamp": timestamp}
+        for message_id, name, message, timestamp in ordered
+    ]
+
+
+def _messages_from_rows(rows: list[Any]) -> list[dict[str, Any]]:
+    """Turn newest-first message rows into the oldest-first public dict list."""
+    return [
+        {"username": name, "message": message, "timestamp": timestamp}
+        for name, message, timestamp in reversed(rows)
+    ]
+
+
 def _resolve_character_name(cursor: Any, name: str, *, world_id: str) -> str | None:
     """Resolve a character name using strict world-scoped character identity."""
     from mud_server.db.characters_repo import _resolve_character_name as resolve_character_name_impl
@@ -60,13 +491,34 @@ def add_chat_message(
       ``recipient_character_name``.
     - Sender and recipient names require explicit character identities.
     """
+    message_id = insert_chat_message(
+        character_name,
+        message,
+        room,
+        recipient_character_name,
+        recipient,
+        world_id=world_id,
+    )
+    return message_id is not None
+
+
+def insert_chat_message(
+    character_name: str,
+    message: str,
+    room: str,
+    recipient_character_name: str | None = None,
+    recipient: str | None = None,
+    *,
+    world_id: str,
+) -> int | None:
+    """Like :func:`add_chat_message`, but return the new row id (``None`` if not stored)."""
     try:
         with connection_scope(write=True) as conn:
             cursor = conn.cursor()
 
             resolved_sender = _resolve_character_name(cursor, character_name, world_id=world_id)
             if not resolved_sender:
-                return False
+                return None
 
             cursor.execute(
                 "SELECT id, user_id FROM characters WHERE name = ? AND world_id = ?",
@@ -74,7 +526,7 @@ def add_chat_message(
             )
             sender_row = cursor.fetchone()
             if not sender_row:
-                return False
+                return None
 
             sender_id = int(sender_row[0])
             user_id = sender_row[1]
@@ -101,20 +553,22 @@ def add_chat_message(
                     recipient_id = int(recipient_row[0])
 
             cursor.execute(
-                """
-                INSERT INTO chat_messages (
-                    character_id,
-                    user_id,
-                    message,
-                    world_id,
-                    room,
-                    recipient_character_id
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_CHAT_MESSAGE_SQL,
                 (sender_id, user_id, message, world_id, room, recipient_id),
             )
-            return True
+            message_id = int(cursor.lastrowid or 0)
+            cursor.execute(_CHAT_MESSAGE_TIMESTAMP_SQL, (message_id,))
+            timestamp_row = cursor.fetchone()
+        buffered = _BufferedChatMessage(
+            id=message_id,
+            username=resolved_sender,
+            message=message,
+            timestamp=timestamp_row[0] if timestamp_row else None,
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+        )
+        run_after_commit(lambda: _room_chat_buffers.append(world_id, room, buffered))
+        return message_id
     except Exception as exc:
         _raise_write_error(
             "chat.add_chat_message",
@@ -123,6 +577,149 @@ def add_chat_message(
         )
 
 
+def add_chat_messages(
+    character_name: str,
+    message: str,
+    rooms: Sequence[str],
+    *,
+    world_id: str,
+) -> list[str]:
+    """Insert one public message into several rooms in a single transaction.
+
+    Used for yell fan-out: the sender is resolved once and the rows are written
+    with one ``executemany``. If that fails, the rows are retried one by one so
+    a bad room does not stop the others. Repeated rooms are written once.
+
+    Args:
+        character_name: Sending character.
+        message: Message text, already sanitized.
+        rooms: Target room ids.
+        world_id: World scope.
+
+    Returns:
+        Rooms that received the message, in the order given. ``[]`` when the
+        sender is unknown.
+    """
+    return list(insert_chat_messages(character_name, message, rooms, world_id=world_id))
+
+
+def insert_chat_messages(
+    character_name: str,
+    message: str,
+    rooms: Sequence[str],
+    *,
+    world_id: str,
+) -> dict[str, int]:
+    """Like :func:`add_chat_messages`, but map each room reached to its new row id."""
+    targets = list(dict.fromkeys(rooms))
+    if not targets:
+        return {}
+    try:
+        with connection_scope(write=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, user_id FROM characters WHERE name = ? AND world_id = ?",
+                (character_name, world_id),
+            )
+            sender_row = cursor.fetchone()
+            if not sender_row:
+                return {}
+            sender_id = int(sender_row[0])
+            rows = [(sender_id, sender_row[1], message, world_id, room, None) for room in targets]
+
+            # The savepoint undoes a partial executemany before the per-row retry.
+            if not conn.in_transaction:
+                cursor.execute("BEGIN")
+            cursor.execute("SAVEPOINT chat_fanout")
+            try:
+                cursor.executemany(_INSERT_CHAT_MESSAGE_SQL, rows)
+                written = targets
+            except sqlite3.Error:
+                cursor.execute("ROLLBACK TO SAVEPOINT chat_fanout")
+                written = []
+                for row in rows:
+                    try:
+                        cursor.execute(_INSERT_CHAT_MESSAGE_SQL, row)
+                    except sqlite3.Error:
+                        continue
+                    written.append(row[4])
+            cursor.execute("RELEASE SAVEPOINT chat_fanout")
+
+            # The transaction holds the write lock, so our ids are contiguous.
+            last_id = int(cursor.execute("SELECT last_insert_rowid()").fetchone()[0])
+            cursor.execute(_CHAT_MESSAGE_RANGE_SQL, (last_id - len(written) + 1, last_id))
+            inserted = cursor.fetchall()
+        buffered = [
+            (
+                room,
+                _BufferedChatMessage(
+                    id=int(message_id),
+                    username=character_name,
+                    message=message,
+                    timestamp=timestamp,
+                    sender_id=sender_id,
+                    recipient_id=None,
+                ),
+            )
+            for message_id, room, timestamp in inserted
+        ]
+
+        def append_to_buffers() -> None:
+            for room, item in buffered:
+                _room_chat_buffers.append(world_id, room, item)
+
+        run_after_commit(append_to_buffers)
+        return {room: int(message_id) for message_id, room, _ in inserted}
+    except Exception as exc:
+        _raise_write_error(
+            "chat.add_chat_messages",
+            exc,
+            details=(
+                f"character_name={character_name!r}, world_id={world_id!r}, "
+                f"rooms={len(targets)}"
+            ),
+        )
+
+
+def update_chat_messages(message_ids: Sequence[int], message: str, *, world_id: str) -> int:
+    """Replace the text of already-stored messages.
+
+    Used by deferred translation to swap the OOC placeholder of a say, yell or
+    whisper for its in-character rendering. Ids and timestamps are unchanged,
+    so readers that already passed a row see the new text only on a full
+    reload or through the ``CHAT_TRANSLATED`` event.
+
+    Args:
+        message_ids: Rows to rewrite.
+        message: New message text, already sanitized.
+        world_id: World scope; ids from other worlds are left alone.
+
+    Returns:
+        Number of rows updated.
+    """
+    ids = sorted({int(message_id) for message_id in message_ids})
+    if not ids:
+        return 0
+    placeholders = ", ".join("?" for _ in ids)
+    try:
+        with connection_scope(write=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"UPDATE chat_messages SET message = ? "
+                f"WHERE world_id = ? AND id IN ({placeholders})",
+                (message, world_id, *ids),
+            )
+            updated = int(cursor.rowcount or 0)
+        run_after_commit(lambda: _room_chat_buffers.replace_text(world_id, ids, message))
+        return updated
+    except Exception as exc:
+        _raise_write_error(
+            "chat.update_chat_messages",
+            exc,
+            details=f"world_id={world_id!r}, messages={len(ids)}",
+        )
+
+
 def prune_chat_messages(
     max_age_hours: int,
     *,
@@ -169,7 +766,9 @@ def prune_chat_messages(
                     (f"-{max_age_hours}", world_id, room),
                 )
 
-            return cursor.rowcount
+            deleted = cursor.rowcount
+        run_after_commit(lambda: _room_chat_buffers.discard(world_id=world_id, room=room))
+        return deleted
     except Exception as exc:
         _raise_write_error(
             "chat.prune_chat_messages",
@@ -192,6 +791,9 @@ def get_room_messages(
     - public messages in the room,
     - whispers to that character,
     - whispers sent by that character.
+
+    Served from the room's in-memory buffer when it holds ``limit`` visible
+    messages (or the room's whole history).
     """
     try:
         with connection_scope() as conn:
@@ -200,59 +802,95 @@ def get_room_messages(
             if character_name is None and username is not None:
                 character_name = username
 
+            character_id: int | None = None
             if character_name:
-                resolved_name = _resolve_character_name(cursor, character_name, world_id=world_id)
-                if resolved_name is None and username is not None:
-                    resolved_name = _resolve_character_name(cursor, username, world_id=world_id)
-                if not resolved_name:
+                character_id = _viewer_character_id(cursor, character_name, world_id=world_id)
+                if character_id is None and username not in (None, character_name):
+                    character_id = _viewer_character_id(cursor, username, world_id=world_id)
+                if character_id is None:
                     return []
 
-                cursor.execute(
-                    "SELECT id FROM characters WHERE name = ? AND world_id = ?",
-                    (resolved_name, world_id),
-                )
-                row = cursor.fetchone()
-                if not row:
-                    return []
-                character_id = int(row[0])
+            buffered = _read_room_buffer(
+                cursor,
+                room,
+                world_id=world_id,
+                since_id=None,
+                limit=limit,
+                character_id=character_id,
+            )
+            if buffered is not None:
+                return _buffered_to_dicts(buffered, with_ids=False)
 
+            if character_id is not None:
                 cursor.execute(
-                    """
-                    SELECT c.name, m.message, m.timestamp
-                    FROM chat_messages m
-                    JOIN characters c ON c.id = m.character_id
-                    WHERE m.world_id = ? AND m.room = ? AND (
-                        m.recipient_character_id IS NULL OR
-                        m.recipient_character_id = ? OR
-                        m.character_id = ?
-                    )
-                    ORDER BY m.timestamp DESC, m.id DESC
-                    LIMIT ?
-                    """,
+                    _ROOM_MESSAGES_FOR_CHARACTER_SQL,
                     (world_id, room, character_id, character_id, limit),
                 )
             else:
-                cursor.execute(
-                    """
-                    SELECT c.name, m.message, m.timestamp
-                    FROM chat_messages m
-                    JOIN characters c ON c.id = m.character_id
-                    WHERE m.world_id = ? AND m.room = ?
-                    ORDER BY m.timestamp DESC, m.id DESC
-                    LIMIT ?
-                    """,
-                    (world_id, room, limit),
-                )
+                cursor.execute(_ROOM_MESSAGES_SQL, (world_id, room, limit))
 
             rows = cursor.fetchall()
 
-        messages = []
-        for name, message, timestamp in reversed(rows):
-            messages.append({"username": name, "message": message, "timestamp": timestamp})
-        return messages
+        return _messages_from_rows(rows)
     except Exception as exc:
         _raise_read_error(
             "chat.get_room_messages",
             exc,
             details=f"world_id={world_id!r}, room={room!r}, limit={limit}",
         )
+
+
+def get_room_messages_since(
+    room: str,
+    *,
+    since_id: int | None,
+    limit: int = 50,
+    character_name: str,
+    world_id: str,
+) -> list[dict[str, Any]]:
+    """Return room messages visible to ``character_name`` with ids above ``since_id``.
+
+    Unlike :func:`get_room_messages` this is a cursor read for incremental
+    clients: each dict carries the message ``id`` and callers pass the largest
+    id they have seen as the next ``since_id``.
+
+    Args:
+        room: Room id to read.
+        since_id: Return messages with ``id > since_id`` (oldest first).
+            ``None`` returns the newest ``limit`` messages instead.
+        limit: Maximum messages returned.
+        character_name: Reader; whispers to or from other characters are hidden.
+        world_id: World scope.
+
+    Returns:
+        Oldest-first dicts with ``id``, ``username``, ``message`` and
+        ``timestamp``; ``[]`` for an unknown character.
+    """
+    try:
+        with connection_scope() as conn:
+            cursor = conn.cursor()
+            character_id = _viewer_character_id(cursor, character_name, world_id=world_id)
+            if character_id is None:
+                return []
+            buffered = _read_room_buffer(
+                cursor,
+                room,
+                world_id=world_id,
+                since_id=since_id,
+                limit=limit,
+                character_id=character_id,
+            )
+            if buffered is not None:
+                return _buffered_to_dicts(buffered, with_ids=True)
+            sql, params = _messages_since_params(
+                room, since_id=since_id, limit=limit, character_id=character_id, world_id=world_id
+            )
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        return _cursor_messages_from_rows(rows, newest_first=since_id is None)
+    except Exception as exc:
+        _raise_read_error(
+            "chat.get_room_messages_since",
+            exc,
+            details=f"world_id={world_id!r}, room={room!r}, since_id={since_id}, limit={limit}",
+        )
@@ -2,14 +2,47 @@
 
 This module owns connection creation and low-level SQLite runtime pragmas so
 repository code can stay focused on queries and transaction intent.
+
+Connection reuse:
+    ``connection_scope()`` draws connections from a bounded, process-wide
+    :class:`ConnectionPool` instead of opening (and re-configuring) a fresh
+    SQLite handle for every repository call. ``get_connection()`` remains the
+    pool's connection factory and still returns a caller-owned connection for
+    schema bootstrap, migrations, and tests that manage handles explicitly.
+
+Unit of work:
+    ``unit_of_work()`` pins one connection to the current context (thread or
+    asyncio task). Every ``connection_scope()`` entered while it is active
+    joins that connection instead of checking out its own, and write scopes
+    defer their commit to the unit of work, so a whole game command runs on one
+    connection with one commit. Nested write scopes use savepoints so a failed
+    repository write still only undoes its own statements. In-memory state that
+    mirrors a write (such as the room chat buffers) is updated through
+    ``run_after_commit()`` so it never shows rows that are later rolled back.
+
+Durability profile:
+    ``[database] profile`` selects a :class:`SqliteProfile` preset from
+    :data:`SQLITE_PROFILES` (``durable`` or ``throughput``); individual pragma
+    settings override the preset. Per-connection pragmas are applied by
+    ``configure_connection()``. ``journal_mode`` is persistent in the database
+    file, so ``init_database()`` sets it once and verifies the whole profile.
 """
 
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import Iterator
+import threading
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import TYPE_CHECKING, NoReturn
+
+from mud_server.db.errors import DatabaseOperationContext, DatabaseWriteError
+
+if TYPE_CHECKING:
+    from mud_server.config import DatabaseSettings
 
 
 def get_db_path() -> Path:
@@ -19,6 +52,82 @@ def get_db_path() -> Path:
     return config.database.absolute_path
 
 
+@dataclass(frozen=True, slots=True)
+class SqliteProfile:
+    """Resolved SQLite durability/concurrency pragmas.
+
+    Attributes:
+        journal_mode: Journal mode persisted in the database file (``wal``).
+        synchronous: fsync policy per commit (``full`` or ``normal``).
+        cache_size: Page cache size; negative values are KiB, positive pages.
+        mmap_size: Bytes of the database file to memory-map (``0`` disables).
+        temp_store: Where temp tables and indices live (``default``/``memory``).
+        wal_autocheckpoint: WAL pages before an automatic checkpoint.
+    """
+
+    journal_mode: str
+    synchronous: str
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+    wal_autocheckpoint: int
+
+
+# Both presets use WAL so readers never block the single writer.
+# - durable: fsync the WAL on every commit; a committed command survives power loss.
+# - throughput: fsync only at checkpoints; a power loss may drop the last few
+#   commits but never corrupts the file. Larger cache/mmap for read-heavy worlds.
+SQLITE_PROFILES: dict[str, SqliteProfile] = {
+    "durable": SqliteProfile(
+        journal_mode="wal",
+        synchronous="full",
+        cache_size=-8192,
+        mmap_size=0,
+        temp_store="default",
+        wal_autocheckpoint=1000,
+    ),
+    "throughput": SqliteProfile(
+        journal_mode="wal",
+        synchronous="normal",
+        cache_size=-65536,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="memory",
+        wal_autocheckpoint=1000,
+    ),
+}
+
+# PRAGMA reads report keyword settings as integers.
+_SYNCHRONOUS_CODES = {"off": 0, "normal": 1, "full": 2, "extra": 3}
+_TEMP_STORE_CODES = {"default": 0, "file": 1, "memory": 2}
+
+
+def resolve_sqlite_profile(settings: DatabaseSettings | None = None) -> SqliteProfile:
+    """Return the configured preset with any per-pragma overrides applied.
+
+    Args:
+        settings: Database settings to resolve; defaults to ``config.database``.
+    """
+    if settings is None:
+        from mud_server.config import config
+
+        settings = config.database
+
+    base = SQLITE_PROFILES.get(settings.profile, SQLITE_PROFILES["durable"])
+    overrides = {
+        name: value
+        for name in (
+            "journal_mode",
+            "synchronous",
+            "cache_size",
+            "mmap_size",
+            "temp_store",
+            "wal_autocheckpoint",
+        )
+        if (value := getattr(settings, name)) is not None
+    }
+    return replace(base, **overrides)
+
+
 def configure_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
     """Apply connection-level SQLite pragmas required by the application.
 
@@ -27,18 +136,500 @@ def configure_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
           foreign-key constraints by default.
         - ``busy_timeout`` reduces transient lock failures during short-lived
           concurrent writes in tests and local multi-process development.
+        - The remaining pragmas come from the resolved durability profile and
+          only last for the lifetime of the connection.
     """
-    connection.execute("PRAGMA foreign_keys = ON")
-    connection.execute("PRAGMA busy_timeout = 5000")
+    for statement in connection_pragma_statements():
+        connection.execute(statement)
     return connection
 
 
+def connection_pragma_statements() -> tuple[str, ...]:
+    """Return the per-connection ``PRAGMA`` statements, in application order.
+
+    Shared by the sync connection factory and the aiosqlite pool so both
+    layers run with identical settings.
+    """
+    profile = resolve_sqlite_profile()
+    return (
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA busy_timeout = 5000",
+        f"PRAGMA synchronous = {profile.synchronous.upper()}",
+        f"PRAGMA cache_size = {int(profile.cache_size)}",
+        f"PRAGMA mmap_size = {int(profile.mmap_size)}",
+        f"PRAGMA temp_store = {profile.temp_store.upper()}",
+        f"PRAGMA wal_autocheckpoint = {int(profile.wal_autocheckpoint)}",
+    )
+
+
+def apply_journal_mode(cursor: sqlite3.Cursor, profile: SqliteProfile) -> str | None:
+    """Switch the database file to the profile's journal mode.
+
+    Returns:
+        Journal mode reported by SQLite after the switch. This can differ from
+        the request, e.g. ``memory`` for in-memory databases or the previous
+        mode when another connection holds the file open.
+    """
+    cursor.execute(f"PRAGMA journal_mode = {profile.journal_mode.upper()}")
+    row = cursor.fetchone()
+    return str(row[0]).lower() if row else None
+
+
+def verify_sqlite_profile(
+    cursor: sqlite3.Cursor, profile: SqliteProfile
+) -> dict[str, tuple[object, object]]:
+    """Read back the active pragmas and report any that differ from ``profile``.
+
+    Returns:
+        Mapping of pragma name to ``(expected, actual)`` for mismatches only;
+        an empty dict means the connection runs the requested profile.
+    """
+    expected: dict[str, object] = {
+        "journal_mode": profile.journal_mode,
+        "synchronous": _SYNCHRONOUS_CODES[profile.synchronous],
+        "cache_size": profile.cache_size,
+        "mmap_size": profile.mmap_size,
+        "temp_store": _TEMP_STORE_CODES[profile.temp_store],
+        "wal_autocheckpoint": profile.wal_autocheckpoint,
+    }
+    mismatches: dict[str, tuple[object, object]] = {}
+    for name, wanted in expected.items():
+        cursor.execute(f"PRAGMA {name}")
+        row = cursor.fetchone()
+        actual = row[0] if row else None
+        if isinstance(actual, str):
+            actual = actual.lower()
+        if actual != wanted:
+            mismatches[name] = (wanted, actual)
+    return mismatches
+
+
 def get_connection() -> sqlite3.Connection:
-    """Create and configure a new SQLite connection."""
-    connection = sqlite3.connect(str(get_db_path()))
+    """Create and configure a new SQLite connection.
+
+    ``check_same_thread`` is disabled because pooled connections may be checked
+    out by different worker threads over their lifetime. The pool guarantees a
+    connection is only ever held by one caller at a time.
+    """
+    connection = sqlite3.connect(str(get_db_path()), check_same_thread=False)
     return configure_connection(connection)
 
 
+@dataclass(slots=True)
+class ConnectionPoolStats:
+    """Point-in-time counters for one connection pool.
+
+    Attributes:
+        db_path: Database file served by the pool.
+        max_size: Maximum number of idle connections retained.
+        idle: Connections currently parked in the pool.
+        created: Connections opened through the factory.
+        reused: Checkouts satisfied by an idle pooled connection.
+        discarded: Connections closed because they failed a health check,
+            could not be reset, or overflowed the idle bound.
+    """
+
+    db_path: str
+    max_size: int
+    idle: int
+    created: int
+    reused: int
+    discarded: int
+
+
+class ConnectionPool:
+    """Bounded LIFO pool of configured SQLite connections for one database.
+
+    The pool bounds how many *idle* connections are retained. Checkouts never
+    block: when the pool is empty a new connection is opened, and surplus
+    connections are closed on release. This keeps nested repository calls
+    deadlock-free while still removing connect/pragma setup from the common
+    path.
+
+    Connections are reset on both checkout and release: any open transaction
+    is rolled back, which preserves the old close-on-exit semantics where
+    uncommitted work in a read scope was discarded.
+    """
+
+    def __init__(
+        self,
+        *,
+        db_path: Path,
+        max_size: int,
+        factory: Callable[[], sqlite3.Connection],
+        health_check: bool = True,
+    ) -> None:
+        self.db_path = db_path
+        self.max_size = max(0, int(max_size))
+        self.factory = factory
+        self.health_check = health_check
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a healthy connection, opening a new one when none are idle."""
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                connection = self.factory()
+                with self._lock:
+                    self._created += 1
+                return connection
+            if self._reset(connection):
+                with self._lock:
+                    self._reused += 1
+                return connection
+            self._discard(connection)
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """Return a connection to the pool, closing it when it cannot be reused."""
+        if not isinstance(connection, sqlite3.Connection):
+            # Non-SQLite stand-ins (test doubles) are never retained.
+            connection.close()
+            return
+        if not self._reset(connection):
+            self._discard(connection)
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_size:
+                self._idle.append(connection)
+                return
+        self._discard(connection)
+
+    def close(self) -> None:
+        """Close all idle connections and stop retaining released ones."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            _close_quietly(connection)
+
+    def stats(self) -> ConnectionPoolStats:
+        """Return a snapshot of pool counters."""
+        with self._lock:
+            return ConnectionPoolStats(
+                db_path=str(self.db_path),
+                max_size=self.max_size,
+                idle=len(self._idle),
+                created=self._created,
+                reused=self._reused,
+                discarded=self._discarded,
+            )
+
+    def _reset(self, connection: sqlite3.Connection) -> bool:
+        """Roll back leftover transaction state and optionally ping the handle."""
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+            if self.health_check:
+                connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def _discard(self, connection: sqlite3.Connection) -> None:
+        """Close one connection and count it as discarded."""
+        _close_quietly(connection)
+        with self._lock:
+            self._discarded += 1
+
+
+def _close_quietly(connection: sqlite3.Connection) -> None:
+    """Close a connection, ignoring errors from already-broken handles."""
+    try:
+        connection.close()
+    except sqlite3.Error:
+        pass
+
+
+_pool_lock = threading.Lock()
+_active_pool: ConnectionPool | None = None
+
+
+def get_connection_pool() -> ConnectionPool | None:
+    """Return the process-wide pool for the configured database, if enabled.
+
+    The pool is keyed by database path, connection factory and configured size.
+    When any of them changes (for example tests swapping ``config.database.path``
+    or patching ``get_connection``), the previous pool is closed and replaced so
+    a connection opened for one target is never handed out for another.
+
+    Returns:
+        Active pool, or ``None`` when ``database.pool_size`` is ``0``.
+    """
+    global _active_pool
+    from mud_server.config import config
+
+    settings = config.database
+    if settings.pool_size <= 0:
+        close_connection_pool()
+        return None
+
+    db_path = get_db_path()
+    factory = get_connection
+    with _pool_lock:
+        pool = _active_pool
+        if (
+            pool is not None
+            and pool.db_path == db_path
+            and pool.factory is factory
+            and pool.max_size == settings.pool_size
+            and pool.health_check == settings.pool_health_check
+        ):
+            return pool
+        _active_pool = ConnectionPool(
+            db_path=db_path,
+            max_size=settings.pool_size,
+            factory=factory,
+            health_check=settings.pool_health_check,
+        )
+    if pool is not None:
+        pool.close()
+    return _active_pool
+
+
+def close_connection_pool() -> None:
+    """Close and forget the process-wide connection pool (shutdown/tests)."""
+    global _active_pool
+    with _pool_lock:
+        pool, _active_pool = _active_pool, None
+    if pool is not None:
+        pool.close()
+
+
+@dataclass(slots=True)
+class WalCheckpointResult:
+    """Outcome of one ``PRAGMA wal_checkpoint`` call.
+
+    Attributes:
+        busy: ``True`` when the checkpoint could not complete because of
+            concurrent readers/writers (expected for ``PASSIVE`` under load).
+        log_frames: Frames currently in the WAL file (``-1`` outside WAL mode).
+        checkpointed_frames: Frames copied back into the database file.
+    """
+
+    busy: bool
+    log_frames: int
+    checkpointed_frames: int
+
+
+def checkpoint_wal(mode: str = "PASSIVE") -> WalCheckpointResult:
+    """Run a WAL checkpoint against the configured database.
+
+    Args:
+        mode: ``PASSIVE`` (never blocks, used by the background task),
+            ``FULL``, ``RESTART`` or ``TRUNCATE`` (used at shutdown to shrink
+            the WAL file).
+
+    Raises:
+        ValueError: If ``mode`` is not a recognised checkpoint mode.
+    """
+    normalized = mode.strip().upper()
+    if normalized not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+        raise ValueError(f"Unsupported WAL checkpoint mode: {mode!r}")
+    with connection_scope() as connection:
+        row = connection.execute(f"PRAGMA wal_checkpoint({normalized})").fetchone()
+    busy, log_frames, checkpointed = row if row else (0, -1, -1)
+    return WalCheckpointResult(
+        busy=bool(busy), log_frames=int(log_frames), checkpointed_frames=int(checkpointed)
+    )
+
+
+class UnitOfWork:
+    """One lazily-opened connection shared by every scope in a request.
+
+    The connection is only checked out when the first ``connection_scope()``
+    runs, so commands that never touch the database pay nothing. When
+    ``immediate`` is set the transaction starts with ``BEGIN IMMEDIATE`` so a
+    read-modify-write sequence holds the write lock from its first read.
+    """
+
+    def __init__(self, *, immediate: bool = False) -> None:
+        self.immediate = immediate
+        self.connection: sqlite3.Connection | None = None
+        self._pool: ConnectionPool | None = None
+        self._after_commit: list[Callable[[], None]] = []
+
+    def acquire(self) -> sqlite3.Connection:
+        """Return the pinned connection, checking one out on first use."""
+        if self.connection is None:
+            self._pool = get_connection_pool()
+            self.connection = self._pool.acquire() if self._pool is not None else get_connection()
+        if self.immediate and not self.connection.in_transaction:
+            self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def require_immediate(self) -> None:
+        """Upgrade to an immediate transaction for a nested atomic block."""
+        self.immediate = True
+        if self.connection is not None and not self.connection.in_transaction:
+            self.connection.execute("BEGIN IMMEDIATE")
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Queue ``callback`` until the next successful commit."""
+        self._after_commit.append(callback)
+
+    def commit(self) -> None:
+        """Commit pending work without ending the unit of work."""
+        if self.connection is not None and self.connection.in_transaction:
+            self.connection.commit()
+        self._run_after_commit()
+
+    def _run_after_commit(self) -> None:
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    def close(self, *, commit: bool) -> None:
+        """Commit or roll back, then return the connection to the pool."""
+        connection, self.connection = self.connection, None
+        if connection is None:
+            return
+        try:
+            if commit:
+                connection.commit()
+            else:
+                self._after_commit = []
+                try:
+                    connection.rollback()
+                except sqlite3.Error:
+                    # Preserve the original exception while best-effort rolling back.
+                    pass
+        finally:
+            if self._pool is not None:
+                self._pool.release(connection)
+            else:
+                connection.close()
+        if commit:
+            self._run_after_commit()
+
+
+_active_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar(
+    "mud_server_db_unit_of_work", default=None
+)
+
+
+def _raise_unit_of_work_error(operation: str, exc: sqlite3.Error) -> NoReturn:
+    """Raise a typed write error for transaction control outside repositories."""
+    raise DatabaseWriteError(
+        context=DatabaseOperationContext(operation=operation),
+        cause=exc,
+    ) from exc
+
+
+@contextmanager
+def unit_of_work(*, immediate: bool = False) -> Iterator[UnitOfWork]:
+    """Run the enclosed repository calls on one connection and one transaction.
+
+    Args:
+        immediate: Start the transaction with ``BEGIN IMMEDIATE`` so reads
+            inside the block are serialized with the writes that follow them.
+
+    Yields:
+        Active :class:`UnitOfWork`.
+
+    Behavior:
+        - Re-entrant: a nested call joins the outer unit of work (upgrading it
+          to ``immediate`` when requested) and leaves commit to the outermost.
+        - Commits once when the outermost block exits successfully and rolls
+          back everything when it raises.
+
+    Raises:
+        DatabaseWriteError: If the final commit (or a nested ``immediate``
+            upgrade) fails.
+    """
+    active = _active_unit_of_work.get()
+    if active is not None:
+        if immediate:
+            try:
+                active.require_immediate()
+            except sqlite3.Error as exc:
+                _raise_unit_of_work_error("unit_of_work.begin", exc)
+        yield active
+        return
+
+    unit = UnitOfWork(immediate=immediate)
+    token = _active_unit_of_work.set(unit)
+    try:
+        yield unit
+    except BaseException:
+        unit.close(commit=False)
+        raise
+    else:
+        try:
+            unit.close(commit=True)
+        except sqlite3.Error as exc:
+            _raise_unit_of_work_error("unit_of_work.commit", exc)
+    finally:
+        _active_unit_of_work.reset(token)
+
+
+def commit_unit_of_work() -> None:
+    """Commit pending work in the active unit of work, if any.
+
+    Call this before slow non-database work (for example an LLM translation)
+    so the SQLite write lock is not held across it. No-op outside a unit of
+    work.
+
+    Raises:
+        DatabaseWriteError: If SQLite rejects the commit.
+    """
+    active = _active_unit_of_work.get()
+    if active is not None:
+        try:
+            active.commit()
+        except sqlite3.Error as exc:
+            _raise_unit_of_work_error("unit_of_work.commit", exc)
+
+
+def run_after_commit(callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the caller's completed write scope is committed.
+
+    Outside a unit of work the scope has already committed, so ``callback``
+    runs immediately. Inside one it is deferred to the next
+    :func:`commit_unit_of_work` or the final commit, and dropped on rollback.
+    """
+    active = _active_unit_of_work.get()
+    if active is None:
+        callback()
+    else:
+        active.after_commit(callback)
+
+
+@contextmanager
+def _joined_scope(unit: UnitOfWork, *, write: bool) -> Iterator[sqlite3.Connection]:
+    """Yield the unit-of-work connection, isolating write failures in a savepoint."""
+    connection = unit.acquire()
+    if not write:
+        yield connection
+        return
+
+    use_savepoint = connection.in_transaction
+    if use_savepoint:
+        connection.execute("SAVEPOINT connection_scope")
+    try:
+        yield connection
+    except Exception:
+        try:
+            if use_savepoint:
+                connection.execute("ROLLBACK TO SAVEPOINT connection_scope")
+                connection.execute("RELEASE SAVEPOINT connection_scope")
+            else:
+                connection.rollback()
+        except sqlite3.Error:
+            # Preserve the original exception while best-effort rolling back.
+            pass
+        raise
+    else:
+        if use_savepoint:
+            connection.execute("RELEASE SAVEPOINT connection_scope")
+
+
 @contextmanager
 def connection_scope(*, write: bool = False) -> Iterator[sqlite3.Connection]:
     """Yield a configured connection with guaranteed cleanup semantics.
@@ -50,11 +641,22 @@ def connection_scope(*, write: bool = False) -> Iterator[sqlite3.Connection]:
         Configured SQLite connection ready for cursor operations.
 
     Behavior:
-        - Always closes the connection in ``finally``.
+        - Checks the connection out of the pool (or opens a fresh one when
+          pooling is disabled) and always returns/closes it in ``finally``.
         - For write scopes, commits at the end of a successful block.
         - For write scopes, attempts rollback before re-raising failures.
+        - Uncommitted work left in a read scope is rolled back on release.
+        - Inside :func:`unit_of_work`, joins the shared connection instead and
+          leaves the commit to the unit of work.
     """
-    connection = get_connection()
+    unit = _active_unit_of_work.get()
+    if unit is not None:
+        with _joined_scope(unit, write=write) as connection:
+            yield connection
+        return
+
+    pool = get_connection_pool()
+    connection = pool.acquire() if pool is not None else get_connection()
     try:
         yield connection
         if write:
@@ -68,4 +670,7 @@ def connection_scope(*, write: bool = False) -> Iterator[sqlite3.Connection]:
                 pass
         raise
     finally:
-        connection.close()
+        if pool is not None:
+            pool.release(connection)
+        else:
+            connection.close()
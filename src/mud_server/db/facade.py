@@ -37,6 +37,8 @@ _PUBLIC_API: tuple[str, ...] = (
     "DEFAULT_WORLD_ID",
     "activate_user",
     "add_chat_message",
+    "add_chat_message_async",
+    "add_chat_messages",
     "apply_axis_event",
     "apply_entity_state_to_character",
     "can_user_access_world",
@@ -45,12 +47,14 @@ _PUBLIC_API: tuple[str, ...] = (
     "cleanup_expired_guest_accounts",
     "cleanup_expired_sessions",
     "clear_all_sessions",
+    "commit_unit_of_work",
     "create_character_for_user",
     "create_session",
     "create_user_with_password",
     "deactivate_user",
     "delete_character",
     "delete_user",
+    "flush_session_activity",
     "get_active_characters",
     "get_active_connections",
     "get_active_session_count",
@@ -61,17 +65,29 @@ _PUBLIC_API: tuple[str, ...] = (
     "get_character_axis_events",
     "get_character_axis_state",
     "get_character_by_id",
+    "get_character_by_id_async",
     "get_character_by_name",
     "get_character_by_name_in_world",
     "get_character_inventory",
     "get_character_locations",
     "get_character_name_by_id",
+    "get_character_name_by_id_async",
     "get_character_room",
+    "get_character_room_async",
     "get_characters_in_room",
+    "get_characters_in_room_async",
     "get_connection",
+    "get_occupied_rooms",
+    "get_pending_session_activity_count",
     "get_room_messages",
+    "get_room_messages_async",
+    "get_room_messages_since",
+    "get_room_messages_since_async",
     "get_schema_map",
     "get_session_by_id",
+    "get_session_by_id_async",
+    "get_session_context",
+    "get_session_context_async",
     "get_table_names",
     "get_table_rows",
     "get_user_account_origin",
@@ -79,17 +95,24 @@ _PUBLIC_API: tuple[str, ...] = (
     "get_user_characters",
     "get_user_id",
     "get_user_role",
+    "get_user_role_async",
     "get_username_by_id",
+    "get_username_by_id_async",
     "get_world_access_decision",
     "get_world_admin_rows",
     "get_world_by_id",
     "init_database",
+    "insert_chat_message",
+    "insert_chat_messages",
+    "is_character_active",
     "is_user_active",
     "list_tables",
     "list_worlds",
     "list_worlds_for_user",
     "prune_chat_messages",
+    "record_session_activity",
     "remove_session_by_id",
+    "remove_session_by_id_async",
     "remove_sessions_for_character",
     "remove_sessions_for_character_count",
     "remove_sessions_for_user",
@@ -98,11 +121,15 @@ _PUBLIC_API: tuple[str, ...] = (
     "set_character_inventory",
     "set_character_room",
     "set_session_character",
+    "set_session_character_async",
     "set_user_role",
     "tombstone_character",
     "tombstone_user",
+    "unit_of_work",
     "unlink_characters_for_user",
+    "update_chat_messages",
     "update_session_activity",
+    "update_session_activity_async",
     "user_exists",
     "verify_password_for_user",
 )
@@ -0,0 +1,239 @@
+"""In-memory room presence for characters with a live session.
+
+``get_characters_in_room`` used to join ``characters``, ``character_locations``
+and ``sessions`` (with an expiry check) for every ``look``, chat line and room
+description, and ``whisper`` fetched the whole active-character list to test
+one name. :class:`RoomPresenceIndex` instead keeps, per world, each active
+character's room and latest session expiry. A world is loaded from SQLite with
+one query the first time it is asked about and then maintained in memory:
+
+- :func:`~mud_server.db.characters_repo.set_character_room` moves the
+  character once its write commits.
+- Session changes reported through :mod:`mud_server.db.session_invalidation`
+  (login, character selection, logout, kicks, account and character removal)
+  and expiry sweeps that delete rows drop every loaded world; the next query
+  reloads it.
+- A query that meets an occupant whose cached expiry has passed reloads the
+  world, so both sliding-expiration extensions and real expiries are settled
+  by the database.
+
+Loads that raced a move or an invalidation are answered but not installed.
+Everything is dropped when the configured database path changes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mud_server.db.connection import get_db_path, run_after_commit
+from mud_server.db.session_invalidation import (
+    SessionInvalidation,
+    add_session_invalidation_listener,
+)
+
+# One row per character with a live session in the world: name, room (NULL
+# without a location row for this world) and the latest session expiry.
+# Shared with ``mud_server.db.async_repo``.
+_WORLD_PRESENCE_SQL = """
+    SELECT c.name, l.room_id, MAX(s.expires_at_epoch)
+    FROM sessions s
+    JOIN characters c ON c.id = s.character_id
+    LEFT JOIN character_locations l ON l.character_id = c.id AND l.world_id = s.world_id
+    WHERE s.world_id = ?
+      AND s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)
+    GROUP BY c.id
+    ORDER BY c.id
+"""
+
+
+@dataclass(slots=True)
+class _WorldPresence:
+    """Active characters of one world.
+
+    Attributes:
+        rooms: Room id -> names present (dict used as an ordered set).
+        locations: Name -> room id (``None`` when the character has no room).
+        expires: Name -> latest session expiry as a Unix epoch.
+    """
+
+    rooms: dict[str, dict[str, None]] = field(default_factory=dict)
+    locations: dict[str, str | None] = field(default_factory=dict)
+    expires: dict[str, int] = field(default_factory=dict)
+
+    def any_expired(self, names: Iterable[str], now: int) -> bool:
+        """Return True when any of ``names`` has outlived its cached expiry."""
+        return any(self.expires[name] <= now for name in names)
+
+
+class RoomPresenceIndex:
+    """Thread-safe per-world ``room -> characters`` index of live sessions."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._worlds: dict[str, _WorldPresence] = {}
+        self._versions: dict[str, int] = {}
+        self._epoch = 0
+        self._db_path: Path | None = None
+
+    def _sync_target_locked(self) -> None:
+        """Drop every world if the configured database changed."""
+        db_path = get_db_path()
+        if db_path != self._db_path:
+            self._clear_locked()
+            self._db_path = db_path
+
+    def _clear_locked(self) -> None:
+        self._worlds.clear()
+        self._versions.clear()
+        self._epoch += 1
+
+    def clear(self) -> None:
+        """Forget every loaded world; loads in flight are not installed."""
+        with self._lock:
+            self._clear_locked()
+
+    def _expire_locked(self, world_id: str, presence: _WorldPresence, names: Iterable[str]) -> bool:
+        """Drop the world and return True if any of ``names`` outlived its expiry."""
+        if presence.any_expired(names, int(time.time())):
+            del self._worlds[world_id]
+            return True
+        return False
+
+    def characters_in_room(self, world_id: str, room: str) -> list[str] | None:
+        """Names present in ``room``, or ``None`` if the world must be (re)loaded."""
+        with self._lock:
+            self._sync_target_locked()
+            presence = self._worlds.get(world_id)
+            if presence is None:
+                return None
+            occupants = presence.rooms.get(room, {})
+            if self._expire_locked(world_id, presence, occupants):
+                return None
+            return list(occupants)
+
+    def active_characters(self, world_id: str) -> list[str] | None:
+        """Every active name in the world, or ``None`` if it must be (re)loaded."""
+        with self._lock:
+            self._sync_target_locked()
+            presence = self._worlds.get(world_id)
+            if presence is None or self._expire_locked(world_id, presence, presence.locations):
+                return None
+            return list(presence.locations)
+
+    def is_active(self, world_id: str, name: str) -> bool | None:
+        """Whether ``name`` has a live session, or ``None`` if the world must be loaded."""
+        with self._lock:
+            self._sync_target_locked()
+            presence = self._worlds.get(world_id)
+            if presence is None:
+                return None
+            if name not in presence.locations:
+                return False
+            if self._expire_locked(world_id, presence, (name,)):
+                return None
+            return True
+
+    def occupied_rooms(self, world_id: str) -> set[str] | None:
+        """Rooms holding at least one active name, or ``None`` if the world must be loaded."""
+        with self._lock:
+            self._sync_target_locked()
+            presence = self._worlds.get(world_id)
+            if presence is None or self._expire_locked(world_id, presence, presence.locations):
+                return None
+            return set(presence.rooms)
+
+    def begin_load(self, world_id: str) -> tuple[int, int]:
+        """Return a load token for :meth:`finish_load`."""
+        with self._lock:
+            self._sync_target_locked()
+            return self._epoch, self._versions.get(world_id, 0)
+
+    def finish_load(
+        self,
+        world_id: str,
+        rows: Sequence[Sequence[Any]],
+        token: tuple[int, int],
+        *,
+        install: bool = True,
+    ) -> None:
+        """Keep :data:`_WORLD_PRESENCE_SQL` rows as the world's index.
+
+        Nothing is kept unless ``install`` is set and no move or invalidation
+        happened since :meth:`begin_load`.
+        """
+        if not install:
+            return
+        presence = _WorldPresence()
+        for name, room, expires in rows:
+            presence.locations[name] = room
+            presence.expires[name] = int(expires)
+            if room is not None:
+                presence.rooms.setdefault(room, {})[name] = None
+        epoch, version = token
+        with self._lock:
+            self._sync_target_locked()
+            if self._epoch == epoch and self._versions.get(world_id, 0) == version:
+                self._worlds[world_id] = presence
+
+    def move(self, world_id: str, name: str, room: str) -> None:
+        """Record a committed room change for ``name``."""
+        with self._lock:
+            self._sync_target_locked()
+            # Loads already in flight may have read the previous room.
+            self._versions[world_id] = self._versions.get(world_id, 0) + 1
+            presence = self._worlds.get(world_id)
+            if presence is None or name not in presence.locations:
+                return
+            previous = presence.locations[name]
+            if previous is not None:
+                occupants = presence.rooms.get(previous)
+                if occupants is not None:
+                    occupants.pop(name, None)
+                    if not occupants:
+                        del presence.rooms[previous]
+            presence.locations[name] = room
+            presence.rooms.setdefault(room, {})[name] = None
+
+
+room_presence = RoomPresenceIndex()
+"""Process-wide presence index shared by the sync and async repositories."""
+
+
+def clear_room_presence() -> None:
+    """Drop the presence index now and again once the caller's write commits.
+
+    Until then other connections still read the previous rows, so a reload
+    in between must not be kept.
+    """
+    room_presence.clear()
+    run_after_commit(room_presence.clear)
+
+
+def _on_sessions_changed(_change: SessionInvalidation) -> None:
+    clear_room_presence()
+
+
+add_session_invalidation_listener(_on_sessions_changed)
+
+
+def _occupants_from_rows(rows: Sequence[Sequence[Any]], room: str) -> list[str]:
+    """Names in ``room`` from freshly read :data:`_WORLD_PRESENCE_SQL` rows."""
+    return [name for name, room_id, _ in rows if room_id == room]
+
+
+def _read_world_presence(cursor: Any, world_id: str) -> list[Any]:
+    """Read a world's presence rows and install them when safe.
+
+    Rows read inside an open write transaction may include uncommitted changes,
+    so they answer the caller without being installed.
+    """
+    token = room_presence.begin_load(world_id)
+    cursor.execute(_WORLD_PRESENCE_SQL, (world_id,))
+    rows = cursor.fetchall()
+    room_presence.finish_load(world_id, rows, token, install=not cursor.connection.in_transaction)
+    return rows
@@ -6,19 +6,30 @@ changes are reviewable without wading through unrelated repository logic.
 
 from __future__ import annotations
 
+import logging
 import os
 import sqlite3
 
 from mud_server.api.password import hash_password
-from mud_server.db.connection import get_connection
+from mud_server.db.connection import (
+    apply_journal_mode,
+    get_connection,
+    resolve_sqlite_profile,
+    verify_sqlite_profile,
+)
 from mud_server.db.constants import DEFAULT_WORLD_ID
 
+logger = logging.getLogger(__name__)
+
 # Hot-path index rationale:
 # 1. sessions user/world activity predicates are used repeatedly for auth,
 #    online-status, admin dashboards, and cleanup operations.
 # 2. character ownership counts are user+world scoped for slot checks.
 # 3. character list and session dashboards sort by activity/created-at often.
 # 4. room chat history is always world+room scoped and frequently ordered by time.
+# 5. session liveness filters compare the generated epoch columns (see
+#    ``SESSION_EPOCH_COLUMNS``) against a constant, so these indexes can be
+#    searched by range instead of evaluating ``datetime()`` on every row.
 HOT_PATH_INDEX_STATEMENTS = (
     "CREATE INDEX IF NOT EXISTS idx_characters_user_world ON characters(user_id, world_id)",
     (
@@ -40,6 +51,19 @@ HOT_PATH_INDEX_STATEMENTS = (
         "CREATE INDEX IF NOT EXISTS idx_sessions_world_last_activity "
         "ON sessions(world_id, last_activity DESC)"
     ),
+    ("CREATE INDEX IF NOT EXISTS idx_sessions_expires_epoch " "ON sessions(expires_at_epoch)"),
+    (
+        "CREATE INDEX IF NOT EXISTS idx_sessions_activity_epoch "
+        "ON sessions(last_activity_epoch, expires_at_epoch)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS idx_sessions_user_expires_epoch "
+        "ON sessions(user_id, expires_at_epoch)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS idx_sessions_world_expires_epoch "
+        "ON sessions(world_id, character_id, expires_at_epoch)"
+    ),
     (
         "CREATE INDEX IF NOT EXISTS idx_chat_messages_world_room_timestamp "
         "ON chat_messages(world_id, room, timestamp)"
@@ -74,6 +98,40 @@ def ensure_character_state_columns(cursor: sqlite3.Cursor) -> None:
     cursor.execute("UPDATE characters SET state_seed = 0 WHERE state_seed IS NULL")
 
 
+# Integer views of the session timestamps, maintained by SQLite itself so every
+# writer (repositories, triggers, direct SQL) stays consistent. A NULL expiry
+# means "never expires" and maps to the largest integer; unparseable text maps
+# to NULL, which matches neither the "still valid" nor the "expired" predicate,
+# exactly like the ``datetime(expires_at)`` comparisons these columns replace.
+SESSION_EPOCH_COLUMNS = {
+    "expires_at_epoch": (
+        "INTEGER GENERATED ALWAYS AS ("
+        "CASE WHEN expires_at IS NULL THEN 9223372036854775807 "
+        "ELSE CAST(strftime('%s', expires_at) AS INTEGER) END"
+        ") VIRTUAL"
+    ),
+    "last_activity_epoch": (
+        "INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', last_activity) AS INTEGER)) VIRTUAL"
+    ),
+}
+
+
+def ensure_session_epoch_columns(cursor: sqlite3.Cursor) -> None:
+    """Ensure the generated epoch columns exist on the ``sessions`` table.
+
+    Virtual generated columns may be added with ``ALTER TABLE`` and need no
+    backfill, so legacy databases migrate in place. ``PRAGMA table_xinfo`` is
+    used because ``table_info`` hides generated columns.
+    """
+    cursor.execute("PRAGMA table_xinfo(sessions)")
+    existing_columns = {row[1] for row in cursor.fetchall()}
+
+    for column_name, column_def in SESSION_EPOCH_COLUMNS.items():
+        if column_name in existing_columns:
+            continue
+        cursor.execute(f"ALTER TABLE sessions ADD COLUMN {column_name} {column_def}")
+
+
 def create_session_invariant_triggers(conn: sqlite3.Connection) -> None:
     """Create triggers that enforce account-first session invariants.
 
@@ -188,9 +246,12 @@ def init_database(*, skip_superuser: bool = False) -> None:
     """Initialize the SQLite database schema and baseline triggers.
 
     Behavior:
+    - Switches the database to the configured journal mode and logs a warning
+      for any durability-profile pragma SQLite did not accept.
     - Creates required tables and indexes if missing.
     - Seeds the default world row when absent.
     - Ensures character snapshot columns are present.
+    - Ensures the generated session epoch columns are present.
     - Installs session invariant triggers.
     - Optionally creates a bootstrap superuser from environment variables.
 
@@ -200,6 +261,11 @@ def init_database(*, skip_superuser: bool = False) -> None:
     conn = get_connection()
     cursor = conn.cursor()
 
+    profile = resolve_sqlite_profile()
+    apply_journal_mode(cursor, profile)
+    for name, (expected, actual) in verify_sqlite_profile(cursor, profile).items():
+        logger.warning("SQLite pragma %s is %r (profile expects %r)", name, actual, expected)
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -318,6 +384,8 @@ def init_database(*, skip_superuser: bool = False) -> None:
         )
     """)
 
+    ensure_session_epoch_columns(cursor)
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS event (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
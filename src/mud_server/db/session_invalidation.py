@@ -0,0 +1,97 @@
+"""Synchronous change notifications for session-derived caches.
+
+The API layer caches validated session records (session row joined with its
+user, role and selected character). The repositories that change any of those
+inputs call :func:`notify_sessions_changed` after their write so caches can
+drop affected entries immediately instead of waiting for a TTL.
+
+Listeners run inline on the writing thread and must be cheap and non-raising.
+The DB layer only knows about this registry, never about the cache itself.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionInvalidation:
+    """Describes which cached sessions are stale.
+
+    Any combination of selectors may be set; an entry matching *any* of them is
+    stale. When every selector is ``None`` all cached sessions are stale.
+
+    Attributes:
+        session_id: One session token.
+        user_id: Every session owned by this user id.
+        username: Every session owned by this username.
+        character_id: Every session bound to this character id.
+    """
+
+    session_id: str | None = None
+    user_id: int | None = None
+    username: str | None = None
+    character_id: int | None = None
+
+    @property
+    def everything(self) -> bool:
+        """Return True when no selector is set (invalidate all entries)."""
+        return (
+            self.session_id is None
+            and self.user_id is None
+            and self.username is None
+            and self.character_id is None
+        )
+
+
+SessionInvalidationListener = Callable[[SessionInvalidation], None]
+
+_listeners: list[SessionInvalidationListener] = []
+_listeners_lock = threading.Lock()
+
+
+def add_session_invalidation_listener(listener: SessionInvalidationListener) -> None:
+    """Register ``listener`` for session change notifications (idempotent)."""
+    with _listeners_lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+def remove_session_invalidation_listener(listener: SessionInvalidationListener) -> None:
+    """Unregister ``listener``; unknown listeners are ignored."""
+    with _listeners_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def notify_sessions_changed(
+    *,
+    session_id: str | None = None,
+    user_id: int | None = None,
+    username: str | None = None,
+    character_id: int | None = None,
+) -> None:
+    """Tell registered listeners which sessions changed.
+
+    Called by repositories after a successful write. With no arguments every
+    cached session is invalidated. Listener failures are logged and swallowed
+    so a cache bug can never fail the write that triggered it.
+    """
+    change = SessionInvalidation(
+        session_id=session_id,
+        user_id=user_id,
+        username=username,
+        character_id=character_id,
+    )
+    with _listeners_lock:
+        listeners = tuple(_listeners)
+    for listener in listeners:
+        try:
+            listener(change)
+        except Exception:  # pragma: no cover - defensive, listeners must not raise
+            logger.exception("Session invalidation listener failed")
@@ -6,6 +6,8 @@ runtime behavior expected by API, engine, and tests.
 
 from __future__ import annotations
 
+import threading
+from datetime import UTC, datetime, timedelta
 from typing import Any, NoReturn
 
 from mud_server.db.connection import connection_scope
@@ -15,6 +17,8 @@ from mud_server.db.errors import (
     DatabaseReadError,
     DatabaseWriteError,
 )
+from mud_server.db.presence import _read_world_presence, clear_room_presence, room_presence
+from mud_server.db.session_invalidation import notify_sessions_changed
 
 
 def _raise_read_error(operation: str, exc: Exception, *, details: str | None = None) -> NoReturn:
@@ -37,6 +41,226 @@ def _raise_write_error(operation: str, exc: Exception, *, details: str | None =
     ) from exc
 
 
+# SQL and row mapping shared with ``mud_server.db.async_repo`` so the sync and
+# async session lookups cannot drift apart.
+_SESSION_BY_ID_SQL = """
+    SELECT user_id, character_id, world_id, session_id, created_at, last_activity, expires_at,
+           client_type
+    FROM sessions WHERE session_id = ?
+"""
+
+
+def _session_row_to_dict(row: Any) -> dict[str, Any]:
+    """Map a ``_SESSION_BY_ID_SQL`` row to the public session dict shape.
+
+    Activity recorded but not yet flushed by :func:`record_session_activity`
+    is overlaid so readers see the same timestamps the database will hold.
+    """
+    session = {
+        "user_id": int(row[0]),
+        "character_id": row[1],
+        "world_id": row[2],
+        "session_id": row[3],
+        "created_at": row[4],
+        "last_activity": row[5],
+        "expires_at": row[6],
+        "client_type": row[7],
+    }
+    _activity_buffer.overlay(session)
+    return session
+
+
+# One round-trip for everything request validation needs: the session row plus
+# its user, role and selected character (name and world). LEFT JOINs keep the
+# session visible when a referenced row is missing so callers can reject it
+# with the right status instead of treating it as an unknown token.
+_SESSION_CONTEXT_SQL = """
+    SELECT s.user_id, s.character_id, s.world_id, s.session_id, s.created_at,
+           s.last_activity, s.expires_at, s.client_type,
+           u.username, u.role, c.name, c.world_id
+    FROM sessions s
+    LEFT JOIN users u ON u.id = s.user_id
+    LEFT JOIN characters c ON c.id = s.character_id
+    WHERE s.session_id = ?
+"""
+
+
+def _session_context_row_to_dict(row: Any) -> dict[str, Any]:
+    """Map a ``_SESSION_CONTEXT_SQL`` row to a session dict with joined fields."""
+    context = _session_row_to_dict(row)
+    context["username"] = row[8]
+    context["role"] = row[9]
+    context["character_name"] = row[10]
+    context["character_world_id"] = row[11]
+    return context
+
+
+def _session_activity_statement(session_id: str) -> tuple[str, tuple[Any, ...]]:
+    """Build the activity-touch UPDATE honoring sliding-expiration config."""
+    from mud_server.config import config
+
+    if config.session.sliding_expiration and config.session.ttl_minutes > 0:
+        return (
+            """
+            UPDATE sessions
+            SET last_activity = CURRENT_TIMESTAMP,
+                expires_at = datetime('now', ?)
+            WHERE session_id = ?
+            """,
+            (f"+{config.session.ttl_minutes} minutes", session_id),
+        )
+    return (
+        "UPDATE sessions SET last_activity = CURRENT_TIMESTAMP WHERE session_id = ?",
+        (session_id,),
+    )
+
+
+# ============================================================================
+# WRITE-BEHIND SESSION ACTIVITY
+# ============================================================================
+
+_SQLITE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# ``expires_at`` is only replaced when sliding expiration produced a value.
+_FLUSH_ACTIVITY_SQL = """
+    UPDATE sessions
+    SET last_activity = ?,
+        expires_at = COALESCE(?, expires_at)
+    WHERE session_id = ?
+"""
+
+
+class _SessionActivityBuffer:
+    """
+    Latest pending ``(last_activity, expires_at)`` per session, awaiting flush.
+
+    Repeated touches of one session between flushes coalesce into a single
+    row update. Entries being written by an in-progress flush stay visible to
+    :meth:`overlay` until the flush commits, so a concurrent validation never
+    reads the pre-flush expiry. Pending entries are dropped when the configured
+    database path changes.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, tuple[str, str | None]] = {}
+        self._flushing: dict[str, tuple[str, str | None]] = {}
+        self._lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self._db_path: str | None = None
+
+    def record(self, session_id: str, last_activity: str, expires_at: str | None) -> None:
+        """Remember the latest activity for ``session_id``."""
+        with self._lock:
+            self._sync_database_path()
+            self._pending[session_id] = (last_activity, expires_at)
+
+    def overlay(self, session: dict[str, Any]) -> None:
+        """Apply unflushed activity for ``session["session_id"]`` in place."""
+        with self._lock:
+            self._sync_database_path()
+            session_id = session["session_id"]
+            entry = self._pending.get(session_id) or self._flushing.get(session_id)
+        if entry is None:
+            return
+        session["last_activity"] = entry[0]
+        if entry[1] is not None:
+            session["expires_at"] = entry[1]
+
+    def pending_count(self) -> int:
+        """Return the number of sessions with unflushed activity."""
+        with self._lock:
+            return len(self._pending)
+
+    def begin_flush(self) -> list[tuple[str, str | None, str]]:
+        """Move pending entries to the in-flight set and return UPDATE params."""
+        with self._lock:
+            self._sync_database_path()
+            self._flushing, self._pending = self._pending, {}
+            return [
+                (last_activity, expires_at, session_id)
+                for session_id, (last_activity, expires_at) in self._flushing.items()
+            ]
+
+    def end_flush(self, *, committed: bool) -> None:
+        """Retire in-flight entries, re-queueing them if the write failed."""
+        with self._lock:
+            if not committed:
+                self._pending = {**self._flushing, **self._pending}
+            self._flushing = {}
+
+    def _sync_database_path(self) -> None:
+        """Forget all entries when the configured database changes (lock held)."""
+        from mud_server.config import config
+
+        db_path = config.database.path
+        if db_path != self._db_path:
+            self._pending.clear()
+            self._flushing.clear()
+            self._db_path = db_path
+
+
+_activity_buffer = _SessionActivityBuffer()
+
+
+def record_session_activity(session_id: str) -> bool:
+    """Record request activity for ``session_id`` without touching the database.
+
+    The update (and the sliding-expiration extension, when enabled) is written
+    by the next :func:`flush_session_activity`. Reads through this module see
+    the pending values immediately.
+
+    Returns:
+        ``True`` when the activity was buffered; ``False`` when
+        ``session.activity_flush_seconds`` is 0 and the caller must write it
+        through with :func:`update_session_activity` instead.
+    """
+    from mud_server.config import config
+
+    if config.session.activity_flush_seconds <= 0:
+        return False
+
+    now = datetime.now(UTC)
+    expires_at = None
+    if config.session.sliding_expiration and config.session.ttl_minutes > 0:
+        expires_at = (now + timedelta(minutes=config.session.ttl_minutes)).strftime(
+            _SQLITE_TIMESTAMP_FORMAT
+        )
+    _activity_buffer.record(session_id, now.strftime(_SQLITE_TIMESTAMP_FORMAT), expires_at)
+    return True
+
+
+def flush_session_activity() -> int:
+    """Write all buffered session activity in one ``executemany`` transaction.
+
+    On failure the drained entries are re-queued (newer activity recorded in
+    the meantime wins) and the typed write error is raised.
+
+    Returns:
+        Number of buffered sessions written.
+    """
+    with _activity_buffer.flush_lock:
+        batch = _activity_buffer.begin_flush()
+        if not batch:
+            return 0
+        try:
+            with connection_scope(write=True) as conn:
+                conn.executemany(_FLUSH_ACTIVITY_SQL, batch)
+        except Exception as exc:
+            _activity_buffer.end_flush(committed=False)
+            _raise_write_error(
+                "sessions.flush_session_activity",
+                exc,
+                details=f"sessions={len(batch)}",
+            )
+        _activity_buffer.end_flush(committed=True)
+        return len(batch)
+
+
+def get_pending_session_activity_count() -> int:
+    """Return how many sessions have activity waiting for the next flush."""
+    return _activity_buffer.pending_count()
+
+
 def _get_user_id_by_username(username: str) -> int | None:
     """Resolve user id for username directly from SQL."""
     try:
@@ -160,6 +384,10 @@ def create_session(
                 (user_id,),
             )
 
+        if config.session.allow_multiple_sessions:
+            notify_sessions_changed(session_id=session_id)
+        else:
+            notify_sessions_changed(session_id=session_id, user_id=int(user_id))
         return True
     except Exception as exc:
         _raise_write_error(
@@ -178,7 +406,9 @@ def set_session_character(session_id: str, character_id: int, *, world_id: str)
                 "UPDATE sessions SET character_id = ?, world_id = ? WHERE session_id = ?",
                 (character_id, world_id, session_id),
             )
-            return int(cursor.rowcount or 0) > 0
+            updated = int(cursor.rowcount or 0)
+        notify_sessions_changed(session_id=session_id)
+        return updated > 0
     except Exception as exc:
         _raise_write_error(
             "sessions.set_session_character",
@@ -194,7 +424,8 @@ def remove_session_by_id(session_id: str) -> bool:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
             removed = int(cursor.rowcount or 0)
-            return removed > 0
+        notify_sessions_changed(session_id=session_id)
+        return removed > 0
     except Exception as exc:
         _raise_write_error(
             "sessions.remove_session_by_id",
@@ -210,7 +441,8 @@ def remove_sessions_for_user(user_id: int) -> bool:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
             removed = int(cursor.rowcount or 0)
-            return removed > 0
+        notify_sessions_changed(user_id=user_id)
+        return removed > 0
     except Exception as exc:
         _raise_write_error(
             "sessions.remove_sessions_for_user",
@@ -231,7 +463,8 @@ def remove_sessions_for_character_count(character_id: int) -> int:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM sessions WHERE character_id = ?", (character_id,))
             removed = int(cursor.rowcount or 0)
-            return removed
+        notify_sessions_changed(character_id=character_id)
+        return removed
     except Exception as exc:
         _raise_write_error(
             "sessions.remove_sessions_for_character_count",
@@ -242,27 +475,10 @@ def remove_sessions_for_character_count(character_id: int) -> int:
 
 def update_session_activity(session_id: str) -> bool:
     """Update last activity and apply sliding expiration if configured."""
-    from mud_server.config import config
-
     try:
         with connection_scope(write=True) as conn:
             cursor = conn.cursor()
-
-            if config.session.sliding_expiration and config.session.ttl_minutes > 0:
-                cursor.execute(
-                    """
-                    UPDATE sessions
-                    SET last_activity = CURRENT_TIMESTAMP,
-                        expires_at = datetime('now', ?)
-                    WHERE session_id = ?
-                    """,
-                    (f"+{config.session.ttl_minutes} minutes", session_id),
-                )
-            else:
-                cursor.execute(
-                    "UPDATE sessions SET last_activity = CURRENT_TIMESTAMP WHERE session_id = ?",
-                    (session_id,),
-                )
+            cursor.execute(*_session_activity_statement(session_id))
             return int(cursor.rowcount or 0) > 0
     except Exception as exc:
         _raise_write_error(
@@ -277,27 +493,11 @@ def get_session_by_id(session_id: str) -> dict[str, Any] | None:
     try:
         with connection_scope() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT user_id, character_id, world_id, session_id, created_at, last_activity, expires_at,
-                       client_type
-                FROM sessions WHERE session_id = ?
-                """,
-                (session_id,),
-            )
+            cursor.execute(_SESSION_BY_ID_SQL, (session_id,))
             row = cursor.fetchone()
         if not row:
             return None
-        return {
-            "user_id": int(row[0]),
-            "character_id": row[1],
-            "world_id": row[2],
-            "session_id": row[3],
-            "created_at": row[4],
-            "last_activity": row[5],
-            "expires_at": row[6],
-            "client_type": row[7],
-        }
+        return _session_row_to_dict(row)
     except Exception as exc:
         _raise_read_error(
             "sessions.get_session_by_id",
@@ -306,6 +506,30 @@ def get_session_by_id(session_id: str) -> dict[str, Any] | None:
         )
 
 
+def get_session_context(session_id: str) -> dict[str, Any] | None:
+    """Return session record joined with its user and selected character.
+
+    The dict has the :func:`get_session_by_id` keys plus ``username``,
+    ``role``, ``character_name`` and ``character_world_id``; joined values are
+    ``None`` when the referenced row is missing (or no character is selected).
+    Returns ``None`` if the session token is absent.
+    """
+    try:
+        with connection_scope() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SESSION_CONTEXT_SQL, (session_id,))
+            row = cursor.fetchone()
+        if not row:
+            return None
+        return _session_context_row_to_dict(row)
+    except Exception as exc:
+        _raise_read_error(
+            "sessions.get_session_context",
+            exc,
+            details=f"session_id={session_id!r}",
+        )
+
+
 def get_active_session_count() -> int:
     """Count active sessions within the configured activity window."""
     from mud_server.config import config
@@ -313,10 +537,12 @@ def get_active_session_count() -> int:
     try:
         with connection_scope() as conn:
             cursor = conn.cursor()
-            where_clauses = ["(expires_at IS NULL OR datetime(expires_at) > datetime('now'))"]
+            where_clauses = ["expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)"]
             params: list[str] = []
             if config.session.active_window_minutes > 0:
-                where_clauses.append("datetime(last_activity) >= datetime('now', ?)")
+                where_clauses.append(
+                    "last_activity_epoch >= CAST(strftime('%s', 'now', ?) AS INTEGER)"
+                )
                 params.append(f"-{config.session.active_window_minutes} minutes")
 
             sql = f"""
@@ -330,19 +556,42 @@ def get_active_session_count() -> int:
         _raise_read_error("sessions.get_active_session_count", exc)
 
 
-def cleanup_expired_sessions() -> int:
-    """Delete expired session rows and return number removed."""
+def cleanup_expired_sessions(*, limit: int | None = None) -> int:
+    """Delete expired session rows and return number removed.
+
+    Buffered activity is flushed first so sessions kept alive by sliding
+    expiration inside the flush window are not swept.
+
+    Args:
+        limit: Maximum rows deleted in this transaction; ``None`` removes all.
+            Callers sweeping large backlogs pass a chunk size and call again
+            until fewer than ``limit`` rows come back.
+    """
+    flush_session_activity()
     try:
         with connection_scope(write=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.execute(
+                """
                 DELETE FROM sessions
-                WHERE expires_at IS NOT NULL AND datetime(expires_at) <= datetime('now')
-                """)
+                WHERE id IN (
+                    SELECT id FROM sessions
+                    WHERE expires_at_epoch <= CAST(strftime('%s', 'now') AS INTEGER)
+                    LIMIT ?
+                )
+                """,
+                (-1 if limit is None else limit,),
+            )
             removed_count = int(cursor.rowcount or 0)
-            return removed_count
+        if removed_count:
+            clear_room_presence()
+        return removed_count
     except Exception as exc:
-        _raise_write_error("sessions.cleanup_expired_sessions", exc)
+        _raise_write_error(
+            "sessions.cleanup_expired_sessions",
+            exc,
+            details=f"limit={limit}",
+        )
 
 
 def clear_all_sessions() -> int:
@@ -352,28 +601,23 @@ def clear_all_sessions() -> int:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM sessions")
             removed_count = int(cursor.rowcount or 0)
-            return removed_count
+        notify_sessions_changed()
+        return removed_count
     except Exception as exc:
         _raise_write_error("sessions.clear_all_sessions", exc)
 
 
 def get_active_characters(*, world_id: str) -> list[str]:
-    """Return active character names for one explicit world scope."""
+    """Return active character names for one explicit world scope.
+
+    Served from the in-memory presence index (see :mod:`mud_server.db.presence`).
+    """
+    active = room_presence.active_characters(world_id)
+    if active is not None:
+        return active
     try:
         with connection_scope() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT DISTINCT c.name
-                FROM sessions s
-                JOIN characters c ON c.id = s.character_id
-                WHERE s.character_id IS NOT NULL
-                  AND s.world_id = ?
-                  AND (s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now'))
-                """,
-                (world_id,),
-            )
-            rows = cursor.fetchall()
+            rows = _read_world_presence(conn.cursor(), world_id)
         return [row[0] for row in rows]
     except Exception as exc:
         _raise_read_error(
@@ -381,3 +625,20 @@ def get_active_characters(*, world_id: str) -> list[str]:
             exc,
             details=f"world_id={world_id!r}",
         )
+
+
+def is_character_active(name: str, *, world_id: str) -> bool:
+    """Return ``True`` when ``name`` has a live session in ``world_id``."""
+    active = room_presence.is_active(world_id, name)
+    if active is not None:
+        return active
+    try:
+        with connection_scope() as conn:
+            rows = _read_world_presence(conn.cursor(), world_id)
+        return any(row[0] == name for row in rows)
+    except Exception as exc:
+        _raise_read_error(
+            "sessions.is_character_active",
+            exc,
+            details=f"name={name!r}, world_id={world_id!r}",
+        )
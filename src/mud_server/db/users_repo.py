@@ -16,6 +16,7 @@ from mud_server.db.errors import (
     DatabaseReadError,
     DatabaseWriteError,
 )
+from mud_server.db.session_invalidation import notify_sessions_changed
 
 
 def _raise_read_error(operation: str, exc: Exception, *, details: str | None = None) -> NoReturn:
@@ -177,6 +178,7 @@ def set_user_role(username: str, role: str) -> bool:
         with connection_scope(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("UPDATE users SET role = ? WHERE username = ?", (role, username))
+        notify_sessions_changed(username=username)
         return True
     except Exception as exc:
         _raise_write_error(
@@ -232,6 +234,7 @@ def deactivate_user(username: str) -> bool:
         with connection_scope(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("UPDATE users SET is_active = 0 WHERE username = ?", (username,))
+        notify_sessions_changed(username=username)
         return True
     except Exception as exc:
         _raise_write_error("users.deactivate_user", exc, details=f"username={username!r}")
@@ -283,6 +286,7 @@ def tombstone_user(user_id: int) -> None:
                 """,
                 (user_id,),
             )
+        notify_sessions_changed(user_id=user_id)
     except Exception as exc:
         _raise_write_error("users.tombstone_user", exc, details=f"user_id={user_id}")
 
@@ -302,6 +306,7 @@ def delete_user(username: str) -> bool:
                 "UPDATE users SET is_active = 0, tombstoned_at = CURRENT_TIMESTAMP WHERE id = ?",
                 (user_id,),
             )
+        notify_sessions_changed(user_id=user_id)
         return True
     except Exception as exc:
         _raise_write_error("users.delete_user", exc, details=f"username={username!r}")
@@ -321,9 +326,13 @@ def unlink_characters_for_user(user_id: int) -> None:
         )
 
 
-def cleanup_expired_guest_accounts() -> int:
+def cleanup_expired_guest_accounts(*, limit: int | None = None) -> int:
     """Delete expired guest accounts and detach their character ownership.
 
+    Args:
+        limit: Maximum accounts removed in this transaction; ``None`` removes
+            all. Chunked sweeps call again until fewer than ``limit`` return.
+
     Returns:
         Number of user rows removed.
     """
@@ -331,7 +340,8 @@ def cleanup_expired_guest_accounts() -> int:
         with connection_scope(write=True) as conn:
             cursor = conn.cursor()
 
-            cursor.execute("""
+            cursor.execute(
+                """
                 SELECT id
                 FROM users
                 WHERE tombstoned_at IS NULL
@@ -343,7 +353,10 @@ def cleanup_expired_guest_accounts() -> int:
                      AND guest_expires_at IS NULL
                      AND datetime(created_at) <= datetime('now', '-24 hours'))
                   )
-                """)
+                LIMIT ?
+                """,
+                (-1 if limit is None else limit,),
+            )
             rows = cursor.fetchall()
             if not rows:
                 return 0
@@ -363,6 +376,7 @@ def cleanup_expired_guest_accounts() -> int:
                 f"DELETE FROM users WHERE id IN ({placeholders})",  # nosec B608
                 user_ids,
             )
-            return len(user_ids)
+        notify_sessions_changed()
+        return len(user_ids)
     except Exception as exc:
-        _raise_write_error("users.cleanup_expired_guest_accounts", exc)
+        _raise_write_error("users.cleanup_expired_guest_accounts", exc, details=f"limit={limit}")
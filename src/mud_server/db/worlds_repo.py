@@ -308,10 +308,10 @@ def get_world_admin_rows() -> list[dict[str, Any]]:
                 LEFT JOIN sessions s
                        ON s.world_id = w.id
                       AND s.character_id IS NOT NULL
-                      AND (s.expires_at IS NULL OR datetime(s.expires_at) > datetime('now'))
+                      AND s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)
                 LEFT JOIN characters c ON c.id = s.character_id
                 LEFT JOIN users u ON u.id = s.user_id
-                ORDER BY w.id ASC, datetime(s.last_activity) DESC
+                ORDER BY w.id ASC, s.last_activity_epoch DESC
                 """)
             rows = cursor.fetchall()
     except Exception as exc:
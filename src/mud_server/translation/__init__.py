@@ -13,15 +13,20 @@ profile.
 
 Package structure
 -----------------
+cache.py            TranslationCache        — LRU + TTL cache of validated
+                    deterministic output, optionally persisted to SQLite.
 config.py           TranslationLayerConfig  — world-scoped settings loaded
                     from world.json.
+guard.py            EndpointGuard           — per-endpoint concurrency limit,
+                    wait queue and circuit breaker shared by renderers.
 profile_builder.py  CharacterProfileBuilder — fetches axis state from DB
                     and builds the template context dict.
-renderer.py         OllamaRenderer          — synchronous HTTP client for
-                    the Ollama /api/chat endpoint.
+renderer.py         OllamaRenderer          — pooled synchronous HTTP client
+                    for the Ollama /api/chat endpoint; AsyncOllamaRenderer
+                    is its httpx counterpart for async mode.
 validator.py        OutputValidator         — validates/cleans raw LLM output
                     before it is stored.
-service.py          OOCToICTranslationService — orchestrates the other four
+service.py          OOCToICTranslationService — orchestrates the other five
                     classes; the single public entry-point used by the engine.
 
 Typical call flow (inside GameEngine.chat)
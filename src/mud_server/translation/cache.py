@@ -0,0 +1,226 @@
+"""Result cache for deterministic OOC→IC translations.
+
+With ``deterministic = true`` the same rendered prompt, OOC input, model,
+temperature and seed are meant to produce the same IC output, so asking
+Ollama again only costs latency.  ``TranslationCache`` remembers the raw
+model output of translations that passed validation and answers repeats
+without a network call.
+
+Key
+---
+:func:`cache_key` hashes (SHA-256) the rendered system prompt, the OOC
+message, the model tag, the effective temperature and the seed.  The
+rendered prompt already contains the character's ``profile_summary``, so a
+change to any axis score or label yields a different key.
+
+Eviction
+--------
+Entries live in an in-memory LRU of ``max_entries`` items and expire
+``ttl_seconds`` after they were stored (``0`` disables expiry).  When a
+``path`` is given the cache is also written through to a small SQLite file,
+bounded to the same number of entries, so warm results survive a restart.
+A disk failure never affects translation: the cache just degrades to
+memory only.
+
+Only deterministic (seeded) translations are cached; sampled output is
+expected to vary between repeats.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(
+    *,
+    system_prompt: str,
+    ooc_message: str,
+    model: str,
+    temperature: float,
+    seed: int | None,
+) -> str:
+    """Return the hex SHA-256 key for one translation request."""
+    payload = json.dumps(
+        [system_prompt, ooc_message, model, temperature, seed],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationCacheStats:
+    """Hit/miss counters for one world's translation cache.
+
+    Attributes:
+        entries:     Entries held in memory.
+        max_entries: Configured capacity.
+        hits:        Lookups answered from the cache (memory or disk).
+        misses:      Lookups that had to call Ollama (including expired
+                     entries).
+        evictions:   Entries dropped from memory to respect ``max_entries``.
+    """
+
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TranslationCache:
+    """Thread-safe LRU + TTL cache of raw translation output, optionally on disk."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise the cache.
+
+        Args:
+            max_entries: Capacity of the in-memory LRU (and of the disk file).
+            ttl_seconds: Entry lifetime; ``0`` or less keeps entries until
+                         evicted.
+            path:        SQLite file for write-through persistence, or
+                         ``None`` for memory only.
+            clock:       Wall-clock source (``time.time``); injectable for
+                         tests.  Wall time rather than monotonic so ages
+                         stay meaningful across restarts.
+        """
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._db: sqlite3.Connection | None = self._open(path) if path is not None else None
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> str | None:
+        """Return the cached output for ``key``, or ``None`` on a miss."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[1], now):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                entry = self._disk_get(key, now)
+                if entry is not None:
+                    self._remember(key, entry)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: str, output: str) -> None:
+        """Store ``output`` under ``key``, evicting the least recently used entry."""
+        entry = (output, self._clock())
+        with self._lock:
+            self._remember(key, entry)
+            self._disk_put(key, entry)
+
+    def stats(self) -> TranslationCacheStats:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return TranslationCacheStats(
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def close(self) -> None:
+        """Close the disk file, if any (the memory LRU stays usable)."""
+        with self._lock:
+            db, self._db = self._db, None
+        if db is not None:
+            db.close()
+
+    # ── Internal helpers (caller holds ``self._lock``) ────────────────────────
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self._ttl > 0 and now - stored_at > self._ttl
+
+    def _remember(self, key: str, entry: tuple[str, float]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _open(self, path: Path) -> sqlite3.Connection | None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS translation_cache ("
+                " key TEXT PRIMARY KEY, output TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            if self._ttl > 0:
+                db.execute(
+                    "DELETE FROM translation_cache WHERE stored_at < ?",
+                    (self._clock() - self._ttl,),
+                )
+            return db
+        except (OSError, sqlite3.Error):
+            logger.warning("Translation cache file %s unavailable; using memory only", path)
+            return None
+
+    def _disk_get(self, key: str, now: float) -> tuple[str, float] | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT output, stored_at FROM translation_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Translation cache read failed", exc_info=True)
+            return None
+        if row is None or self._expired(row[1], now):
+            return None
+        return str(row[0]), float(row[1])
+
+    def _disk_put(self, key: str, entry: tuple[str, float]) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO translation_cache (key, output, stored_at)"
+                " VALUES (?, ?, ?)",
+                (key, *entry),
+            )
+            self._db.execute(
+                "DELETE FROM translation_cache WHERE key NOT IN ("
+                " SELECT key FROM translation_cache ORDER BY stored_at DESC LIMIT ?)",
+                (self._max_entries,),
+            )
+        except sqlite3.Error:
+            logger.warning("Translation cache write failed", exc_info=True)
@@ -85,6 +85,18 @@ class TranslationLayerConfig:
                               will use ``temperature=0.0`` and a seed
                               derived from the IPC hash.  See module
                               docstring for IPC sourcing status.
+        connect_timeout_seconds: TCP connect timeout for Ollama calls,
+                              separate from ``timeout_seconds`` (the read
+                              timeout) so an unreachable host fails fast.
+        pool_size:            Keep-alive connections the renderer keeps
+                              open to the Ollama host.
+        cache_size:           Deterministic translations remembered per
+                              world (``0`` disables the result cache).
+        cache_ttl_seconds:    Lifetime of a cached translation; ``0`` keeps
+                              entries until evicted.
+        cache_path:           Optional SQLite file the cache writes through
+                              to, so results survive restarts.  Relative
+                              paths resolve against the world package.
     """
 
     enabled: bool
@@ -97,6 +109,11 @@ class TranslationLayerConfig:
     prompt_policy_id: str | None
     active_axes: list[str]
     deterministic: bool
+    connect_timeout_seconds: float = 3.0
+    pool_size: int = 4
+    cache_size: int = 256
+    cache_ttl_seconds: float = 3600.0
+    cache_path: Path | None = None
 
     @property
     def api_endpoint(self) -> str:
@@ -104,7 +121,7 @@ class TranslationLayerConfig:
         return f"{self.ollama_base_url.rstrip('/')}/api/chat"
 
     @classmethod
-    def from_dict(cls, data: dict, *, world_root: Path) -> TranslationLayerConfig:  # noqa: ARG002
+    def from_dict(cls, data: dict, *, world_root: Path) -> TranslationLayerConfig:
         """Parse a ``translation_layer`` config block from ``world.json``.
 
         Missing optional fields fall back to safe defaults so that a minimal
@@ -112,9 +129,8 @@ class TranslationLayerConfig:
 
         Args:
             data:       The ``translation_layer`` dict from ``world.json``.
-            world_root: Passed for future use (e.g. resolving relative paths
-                        at parse time).  Currently unused at construction but
-                        kept in the signature to avoid a breaking change later.
+            world_root: World package directory; relative ``cache_path``
+                        values are resolved against it.
 
         Returns:
             A fully-populated, frozen ``TranslationLayerConfig``.
@@ -125,6 +141,8 @@ class TranslationLayerConfig:
         )
         # ``prompt_template_path`` is intentionally ignored in canonical
         # runtime mode. Prompt selection is policy-id based only.
+        raw_cache_path = data.get("cache_path")
+        cache_path = world_root / str(raw_cache_path) if raw_cache_path else None
         return cls(
             enabled=bool(data.get("enabled", False)),
             model=str(data.get("model", "gemma2:2b")),
@@ -136,6 +154,11 @@ class TranslationLayerConfig:
             prompt_policy_id=prompt_policy_id or "prompt:translation.prompts.ic:default",
             active_axes=list(data.get("active_axes", [])),
             deterministic=bool(data.get("deterministic", False)),
+            connect_timeout_seconds=float(data.get("connect_timeout_seconds", 3.0)),
+            pool_size=max(1, int(data.get("pool_size", 4))),
+            cache_size=max(0, int(data.get("cache_size", 256))),
+            cache_ttl_seconds=float(data.get("cache_ttl_seconds", 3600.0)),
+            cache_path=cache_path,
         )
 
     @classmethod
@@ -0,0 +1,349 @@
+"""Per-endpoint admission control for Ollama translation calls.
+
+Every renderer that talks to the same ``/api/chat`` URL shares one
+:class:`EndpointGuard`, whatever world it belongs to, because they share
+one model on one host.  The guard combines two mechanisms:
+
+Concurrency limit and wait queue
+--------------------------------
+At most ``max_concurrency`` calls are in flight.  Further callers wait in a
+FIFO queue of ``queue_size`` slots, each for at most ``queue_timeout_seconds``.
+A caller that finds the queue full, or whose wait runs out, is *shed*: it
+gets ``False`` from :meth:`EndpointGuard.acquire` and the translation falls
+back to the OOC text without a network call.  Threads (sync and deferred
+mode) and coroutines (async mode) wait in the same queue.
+
+Circuit breaker
+---------------
+``breaker_failure_threshold`` consecutive timeouts or connection errors
+open the breaker: callers are rejected at once (OOC fallback) and queued
+callers are released with a rejection.  After ``breaker_reset_seconds`` it
+is half-open: up to ``breaker_half_open_probes`` calls go through as
+probes, and the first probe result closes the breaker (success) or opens
+it again (failure).  A non-2xx response counts as the endpoint being
+reachable — only a missing answer trips the breaker.
+
+Settings come from ``[ollama_translation]`` in ``server.ini`` and are read
+when an endpoint's guard is first created.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointGuardStats:
+    """Breaker state and queue counters for one Ollama endpoint.
+
+    Attributes:
+        endpoint:             The ``/api/chat`` URL.
+        state:                ``"closed"``, ``"open"`` or ``"half_open"``.
+        consecutive_failures: Timeouts/connection errors since the last
+                              answered call.
+        in_flight:            Calls currently holding a slot.
+        queue_depth:          Callers currently waiting for a slot.
+        max_concurrency:      Configured slot count.
+        queue_size:           Configured wait-queue capacity.
+        shed:                 Callers that fell back because the queue was
+                              full or their wait timed out.
+        rejected:             Callers that fell back because the breaker was
+                              open (or half-open with all probes busy).
+        trips:                Times the breaker has opened.
+    """
+
+    endpoint: str
+    state: BreakerState
+    consecutive_failures: int
+    in_flight: int
+    queue_depth: int
+    max_concurrency: int
+    queue_size: int
+    shed: int
+    rejected: int
+    trips: int
+
+
+class _Waiter:
+    """One queued caller; woken with a grant or a rejection."""
+
+    __slots__ = ("granted", "_event", "_future", "_loop")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.granted: bool | None = None
+        self._loop = loop
+        self._event = threading.Event() if loop is None else None
+        self._future: asyncio.Future[None] | None = loop.create_future() if loop else None
+
+    def wake(self, granted: bool) -> None:
+        """Record the decision and wake the waiter (caller holds the guard lock)."""
+        self.granted = granted
+        if self._event is not None:
+            self._event.set()
+        elif self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if self._future is not None and not self._future.done():
+            self._future.set_result(None)
+
+    def wait(self, timeout: float) -> None:
+        """Block the calling thread until woken or ``timeout`` elapses."""
+        assert self._event is not None
+        self._event.wait(timeout)
+
+    async def wait_async(self, timeout: float) -> None:
+        """Await until woken or ``timeout`` elapses."""
+        assert self._future is not None
+        try:
+            await asyncio.wait_for(asyncio.shield(self._future), timeout)
+        except TimeoutError:
+            pass
+
+
+class EndpointGuard:
+    """Concurrency limit, bounded wait queue and circuit breaker for one endpoint.
+
+    Usage::
+
+        if not guard.acquire():
+            return None                   # shed or breaker open → fallback
+        healthy = None
+        try:
+            ...                           # the HTTP call
+            healthy = True                # answered (any status)
+        except Timeout:
+            healthy = False               # counts towards opening the breaker
+        finally:
+            guard.release(healthy=healthy)
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        max_concurrency: int,
+        queue_size: int,
+        queue_timeout_seconds: float,
+        failure_threshold: int,
+        reset_seconds: float,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise a closed guard with no calls in flight.
+
+        Args:
+            endpoint:              The ``/api/chat`` URL (for stats and logs).
+            max_concurrency:       Calls allowed in flight at once.
+            queue_size:            Callers allowed to wait for a slot.
+            queue_timeout_seconds: Longest wait for a slot.
+            failure_threshold:     Consecutive failures that open the breaker.
+            reset_seconds:         Time the breaker stays open before
+                                   half-opening.
+            half_open_probes:      Concurrent probe calls while half-open.
+            clock:                 Monotonic time source; injectable for tests.
+        """
+        self.endpoint = endpoint
+        self._max_concurrency = max(1, max_concurrency)
+        self._queue_size = max(0, queue_size)
+        self._queue_timeout = max(0.0, queue_timeout_seconds)
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = max(0.0, reset_seconds)
+        self._half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+        self._in_flight = 0
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._probes = 0
+        self._consecutive_failures = 0
+        self._shed = 0
+        self._rejected = 0
+        self._trips = 0
+
+    # ── Admission ─────────────────────────────────────────────────────────────
+
+    def acquire(self) -> bool:
+        """Take a slot, waiting in the queue if needed; ``False`` means fall back."""
+        with self._lock:
+            admitted = self._admit(None)
+        if not isinstance(admitted, _Waiter):
+            return admitted
+        admitted.wait(self._queue_timeout)
+        return self._settle(admitted)
+
+    async def acquire_async(self) -> bool:
+        """Async :meth:`acquire`; cancellation while queued gives up the place."""
+        with self._lock:
+            admitted = self._admit(asyncio.get_running_loop())
+        if not isinstance(admitted, _Waiter):
+            return admitted
+        try:
+            await admitted.wait_async(self._queue_timeout)
+        except asyncio.CancelledError:
+            with self._lock:
+                if admitted.granted is None:
+                    self._waiters.remove(admitted)
+                granted = admitted.granted
+            if granted:
+                self.release(healthy=None)
+            raise
+        return self._settle(admitted)
+
+    def release(self, *, healthy: bool | None) -> None:
+        """Return a slot and report the call's outcome to the breaker.
+
+        Args:
+            healthy: ``True`` if the endpoint answered (any status),
+                     ``False`` on a timeout or connection error, ``None``
+                     when the call says nothing about the endpoint (e.g. it
+                     was cancelled).
+        """
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            state = self._current_state()
+            if healthy is True:
+                self._consecutive_failures = 0
+                if state == "half_open":
+                    self._close()
+            elif healthy is False:
+                self._consecutive_failures += 1
+                if state == "half_open" or (
+                    state == "closed" and self._consecutive_failures >= self._failure_threshold
+                ):
+                    self._open()
+            elif state == "half_open":
+                self._probes = max(0, self._probes - 1)
+            self._dispatch()
+
+    def stats(self) -> EndpointGuardStats:
+        """Return the breaker state and queue counters."""
+        with self._lock:
+            return EndpointGuardStats(
+                endpoint=self.endpoint,
+                state=self._current_state(),
+                consecutive_failures=self._consecutive_failures,
+                in_flight=self._in_flight,
+                queue_depth=len(self._waiters),
+                max_concurrency=self._max_concurrency,
+                queue_size=self._queue_size,
+                shed=self._shed,
+                rejected=self._rejected,
+                trips=self._trips,
+            )
+
+    # ── Internal helpers (caller holds ``self._lock``) ────────────────────────
+
+    def _current_state(self) -> BreakerState:
+        if self._state == "open" and self._clock() - self._opened_at >= self._reset_seconds:
+            self._state = "half_open"
+            self._probes = 0
+            logger.info("Ollama circuit half-open for %s; probing", self.endpoint)
+        return self._state
+
+    def _admit(self, loop: asyncio.AbstractEventLoop | None) -> bool | _Waiter:
+        state = self._current_state()
+        if state == "open" or (state == "half_open" and self._probes >= self._half_open_probes):
+            self._rejected += 1
+            return False
+        if state == "half_open":
+            self._probes += 1
+            self._in_flight += 1
+            return True
+        if self._in_flight < self._max_concurrency:
+            self._in_flight += 1
+            return True
+        if len(self._waiters) >= self._queue_size:
+            self._shed += 1
+            logger.debug("Ollama queue full for %s; shedding to fallback", self.endpoint)
+            return False
+        waiter = _Waiter(loop)
+        self._waiters.append(waiter)
+        return waiter
+
+    def _settle(self, waiter: _Waiter) -> bool:
+        """Resolve a finished wait: granted, rejected, or timed out (shed)."""
+        with self._lock:
+            if waiter.granted is None:
+                self._waiters.remove(waiter)
+                self._shed += 1
+                return False
+            return waiter.granted
+
+    def _dispatch(self) -> None:
+        """Hand freed slots to queued callers, or reject them all if not closed."""
+        if self._state != "closed":
+            while self._waiters:
+                self._rejected += 1
+                self._waiters.popleft().wake(False)
+            return
+        while self._waiters and self._in_flight < self._max_concurrency:
+            self._in_flight += 1
+            self._waiters.popleft().wake(True)
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = self._clock()
+        self._probes = 0
+        self._trips += 1
+        logger.warning(
+            "Ollama circuit open for %s after %d consecutive failures; "
+            "translations fall back for %.0fs",
+            self.endpoint,
+            self._consecutive_failures,
+            self._reset_seconds,
+        )
+
+    def _close(self) -> None:
+        self._state = "closed"
+        self._probes = 0
+        logger.info("Ollama circuit closed for %s", self.endpoint)
+
+
+_guards: dict[str, EndpointGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_endpoint_guard(endpoint: str) -> EndpointGuard:
+    """Return the shared guard for ``endpoint``, creating it from ``server.ini``."""
+    from mud_server.config import config
+
+    with _guards_lock:
+        guard = _guards.get(endpoint)
+        if guard is None:
+            settings = config.ollama_translation
+            guard = _guards[endpoint] = EndpointGuard(
+                endpoint,
+                max_concurrency=settings.max_concurrency,
+                queue_size=settings.queue_size,
+                queue_timeout_seconds=settings.queue_timeout_seconds,
+                failure_threshold=settings.breaker_failure_threshold,
+                reset_seconds=settings.breaker_reset_seconds,
+                half_open_probes=settings.breaker_half_open_probes,
+            )
+        return guard
+
+
+def endpoint_guard_stats() -> list[EndpointGuardStats]:
+    """Return stats for every endpoint with a guard, sorted by URL."""
+    with _guards_lock:
+        guards = sorted(_guards.values(), key=lambda guard: guard.endpoint)
+    return [guard.stats() for guard in guards]
+
+
+def reset_endpoint_guards() -> None:
+    """Forget all guards so the next lookup re-reads settings (tests)."""
+    with _guards_lock:
+        _guards.clear()
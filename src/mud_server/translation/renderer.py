@@ -1,23 +1,43 @@
 """Ollama HTTP renderer for the OOC→IC translation layer.
 
 ``OllamaRenderer`` is a thin, synchronous wrapper around the Ollama
-``/api/chat`` endpoint.  It is the only place in the translation layer
-that makes a network call.
+``/api/chat`` endpoint and ``AsyncOllamaRenderer`` is its ``httpx``
+counterpart.  They are the only places in the translation layer that make
+a network call.
 
 Sync vs async
 -------------
-The renderer uses the synchronous ``requests`` library (already a pinned
-dependency at ``requests==2.32.5``).  The ``GameEngine`` is fully
-synchronous, and FastAPI runs sync endpoint handlers inside a thread-pool
-executor, so a blocking HTTP call here does not stall the event loop.
-
-When the engine is eventually asyncified the upgrade path is:
-1. Replace ``requests.post`` with ``await httpx.AsyncClient().post``.
-2. Mark ``render`` as ``async def``.
-3. Mark ``OOCToICTranslationService.translate`` as ``async def``.
-4. Propagate ``await`` up through ``engine.chat/yell/whisper``.
-``httpx`` is already in the project dependencies (``>=0.28.1``) so no
-new dep is required at that point.
+``OllamaRenderer`` uses the synchronous ``requests`` library (already a
+pinned dependency at ``requests==2.32.5``).  Engine commands run on the
+engine worker pool, so a blocking HTTP call here does not stall the event
+loop, but it does occupy a worker for up to ``timeout_seconds``.
+
+``AsyncOllamaRenderer`` (selected with ``[ollama_translation] mode = async``)
+awaits ``httpx.AsyncClient.post`` instead.  The engine's ``chat_async``,
+``yell_async`` and ``whisper_async`` run the database work on the worker
+pool and await only the Ollama call on the event loop, so translations
+overlap without holding workers, and a cancelled request (client
+disconnect) cancels its HTTP call.  Each world's translation service owns
+one ``AsyncClient``.  Deterministic seeds are passed per call rather than
+armed on the renderer, because concurrent translations share it.
+
+Connection pooling
+------------------
+Each renderer owns a ``requests.Session`` whose adapter keeps up to
+``pool_size`` keep-alive connections to the Ollama host, so consecutive
+chat lines reuse a TCP connection instead of paying connection setup on
+every call.  Connect and read timeouts are separate: a dead host fails
+within ``connect_timeout_seconds`` while a slow generation may still use
+the full ``timeout_seconds``.  ``stats()`` reports request latency and how
+many requests reused a pooled connection.
+
+Admission control
+-----------------
+A renderer built with an :class:`~mud_server.translation.guard.EndpointGuard`
+asks it for a slot before each call and reports whether Ollama answered.
+When the guard sheds the call (queue full, wait timed out) or its circuit
+breaker is open, ``render`` returns ``None`` at once, so the caller takes
+the OOC fallback without waiting ``timeout_seconds``.
 
 Request structure
 -----------------
@@ -49,9 +69,17 @@ the configured temperature from ``TranslationLayerConfig``.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
+from dataclasses import dataclass
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+from mud_server.translation.guard import EndpointGuard
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +89,119 @@ _DEFAULT_TEMPERATURE = 0.7
 # Conservative token ceiling for a single line of dialogue.
 _DEFAULT_NUM_PREDICT = 128
 
+# Keep-alive connections held open to the Ollama host per renderer.
+_DEFAULT_POOL_SIZE = 4
+
+# Time allowed to establish a TCP connection, separate from the read timeout.
+_DEFAULT_CONNECT_TIMEOUT = 3.0
+
+
+@dataclass(frozen=True, slots=True)
+class RendererStats:
+    """Request, latency and connection-reuse counters for one renderer.
+
+    Attributes:
+        requests:              Requests sent to Ollama.
+        failures:              Requests that returned no content because of a
+                               network error, timeout or non-2xx status.
+        connections_opened:    TCP connections opened by the session's pool.
+        connections_reused:    Requests served on an already-open connection.
+        total_latency_seconds: Summed wall-clock time of all requests.
+        max_latency_seconds:   Slowest single request.
+    """
+
+    requests: int
+    failures: int
+    connections_opened: int
+    connections_reused: int
+    total_latency_seconds: float
+    max_latency_seconds: float
+
+    @property
+    def mean_latency_seconds(self) -> float:
+        """Average request latency (0.0 before the first request)."""
+        return self.total_latency_seconds / self.requests if self.requests else 0.0
+
+
+class _RequestCounters:
+    """Thread-safe request, failure and latency counters shared by both renderers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, started: float, *, failed: bool) -> None:
+        """Add one request's latency (from ``started``) and outcome."""
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.requests += 1
+            self.failures += int(failed)
+            self.total_latency += elapsed
+            self.max_latency = max(self.max_latency, elapsed)
+
+    def snapshot(self, *, opened: int, reused: int) -> RendererStats:
+        """Return the counters with the given connection figures."""
+        with self._lock:
+            return RendererStats(
+                requests=self.requests,
+                failures=self.failures,
+                connections_opened=opened,
+                connections_reused=reused,
+                total_latency_seconds=self.total_latency,
+                max_latency_seconds=self.max_latency,
+            )
+
+
+def _chat_payload(
+    *,
+    model: str,
+    keep_alive: str,
+    temperature: float,
+    seed: int | None,
+    system_prompt: str,
+    user_message: str,
+) -> dict:
+    """Construct the Ollama ``/api/chat`` request payload.
+
+    ``stream`` is always ``False`` — we want the full response in a
+    single JSON object rather than a server-sent-event stream.
+    ``keep_alive`` is included at the top level to control how long
+    Ollama keeps the model loaded after responding.
+    """
+    options: dict = {
+        "temperature": temperature,
+        "num_predict": _DEFAULT_NUM_PREDICT,
+    }
+    if seed is not None:
+        options["seed"] = seed
+
+    return {
+        "model": model,
+        "stream": False,
+        "keep_alive": keep_alive,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+        "options": options,
+    }
+
+
+def create_session(pool_size: int = _DEFAULT_POOL_SIZE) -> requests.Session:
+    """Build a keep-alive ``requests.Session`` pooling ``pool_size`` connections.
+
+    Requests beyond ``pool_size`` still run on a temporary connection
+    (``pool_block=False``); only ``pool_size`` are kept open afterwards.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), pool_block=False)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class OllamaRenderer:
     """Synchronous renderer that calls the Ollama ``/api/chat`` endpoint.
@@ -75,7 +216,10 @@ class OllamaRenderer:
     Attributes:
         _api_endpoint:  Full ``/api/chat`` URL.
         _model:         Ollama model tag (e.g. ``"gemma2:2b"``).
-        _timeout:       HTTP request timeout in seconds.
+        _timeout:       HTTP read timeout in seconds.
+        _connect_timeout: TCP connect timeout in seconds.
+        _session:       Pooled keep-alive session (shared with lab renderers
+                        built from this one).
         _keep_alive:    Ollama ``keep_alive`` duration string (e.g.
                         ``"5m"``).  Controls how long the model stays
                         loaded in GPU/CPU memory after each request.
@@ -93,26 +237,70 @@ class OllamaRenderer:
         timeout_seconds: float,
         temperature: float = _DEFAULT_TEMPERATURE,
         keep_alive: str = "5m",
+        connect_timeout_seconds: float = _DEFAULT_CONNECT_TIMEOUT,
+        pool_size: int = _DEFAULT_POOL_SIZE,
+        session: requests.Session | None = None,
+        guard: EndpointGuard | None = None,
     ) -> None:
         """Initialise the renderer.
 
         Args:
             api_endpoint:    Full Ollama ``/api/chat`` URL.
             model:           Ollama model tag.
-            timeout_seconds: HTTP request timeout.
+            timeout_seconds: HTTP read timeout (time allowed for Ollama
+                             to answer once connected).
             temperature:     Default sampling temperature.
             keep_alive:      Ollama ``keep_alive`` duration string.
                              Controls how long the model stays loaded
                              after each request.  ``"5m"`` (default)
                              keeps it warm for 5 minutes; ``"0"``
                              unloads immediately.
+            connect_timeout_seconds: TCP connect timeout, capped at
+                             ``timeout_seconds``.
+            pool_size:       Keep-alive connections kept open to the
+                             Ollama host.  Ignored when ``session`` is given.
+            session:         Existing pooled session to share (see
+                             :meth:`session`); a new one is created when
+                             ``None``.
+            guard:           Per-endpoint concurrency limit and circuit
+                             breaker; ``None`` calls Ollama unconditionally.
         """
         self._api_endpoint = api_endpoint
         self._model = model
         self._timeout = timeout_seconds
+        self._connect_timeout = min(connect_timeout_seconds, timeout_seconds)
         self._keep_alive = keep_alive
         self._temperature: float = temperature
         self._seed: int | None = None
+        self._session = session if session is not None else create_session(pool_size)
+        self._guard = guard
+        self._counters = _RequestCounters()
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session, for renderers that should share its connections."""
+        return self._session
+
+    def close(self) -> None:
+        """Close pooled connections held by this renderer's session."""
+        self._session.close()
+
+    def stats(self) -> RendererStats:
+        """Return request latency and connection-reuse counters.
+
+        Connection counters come from the session's pool for the Ollama
+        host, so they include requests from renderers sharing the session.
+        """
+        opened, pooled_requests = self._pool_counters()
+        return self._counters.snapshot(opened=opened, reused=max(0, pooled_requests - opened))
+
+    def _pool_counters(self) -> tuple[int, int]:
+        """Return ``(connections opened, requests sent)`` for the endpoint's pool."""
+        adapter = self._session.get_adapter(self._api_endpoint)
+        if not isinstance(adapter, HTTPAdapter):
+            return 0, 0
+        pool = adapter.poolmanager.connection_from_url(self._api_endpoint)
+        return int(pool.num_connections), int(pool.num_requests)
 
     # ── Deterministic mode ────────────────────────────────────────────────────
 
@@ -139,12 +327,15 @@ class OllamaRenderer:
     def render(self, system_prompt: str, user_message: str) -> str | None:
         """Call Ollama and return the raw response content.
 
-        Builds the Ollama request payload, executes a synchronous POST, and
-        returns the ``message.content`` string from the JSON response.
+        Builds the Ollama request payload, executes a synchronous POST on
+        the pooled session, and returns the ``message.content`` string from
+        the JSON response.
 
         Returns ``None`` on any network-level failure (timeout, connection
-        error, non-2xx status).  Content-level validation (PASSTHROUGH
-        sentinel, multi-line output, etc.) is handled by ``OutputValidator``.
+        error, non-2xx status), and without a request when the endpoint
+        guard sheds the call or its breaker is open.  Content-level
+        validation (PASSTHROUGH sentinel, multi-line output, etc.) is
+        handled by ``OutputValidator``.
 
         Args:
             system_prompt: The fully-rendered system prompt (with character
@@ -155,19 +346,27 @@ class OllamaRenderer:
         Returns:
             Raw LLM output string on success, ``None`` on failure.
         """
+        if self._guard is not None and not self._guard.acquire():
+            return None
         payload = self._build_payload(system_prompt, user_message)
+        healthy: bool | None = None
+        started = time.perf_counter()
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self._api_endpoint,
                 json=payload,
-                timeout=self._timeout,
+                timeout=(self._connect_timeout, self._timeout),
             )
+            healthy = True
             response.raise_for_status()
             data = response.json()
+            self._counters.record(started, failed=False)
             return data.get("message", {}).get("content", "").strip() or None
 
         except requests.exceptions.Timeout:
+            healthy = False
+            self._counters.record(started, failed=True)
             logger.warning(
                 "OllamaRenderer: request timed out after %.1fs (endpoint=%s)",
                 self._timeout,
@@ -175,25 +374,26 @@ class OllamaRenderer:
             )
             return None
         except requests.exceptions.ConnectionError:
+            healthy = False
+            self._counters.record(started, failed=True)
             logger.warning(
                 "OllamaRenderer: cannot connect to Ollama at %s",
                 self._api_endpoint,
             )
             return None
         except requests.exceptions.RequestException as exc:
+            self._counters.record(started, failed=True)
             logger.error("OllamaRenderer: request failed: %s", exc)
             return None
+        finally:
+            if self._guard is not None:
+                self._guard.release(healthy=healthy)
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
     def _build_payload(self, system_prompt: str, user_message: str) -> dict:
         """Construct the Ollama ``/api/chat`` request payload.
 
-        ``stream`` is always ``False`` — we want the full response in a
-        single JSON object rather than a server-sent-event stream.
-        ``keep_alive`` is included at the top level to control how long
-        Ollama keeps the model loaded after responding.
-
         Args:
             system_prompt: Rendered system prompt text.
             user_message:  OOC message text.
@@ -201,20 +401,155 @@ class OllamaRenderer:
         Returns:
             Dict ready to be serialised as the POST body.
         """
-        options: dict = {
-            "temperature": self._temperature,
-            "num_predict": _DEFAULT_NUM_PREDICT,
-        }
-        if self._seed is not None:
-            options["seed"] = self._seed
-
-        return {
-            "model": self._model,
-            "stream": False,
-            "keep_alive": self._keep_alive,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ],
-            "options": options,
-        }
+        return _chat_payload(
+            model=self._model,
+            keep_alive=self._keep_alive,
+            temperature=self._temperature,
+            seed=self._seed,
+            system_prompt=system_prompt,
+            user_message=user_message,
+        )
+
+
+class AsyncOllamaRenderer:
+    """Async renderer that calls the Ollama ``/api/chat`` endpoint via ``httpx``.
+
+    Owns one ``httpx.AsyncClient`` (keep-alive pool of ``pool_size``
+    connections), created on first use inside the running event loop and
+    recreated if a different loop uses the renderer later.  Unlike
+    :class:`OllamaRenderer` it holds no deterministic state: the seed is
+    a ``render`` argument, so concurrent translations cannot see each
+    other's seeds.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_endpoint: str,
+        model: str,
+        timeout_seconds: float,
+        temperature: float = _DEFAULT_TEMPERATURE,
+        keep_alive: str = "5m",
+        connect_timeout_seconds: float = _DEFAULT_CONNECT_TIMEOUT,
+        pool_size: int = _DEFAULT_POOL_SIZE,
+        guard: EndpointGuard | None = None,
+    ) -> None:
+        """Initialise the renderer (arguments as for :class:`OllamaRenderer`)."""
+        self._api_endpoint = api_endpoint
+        self._model = model
+        self._timeout = timeout_seconds
+        self._connect_timeout = min(connect_timeout_seconds, timeout_seconds)
+        self._keep_alive = keep_alive
+        self._temperature = temperature
+        self._pool_size = max(1, pool_size)
+        self._guard = guard
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._counters = _RequestCounters()
+        self._connections_opened = 0
+        self._connections_reused = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the client bound to the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self._timeout, connect=self._connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self._pool_size,
+                    max_keepalive_connections=self._pool_size,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client and its pooled connections."""
+        client, self._client = self._client, None
+        self._client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    def stats(self) -> RendererStats:
+        """Return request latency and connection-reuse counters."""
+        return self._counters.snapshot(
+            opened=self._connections_opened, reused=self._connections_reused
+        )
+
+    async def render(
+        self, system_prompt: str, user_message: str, *, seed: int | None = None
+    ) -> str | None:
+        """Call Ollama and return the raw response content.
+
+        Same contract as :meth:`OllamaRenderer.render`: ``None`` on any
+        network-level failure or when the endpoint guard refuses the call.
+        Cancellation (e.g. the requesting client disconnected) propagates
+        and aborts the HTTP call (or gives up its place in the queue).
+
+        Args:
+            system_prompt: The fully-rendered system prompt.
+            user_message:  The original OOC message.
+            seed:          Deterministic seed; when given, temperature is
+                           clamped to 0.0 for this call only.
+
+        Returns:
+            Raw LLM output string on success, ``None`` on failure.
+        """
+        if self._guard is not None and not await self._guard.acquire_async():
+            return None
+        payload = _chat_payload(
+            model=self._model,
+            keep_alive=self._keep_alive,
+            temperature=0.0 if seed is not None else self._temperature,
+            seed=seed,
+            system_prompt=system_prompt,
+            user_message=user_message,
+        )
+        opened = responded = False
+        healthy: bool | None = None
+
+        async def trace(event_name: str, _info: dict) -> None:
+            nonlocal opened
+            if event_name == "connection.connect_tcp.complete":
+                opened = True
+
+        started = time.perf_counter()
+        try:
+            response = await self._get_client().post(
+                self._api_endpoint, json=payload, extensions={"trace": trace}
+            )
+            responded = healthy = True
+            response.raise_for_status()
+            data = response.json()
+            self._counters.record(started, failed=False)
+            return data.get("message", {}).get("content", "").strip() or None
+
+        except httpx.TimeoutException:
+            healthy = False
+            self._counters.record(started, failed=True)
+            logger.warning(
+                "AsyncOllamaRenderer: request timed out after %.1fs (endpoint=%s)",
+                self._timeout,
+                self._api_endpoint,
+            )
+            return None
+        except httpx.ConnectError:
+            healthy = False
+            self._counters.record(started, failed=True)
+            logger.warning(
+                "AsyncOllamaRenderer: cannot connect to Ollama at %s",
+                self._api_endpoint,
+            )
+            return None
+        except httpx.HTTPError as exc:
+            self._counters.record(started, failed=True)
+            logger.error("AsyncOllamaRenderer: request failed: %s", exc)
+            return None
+        finally:
+            if self._guard is not None:
+                self._guard.release(healthy=healthy)
+            # Runs on the event loop, so plain increments are safe.
+            if opened:
+                self._connections_opened += 1
+            elif responded:
+                self._connections_reused += 1
@@ -44,6 +44,7 @@ Events record:
 - ``axis_snapshot``:   ``{axis_name: {score, label}}`` for every axis
                        present in the character's profile at translation
                        time
+- ``cached``:          ``true`` when the output came from the result cache
 
 A ledger write failure is **never fatal** — the game interaction
 completes and only the audit record is lost.  See
@@ -70,6 +71,15 @@ When ``ipc_hash`` is ``None`` (solo-room interactions, axis resolution
 disabled, or axis engine failure), deterministic mode is silently skipped
 and the renderer uses the configured temperature.
 
+Result cache
+------------
+Deterministic translations (seeded via ``ipc_hash``) are looked up in a
+per-world :class:`~mud_server.translation.cache.TranslationCache` during
+``prepare_translation``.  A hit skips the Ollama call; the cached raw
+output is still validated and the ledger event is emitted as usual, with
+``data.cached = true``.  Raw output is stored only after it passed
+validation.
+
 Pre-axis-engine era
 -------------------
 Events emitted before the axis engine was integrated carry
@@ -86,9 +96,11 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from mud_server.ledger import append_event as _ledger_append
+from mud_server.translation.cache import TranslationCache, TranslationCacheStats, cache_key
 from mud_server.translation.config import TranslationLayerConfig
+from mud_server.translation.guard import EndpointGuard, EndpointGuardStats, get_endpoint_guard
 from mud_server.translation.profile_builder import CharacterProfileBuilder
-from mud_server.translation.renderer import OllamaRenderer
+from mud_server.translation.renderer import AsyncOllamaRenderer, OllamaRenderer, RendererStats
 from mud_server.translation.validator import OutputValidator
 
 logger = logging.getLogger(__name__)
@@ -126,6 +138,55 @@ class LabTranslateResult:
     prompt_template: str
 
 
+@dataclass(frozen=True)
+class PreparedTranslation:
+    """A translation that has everything it needs except the Ollama reply.
+
+    Produced by ``OOCToICTranslationService.prepare_translation`` (database
+    work) and consumed by ``render_async`` and ``finish_translation``, so
+    the async chat path can await only the network call on the event loop.
+
+    Attributes:
+        character_name: Character whose voice is translated.
+        ooc_message:    Raw OOC input.
+        channel:        Chat channel (``"say"``, ``"yell"``, ``"whisper"``).
+        ipc_hash:       Axis-engine IPC hash, or ``None``.
+        profile:        Character profile with ``channel`` and
+                        ``profile_summary`` injected.
+        system_prompt:  Fully-rendered system prompt.
+        seed:           Deterministic seed, or ``None`` when not deterministic.
+        cache_key:      Result-cache key, or ``None`` when not cacheable.
+        cached_output:  Raw output found in the result cache; when set no
+                        Ollama call is made.
+    """
+
+    character_name: str
+    ooc_message: str
+    channel: str
+    ipc_hash: str | None
+    profile: dict
+    system_prompt: str
+    seed: int | None
+    cache_key: str | None = None
+    cached_output: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationStats:
+    """Renderer, result-cache and endpoint-guard counters for one world's service.
+
+    Attributes:
+        renderer: Ollama request, latency and connection counters.
+        cache:    Result-cache counters, or ``None`` when caching is off.
+        guard:    Breaker state and queue depth of the world's Ollama
+                  endpoint (shared with other worlds on the same URL).
+    """
+
+    renderer: RendererStats
+    cache: TranslationCacheStats | None
+    guard: EndpointGuardStats
+
+
 # ── Module-level helpers ──────────────────────────────────────────────────────
 
 
@@ -291,6 +352,7 @@ def _emit_translation_event(
     ic_output: str | None,
     profile: dict,
     ipc_hash: str | None,
+    cached: bool = False,
 ) -> None:
     """Emit a ``chat.translation`` event to the world ledger.
 
@@ -341,6 +403,8 @@ def _emit_translation_event(
         ipc_hash:       IPC hash produced by the axis engine, or ``None``
                         when the axis engine did not run (solo-room
                         interaction, engine disabled, or engine failure).
+        cached:         ``True`` when the output came from the result cache
+                        instead of a fresh Ollama call.
     """
     # Mark pre-axis-engine events explicitly so they are distinguishable
     # from post-integration events during replay or ledger analysis.
@@ -368,6 +432,7 @@ def _emit_translation_event(
                 "ooc_input": ooc_message,
                 "ic_output": ic_output,
                 "axis_snapshot": axis_snapshot,
+                "cached": cached,
             },
         )
     except Exception:
@@ -394,6 +459,12 @@ class OOCToICTranslationService:
         _config:          Frozen translation config from ``world.json``.
         _profile_builder: Builds the character context dict.
         _renderer:        Calls the Ollama API.
+        _guard:           Concurrency limit and circuit breaker shared by all
+                          renderers (any world) calling the same endpoint.
+        _async_renderer:  ``httpx`` renderer used by ``render_async``;
+                          created on first use.
+        _cache:           Result cache for deterministic translations, or
+                          ``None`` when ``cache_size`` is 0.
         _validator:       Validates/cleans the raw LLM output.
         _prompt_template: System prompt template text, loaded once at init.
     """
@@ -427,17 +498,30 @@ class OOCToICTranslationService:
             world_id=world_id,
             active_axes=config.active_axes,
         )
+        self._guard: EndpointGuard = get_endpoint_guard(config.api_endpoint)
         self._renderer = OllamaRenderer(
             api_endpoint=config.api_endpoint,
             model=config.model,
             timeout_seconds=config.timeout_seconds,
             keep_alive=config.keep_alive,
+            connect_timeout_seconds=config.connect_timeout_seconds,
+            pool_size=config.pool_size,
+            guard=self._guard,
         )
         self._validator = OutputValidator(
             strict_mode=config.strict_mode,
             max_output_chars=config.max_output_chars,
         )
         self._prompt_template: str = self._load_prompt_template(world_root)
+        # Created on first render_async (async translation mode only).
+        self._async_renderer: AsyncOllamaRenderer | None = None
+        self._cache: TranslationCache | None = None
+        if config.cache_size > 0:
+            self._cache = TranslationCache(
+                max_entries=config.cache_size,
+                ttl_seconds=config.cache_ttl_seconds,
+                path=config.cache_path,
+            )
 
         logger.info(
             "OOCToICTranslationService initialised for world %r " "(model=%s, deterministic=%s)",
@@ -499,6 +583,36 @@ class OOCToICTranslationService:
         Returns:
             IC dialogue string on success, ``None`` on any failure.
         """
+        prepared = self.prepare_translation(
+            character_name, ooc_message, channel=channel, ipc_hash=ipc_hash
+        )
+        if prepared is None:
+            return None
+
+        # ── Step 3: Deterministic mode ─────────────────────────────────────────
+        # When the axis engine provides an ipc_hash and config.deterministic is
+        # True, render() arms the renderer with the seed prepare_translation()
+        # derived from the hash, so the same game state always produces the
+        # same IC output and translation events are replayable.
+        # ── Step 5: Call Ollama ────────────────────────────────────────────────
+        ic_raw = self.render(prepared)
+        return self.finish_translation(prepared, ic_raw)
+
+    def prepare_translation(
+        self,
+        character_name: str,
+        ooc_message: str,
+        *,
+        channel: str = "say",
+        ipc_hash: str | None = None,
+    ) -> PreparedTranslation | None:
+        """Run steps 1–4 of :meth:`translate`: everything before the Ollama call.
+
+        Reads the character profile from the database, so call it from an
+        engine worker thread.  Returns ``None`` when translation is disabled
+        or the profile cannot be resolved (no ledger event, as in
+        :meth:`translate`).
+        """
         if not self._config.enabled:
             return None
 
@@ -526,19 +640,11 @@ class OOCToICTranslationService:
         # making the model blind to all character axis data.
         profile["profile_summary"] = _build_profile_summary(profile)
 
-        # ── Step 3: Deterministic mode ─────────────────────────────────────────
-        # When the axis engine provides an ipc_hash and config.deterministic is
-        # True, arm the renderer with a seed derived from the first 16 hex
-        # characters of the hash.  This ensures that the same game state always
-        # produces the same IC output, making translation events replayable.
+        # ── Step 3: Deterministic seed ─────────────────────────────────────────
+        # Derived here; applied by whichever renderer makes the call.
+        seed = None
         if self._config.deterministic and ipc_hash is not None:
-            seed_int = int(ipc_hash[:16], 16)
-            self._renderer.set_deterministic(seed_int)
-            logger.debug(
-                "OOCToICTranslationService: deterministic mode armed " "(ipc_hash=%s..., seed=%d)",
-                ipc_hash[:8],
-                seed_int,
-            )
+            seed = int(ipc_hash[:16], 16)
 
         # ── Step 4: Render system prompt ──────────────────────────────────────
         # Substitute all {{key}} placeholders in the loaded template with
@@ -547,24 +653,87 @@ class OOCToICTranslationService:
         # pre-formatted profile_summary block.
         system_prompt = self._render_system_prompt(profile, ooc_message)
 
-        # ── Step 5: Call Ollama ────────────────────────────────────────────────
-        ic_raw = self._renderer.render(system_prompt, ooc_message)
+        # ── Result cache (deterministic translations only) ─────────────────────
+        key = cached_output = None
+        if self._cache is not None and seed is not None:
+            key = cache_key(
+                system_prompt=system_prompt,
+                ooc_message=ooc_message,
+                model=self._config.model,
+                temperature=0.0,  # seeded renders are clamped to 0.0
+                seed=seed,
+            )
+            cached_output = self._cache.get(key)
+        return PreparedTranslation(
+            character_name=character_name,
+            ooc_message=ooc_message,
+            channel=channel,
+            ipc_hash=ipc_hash,
+            profile=profile,
+            system_prompt=system_prompt,
+            seed=seed,
+            cache_key=key,
+            cached_output=cached_output,
+        )
+
+    def render(self, prepared: PreparedTranslation) -> str | None:
+        """Run step 5 of :meth:`translate` with the blocking renderer.
+
+        Arms deterministic mode first when the prepared translation carries
+        a seed.  Used by :meth:`translate` and by the deferred-translation
+        worker, which calls :meth:`finish_translation` afterwards.  A
+        result-cache hit is returned without calling Ollama.
+        """
+        if prepared.cached_output is not None:
+            return prepared.cached_output
+        if prepared.seed is not None:
+            self._renderer.set_deterministic(prepared.seed)
+            logger.debug(
+                "OOCToICTranslationService: deterministic mode armed " "(ipc_hash=%s..., seed=%d)",
+                prepared.ipc_hash[:8] if prepared.ipc_hash else "",
+                prepared.seed,
+            )
+        return self._renderer.render(prepared.system_prompt, prepared.ooc_message)
+
+    async def render_async(self, prepared: PreparedTranslation) -> str | None:
+        """Run step 5 of :meth:`translate` on the event loop.
+
+        Uses this world's :class:`AsyncOllamaRenderer` (one ``AsyncClient``
+        per world).  Returns the raw output for :meth:`finish_translation`;
+        cancelling the awaiting task aborts the HTTP call.  A result-cache
+        hit is returned without calling Ollama.
+        """
+        if prepared.cached_output is not None:
+            return prepared.cached_output
+        if self._async_renderer is None:
+            self._async_renderer = AsyncOllamaRenderer(
+                api_endpoint=self._config.api_endpoint,
+                model=self._config.model,
+                timeout_seconds=self._config.timeout_seconds,
+                keep_alive=self._config.keep_alive,
+                connect_timeout_seconds=self._config.connect_timeout_seconds,
+                pool_size=self._config.pool_size,
+                guard=self._guard,
+            )
+        return await self._async_renderer.render(
+            prepared.system_prompt, prepared.ooc_message, seed=prepared.seed
+        )
+
+    def finish_translation(self, prepared: PreparedTranslation, ic_raw: str | None) -> str | None:
+        """Run steps 6–7 of :meth:`translate` on the renderer's raw output.
+
+        Validates ``ic_raw`` (``None`` meaning the Ollama call failed) and
+        emits the ``chat.translation`` ledger event.
+
+        Returns:
+            IC dialogue string on success, ``None`` on any fallback.
+        """
         if ic_raw is None:
             # Renderer already logged the specific failure reason.
             # Emit a ledger event recording the api_error fallback so the
             # audit trail includes every translation attempt, not just
             # successes.  The emit is fire-and-forget and never raises.
-            _emit_translation_event(
-                _ledger_append,
-                world_id=self._world_id,
-                status="fallback.api_error",
-                character_name=character_name,
-                channel=channel,
-                ooc_message=ooc_message,
-                ic_output=None,
-                profile=profile,
-                ipc_hash=ipc_hash,
-            )
+            self._emit(prepared, status="fallback.api_error", ic_output=None)
             return None
 
         # ── Step 6: Validate output ───────────────────────────────────────────
@@ -575,17 +744,7 @@ class OOCToICTranslationService:
             # returning.  ic_output is None — the failed raw text is
             # intentionally not stored to avoid persisting partial or unsafe
             # model output.
-            _emit_translation_event(
-                _ledger_append,
-                world_id=self._world_id,
-                status="fallback.validation_failed",
-                character_name=character_name,
-                channel=channel,
-                ooc_message=ooc_message,
-                ic_output=None,
-                profile=profile,
-                ipc_hash=ipc_hash,
-            )
+            self._emit(prepared, status="fallback.validation_failed", ic_output=None)
             return None
 
         # ── Step 7: Emit success event ────────────────────────────────────────
@@ -593,18 +752,32 @@ class OOCToICTranslationService:
         # player said (ooc_input), what the character said (ic_output), the
         # character's mechanical state at translation time (axis_snapshot),
         # and the ipc_hash linking this event to the preceding axis resolution.
+        self._emit(prepared, status="success", ic_output=ic_text)
+        if self._cache is not None and prepared.cache_key and prepared.cached_output is None:
+            self._cache.put(prepared.cache_key, ic_raw)
+        return ic_text
+
+    def _emit(self, prepared: PreparedTranslation, *, status: str, ic_output: str | None) -> None:
+        """Emit the ``chat.translation`` ledger event for one prepared translation."""
         _emit_translation_event(
             _ledger_append,
             world_id=self._world_id,
-            status="success",
-            character_name=character_name,
-            channel=channel,
-            ooc_message=ooc_message,
-            ic_output=ic_text,
-            profile=profile,
-            ipc_hash=ipc_hash,
+            status=status,
+            character_name=prepared.character_name,
+            channel=prepared.channel,
+            ooc_message=prepared.ooc_message,
+            ic_output=ic_output,
+            profile=prepared.profile,
+            ipc_hash=prepared.ipc_hash,
+            cached=prepared.cached_output is not None,
         )
-        return ic_text
+
+    async def aclose(self) -> None:
+        """Close the async renderer's client and the cache file, if any."""
+        if self._async_renderer is not None:
+            await self._async_renderer.aclose()
+        if self._cache is not None:
+            self._cache.close()
 
     # ── Public properties ─────────────────────────────────────────────────────
 
@@ -613,6 +786,23 @@ class OOCToICTranslationService:
         """Return the world's frozen translation layer configuration."""
         return self._config
 
+    def renderer_stats(self) -> RendererStats:
+        """Return latency and connection-reuse counters of the game renderer.
+
+        Reports the async renderer once ``render_async`` has been used.
+        """
+        if self._async_renderer is not None:
+            return self._async_renderer.stats()
+        return self._renderer.stats()
+
+    def stats(self) -> TranslationStats:
+        """Return renderer, result-cache and endpoint-guard counters for this world."""
+        return TranslationStats(
+            renderer=self.renderer_stats(),
+            cache=self._cache.stats() if self._cache is not None else None,
+            guard=self._guard.stats(),
+        )
+
     # ── Lab API ───────────────────────────────────────────────────────────────
 
     def translate_with_axes(
@@ -642,7 +832,8 @@ class OOCToICTranslationService:
         exactly which axes were applied.
 
         A fresh ``OllamaRenderer`` is created for each call to avoid
-        polluting the persistent game renderer's deterministic-mode state.
+        polluting the persistent game renderer's deterministic-mode state;
+        it shares the game renderer's pooled connections.
 
         Args:
             axes:           Dict of ``{axis_name: {"label": str, "score": float}}``.
@@ -702,6 +893,9 @@ class OOCToICTranslationService:
             timeout_seconds=self._config.timeout_seconds,
             temperature=temperature,
             keep_alive=self._config.keep_alive,
+            connect_timeout_seconds=self._config.connect_timeout_seconds,
+            session=self._renderer.session,
+            guard=self._guard,
         )
         if seed is not None:
             renderer.set_deterministic(seed)
@@ -82,6 +82,40 @@ async function getStatus(sessionId) {
   });
 }
 
+/**
+ * Build the query string for the incremental chat endpoint.
+ *
+ * @param {{sinceId?: number|null, waitSeconds?: number, limit?: number}} params
+ * @returns {URLSearchParams}
+ */
+function buildChatSinceParams({ sinceId = null, waitSeconds = 0, limit = 50 } = {}) {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (sinceId !== null && sinceId !== undefined) {
+    params.set('since_id', String(sinceId));
+    if (waitSeconds > 0) {
+      params.set('wait', String(waitSeconds));
+    }
+  }
+  return params;
+}
+
+/**
+ * Fetch room chat newer than `sinceId`, long-polling up to `waitSeconds`.
+ *
+ * Without `sinceId` the newest page is returned; pass the response `cursor`
+ * as the next `sinceId`.
+ *
+ * @param {{sessionId: string, sinceId?: number|null, waitSeconds?: number, limit?: number}} params
+ * @returns {Promise<{messages: Array<{id: number, username: string, message: string, timestamp: string|null}>, cursor: number, room: string|null}>}
+ */
+async function getChatSince({ sessionId, ...options }) {
+  const params = buildChatSinceParams(options);
+  return apiCall(`/chat/${encodeURIComponent(sessionId)}/messages?${params.toString()}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+}
+
 /**
  * Build the character-list query string.
  *
@@ -154,7 +188,9 @@ async function createCharacter(sessionId, worldId) {
 export {
   apiCall,
   buildCharacterListParams,
+  buildChatSinceParams,
   createCharacter,
+  getChatSince,
   getErrorMessage,
   getStatus,
   listCharacters,
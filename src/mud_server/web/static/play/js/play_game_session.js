@@ -1,26 +1,43 @@
 /*
  * play_game_session.js
  *
- * In-world command submission and chat polling helpers for the play shell.
+ * In-world command submission and live room chat for the play shell.
+ *
+ * Chat and presence arrive over a WebSocket (`/ws/{sessionId}`). If the
+ * socket cannot be opened or drops, the shell falls back to long-polling
+ * `GET /chat/{sessionId}/messages` with the last message id it has seen.
  */
 
-import { apiCall, getErrorMessage } from './play_api.js';
+import { apiCall, getChatSince, getErrorMessage } from './play_api.js';
+
+/** Id of the newest chat message already shown, or null before seeding. */
+let _chatCursor = null;
+/** Bumped to stop any running long-poll loop. */
+let _pollGeneration = 0;
+/** @type {string[]} Chat lines shown from the socket since the cursor was set. */
+let _pushedChatLines = [];
+/** @type {WebSocket|null} */
+let _roomSocket = null;
 
-/** @type {ReturnType<typeof setInterval>|null} */
-let _chatPollInterval = null;
-/** @type {string[]} */
-let _prevChatLines = [];
+/** WebSocket close code meaning the session is no longer valid. */
+const CLOSE_SESSION_INVALID = 4401;
+/** Seconds the server may hold each long-poll request open. */
+const CHAT_WAIT_SECONDS = 25;
+/** Delay before retrying after a failed long-poll request. */
+const CHAT_RETRY_MS = 5000;
 
 /**
- * Stop the active chat polling loop if one is running.
+ * Stop live chat: close the room socket and any fallback polling loop.
  *
  * @returns {void}
  */
 function stopChatPolling() {
-  if (_chatPollInterval !== null) {
-    clearInterval(_chatPollInterval);
-    _chatPollInterval = null;
+  if (_roomSocket !== null) {
+    const socket = _roomSocket;
+    _roomSocket = null;
+    socket.close();
   }
+  _pollGeneration += 1;
 }
 
 /**
@@ -78,39 +95,172 @@ async function submitCommand(sessionId, command) {
 }
 
 /**
- * Poll GET /chat/{sessionId} and append any new messages to the output.
+ * Render one message from `GET /chat/{sessionId}/messages` as an output line.
+ *
+ * @param {{username: string, message: string}} message
+ * @returns {string}
+ */
+function formatChatMessage(message) {
+  return `${message.username}: ${message.message}`;
+}
+
+/**
+ * Drop lines the socket already displayed, consuming each pushed line once.
+ *
+ * @param {string[]} lines
+ * @param {string[]} pushed
+ * @returns {string[]}
+ */
+function withoutPushedLines(lines, pushed) {
+  const remaining = [...pushed];
+  return lines.filter((line) => {
+    const idx = remaining.indexOf(line);
+    if (idx === -1) {
+      return true;
+    }
+    remaining.splice(idx, 1);
+    return false;
+  });
+}
+
+/**
+ * Long-poll for new chat until `stopChatPolling` bumps the generation.
+ *
+ * The first batch is de-duplicated against lines the socket already showed,
+ * since the cursor does not advance while the socket is live.
  *
  * @param {string} sessionId
+ * @param {number} generation
  * @returns {Promise<void>}
  */
-async function pollChat(sessionId) {
+async function runChatLongPoll(sessionId, generation) {
+  while (generation === _pollGeneration) {
+    try {
+      const data = await getChatSince({
+        sessionId,
+        sinceId: _chatCursor,
+        waitSeconds: CHAT_WAIT_SECONDS,
+      });
+      if (generation !== _pollGeneration) {
+        return;
+      }
+      const lines = withoutPushedLines(
+        (data?.messages || []).map(formatChatMessage),
+        _pushedChatLines,
+      );
+      _pushedChatLines = [];
+      for (const line of lines) {
+        appendToOutput(line, 'output-chat');
+      }
+      if (typeof data?.cursor === 'number') {
+        _chatCursor = data.cursor;
+      }
+    } catch (err) {
+      if (generation !== _pollGeneration) {
+        return;
+      }
+      if (err?.status >= 400 && err.status < 500) {
+        appendToOutput('Your session has ended. Please log in again.', 'output-error');
+        return;
+      }
+      // Don't disrupt gameplay on transient failures; retry after a pause.
+      await new Promise((resolve) => setTimeout(resolve, CHAT_RETRY_MS));
+    }
+  }
+}
+
+/**
+ * Start the long-poll chat fallback, replacing any loop already running.
+ *
+ * @param {string} sessionId
+ * @returns {void}
+ */
+function startChatPolling(sessionId) {
+  _pollGeneration += 1;
+  void runChatLongPoll(sessionId, _pollGeneration);
+}
+
+/**
+ * Build the room socket URL for the current page origin.
+ *
+ * @param {string} sessionId
+ * @param {{protocol: string, host: string}} location
+ * @returns {string}
+ */
+function roomSocketUrl(sessionId, location) {
+  const scheme = location.protocol === 'https:' ? 'wss:' : 'ws:';
+  return `${scheme}//${location.host}/ws/${encodeURIComponent(sessionId)}`;
+}
+
+/**
+ * Turn one pushed room message into an output line, or null to ignore it.
+ *
+ * Chat lines use the same `username: message` shape as
+ * {@link formatChatMessage} so the fallback can de-duplicate against them.
+ *
+ * @param {any} payload
+ * @returns {{text: string, cssClass: string}|null}
+ */
+function formatRoomMessage(payload) {
+  if (payload?.type === 'chat' && payload.username && payload.message) {
+    return { text: `${payload.username}: ${payload.message}`, cssClass: 'output-chat' };
+  }
+  if (payload?.type === 'presence' && payload.message) {
+    return { text: payload.message, cssClass: 'output-text' };
+  }
+  return null;
+}
+
+/**
+ * Open the room socket; fall back to polling if it fails or drops.
+ *
+ * @param {string} sessionId
+ * @returns {void}
+ */
+function connectRoomSocket(sessionId) {
+  if (typeof WebSocket === 'undefined') {
+    startChatPolling(sessionId);
+    return;
+  }
+  let socket;
   try {
-    const data = await apiCall(`/chat/${sessionId}`, { method: 'GET' });
-    const chatStr = typeof data?.chat === 'string' ? data.chat : '';
-    if (!chatStr) {
+    socket = new WebSocket(roomSocketUrl(sessionId, window.location));
+  } catch (_err) {
+    startChatPolling(sessionId);
+    return;
+  }
+  _roomSocket = socket;
+
+  socket.addEventListener('message', (event) => {
+    let payload;
+    try {
+      payload = JSON.parse(event.data);
+    } catch (_err) {
       return;
     }
-    const lines = chatStr.split('\n').filter((line) => line.trim() && !line.startsWith('['));
-    if (lines.length === 0) {
-      _prevChatLines = [];
+    const line = formatRoomMessage(payload);
+    if (!line) {
       return;
     }
+    appendToOutput(line.text, line.cssClass);
+    if (line.cssClass === 'output-chat') {
+      // Keep the polling fallback's de-duplication baseline current.
+      _pushedChatLines = [..._pushedChatLines.slice(-49), line.text];
+    }
+  });
 
-    let newStart = 0;
-    for (let i = _prevChatLines.length - 1; i >= 0; i -= 1) {
-      const idx = lines.lastIndexOf(_prevChatLines[i]);
-      if (idx !== -1) {
-        newStart = idx + 1;
-        break;
-      }
+  socket.addEventListener('close', (event) => {
+    if (_roomSocket !== socket) {
+      // Closed deliberately by stopChatPolling().
+      return;
     }
-    for (const msg of lines.slice(newStart)) {
-      appendToOutput(msg, 'output-chat');
+    _roomSocket = null;
+    if (event.code === CLOSE_SESSION_INVALID) {
+      appendToOutput('Your session has ended. Please log in again.', 'output-error');
+      return;
     }
-    _prevChatLines = lines;
-  } catch (_err) {
-    // Don't disrupt gameplay on transient chat poll failures.
-  }
+    startChatPolling(sessionId);
+  });
 }
 
 /**
@@ -140,7 +290,7 @@ function bindCommandInput(sessionId) {
 
 /**
  * Start an in-world game session: clear the output, fire an initial look,
- * seed the chat baseline, and begin polling for new messages.
+ * seed the chat cursor, and open the live room socket.
  *
  * @param {string} _worldId
  * @param {string} sessionId
@@ -151,22 +301,28 @@ async function startGameSession(_worldId, sessionId) {
   if (output) {
     output.innerHTML = '';
   }
-  _prevChatLines = [];
+  _chatCursor = null;
+  _pushedChatLines = [];
 
   bindCommandInput(sessionId);
   await submitCommand(sessionId, 'look');
 
   try {
-    const data = await apiCall(`/chat/${sessionId}`, { method: 'GET' });
-    const chatStr = typeof data?.chat === 'string' ? data.chat : '';
-    const lines = chatStr.split('\n').filter((line) => line.trim() && !line.startsWith('['));
-    _prevChatLines = lines;
+    const data = await getChatSince({ sessionId, limit: 1 });
+    _chatCursor = data.cursor;
   } catch (_err) {
-    // Polling will recover on the first tick.
+    // The socket (or polling fallback) will pick up new messages.
   }
 
   stopChatPolling();
-  _chatPollInterval = setInterval(() => pollChat(sessionId), 5000);
+  connectRoomSocket(sessionId);
 }
 
-export { startGameSession, stopChatPolling };
+export {
+  formatChatMessage,
+  formatRoomMessage,
+  roomSocketUrl,
+  startGameSession,
+  stopChatPolling,
+  withoutPushedLines,
+};
@@ -4,6 +4,8 @@ import test from 'node:test';
 import {
   apiCall,
   buildCharacterListParams,
+  buildChatSinceParams,
+  getChatSince,
   getErrorMessage,
 } from '../../src/mud_server/web/static/play/js/play_api.js';
 
@@ -14,6 +16,38 @@ test('buildCharacterListParams includes legacy-default exclusion flag', () => {
   assert.equal(params.get('exclude_legacy_defaults'), 'true');
 });
 
+test('buildChatSinceParams only long-polls when a cursor is given', () => {
+  const first = buildChatSinceParams({ waitSeconds: 25 });
+  assert.equal(first.get('since_id'), null);
+  assert.equal(first.get('wait'), null);
+  assert.equal(first.get('limit'), '50');
+
+  const next = buildChatSinceParams({ sinceId: 0, waitSeconds: 25, limit: 10 });
+  assert.equal(next.get('since_id'), '0');
+  assert.equal(next.get('wait'), '25');
+  assert.equal(next.get('limit'), '10');
+});
+
+test('getChatSince requests the cursor endpoint for the session', async () => {
+  const originalFetch = globalThis.fetch;
+  let requested = '';
+  try {
+    globalThis.fetch = async (url) => {
+      requested = url;
+      return new Response(JSON.stringify({ messages: [], cursor: 7, room: 'spawn' }), {
+        status: 200,
+        headers: { 'content-type': 'application/json' },
+      });
+    };
+
+    const data = await getChatSince({ sessionId: 'abc', sinceId: 7, waitSeconds: 5 });
+    assert.equal(data.cursor, 7);
+    assert.equal(requested, '/chat/abc/messages?limit=50&since_id=7&wait=5');
+  } finally {
+    globalThis.fetch = originalFetch;
+  }
+});
+
 test('getErrorMessage normalizes unknown values', () => {
   assert.equal(getErrorMessage(new Error('nope')), 'nope');
   assert.equal(getErrorMessage('oops'), 'Unexpected error.');
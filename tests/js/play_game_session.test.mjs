@@ -0,0 +1,50 @@
+import assert from 'node:assert/strict';
+import test from 'node:test';
+
+import {
+  formatChatMessage,
+  formatRoomMessage,
+  roomSocketUrl,
+  withoutPushedLines,
+} from '../../src/mud_server/web/static/play/js/play_game_session.js';
+
+test('roomSocketUrl follows the page scheme and host', () => {
+  assert.equal(
+    roomSocketUrl('abc', { protocol: 'http:', host: 'localhost:8000' }),
+    'ws://localhost:8000/ws/abc'
+  );
+  assert.equal(
+    roomSocketUrl('a/b', { protocol: 'https:', host: 'mud.example' }),
+    'wss://mud.example/ws/a%2Fb'
+  );
+});
+
+test('formatRoomMessage renders chat like cursor-endpoint lines', () => {
+  assert.deepEqual(
+    formatRoomMessage({ type: 'chat', channel: 'yell', username: 'Ada', message: '[YELL] hi' }),
+    { text: 'Ada: [YELL] hi', cssClass: 'output-chat' }
+  );
+});
+
+test('formatRoomMessage renders presence notices and ignores control frames', () => {
+  assert.deepEqual(
+    formatRoomMessage({ type: 'presence', action: 'entered', message: 'Ada arrives.' }),
+    { text: 'Ada arrives.', cssClass: 'output-text' }
+  );
+  assert.equal(formatRoomMessage({ type: 'ping' }), null);
+  assert.equal(formatRoomMessage({ type: 'room', room: 'spawn' }), null);
+  assert.equal(formatRoomMessage(null), null);
+});
+
+test('formatChatMessage matches pushed chat lines', () => {
+  const pushed = formatRoomMessage({ type: 'chat', username: 'Ada', message: 'hi' });
+  assert.equal(formatChatMessage({ id: 3, username: 'Ada', message: 'hi' }), pushed.text);
+});
+
+test('withoutPushedLines skips each already-shown line once', () => {
+  assert.deepEqual(
+    withoutPushedLines(['Ada: hi', 'Bob: yo', 'Ada: hi', 'Cy: new'], ['Ada: hi', 'Bob: yo']),
+    ['Ada: hi', 'Cy: new']
+  );
+  assert.deepEqual(withoutPushedLines(['Ada: hi'], []), ['Ada: hi']);
+});
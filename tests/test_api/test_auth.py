@@ -6,6 +6,7 @@ Tests cover:
 - Expiration enforcement and sliding expiry updates
 - Permission-based validation
 - Session lifecycle helpers
+- Validated-session cache hits, invalidation and expiry
 """
 
 from datetime import UTC, datetime, timedelta
@@ -16,7 +17,9 @@ from fastapi import HTTPException
 
 from mud_server.api.auth import (
     clear_all_sessions,
+    clear_session_cache,
     get_active_session_count,
+    get_session_cache_stats,
     get_username_and_role_from_session,
     get_username_from_session,
     remove_session,
@@ -87,8 +90,10 @@ def test_get_username_and_role_from_session_nonexistent(test_db, db_with_users):
 @pytest.mark.auth
 def test_get_username_and_role_from_session_missing_user():
     with (
-        patch("mud_server.api.auth._get_valid_session", return_value={"user_id": 999}),
-        patch.object(database, "get_username_by_id", return_value=None),
+        patch(
+            "mud_server.api.auth._get_valid_session",
+            return_value={"user_id": 999, "username": None, "role": None},
+        ),
     ):
         assert get_username_and_role_from_session("session") is None
 
@@ -97,9 +102,10 @@ def test_get_username_and_role_from_session_missing_user():
 @pytest.mark.auth
 def test_get_username_and_role_from_session_missing_role():
     with (
-        patch("mud_server.api.auth._get_valid_session", return_value={"user_id": 123}),
-        patch.object(database, "get_username_by_id", return_value="testplayer"),
-        patch.object(database, "get_user_role", return_value=None),
+        patch(
+            "mud_server.api.auth._get_valid_session",
+            return_value={"user_id": 123, "username": "testplayer", "role": None},
+        ),
     ):
         assert get_username_and_role_from_session("session") is None
 
@@ -267,8 +273,10 @@ def test_validate_session_rejects_missing_role(test_db):
 @pytest.mark.auth
 def test_validate_session_rejects_missing_user():
     with (
-        patch("mud_server.api.auth._get_valid_session", return_value={"user_id": 999}),
-        patch.object(database, "get_username_by_id", return_value=None),
+        patch(
+            "mud_server.api.auth._get_valid_session",
+            return_value={"user_id": 999, "username": None, "role": None},
+        ),
     ):
         with pytest.raises(HTTPException) as exc_info:
             validate_session("session")
@@ -280,9 +288,10 @@ def test_validate_session_rejects_missing_user():
 @pytest.mark.auth
 def test_validate_session_rejects_missing_role_lookup():
     with (
-        patch("mud_server.api.auth._get_valid_session", return_value={"user_id": 123}),
-        patch.object(database, "get_username_by_id", return_value="testplayer"),
-        patch.object(database, "get_user_role", return_value=None),
+        patch(
+            "mud_server.api.auth._get_valid_session",
+            return_value={"user_id": 123, "username": "testplayer", "role": None},
+        ),
     ):
         with pytest.raises(HTTPException) as exc_info:
             validate_session("session")
@@ -296,6 +305,7 @@ def test_validate_session_maps_database_error_to_500():
     """Session validation should map repository failures to a deterministic 500."""
     with (
         patch("mud_server.api.auth._get_valid_session", return_value={"user_id": 123}),
+        patch.object(database, "record_session_activity", return_value=False),
         patch.object(
             database,
             "update_session_activity",
@@ -362,8 +372,11 @@ def test_validate_session_for_game_missing_character_row(test_db, db_with_users)
     )
 
     # DB invariants now prevent dangling character_id references. Simulate the
-    # lookup failure path by forcing name resolution to return None.
-    with patch.object(database, "get_character_name_by_id", return_value=None):
+    # lookup failure path by blanking the joined character name.
+    context = database.get_session_context(session_id)
+    assert context is not None
+    context["character_name"] = None
+    with patch.object(database, "get_session_context", return_value=context):
         with pytest.raises(HTTPException) as exc_info:
             validate_session_for_game(session_id)
 
@@ -404,7 +417,10 @@ def test_validate_session_for_game_missing_role(test_db, temp_db_path, db_with_u
         session_id = "missing-role-session"
         database.create_session("testplayer", session_id)
 
-        with patch.object(database, "get_user_role", return_value=None):
+        context = database.get_session_context(session_id)
+        assert context is not None
+        context["role"] = None
+        with patch.object(database, "get_session_context", return_value=context):
             with pytest.raises(HTTPException) as exc_info:
                 validate_session_for_game(session_id)
 
@@ -415,20 +431,11 @@ def test_validate_session_for_game_missing_role(test_db, temp_db_path, db_with_u
 @pytest.mark.auth
 def test_validate_session_for_game_maps_database_error_to_500():
     """Gameplay session validation should map repository failures to 500."""
-    with (
-        patch(
-            "mud_server.api.auth._get_valid_session",
-            return_value={"user_id": 123, "character_id": 1, "world_id": "pipeworks_web"},
-        ),
-        patch.object(database, "get_username_by_id", return_value="testplayer"),
-        patch.object(database, "get_user_role", return_value="player"),
-        patch.object(database, "get_character_name_by_id", return_value="testplayer_char"),
-        patch.object(
-            database,
-            "get_character_by_id",
-            side_effect=DatabaseReadError(
-                context=DatabaseOperationContext(operation="characters.get_character_by_id")
-            ),
+    with patch.object(
+        database,
+        "get_session_context",
+        side_effect=DatabaseReadError(
+            context=DatabaseOperationContext(operation="sessions.get_session_context")
         ),
     ):
         with pytest.raises(HTTPException) as exc_info:
@@ -547,3 +554,173 @@ def test_validate_session_for_game_sets_world_id(test_db, db_with_users):
     session = database.get_session_by_id(session_id)
     assert session is not None
     assert session["world_id"] == world_id
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_validate_session_for_game_uses_single_joined_lookup(test_db, db_with_users):
+    """Gameplay validation should not fall back to per-entity lookups."""
+    session_id = "joined-lookup-session"
+    database.create_session("testplayer", session_id)
+    player_character = database.get_character_by_name("testplayer_char")
+    assert player_character is not None
+    database.set_session_character(
+        session_id, int(player_character["id"]), world_id=database.DEFAULT_WORLD_ID
+    )
+
+    with (
+        patch.object(database, "get_session_by_id", side_effect=AssertionError),
+        patch.object(database, "get_username_by_id", side_effect=AssertionError),
+        patch.object(database, "get_user_role", side_effect=AssertionError),
+        patch.object(database, "get_character_name_by_id", side_effect=AssertionError),
+        patch.object(database, "get_character_by_id", side_effect=AssertionError),
+    ):
+        result = validate_session_for_game(session_id)
+
+    assert result[1:3] == ("testplayer", "player")
+    assert result[4:] == ("testplayer_char", database.DEFAULT_WORLD_ID)
+
+
+# =========================================================================
+# VALIDATED-SESSION CACHE TESTS
+# =========================================================================
+
+
+@pytest.fixture
+def session_cache():
+    """Start each cache test with an empty cache and restore cache config."""
+    original_ttl = config.session.cache_ttl_seconds
+    original_max = config.session.cache_max_entries
+    clear_session_cache()
+
+    yield
+
+    config.session.cache_ttl_seconds = original_ttl
+    config.session.cache_max_entries = original_max
+    clear_session_cache()
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_serves_repeat_validation(test_db, db_with_users, session_cache):
+    """A second validation should be answered without the joined lookup."""
+    session_id = "cached-session"
+    database.create_session("testplayer", session_id)
+
+    validate_session(session_id)
+    with patch.object(database, "get_session_context", side_effect=AssertionError):
+        _user_id, username, role = validate_session(session_id)
+
+    assert (username, role) == ("testplayer", "player")
+    stats = get_session_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_invalidated_by_logout(test_db, db_with_users, session_cache):
+    session_id = "logout-session"
+    database.create_session("testplayer", session_id)
+    validate_session(session_id)
+
+    assert remove_session(session_id) is True
+
+    with pytest.raises(HTTPException) as exc_info:
+        validate_session(session_id)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_invalidated_by_role_change(test_db, db_with_users, session_cache):
+    session_id = "role-change-session"
+    database.create_session("testplayer", session_id)
+    assert validate_session(session_id)[2] == "player"
+
+    database.set_user_role("testplayer", "admin")
+
+    assert validate_session(session_id)[2] == "admin"
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_invalidated_by_character_selection(test_db, db_with_users, session_cache):
+    session_id = "select-session"
+    database.create_session("testplayer", session_id)
+    validate_session(session_id)
+
+    player_character = database.get_character_by_name("testplayer_char")
+    assert player_character is not None
+    database.set_session_character(
+        session_id, int(player_character["id"]), world_id=database.DEFAULT_WORLD_ID
+    )
+
+    result = validate_session_for_game(session_id)
+    assert result[4] == "testplayer_char"
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_invalidated_by_user_session_removal(test_db, db_with_users, session_cache):
+    session_id = "kicked-session"
+    database.create_session("testplayer", session_id)
+    user_id = validate_session(session_id)[0]
+
+    database.remove_sessions_for_user(user_id)
+
+    with pytest.raises(HTTPException):
+        validate_session(session_id)
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_rechecks_expiry(test_db, db_with_users, session_cache):
+    """A cached record past its expiry must be re-read and rejected."""
+    session_id = "cached-expired-session"
+    database.create_session("testplayer", session_id)
+    validate_session(session_id)
+    # Write out the buffered touch so its sliding expiry is not overlaid on the re-read.
+    database.flush_session_activity()
+
+    conn = database.get_connection()
+    expired_ts = (datetime.now(UTC) - timedelta(minutes=10)).strftime("%Y-%m-%d %H:%M:%S")
+    conn.execute(
+        "UPDATE sessions SET expires_at = ? WHERE session_id = ?", (expired_ts, session_id)
+    )
+    conn.commit()
+    conn.close()
+
+    cached = {**database.get_session_context(session_id), "expires_at": expired_ts}
+    with patch("mud_server.api.auth._session_cache.get", return_value=cached):
+        with pytest.raises(HTTPException):
+            validate_session(session_id)
+
+    assert database.get_session_by_id(session_id) is None
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_disabled_with_zero_ttl(test_db, db_with_users, session_cache):
+    config.session.cache_ttl_seconds = 0
+    session_id = "uncached-session"
+    database.create_session("testplayer", session_id)
+
+    validate_session(session_id)
+    validate_session(session_id)
+
+    stats = get_session_cache_stats()
+    assert (stats.hits, stats.size) == (0, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_session_cache_evicts_least_recently_used(test_db, db_with_users, session_cache):
+    config.session.cache_max_entries = 1
+    database.create_session("testplayer", "lru-a")
+    database.create_session("testadmin", "lru-b")
+
+    validate_session("lru-a")
+    validate_session("lru-b")
+
+    stats = get_session_cache_stats()
+    assert (stats.evictions, stats.size) == (1, 1)
@@ -435,3 +435,85 @@ def test_admin_ollama_generic_error(test_client, test_db, temp_db_path, db_with_
         assert response.status_code == 200
         assert response.json()["success"] is False
         assert "boom" in response.json()["output"].lower()
+
+
+# ============================================================================
+# TRANSLATION STATS TESTS
+# ============================================================================
+
+
+@pytest.mark.api
+@pytest.mark.admin
+def test_translation_stats_requires_admin(test_db, temp_db_path, db_with_users):
+    """Players are refused; admins get per-world renderer counters."""
+    from types import SimpleNamespace
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from mud_server.api.routes.register import register_routes
+    from mud_server.core.engine import GameEngine
+    from mud_server.translation.cache import TranslationCacheStats
+    from mud_server.translation.guard import EndpointGuardStats
+    from mud_server.translation.renderer import RendererStats
+    from mud_server.translation.service import TranslationStats
+
+    renderer = RendererStats(
+        requests=4,
+        failures=1,
+        connections_opened=1,
+        connections_reused=3,
+        total_latency_seconds=2.0,
+        max_latency_seconds=0.9,
+    )
+    cache = TranslationCacheStats(entries=2, max_entries=256, hits=3, misses=1, evictions=0)
+    guard = EndpointGuardStats(
+        endpoint="http://localhost:11434/api/chat",
+        state="open",
+        consecutive_failures=3,
+        in_flight=0,
+        queue_depth=0,
+        max_concurrency=2,
+        queue_size=8,
+        shed=1,
+        rejected=5,
+        trips=1,
+    )
+    stats = TranslationStats(renderer=renderer, cache=cache, guard=guard)
+    engine = GameEngine(bootstrap_policies=False)
+    engine.world_registry = SimpleNamespace(  # type: ignore[assignment]
+        translation_stats=lambda: {"pipeworks_web": stats}
+    )
+    app = FastAPI()
+    register_routes(app, engine)
+    client = TestClient(app)
+
+    with use_test_database(temp_db_path):
+        player_session = client.post(
+            "/login", json={"username": "testplayer", "password": TEST_PASSWORD}
+        ).json()["session_id"]
+        response = client.get(
+            "/admin/ollama/translation-stats", params={"session_id": player_session}
+        )
+        assert response.status_code == 403
+
+        admin_session = client.post(
+            "/login", json={"username": "testadmin", "password": TEST_PASSWORD}
+        ).json()["session_id"]
+        response = client.get(
+            "/admin/ollama/translation-stats", params={"session_id": admin_session}
+        )
+
+    assert response.status_code == 200
+    (world,) = response.json()["worlds"]
+    assert world["world_id"] == "pipeworks_web"
+    assert world["connections_reused"] == 3
+    assert world["mean_latency_ms"] == pytest.approx(500.0)
+    assert world["cache_enabled"] is True
+    assert world["cache_hits"] == 3
+    assert world["cache_hit_rate"] == pytest.approx(0.75)
+    assert world["breaker_state"] == "open"
+    (endpoint,) = response.json()["endpoints"]
+    assert endpoint["endpoint"] == "http://localhost:11434/api/chat"
+    assert endpoint["rejected"] == 5
+    assert endpoint["trips"] == 1
@@ -0,0 +1,282 @@
+"""Tests for the room-push hub, the ``/ws/{session_id}`` route and chat long-polling."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from mud_server.api.room_push import REVALIDATE, RoomPushHub, room_push_hub
+from mud_server.config import use_test_database
+from mud_server.core.bus import MudBus
+from mud_server.core.events import Events
+from mud_server.db.session_invalidation import notify_sessions_changed
+
+
+@pytest.fixture
+def bus():
+    """Fresh bus singleton so hub handlers from other tests do not leak in."""
+    MudBus.reset_for_testing()
+    yield MudBus()
+    MudBus.reset_for_testing()
+
+
+@pytest.fixture
+def hub(bus):
+    """Hub attached to the fresh bus."""
+    push_hub = RoomPushHub(queue_size=4)
+    push_hub.attach(bus)
+    return push_hub
+
+
+def _subscribe(hub: RoomPushHub, name: str, room: str, *, session_id: str | None = None):
+    return hub.subscribe(
+        session_id=session_id or f"session-{name}",
+        user_id=hash(name) % 1000,
+        username=f"account-{name}",
+        character_id=hash(name) % 1000,
+        character_name=name,
+        world_id="w",
+        room_id=room,
+    )
+
+
+def hub_connections() -> int:
+    return room_push_hub.stats().connections
+
+
+async def _drain(subscriber) -> list[dict]:
+    """Let pending call_soon_threadsafe deliveries run, then empty the queue."""
+    await asyncio.sleep(0)
+    items = []
+    while not subscriber.queue.empty():
+        items.append(subscriber.queue.get_nowait())
+    return items
+
+
+@pytest.mark.unit
+async def test_chat_reaches_only_subscribers_in_the_room(bus, hub):
+    alice = _subscribe(hub, "Alice", "spawn")
+    bob = _subscribe(hub, "Bob", "forest")
+
+    await asyncio.to_thread(
+        bus.emit,
+        Events.CHAT_SAID,
+        {"username": "Alice", "message": "hello", "room": "spawn", "world_id": "w"},
+    )
+
+    assert await _drain(alice) == [
+        {"type": "chat", "channel": "say", "username": "Alice", "message": "hello", "room": "spawn"}
+    ]
+    assert await _drain(bob) == []
+
+
+@pytest.mark.unit
+async def test_yell_reaches_each_room_once_and_whisper_only_its_pair(bus, hub):
+    alice = _subscribe(hub, "Alice", "spawn")
+    bob = _subscribe(hub, "Bob", "forest")
+    carol = _subscribe(hub, "Carol", "spawn")
+
+    bus.emit(
+        Events.CHAT_YELLED,
+        {
+            "username": "Alice",
+            "message": "[YELL] hi",
+            "origin_room": "spawn",
+            "rooms_reached": ["spawn", "forest", "spawn"],
+            "world_id": "w",
+        },
+    )
+    bus.emit(
+        Events.CHAT_WHISPERED,
+        {
+            "username": "Alice",
+            "target": "Carol",
+            "message": "[WHISPER: Alice → Carol] psst",
+            "room": "spawn",
+            "world_id": "w",
+        },
+    )
+
+    assert [m["channel"] for m in await _drain(alice)] == ["yell", "whisper"]
+    assert [m["channel"] for m in await _drain(bob)] == ["yell"]
+    assert [m["channel"] for m in await _drain(carol)] == ["yell", "whisper"]
+
+
+@pytest.mark.unit
+async def test_translated_chat_follows_the_original_routing(bus, hub):
+    alice = _subscribe(hub, "Alice", "spawn")
+    bob = _subscribe(hub, "Bob", "forest")
+    carol = _subscribe(hub, "Carol", "spawn")
+    detail = {
+        "username": "Alice",
+        "channel": "yell",
+        "message": "[YELL] Hark!",
+        "message_ids": [7, 8],
+        "room": "spawn",
+        "rooms": ["spawn", "forest"],
+        "target": None,
+        "world_id": "w",
+    }
+
+    bus.emit(Events.CHAT_TRANSLATED, detail)
+    bus.emit(
+        Events.CHAT_TRANSLATED,
+        {**detail, "channel": "whisper", "message_ids": [9], "rooms": ["spawn"], "target": "Bob"},
+    )
+
+    yelled = await _drain(carol)
+    assert yelled == [
+        {
+            "type": "chat_translated",
+            "channel": "yell",
+            "username": "Alice",
+            "message": "[YELL] Hark!",
+            "room": "spawn",
+            "message_ids": [7, 8],
+        }
+    ]
+    assert [m["message_ids"] for m in await _drain(alice)] == [[7, 8], [9]]
+    assert [m["message_ids"] for m in await _drain(bob)] == [[7, 8], [9]]
+
+
+@pytest.mark.unit
+async def test_room_transition_moves_subscription_and_notifies_occupants(bus, hub):
+    alice = _subscribe(hub, "Alice", "spawn")
+    bob = _subscribe(hub, "Bob", "spawn")
+    carol = _subscribe(hub, "Carol", "forest")
+
+    bus.emit(
+        Events.ROOM_EXITED,
+        {"username": "Alice", "room": "spawn", "world_id": "w", "message": "Alice leaves north."},
+    )
+    bus.emit(
+        Events.ROOM_ENTERED,
+        {
+            "username": "Alice",
+            "room": "forest",
+            "world_id": "w",
+            "message": "Alice arrives from south.",
+        },
+    )
+    bus.emit(
+        Events.CHAT_SAID,
+        {"username": "Carol", "message": "welcome", "room": "forest", "world_id": "w"},
+    )
+
+    assert [m["type"] for m in await _drain(alice)] == ["room", "chat"]
+    assert alice.room_id == "forest"
+    assert [m.get("message") for m in await _drain(bob)] == ["Alice leaves north."]
+    assert [m.get("message") for m in await _drain(carol)] == [
+        "Alice arrives from south.",
+        "welcome",
+    ]
+    assert hub.stats().rooms == 2
+
+
+@pytest.mark.unit
+async def test_session_change_requests_revalidation_and_unsubscribe_cleans_up(bus, hub):
+    alice = _subscribe(hub, "Alice", "spawn", session_id="s-alice")
+    bob = _subscribe(hub, "Bob", "spawn", session_id="s-bob")
+
+    notify_sessions_changed(session_id="s-alice")
+
+    assert await _drain(alice) == [REVALIDATE]
+    assert await _drain(bob) == []
+
+    hub.unsubscribe(alice)
+    hub.unsubscribe(bob)
+    hub.unsubscribe(bob)
+    assert hub.stats().connections == 0
+    assert hub.stats().rooms == 0
+
+
+@pytest.mark.unit
+async def test_full_queue_drops_messages_instead_of_blocking(bus, hub):
+    alice = _subscribe(hub, "Alice", "spawn")
+
+    for n in range(6):
+        bus.emit(
+            Events.CHAT_SAID,
+            {"username": "Bob", "message": f"m{n}", "room": "spawn", "world_id": "w"},
+        )
+
+    assert [m["message"] for m in await _drain(alice)] == ["m0", "m1", "m2", "m3"]
+    assert alice.dropped == 2
+    assert hub.stats().dropped == 2
+
+
+@pytest.mark.api
+@pytest.mark.game
+def test_websocket_pushes_room_chat_and_movement(authenticated_client, temp_db_path):
+    client = authenticated_client["client"]
+    session_id = authenticated_client["session_id"]
+
+    with use_test_database(temp_db_path):
+        with client.websocket_connect(f"/ws/{session_id}") as websocket:
+            assert websocket.receive_json()["type"] == "room"
+
+            response = client.post(
+                "/command", json={"session_id": session_id, "command": "say hello there"}
+            )
+            assert response.json()["success"] is True
+
+            message = websocket.receive_json()
+            assert message["type"] == "chat"
+            assert message["channel"] == "say"
+            assert message["message"] == "hello there"
+
+
+@pytest.mark.api
+def test_websocket_rejects_unknown_session(test_client, test_db, temp_db_path):
+    with use_test_database(temp_db_path):
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with test_client.websocket_connect("/ws/not-a-session"):
+                pass
+
+    assert exc_info.value.code == 4401
+
+
+@pytest.mark.api
+def test_websocket_closes_after_logout(authenticated_client, temp_db_path):
+    client = authenticated_client["client"]
+    session_id = authenticated_client["session_id"]
+
+    with use_test_database(temp_db_path):
+        with client.websocket_connect(f"/ws/{session_id}") as websocket:
+            assert websocket.receive_json()["type"] == "room"
+
+            assert client.post("/logout", json={"session_id": session_id}).status_code == 200
+
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                websocket.receive_json()
+
+    assert exc_info.value.code == 4401
+
+
+@pytest.mark.api
+@pytest.mark.game
+def test_chat_long_poll_wakes_on_new_message(authenticated_client, temp_db_path):
+    client = authenticated_client["client"]
+    session_id = authenticated_client["session_id"]
+
+    with use_test_database(temp_db_path):
+        cursor = client.get(f"/chat/{session_id}/messages").json()["cursor"]
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(
+                client.get,
+                f"/chat/{session_id}/messages",
+                params={"since_id": cursor, "wait": 10},
+            )
+            started = time.monotonic()
+            while hub_connections() == 0 and time.monotonic() - started < 5:
+                time.sleep(0.01)
+            client.post("/command", json={"session_id": session_id, "command": "say wake up"})
+            response = pending.result(timeout=5)
+
+    assert time.monotonic() - started < 5
+    assert [m["message"] for m in response.json()["messages"]] == ["wake up"]
+    assert hub_connections() == 0
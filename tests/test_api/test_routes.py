@@ -1062,7 +1062,7 @@ def test_select_character_failure_sets_error(test_client, test_db, temp_db_path,
             "id"
         ]
 
-        with patch.object(database, "set_session_character", return_value=False):
+        with patch.object(database, "set_session_character_async", return_value=False):
             response = test_client.post(
                 "/characters/select",
                 json={"session_id": session_id, "character_id": character_id},
@@ -1089,7 +1089,7 @@ def test_select_character_maps_database_error_to_500(
 
         with patch.object(
             database,
-            "set_session_character",
+            "set_session_character_async",
             side_effect=DatabaseWriteError(
                 context=DatabaseOperationContext(operation="sessions.set_session_character")
             ),
@@ -1632,7 +1632,7 @@ def test_status_maps_database_exception_to_500(authenticated_client, test_db, te
 
         with patch.object(
             database,
-            "get_character_room",
+            "get_character_room_async",
             side_effect=DatabaseReadError(
                 context=DatabaseOperationContext(operation="characters.get_character_room")
             ),
@@ -1662,6 +1662,43 @@ def test_chat_endpoint(authenticated_client, test_db, temp_db_path):
         assert response.status_code in [200, 404]
 
 
+@pytest.mark.api
+@pytest.mark.game
+def test_chat_messages_endpoint_returns_rows_after_cursor(authenticated_client, temp_db_path):
+    """The cursor endpoint returns only messages newer than ``since_id``."""
+    with use_test_database(temp_db_path):
+        session_id = authenticated_client["session_id"]
+        client = authenticated_client["client"]
+
+        seed = client.get(f"/chat/{session_id}/messages")
+        assert seed.status_code == 200
+        cursor = seed.json()["cursor"]
+
+        client.post("/command", json={"session_id": session_id, "command": "say first"})
+        client.post("/command", json={"session_id": session_id, "command": "say second"})
+
+        response = client.get(f"/chat/{session_id}/messages", params={"since_id": cursor})
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["message"] for m in data["messages"]] == ["first", "second"]
+        assert data["cursor"] == data["messages"][-1]["id"]
+        assert data["room"] == "spawn"
+
+        again = client.get(
+            f"/chat/{session_id}/messages", params={"since_id": data["cursor"], "wait": 0.05}
+        )
+        assert again.json() == {"messages": [], "cursor": data["cursor"], "room": "spawn"}
+
+
+@pytest.mark.api
+@pytest.mark.game
+def test_chat_messages_endpoint_rejects_invalid_session(test_client, test_db, temp_db_path):
+    """Unknown sessions are rejected before any chat is read."""
+    with use_test_database(temp_db_path):
+        response = test_client.get("/chat/not-a-session/messages", params={"since_id": 0})
+        assert response.status_code == 401
+
+
 # ============================================================================
 # INTEGRATION TEST - Full User Flow
 # ============================================================================
@@ -1748,6 +1785,54 @@ def test_ping_endpoint(test_client, test_db, temp_db_path, db_with_users):
         assert response.json()["ok"] is True
 
 
+@pytest.mark.api
+@pytest.mark.game
+async def test_ping_stays_fast_while_translation_is_slow(authenticated_client, temp_db_path):
+    """A blocked chat translation must only delay the speaker, not other requests."""
+    import asyncio
+    import threading
+    import time
+
+    import httpx
+
+    from mud_server.core.engine import GameEngine
+
+    session_id = authenticated_client["session_id"]
+    app = authenticated_client["client"].app
+    translation_started = threading.Event()
+    release_translation = threading.Event()
+
+    def slow_chat(character_name, message, *, world_id):
+        translation_started.set()
+        release_translation.wait(timeout=5)
+        return True, f"You say: {message}"
+
+    with use_test_database(temp_db_path), patch.object(GameEngine, "chat", side_effect=slow_chat):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            say = asyncio.create_task(
+                client.post("/command", json={"session_id": session_id, "command": "say hi"})
+            )
+            assert await asyncio.to_thread(translation_started.wait, 5)
+
+            started = time.perf_counter()
+            pings = await asyncio.gather(*(client.post(f"/ping/{session_id}") for _ in range(5)))
+            elapsed = time.perf_counter() - started
+
+            assert all(ping.status_code == 200 for ping in pings)
+            assert elapsed < 2.0
+            assert not say.done()
+
+            health = await client.get("/health")
+            assert health.json()["engine_running"] >= 1
+
+            release_translation.set()
+            response = await say
+
+    assert response.status_code == 200
+    assert response.json()["message"] == "You say: hi"
+
+
 @pytest.mark.api
 def test_login_direct_success(test_client, test_db, temp_db_path, db_with_users):
     """Deprecated login-direct should return migration guidance."""
@@ -395,3 +395,62 @@ def test_main_rejects_removed_legacy_import_commands(legacy_command: str) -> Non
         with pytest.raises(SystemExit) as exc:
             cli.main()
     assert exc.value.code == 2
+
+
+def _write_world_package(worlds_root: Path, world_id: str) -> None:
+    """Write a one-room world package for compile-worlds tests."""
+    zones_dir = worlds_root / world_id / "zones"
+    zones_dir.mkdir(parents=True)
+    (worlds_root / world_id / "world.json").write_text(
+        json.dumps({"name": world_id, "zones": ["test"], "global_items": {}})
+    )
+    (zones_dir / "test.json").write_text(
+        json.dumps(
+            {
+                "id": "test",
+                "rooms": {"spawn": {"id": "spawn", "name": "Spawn", "description": "Spawn"}},
+            }
+        )
+    )
+
+
+@pytest.mark.unit
+def test_cmd_compile_worlds_builds_then_skips_current_snapshots(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    """compile-worlds should write missing snapshots and leave current ones alone."""
+    from mud_server.config import config
+    from mud_server.core.world_snapshot import snapshot_path
+
+    worlds_root = tmp_path / "worlds"
+    snapshot_dir = tmp_path / "snapshots"
+    _write_world_package(worlds_root, "alpha")
+    _write_world_package(worlds_root, "beta")
+    monkeypatch.setattr(config.worlds, "worlds_root", str(worlds_root))
+    monkeypatch.setattr(config.worlds, "snapshot_dir", str(snapshot_dir))
+    monkeypatch.setattr(config.worlds, "snapshots_enabled", True)
+    monkeypatch.setattr("mud_server.db.facade.init_database", lambda **_kwargs: None)
+
+    args = argparse.Namespace(world_ids=None, force=False)
+    assert cli.cmd_compile_worlds(args) == 0
+    assert snapshot_path(snapshot_dir, "alpha").is_file()
+    assert snapshot_path(snapshot_dir, "beta").is_file()
+    assert "alpha: compiled" in capsys.readouterr().out
+
+    assert cli.cmd_compile_worlds(args) == 0
+    assert "alpha: snapshot up to date" in capsys.readouterr().out
+
+    forced = argparse.Namespace(world_ids=["beta", "missing"], force=True)
+    assert cli.cmd_compile_worlds(forced) == 1
+    captured = capsys.readouterr()
+    assert "beta: compiled" in captured.out
+    assert "World package not found" in captured.err
+
+
+@pytest.mark.unit
+def test_cmd_compile_worlds_fails_when_snapshots_disabled(monkeypatch) -> None:
+    """compile-worlds should refuse to run with snapshots switched off."""
+    from mud_server.config import config
+
+    monkeypatch.setattr(config.worlds, "snapshots_enabled", False)
+    assert cli.cmd_compile_worlds(argparse.Namespace(world_ids=None, force=False)) == 1
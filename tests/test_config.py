@@ -121,6 +121,57 @@ def test_namegen_integration_ini_overrides():
     assert cfg.integrations.namegen_timeout_seconds == 5.75
 
 
+@pytest.mark.unit
+def test_database_profile_ini_overrides():
+    """Durability profile and pragma overrides should load from [database]."""
+    parser = configparser.ConfigParser()
+    parser.read_dict(
+        {
+            "database": {
+                "profile": "Throughput",
+                "synchronous": "extra",
+                "temp_store": "bogus",
+                "mmap_size": "-5",
+                "checkpoint_interval_seconds": "60",
+            }
+        }
+    )
+
+    cfg = ServerConfig()
+    _load_from_ini(parser, cfg)
+
+    assert cfg.database.profile == "throughput"
+    assert cfg.database.synchronous == "extra"
+    assert cfg.database.temp_store is None
+    assert cfg.database.mmap_size == 0
+    assert cfg.database.checkpoint_interval_seconds == 60
+
+
+@pytest.mark.unit
+def test_database_profile_env_override(monkeypatch):
+    monkeypatch.setenv("MUD_DB_PROFILE", "throughput")
+
+    cfg = load_config()
+
+    assert cfg.database.profile == "throughput"
+
+
+@pytest.mark.unit
+def test_engine_pool_settings_load_from_ini_and_env(monkeypatch):
+    """Engine worker pool sizing should load from [server] and MUD_ENGINE_WORKERS."""
+    parser = configparser.ConfigParser()
+    parser.read_dict({"server": {"engine_workers": "0", "engine_world_concurrency": "2"}})
+
+    cfg = ServerConfig()
+    _load_from_ini(parser, cfg)
+
+    assert cfg.server.engine_workers == 1
+    assert cfg.server.engine_world_concurrency == 2
+
+    monkeypatch.setenv("MUD_ENGINE_WORKERS", "12")
+    assert load_config().server.engine_workers == 12
+
+
 @pytest.mark.unit
 def test_registration_policy_env_overrides(monkeypatch):
     """Registration policy settings should load from env vars."""
@@ -14,6 +14,7 @@ See _working/plugin_development.md for architectural details.
 """
 
 import asyncio
+import threading
 
 import pytest
 
@@ -508,6 +509,62 @@ class TestWaitFor:
         with pytest.raises(asyncio.TimeoutError):
             await test_bus.wait_for("never:happens", timeout_ms=50)
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_wait_for_resolves_when_emitted_from_worker_thread(self, test_bus):
+        """Emitting on a worker thread should resolve the future on its own loop."""
+
+        async def emit_from_thread():
+            await asyncio.sleep(0.01)
+            await asyncio.to_thread(test_bus.emit, "test:event", {"key": "thread"})
+
+        asyncio.create_task(emit_from_thread())
+
+        event = await test_bus.wait_for("test:event", timeout_ms=1000)
+
+        assert event.detail == {"key": "thread"}
+
+
+# =============================================================================
+# THREAD SAFETY TESTS
+# =============================================================================
+
+
+class TestThreadSafety:
+    """Engine commands emit from executor worker threads."""
+
+    @pytest.mark.unit
+    def test_concurrent_emits_keep_sequence_log_and_delivery_in_step(self, test_bus):
+        """Sequences are unique and log order matches handler delivery order."""
+        delivered = []
+        test_bus.on("test:event", lambda event: delivered.append(event.meta.sequence))
+
+        def emit_many():
+            for n in range(200):
+                test_bus.emit("test:event", {"n": n})
+
+        threads = [threading.Thread(target=emit_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        sequences = [event.meta.sequence for event in test_bus.get_event_log()]
+        assert sequences == list(range(1, 1601))
+        assert delivered == sequences
+
+    @pytest.mark.unit
+    def test_handler_may_emit_follow_up_event(self, test_bus):
+        """The emit lock is re-entrant, so a handler can emit without deadlock."""
+        test_bus.on("test:first", lambda _event: test_bus.emit("test:second"))
+
+        test_bus.emit("test:first")
+
+        assert [event.type for event in test_bus.get_event_log()] == [
+            "test:first",
+            "test:second",
+        ]
+
 
 # =============================================================================
 # EVENT LOG TESTS
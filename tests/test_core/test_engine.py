@@ -448,6 +448,58 @@ def test_move_events_have_engine_source(mock_engine, test_db, temp_db_path, db_w
         assert moved_events[0].meta.source == "engine"
 
 
+@pytest.mark.unit
+@pytest.mark.game
+def test_move_emits_room_exited_then_room_entered(
+    mock_engine, test_db, temp_db_path, db_with_users
+):
+    """Room transition events carry world_id and the notices pushed to occupants."""
+    with use_test_database(temp_db_path):
+        database.set_character_room("testplayer_char", "spawn", world_id=database.DEFAULT_WORLD_ID)
+
+        current_bus = MudBus()
+        initial_count = len(current_bus.get_event_log())
+
+        mock_engine.move("testplayer_char", "north", world_id="pipeworks_web")
+
+        events = [
+            e
+            for e in current_bus.get_event_log()[initial_count:]
+            if e.type in (Events.ROOM_EXITED, Events.ROOM_ENTERED)
+        ]
+        assert [e.type for e in events] == [Events.ROOM_EXITED, Events.ROOM_ENTERED]
+        exited, entered = (e.detail for e in events)
+        assert exited["room"] == "spawn"
+        assert exited["world_id"] == "pipeworks_web"
+        assert exited["message"] == "testplayer_char leaves north."
+        assert entered["room"] == "forest"
+        assert entered["source"] == "movement"
+        assert entered["message"] == "testplayer_char arrives from south."
+
+
+@pytest.mark.unit
+@pytest.mark.game
+def test_chat_emits_chat_said_with_stored_message(
+    mock_engine, test_db, temp_db_path, db_with_users
+):
+    """CHAT_SAID carries the sanitized text that was stored for the room."""
+    with use_test_database(temp_db_path):
+        database.set_character_room("testplayer_char", "spawn", world_id=database.DEFAULT_WORLD_ID)
+
+        current_bus = MudBus()
+        initial_count = len(current_bus.get_event_log())
+
+        mock_engine.chat("testplayer_char", "<b>hi</b>", world_id="pipeworks_web")
+
+        said = [
+            e for e in current_bus.get_event_log()[initial_count:] if e.type == Events.CHAT_SAID
+        ]
+        assert len(said) == 1
+        assert said[0].detail["room"] == "spawn"
+        assert said[0].detail["world_id"] == "pipeworks_web"
+        assert "<b>" not in said[0].detail["message"]
+
+
 # ============================================================================
 # CHAT TESTS
 # ============================================================================
@@ -517,6 +569,37 @@ def test_yell_sends_to_adjacent_rooms(mock_engine, test_db, temp_db_path, db_wit
         assert any("[YELL]" in msg["message"] for msg in desert_messages)
 
 
+@pytest.mark.unit
+@pytest.mark.game
+def test_yell_reaches_rooms_within_world_yell_radius(
+    mock_engine, mock_world, test_db, temp_db_path, db_with_users
+):
+    """Test yell follows the world's yell_radius beyond direct exits."""
+    with use_test_database(temp_db_path):
+        database.set_character_room("testplayer_char", "forest", world_id=database.DEFAULT_WORLD_ID)
+
+        def yelled_rooms() -> set[str]:
+            return {
+                room
+                for room in ("forest", "spawn", "desert")
+                if any(
+                    "[YELL]" in msg["message"]
+                    for msg in database.get_room_messages(
+                        room, limit=10, world_id=database.DEFAULT_WORLD_ID
+                    )
+                )
+            }
+
+        mock_engine.yell("testplayer_char", "near", world_id="pipeworks_web")
+        assert yelled_rooms() == {"forest", "spawn"}
+
+        mock_world.yell_radius = 2
+        success, _ = mock_engine.yell("testplayer_char", "far", world_id="pipeworks_web")
+
+    assert success is True
+    assert yelled_rooms() == {"forest", "spawn", "desert"}
+
+
 @pytest.mark.unit
 @pytest.mark.game
 def test_whisper_success(mock_engine, test_db, temp_db_path, db_with_users):
@@ -728,6 +811,28 @@ def test_pickup_item_case_insensitive(mock_engine, test_db, temp_db_path, db_wit
         )
 
 
+@pytest.mark.unit
+@pytest.mark.game
+def test_pickup_item_rolls_back_with_enclosing_unit_of_work(
+    mock_engine, test_db, temp_db_path, db_with_users
+):
+    """Pickup joins the request unit of work, so a later failure undoes it."""
+    with use_test_database(temp_db_path):
+        database.set_character_room("testplayer_char", "spawn", world_id=database.DEFAULT_WORLD_ID)
+
+        with pytest.raises(RuntimeError):
+            with database.unit_of_work():
+                success, _ = mock_engine.pickup_item(
+                    "testplayer_char", "torch", world_id="pipeworks_web"
+                )
+                assert success is True
+                raise RuntimeError("command failed after pickup")
+
+        assert "torch" not in database.get_character_inventory(
+            "testplayer_char", world_id=database.DEFAULT_WORLD_ID
+        )
+
+
 @pytest.mark.unit
 @pytest.mark.game
 def test_drop_item_success(mock_engine, test_db, temp_db_path, db_with_users):
@@ -1086,11 +1191,11 @@ def test_yell_logs_warning_on_adjacent_room_failure(
     with use_test_database(temp_db_path):
         database.set_character_room("testplayer_char", "spawn", world_id=database.DEFAULT_WORLD_ID)
 
-        def mock_add_chat(character_name, message, room, *args, **kwargs):
+        def mock_add_chats(character_name, message, rooms, *args, **kwargs):
             # Succeed for the current room, fail for adjacent rooms.
-            return room == "spawn"
+            return [room for room in rooms if room == "spawn"]
 
-        with patch.object(database, "add_chat_message", side_effect=mock_add_chat):
+        with patch.object(database, "add_chat_messages", side_effect=mock_add_chats):
             with caplog.at_level(logging.WARNING, logger="mud_server.core.engine"):
                 success, message = mock_engine.yell(
                     "testplayer_char", "Hello!", world_id="pipeworks_web"
@@ -6,20 +6,27 @@ These tests verify that ``engine.chat``, ``engine.yell``, and
 - Fall back to the OOC text when the service returns ``None``.
 - Skip translation entirely when no service is configured.
 
+``chat_async``/``yell_async`` (async translation mode) are covered at the
+end: the prepare → render_async → finish split and cancellation, followed
+by deferred mode (OOC stored first, rows rewritten by the background job).
+
 The translation service itself is mocked — its unit tests live in
 ``tests/test_translation/``.  Here we only test the *wiring* between the
 engine and the service.
 """
 
+import asyncio
 from types import SimpleNamespace
 from typing import Any, cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from mud_server.config import use_test_database
+from mud_server.config import config, use_test_database
+from mud_server.core import deferred_translation
 from mud_server.core.bus import MudBus
 from mud_server.core.engine import GameEngine
+from mud_server.core.events import Events
 
 # ── Fixtures ─────────────────────────────────────────────────────────────────
 
@@ -41,6 +48,7 @@ def _make_world(translation_service=None, axis_engine=None):
         exits={"north": "forest"},
         items=[],
     )
+    world.yell_rooms.return_value = ("spawn", "forest")
     return world
 
 
@@ -155,9 +163,9 @@ class TestEngineYellTranslation:
             stored = []
             with patch("mud_server.core.engine.database") as mock_db:
                 mock_db.get_character_room.return_value = "spawn"
-                mock_db.add_chat_message.side_effect = (
-                    lambda u, m, r, **kw: stored.append(m) or True
-                )
+                mock_db.add_chat_messages.side_effect = lambda u, m, rooms, **kw: stored.append(
+                    m
+                ) or list(rooms)
                 engine.yell("Mira", "can you hear me?!", world_id="daily_undertaking")
 
         # [YELL] prefix wraps the IC text (after sanitise)
@@ -172,9 +180,9 @@ class TestEngineYellTranslation:
             stored = []
             with patch("mud_server.core.engine.database") as mock_db:
                 mock_db.get_character_room.return_value = "spawn"
-                mock_db.add_chat_message.side_effect = (
-                    lambda u, m, r, **kw: stored.append(m) or True
-                )
+                mock_db.add_chat_messages.side_effect = lambda u, m, rooms, **kw: stored.append(
+                    m
+                ) or list(rooms)
                 engine.yell("Mira", "can you hear me?!", world_id="daily_undertaking")
 
         assert stored[0] == "[YELL] can you hear me?!"
@@ -187,7 +195,7 @@ class TestEngineYellTranslation:
         with use_test_database(temp_db_path):
             with patch("mud_server.core.engine.database") as mock_db:
                 mock_db.get_character_room.return_value = "spawn"
-                mock_db.add_chat_message.return_value = True
+                mock_db.add_chat_messages.side_effect = lambda u, m, rooms, **kw: list(rooms)
                 engine.yell("Mira", "hello", world_id="daily_undertaking")
 
         svc.translate.assert_called_once_with(
@@ -207,7 +215,7 @@ class TestEngineWhisperTranslation:
         mock_db.resolve_character_name.side_effect = lambda name, **kw: name
         mock_db.get_character_room.side_effect = lambda name, **kw: room
         mock_db.character_exists.return_value = True
-        mock_db.get_active_characters.return_value = [target]
+        mock_db.is_character_active.return_value = True
         mock_db.add_chat_message.return_value = True
 
     def test_stores_ic_text_with_whisper_prefix(self, test_db, temp_db_path):
@@ -440,7 +448,7 @@ class TestEngineChatAxisEngine:
             with patch("mud_server.core.engine.database") as mock_db:
                 mock_db.get_character_room.return_value = "spawn"
                 mock_db.get_characters_in_room.return_value = ["Mira", "Kael"]
-                mock_db.add_chat_message.return_value = True
+                mock_db.add_chat_messages.side_effect = lambda u, m, rooms, **kw: list(rooms)
                 engine.yell("Mira", "can you hear me?!", world_id="daily_undertaking")
 
         axis_eng.resolve_chat_interaction.assert_called_once_with(
@@ -469,9 +477,9 @@ class TestEngineChatAxisEngine:
             with patch("mud_server.core.engine.database") as mock_db:
                 mock_db.get_character_room.return_value = "spawn"
                 mock_db.get_characters_in_room.return_value = ["Mira", "Kael"]
-                mock_db.add_chat_message.side_effect = (
-                    lambda u, m, r, **kw: stored.append(m) or True
-                )
+                mock_db.add_chat_messages.side_effect = lambda u, m, rooms, **kw: stored.append(
+                    m
+                ) or list(rooms)
                 success, _ = engine.yell("Mira", "hello", world_id="daily_undertaking")
 
         assert success is True
@@ -497,7 +505,7 @@ class TestEngineChatAxisEngine:
                 mock_db.resolve_character_name.side_effect = lambda name, **kw: name
                 mock_db.get_character_room.side_effect = lambda name, **kw: "spawn"
                 mock_db.character_exists.return_value = True
-                mock_db.get_active_characters.return_value = ["Kael"]
+                mock_db.is_character_active.return_value = True
                 mock_db.add_chat_message.side_effect = (
                     lambda u, m, r, **kw: stored.append(m) or True
                 )
@@ -526,7 +534,7 @@ class TestEngineChatAxisEngine:
                 mock_db.resolve_character_name.side_effect = lambda name, **kw: name
                 mock_db.get_character_room.side_effect = lambda name, **kw: "spawn"
                 mock_db.character_exists.return_value = True
-                mock_db.get_active_characters.return_value = ["Kael"]
+                mock_db.is_character_active.return_value = True
                 mock_db.add_chat_message.return_value = True
                 engine.whisper("Mira", "Kael", "secret", world_id="daily_undertaking")
 
@@ -542,3 +550,147 @@ class TestEngineChatAxisEngine:
             channel="whisper",
             ipc_hash="cafebabe00000000",
         )
+
+
+# ── async mode ────────────────────────────────────────────────────────────────
+
+
+def _make_async_translation_service(return_value: str | None):
+    """Build a mock service for the prepare → render_async → finish path."""
+    svc = MagicMock()
+    svc.render_async = AsyncMock(return_value="raw IC")
+    svc.finish_translation.return_value = return_value
+    return svc
+
+
+class TestEngineChatAsyncTranslation:
+    async def test_chat_async_stores_ic_text(self, test_db, temp_db_path):
+        svc = _make_async_translation_service("Hand over the ledger.")
+        engine = _make_engine(_make_world(svc))
+
+        with use_test_database(temp_db_path):
+            stored = []
+            with patch("mud_server.core.engine.database") as mock_db:
+                mock_db.get_character_room.return_value = "spawn"
+                mock_db.add_chat_message.side_effect = (
+                    lambda u, m, r, **kw: stored.append(m) or True
+                )
+                ok, _ = await engine.chat_async(
+                    "Mira", "give me the ledger", world_id="daily_undertaking"
+                )
+
+        assert ok and stored == ["Hand over the ledger."]
+        svc.prepare_translation.assert_called_once_with(
+            "Mira", "give me the ledger", channel="say", ipc_hash=None
+        )
+        svc.render_async.assert_awaited_once_with(svc.prepare_translation.return_value)
+        svc.finish_translation.assert_called_once_with(
+            svc.prepare_translation.return_value, "raw IC"
+        )
+        svc.translate.assert_not_called()
+
+    async def test_yell_async_falls_back_to_ooc(self, test_db, temp_db_path):
+        svc = _make_async_translation_service(None)
+        engine = _make_engine(_make_world(svc))
+
+        with use_test_database(temp_db_path):
+            stored = []
+            with patch("mud_server.core.engine.database") as mock_db:
+                mock_db.get_character_room.return_value = "spawn"
+                mock_db.add_chat_messages.side_effect = lambda u, m, rooms, **kw: stored.append(
+                    m
+                ) or list(rooms)
+                await engine.yell_async("Mira", "hello", world_id="daily_undertaking")
+
+        assert stored == ["[YELL] hello"]
+        assert svc.prepare_translation.call_args.kwargs["channel"] == "yell"
+
+    async def test_cancelled_translation_stores_nothing(self, test_db, temp_db_path):
+        svc = _make_async_translation_service("IC text")
+        started = asyncio.Event()
+
+        async def hang(_prepared):
+            started.set()
+            await asyncio.Event().wait()
+
+        svc.render_async = AsyncMock(side_effect=hang)
+        engine = _make_engine(_make_world(svc))
+
+        with use_test_database(temp_db_path):
+            with patch("mud_server.core.engine.database") as mock_db:
+                mock_db.get_character_room.return_value = "spawn"
+                task = asyncio.create_task(
+                    engine.chat_async("Mira", "hello", world_id="daily_undertaking")
+                )
+                await asyncio.wait_for(started.wait(), 5)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        mock_db.add_chat_message.assert_not_called()
+        svc.finish_translation.assert_not_called()
+
+
+# ── deferred mode ─────────────────────────────────────────────────────────────
+
+
+class TestEngineDeferredTranslation:
+    """``mode = deferred``: OOC stored at once, IC applied by the background job."""
+
+    @pytest.fixture(autouse=True)
+    def deferred_mode(self, monkeypatch):
+        monkeypatch.setattr(config.ollama_translation, "mode", "deferred")
+
+    def _say(self, svc, *, insert_id=41):
+        engine = _make_engine(_make_world(svc))
+        jobs = []
+        with (
+            patch("mud_server.core.engine.database") as mock_db,
+            patch("mud_server.core.engine.get_deferred_translator") as get_translator,
+        ):
+            mock_db.get_character_room.return_value = "spawn"
+            mock_db.insert_chat_message.return_value = insert_id
+            get_translator.return_value.submit.side_effect = jobs.append
+            result = engine.chat("Mira", "<b>hi</b>", world_id="daily_undertaking")
+        return result, mock_db, jobs
+
+    def test_stores_escaped_ooc_and_queues_translation(self):
+        svc = _make_async_translation_service("IC")
+        (ok, reply), mock_db, jobs = self._say(svc)
+
+        assert ok and reply == "You say: &lt;b&gt;hi&lt;/b&gt;"
+        assert mock_db.insert_chat_message.call_args.args[1] == "&lt;b&gt;hi&lt;/b&gt;"
+        mock_db.add_chat_message.assert_not_called()
+        svc.translate.assert_not_called()
+        [job] = jobs
+        assert job.rows == {"spawn": 41} and job.channel == "say"
+        assert job.prepared is svc.prepare_translation.return_value
+
+    def test_nothing_queued_when_insert_fails(self):
+        (ok, _), _, jobs = self._say(_make_async_translation_service("IC"), insert_id=None)
+        assert not ok and jobs == []
+
+    def test_job_rewrites_rows_and_emits_event(self):
+        svc = _make_async_translation_service("<i>Well met.</i>")
+        svc.render.return_value = "raw"
+        _, _, [job] = self._say(svc)
+        events = []
+        MudBus().on(Events.CHAT_TRANSLATED, events.append)
+
+        with patch("mud_server.core.deferred_translation.database") as job_db:
+            assert deferred_translation.translate(job)
+
+        svc.finish_translation.assert_called_once_with(job.prepared, "raw")
+        job_db.update_chat_messages.assert_called_once_with(
+            [41], "&lt;i&gt;Well met.&lt;/i&gt;", world_id="daily_undertaking"
+        )
+        [event] = events
+        assert event.detail["message_ids"] == [41] and event.detail["rooms"] == ["spawn"]
+
+    def test_failed_translation_keeps_ooc_row(self):
+        svc = _make_async_translation_service(None)
+        _, _, [job] = self._say(svc)
+
+        with patch("mud_server.core.deferred_translation.database") as job_db:
+            assert not deferred_translation.translate(job)
+        job_db.update_chat_messages.assert_not_called()
@@ -0,0 +1,106 @@
+"""Tests for the bounded engine executor used by async game routes."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from mud_server.config import config
+from mud_server.core import executor as engine_executor
+from mud_server.core.executor import EngineExecutor
+
+
+@pytest.fixture
+def executor():
+    """Small executor with two workers and one slot per world."""
+    instance = EngineExecutor(max_workers=2, world_concurrency=1)
+    yield instance
+    instance.shutdown(wait=True)
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    """Poll ``predicate`` on the event loop until it holds or time runs out."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+async def test_run_executes_off_the_event_loop_thread(executor):
+    """Calls run on a named worker thread and return their result."""
+    result = await executor.run("w", lambda: threading.current_thread().name)
+    assert result.startswith("mud-engine")
+
+
+@pytest.mark.unit
+async def test_run_propagates_exceptions(executor):
+    """Exceptions raised by the callable surface to the awaiting route."""
+
+    def boom() -> None:
+        raise RuntimeError("engine failed")
+
+    with pytest.raises(RuntimeError, match="engine failed"):
+        await executor.run("w", boom)
+    assert executor.stats().running == 0
+
+
+@pytest.mark.unit
+async def test_world_limit_queues_excess_calls_and_reports_depth(executor):
+    """A busy world queues its own calls while other worlds keep running."""
+    release = threading.Event()
+    busy = asyncio.create_task(executor.run("alpha", release.wait, 5))
+    waiting = asyncio.create_task(executor.run("alpha", lambda: "second"))
+
+    await _wait_until(lambda: executor.stats().running == 1)
+    stats = executor.stats()
+    assert stats.queued == 1
+    assert stats.queued_by_world == {"alpha": 1}
+
+    # Another world is admitted immediately despite alpha's backlog.
+    assert await executor.run("beta", lambda: "beta") == "beta"
+
+    release.set()
+    assert await busy is True
+    assert await waiting == "second"
+    stats = executor.stats()
+    assert (stats.queued, stats.running) == (0, 0)
+
+
+@pytest.mark.unit
+async def test_cancelled_queued_call_is_removed_from_gauge(executor):
+    """Abandoned requests must not leave a phantom queue depth behind."""
+    release = threading.Event()
+    busy = asyncio.create_task(executor.run("alpha", release.wait, 5))
+    waiting = asyncio.create_task(executor.run("alpha", lambda: None))
+    await _wait_until(lambda: executor.stats().queued == 1)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert executor.stats().queued == 0
+
+    release.set()
+    await busy
+
+
+@pytest.mark.unit
+def test_get_engine_executor_follows_configuration(monkeypatch):
+    """The shared executor is rebuilt when its configured size changes."""
+    monkeypatch.setattr(config.server, "engine_workers", 3)
+    monkeypatch.setattr(config.server, "engine_world_concurrency", 2)
+    engine_executor.shutdown_engine_executor()
+    try:
+        first = engine_executor.get_engine_executor()
+        assert engine_executor.get_engine_executor() is first
+        assert (first.max_workers, first.world_concurrency) == (3, 2)
+
+        monkeypatch.setattr(config.server, "engine_workers", 4)
+        second = engine_executor.get_engine_executor()
+        assert second is not first
+        assert second.max_workers == 4
+    finally:
+        engine_executor.shutdown_engine_executor(wait=True)
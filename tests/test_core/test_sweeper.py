@@ -0,0 +1,61 @@
+"""Tests for the chunked expired-row sweeper run by the server lifespan."""
+
+from __future__ import annotations
+
+import pytest
+
+from mud_server.core.sweeper import sweep_expired_rows
+from mud_server.db import database
+
+
+def _insert_account_sessions(username: str, *, expired: int, active: int) -> None:
+    """Insert account-only sessions for ``username`` directly, bypassing single-session rules."""
+    user_id = database.get_user_id(username)
+    assert user_id is not None
+    conn = database.get_connection()
+    rows = [(user_id, f"expired-{index}", "-5 minutes") for index in range(expired)]
+    rows += [(user_id, f"active-{index}", "+5 minutes") for index in range(active)]
+    conn.executemany(
+        "INSERT INTO sessions (user_id, session_id, expires_at) VALUES (?, ?, datetime('now', ?))",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_cleanup_expired_sessions_respects_limit(test_db, db_with_users):
+    _insert_account_sessions("testplayer", expired=3, active=1)
+
+    assert database.cleanup_expired_sessions(limit=2) == 2
+    assert database.cleanup_expired_sessions(limit=2) == 1
+    assert database.cleanup_expired_sessions(limit=2) == 0
+    assert database.get_session_by_id("active-0") is not None
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_sweep_removes_expired_rows_in_chunks(test_db, db_with_users):
+    """Five expired sessions at chunk size 2 take three session chunks plus one guest chunk."""
+    _insert_account_sessions("testplayer", expired=5, active=1)
+
+    report = await sweep_expired_rows(chunk_size=2)
+
+    assert report.sessions_removed == 5
+    assert report.guest_accounts_removed == 0
+    assert report.rows_removed == 5
+    assert report.chunks == 4
+    assert report.elapsed_seconds >= 0
+    assert database.get_session_by_id("active-0") is not None
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_sweep_with_nothing_expired_uses_one_chunk_per_table(test_db, db_with_users):
+    _insert_account_sessions("testplayer", expired=0, active=2)
+
+    report = await sweep_expired_rows(chunk_size=500)
+
+    assert report.rows_removed == 0
+    assert report.chunks == 2
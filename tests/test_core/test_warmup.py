@@ -0,0 +1,100 @@
+"""Tests for the startup world warm-up (``mud_server.core.warmup``)."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from mud_server.core.warmup import WarmupState, warm_up_worlds
+
+
+class _FakeRegistry:
+    """World registry stand-in that records which worlds were built."""
+
+    def __init__(self, rows: list[dict[str, Any]], *, barrier: threading.Barrier | None = None):
+        self._rows = rows
+        self._barrier = barrier
+        self.loaded: list[str] = []
+
+    def list_worlds(self, *, include_inactive: bool = False) -> list[dict[str, Any]]:
+        assert include_inactive
+        return self._rows
+
+    def get_world(self, world_id: str) -> object:
+        if world_id == "broken":
+            raise ValueError("bad package")
+        if self._barrier is not None:
+            # Both worlds must be loading at the same time to pass.
+            self._barrier.wait(timeout=5)
+        self.loaded.append(world_id)
+        return object()
+
+
+def _engine(registry: _FakeRegistry) -> Any:
+    bootstrapped: list[str] = []
+    return SimpleNamespace(
+        world_registry=registry,
+        bootstrapped=bootstrapped,
+        _bootstrap_world_axis_policy=bootstrapped.append,
+    )
+
+
+@pytest.mark.unit
+def test_warm_up_loads_active_worlds_concurrently():
+    """Active worlds are built on parallel threads; every world gets its policy."""
+    registry = _FakeRegistry(
+        [
+            {"id": "alpha", "is_active": True},
+            {"id": "beta", "is_active": True},
+            {"id": "dormant", "is_active": False},
+        ],
+        barrier=threading.Barrier(2),
+    )
+    engine = _engine(registry)
+
+    report = warm_up_worlds(cast(Any, engine), parallelism=2)
+
+    assert sorted(engine.bootstrapped) == ["alpha", "beta", "dormant"]
+    assert sorted(registry.loaded) == ["alpha", "beta"]
+    assert [world.world_id for world in report.worlds] == ["alpha", "beta", "dormant"]
+    dormant = report.worlds[2]
+    assert dormant.load_seconds is None and dormant.error is None
+    assert all(world.load_seconds is not None for world in report.worlds[:2])
+    assert report.failed == ()
+
+
+@pytest.mark.unit
+def test_warm_up_reports_failures_without_raising(caplog):
+    """A world that fails to load is reported and the others still warm up."""
+    registry = _FakeRegistry(
+        [{"id": "broken", "is_active": True}, {"id": "alpha", "is_active": True}, {}]
+    )
+
+    report = warm_up_worlds(cast(Any, _engine(registry)), parallelism=4)
+
+    assert registry.loaded == ["alpha"]
+    assert [world.world_id for world in report.failed] == ["broken"]
+    assert report.failed[0].error == "bad package"
+    assert "malformed world row" in caplog.text
+
+
+@pytest.mark.unit
+def test_warm_up_with_no_worlds_is_empty():
+    report = warm_up_worlds(cast(Any, _engine(_FakeRegistry([]))), parallelism=4)
+    assert report.worlds == ()
+
+
+@pytest.mark.unit
+def test_warmup_state_tracks_readiness():
+    state = WarmupState()
+    assert not state.ready and state.report is None
+
+    report = warm_up_worlds(cast(Any, _engine(_FakeRegistry([]))), parallelism=1)
+    state.mark_ready(report)
+    assert state.ready and state.report is report
+
+    state.reset()
+    assert not state.ready and state.report is None
@@ -163,6 +163,48 @@ def test_can_move_from_nonexistent_room(mock_world):
     assert destination is None
 
 
+# ============================================================================
+# ROOM GRAPH / NEIGHBOURHOOD TESTS
+# ============================================================================
+
+
+@pytest.mark.unit
+def test_neighbourhood_expands_by_hops(mock_world):
+    """Test BFS neighbourhood ordering and hop limits."""
+    assert mock_world.neighbourhood("spawn", 0) == ("spawn",)
+    assert mock_world.neighbourhood("spawn", 1) == ("spawn", "forest", "desert")
+    assert mock_world.neighbourhood("forest", 1) == ("forest", "spawn")
+    assert mock_world.neighbourhood("forest", 2) == ("forest", "spawn", "desert")
+    assert mock_world.neighbourhood("forest", 10) == ("forest", "spawn", "desert")
+    assert mock_world.neighbourhood("nonexistent", 1) == ()
+
+
+@pytest.mark.unit
+def test_neighbourhood_cached_until_rooms_change(mock_world):
+    """Test neighbourhoods are cached and the graph recompiles on room changes."""
+    from mud_server.core.world import Room
+
+    first = mock_world.neighbourhood("spawn", 1)
+    assert mock_world.neighbourhood("spawn", 1) is first
+
+    mock_world.rooms["cave"] = Room(
+        id="cave", name="Cave", description="Dark", exits={"up": "desert"}, items=[]
+    )
+    mock_world.rooms["desert"].exits["down"] = "cave"
+
+    assert mock_world.neighbourhood("spawn", 2) == ("spawn", "forest", "desert", "cave")
+    assert mock_world.can_move("desert", "down") == (True, "cave")
+
+
+@pytest.mark.unit
+def test_yell_rooms_uses_yell_radius(mock_world):
+    """Test yell_rooms follows the world's configured yell radius."""
+    assert mock_world.yell_rooms("forest") == ("forest", "spawn")
+
+    mock_world.yell_radius = 2
+    assert mock_world.yell_rooms("forest") == ("forest", "spawn", "desert")
+
+
 # ============================================================================
 # ROOM DESCRIPTION TESTS
 # ============================================================================
@@ -255,6 +297,43 @@ def test_get_room_description_no_items(mock_world):
         assert "[Items here]:" not in desc
 
 
+@pytest.mark.unit
+def test_get_room_description_full_layout(mock_world):
+    """Test the occupants section is spliced between items and exits."""
+    with patch(
+        "mud_server.core.world.database.get_characters_in_room",
+        return_value=["testplayer", "otherplayer"],
+    ):
+        desc = mock_world.get_room_description("spawn", "testplayer", world_id="pipeworks_web")
+
+    assert desc == (
+        "\n=== Test Spawn ===\nA test spawn room\n"
+        "\n[Items here]:\n  - Torch\n  - Rope\n"
+        "\n[Players here]:\n  - otherplayer\n"
+        "\n[Exits]:\n  - north: Test Forest\n  - south: Test Desert\n"
+    )
+
+
+@pytest.mark.unit
+def test_get_room_description_reuses_static_template(mock_world):
+    """Test static sections render once while occupants stay live."""
+    with (
+        patch(
+            "mud_server.core.world.database.get_characters_in_room",
+            side_effect=[["visitor"], []],
+        ),
+        patch.object(mock_world, "get_item", wraps=mock_world.get_item) as get_item,
+        patch.object(mock_world, "resolve_room", wraps=mock_world.resolve_room) as resolve,
+    ):
+        first = mock_world.get_room_description("spawn", "testplayer", world_id="pipeworks_web")
+        second = mock_world.get_room_description("spawn", "testplayer", world_id="pipeworks_web")
+
+    assert "visitor" in first
+    assert "[Players here]:" not in second
+    assert get_item.call_count == 2  # torch and rope, first render only
+    assert resolve.call_count == 2  # north and south, first render only
+
+
 # ============================================================================
 # ZONE-BASED LOADING TESTS
 # ============================================================================
@@ -851,6 +930,90 @@ def test_default_spawn_non_dict_format(tmp_path):
         world_module.ZONES_DIR = original_zones_dir
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("configured", "expected"),
+    [(None, 1), (3, 3), (0, 0), (-2, 0), ("far", 1), (True, 1)],
+)
+def test_yell_radius_from_world_json(tmp_path, configured, expected):
+    """Test yell_radius is read from world.json with validation and default."""
+    import json
+
+    from mud_server.core.world import World
+
+    zones_dir = tmp_path / "zones"
+    zones_dir.mkdir()
+    world_json = {"name": "Radius World", "zones": ["test"], "global_items": {}}
+    if configured is not None:
+        world_json["yell_radius"] = configured
+    (tmp_path / "world.json").write_text(json.dumps(world_json))
+    zone_data = {
+        "id": "test",
+        "rooms": {
+            "spawn": {"id": "spawn", "name": "Spawn", "description": "Spawn", "exits": {}},
+        },
+    }
+    (zones_dir / "test.json").write_text(json.dumps(zone_data))
+
+    w = World(world_root=tmp_path)
+
+    assert w.yell_radius == expected
+
+
+@pytest.mark.integration
+def test_room_graph_follows_lazy_loaded_zone(tmp_path):
+    """Test unresolved cross-zone exits join the graph once their zone loads."""
+    import json
+
+    from mud_server.core.world import World
+
+    zones_dir = tmp_path / "zones"
+    zones_dir.mkdir()
+    world_json = {"name": "Graph World", "zones": ["pub"], "global_items": {}}
+    (tmp_path / "world.json").write_text(json.dumps(world_json))
+    pub_zone = {
+        "id": "pub",
+        "rooms": {
+            "main_room": {
+                "id": "main_room",
+                "name": "Main Room",
+                "description": "The main pub room",
+                "exits": {"west": "docks:pier"},
+            },
+        },
+    }
+    docks_zone = {
+        "id": "docks",
+        "rooms": {
+            "pier": {
+                "id": "pier",
+                "name": "East Pier",
+                "description": "A wooden pier",
+                "exits": {"east": "pub:main_room", "south": "beach"},
+            },
+            "beach": {"id": "beach", "name": "Beach", "description": "Sand", "exits": {}},
+        },
+    }
+    (zones_dir / "pub.json").write_text(json.dumps(pub_zone))
+    (zones_dir / "docks.json").write_text(json.dumps(docks_zone))
+
+    w = World(world_root=tmp_path)
+
+    # Exits into unloaded zones are not followed until something resolves them,
+    # and the room's description template is left for the first look.
+    assert w.neighbourhood("main_room", 2) == ("main_room",)
+    assert w._room_graph().descriptions.keys() == set()
+
+    assert w.can_move("main_room", "west") == (True, "pier")
+    assert w.neighbourhood("main_room", 2) == ("main_room", "pier", "beach")
+    assert w.resolve_room("docks:pier") is w.rooms["pier"]
+    assert w.can_move("pier", "east") == (True, "main_room")
+
+    with patch("mud_server.core.world.database.get_characters_in_room", return_value=[]):
+        desc = w.get_room_description("main_room", "testplayer", world_id="graph")
+    assert "  - west: East Pier\n" in desc
+
+
 def test_get_room_description_passes_world_id(mock_world):
     """Ensure get_room_description forwards world_id to database lookup."""
     from unittest.mock import patch
@@ -1176,3 +1339,126 @@ def test_axis_resolution_enabled_false():
     w = _make_bare_world()
     w._axis_engine = None
     assert w.axis_resolution_enabled() is False
+
+
+def _write_lazy_world(world_root):
+    """Write a three-zone package: spawn zone -> docks (zone:room) -> cellar (plain ref)."""
+    import json
+
+    zones_dir = world_root / "zones"
+    zones_dir.mkdir(parents=True)
+    world_json = {
+        "name": "Lazy World",
+        "default_spawn": {"zone": "town", "room": "square"},
+        "zones": ["town", "docks", "cellar"],
+        "global_items": {"coin": {"id": "coin", "name": "Coin", "description": "A coin"}},
+    }
+    (world_root / "world.json").write_text(json.dumps(world_json))
+    zones = {
+        "town": {"square": {"north": "docks:pier"}},
+        "docks": {"pier": {"south": "town:square", "down": "vault"}},
+        "cellar": {"vault": {"up": "docks:pier"}},
+    }
+    for zone_id, rooms in zones.items():
+        zone_data = {
+            "id": zone_id,
+            "spawn_room": next(iter(rooms)),
+            "rooms": {
+                room_id: {
+                    "id": room_id,
+                    "name": room_id.title(),
+                    "description": f"The {room_id}",
+                    "exits": exits,
+                }
+                for room_id, exits in rooms.items()
+            },
+            "items": {f"{zone_id}_key": {"id": f"{zone_id}_key", "name": "Key", "description": ""}},
+        }
+        (zones_dir / f"{zone_id}.json").write_text(json.dumps(zone_data))
+
+
+@pytest.mark.integration
+def test_lazy_zones_load_on_first_reference(tmp_path):
+    """Test lazy worlds start with the spawn zone and load others when referenced."""
+    from mud_server.core.world import World
+
+    _write_lazy_world(tmp_path)
+    w = World(world_root=tmp_path, lazy_zones=True)
+
+    assert set(w.zones) == {"town"}
+    assert set(w.rooms) == {"square"}
+    assert w.get_item("coin") is not None
+    stats = w.zone_stats()
+    assert (stats.known, stats.loaded, stats.loads, stats.evictions) == (3, 1, 1, 0)
+
+    # A cross-zone exit loads its zone; a plain exit into another zone
+    # resolves through the room catalog.
+    assert w.can_move("square", "north") == (True, "pier")
+    assert w.can_move("pier", "down") == (True, "vault")
+    assert set(w.zones) == {"town", "docks", "cellar"}
+    assert w.get_item("cellar_key") is not None
+    assert w.zone_stats().loads == 3
+
+
+@pytest.mark.integration
+def test_lazy_zones_load_for_character_location(tmp_path):
+    """Test looking up a room in an unloaded zone loads that zone."""
+    from mud_server.core.world import World
+
+    _write_lazy_world(tmp_path)
+    w = World(world_root=tmp_path, lazy_zones=True)
+
+    assert w.get_room("vault") is not None
+    assert "cellar" in w.zones
+    assert w.neighbourhood("vault", 1) == ("vault",)
+    assert w.get_room("nowhere") is None
+
+
+@pytest.mark.integration
+def test_lazy_zones_evict_idle_zones_over_budget(tmp_path):
+    """Test the least recently used idle zone is evicted once over budget."""
+    from mud_server.core.world import World, ZoneBudget
+
+    _write_lazy_world(tmp_path)
+    w = World(world_root=tmp_path, lazy_zones=True, zone_budget=ZoneBudget(max_zones=2))
+
+    with patch("mud_server.core.world.database.get_occupied_rooms", return_value=set()):
+        assert w.get_room("pier") is not None
+        assert w.get_room("vault") is not None
+
+        # The spawn zone is pinned, so docks is the idle zone that goes.
+        assert set(w.zones) == {"town", "cellar"}
+        assert "pier" not in w.rooms
+        assert w.get_item("docks_key") is None
+        assert w.can_move("vault", "up") == (True, "pier")
+        assert set(w.zones) == {"town", "docks"}
+
+    stats = w.zone_stats()
+    assert (stats.loaded, stats.loads, stats.evictions) == (2, 4, 2)
+
+
+@pytest.mark.integration
+def test_lazy_zones_keep_occupied_zones(tmp_path):
+    """Test zones with characters in them are not evicted, even over budget."""
+    from mud_server.core.world import World, ZoneBudget
+
+    _write_lazy_world(tmp_path)
+    w = World(world_root=tmp_path, lazy_zones=True, zone_budget=ZoneBudget(max_zones=2))
+
+    with patch("mud_server.core.world.database.get_occupied_rooms", return_value={"pier"}):
+        w.get_room("pier")
+        w.get_room("vault")
+
+    assert set(w.zones) == {"town", "docks", "cellar"}
+    assert w.zone_stats().evictions == 0
+
+
+@pytest.mark.unit
+def test_zone_budget_exceeded():
+    """Test zone budgets treat 0 as unlimited."""
+    from mud_server.core.world import ZoneBudget
+
+    assert not ZoneBudget().exceeded(500, 10**9)
+    assert ZoneBudget(max_zones=2).exceeded(3, 0)
+    assert not ZoneBudget(max_zones=2).exceeded(2, 10**9)
+    assert ZoneBudget(max_bytes=100).exceeded(1, 101)
@@ -1,9 +1,12 @@
 """Tests for the WorldRegistry loader and permission filtering."""
 
 import json
+import threading
+import time
 
 import pytest
 
+from mud_server.core import world_registry
 from mud_server.core.world_registry import WorldRegistry
 from mud_server.db import database
 
@@ -65,3 +68,42 @@ def test_world_registry_rejects_inactive_world(test_db, tmp_path):
     registry = WorldRegistry(worlds_root=tmp_path)
     with pytest.raises(ValueError):
         registry.get_world(world_id)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_world_registry_loads_each_world_once_under_concurrency(test_db, tmp_path, monkeypatch):
+    """Concurrent get_world calls for one world share a single load."""
+    world_id = "pipeworks_web"
+    conn = database.get_connection()
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO worlds (id, name, description, is_active, config_json)
+        VALUES (?, ?, '', 1, '{}')
+        """,
+        (world_id, world_id),
+    )
+    conn.commit()
+    conn.close()
+
+    loads: list[str] = []
+
+    def slow_load(world_root, *, snapshot_dir=None):
+        loads.append(world_root.name)
+        time.sleep(0.05)
+        return object()
+
+    monkeypatch.setattr(world_registry, "load_world_package", slow_load)
+    registry = WorldRegistry(worlds_root=tmp_path)
+    results: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get_world(world_id)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [world_id]
+    assert len(results) == 4 and all(result is results[0] for result in results)
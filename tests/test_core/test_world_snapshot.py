@@ -0,0 +1,179 @@
+"""Tests for compiled world snapshots (``mud_server.core.world_snapshot``)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mud_server.core import world_snapshot
+from mud_server.core.world import World
+from mud_server.core.world_snapshot import load_snapshot, snapshot_path
+
+
+def _write_package(world_root: Path, *, room_name: str = "Spawn") -> None:
+    """Write a two-room world package."""
+    zones_dir = world_root / "zones"
+    zones_dir.mkdir(parents=True, exist_ok=True)
+    (world_root / "world.json").write_text(
+        json.dumps(
+            {
+                "name": "Snapshot World",
+                "default_spawn": {"zone": "test", "room": "spawn"},
+                "zones": ["test"],
+                "yell_radius": 2,
+                "global_items": {
+                    "torch": {"id": "torch", "name": "Torch", "description": "A torch"}
+                },
+            }
+        )
+    )
+    zone_data = {
+        "id": "test",
+        "rooms": {
+            "spawn": {
+                "id": "spawn",
+                "name": room_name,
+                "description": "Spawn room",
+                "exits": {"north": "hall"},
+                "items": ["torch"],
+            },
+            "hall": {"id": "hall", "name": "Hall", "description": "A hall", "exits": {}},
+        },
+    }
+    (zones_dir / "test.json").write_text(json.dumps(zone_data))
+
+
+@pytest.mark.integration
+def test_world_load_writes_and_reuses_snapshot(tmp_path):
+    """The first load writes a snapshot; the next load skips parsing zones."""
+    world_root = tmp_path / "snapworld"
+    snapshot_dir = tmp_path / "snapshots"
+    _write_package(world_root)
+
+    first = World(world_root=world_root, snapshot_dir=snapshot_dir)
+    assert snapshot_path(snapshot_dir, "snapworld").is_file()
+
+    with patch.object(World, "_load_zone", side_effect=AssertionError("zone parsed")):
+        second = World(world_root=world_root, snapshot_dir=snapshot_dir)
+
+    assert second.world_name == first.world_name == "Snapshot World"
+    assert second.default_spawn == ("test", "spawn")
+    assert second.yell_radius == 2
+    assert second.rooms.keys() == first.rooms.keys()
+    assert second.items["torch"].name == "Torch"
+    assert second.can_move("spawn", "north") == (True, "hall")
+    with patch("mud_server.core.world.database.get_characters_in_room", return_value=[]):
+        assert second.get_room_description(
+            "spawn", "testplayer", world_id="snapworld"
+        ) == first.get_room_description("spawn", "testplayer", world_id="snapworld")
+
+
+@pytest.mark.integration
+def test_edited_package_rebuilds_snapshot(tmp_path):
+    """A content change makes the snapshot stale and it is rewritten."""
+    world_root = tmp_path / "snapworld"
+    snapshot_dir = tmp_path / "snapshots"
+    _write_package(world_root)
+    World(world_root=world_root, snapshot_dir=snapshot_dir)
+
+    _write_package(world_root, room_name="Renamed Spawn")
+    assert load_snapshot(snapshot_dir, world_root) is None
+
+    rebuilt = World(world_root=world_root, snapshot_dir=snapshot_dir)
+    assert rebuilt.rooms["spawn"].name == "Renamed Spawn"
+    snapshot = load_snapshot(snapshot_dir, world_root)
+    assert snapshot is not None
+    assert snapshot.rooms["spawn"].name == "Renamed Spawn"
+
+
+@pytest.mark.unit
+def test_touched_but_unchanged_package_keeps_snapshot(tmp_path):
+    """New mtimes with identical content still match by content hash."""
+    world_root = tmp_path / "snapworld"
+    snapshot_dir = tmp_path / "snapshots"
+    _write_package(world_root)
+    World(world_root=world_root, snapshot_dir=snapshot_dir)
+
+    zone_path = world_root / "zones" / "test.json"
+    stat = zone_path.stat()
+    os.utime(zone_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    snapshot = load_snapshot(snapshot_dir, world_root)
+    assert snapshot is not None
+    assert snapshot.fingerprint.stamps == world_snapshot._stamp_files(world_root)
+
+
+@pytest.mark.unit
+def test_unreadable_or_foreign_snapshots_are_ignored(tmp_path):
+    """Corrupt files and other format versions fall back to parsing."""
+    world_root = tmp_path / "snapworld"
+    snapshot_dir = tmp_path / "snapshots"
+    _write_package(world_root)
+    World(world_root=world_root, snapshot_dir=snapshot_dir)
+
+    with patch.object(world_snapshot, "SNAPSHOT_FORMAT_VERSION", 999):
+        assert load_snapshot(snapshot_dir, world_root) is None
+
+    snapshot_path(snapshot_dir, "snapworld").write_bytes(b"not a pickle")
+    assert load_snapshot(snapshot_dir, world_root) is None
+    world = World(world_root=world_root, snapshot_dir=snapshot_dir)
+    assert world.rooms["spawn"].name == "Spawn"
+    assert load_snapshot(snapshot_dir, world_root) is not None
+
+
+@pytest.mark.unit
+def test_snapshot_write_failure_is_not_fatal(tmp_path, caplog):
+    """A failed snapshot write is logged and the parsed world is used."""
+    world_root = tmp_path / "snapworld"
+    _write_package(world_root)
+
+    with patch("mud_server.core.world.write_snapshot", side_effect=OSError("read-only")):
+        world = World(world_root=world_root, snapshot_dir=tmp_path / "snapshots")
+
+    assert world.rooms["spawn"].name == "Spawn"
+    assert "Could not write world snapshot" in caplog.text
+
+
+@pytest.mark.unit
+def test_resolve_snapshot_dir_follows_config(tmp_path, monkeypatch):
+    """The snapshot directory defaults next to the database and can be disabled."""
+    from mud_server.config import config
+
+    monkeypatch.setattr(config.worlds, "snapshot_dir", "")
+    monkeypatch.setattr(config.worlds, "snapshots_enabled", True)
+    assert world_snapshot.resolve_snapshot_dir() == (
+        config.database.absolute_path.parent / world_snapshot.SNAPSHOT_DIRNAME
+    )
+
+    monkeypatch.setattr(config.worlds, "snapshot_dir", str(tmp_path / "custom"))
+    assert world_snapshot.resolve_snapshot_dir() == tmp_path / "custom"
+
+    monkeypatch.setattr(config.worlds, "snapshots_enabled", False)
+    assert world_snapshot.resolve_snapshot_dir() is None
+
+
+@pytest.mark.integration
+def test_lazy_snapshot_holds_catalog_and_rebuilds_across_modes(tmp_path):
+    """Lazy worlds snapshot the zone catalog; switching zone mode rebuilds."""
+    world_root = tmp_path / "snapworld"
+    snapshot_dir = tmp_path / "snapshots"
+    _write_package(world_root)
+
+    World(world_root=world_root, snapshot_dir=snapshot_dir, lazy_zones=True)
+    snapshot = load_snapshot(snapshot_dir, world_root)
+    assert snapshot is not None and snapshot.lazy_zones
+    assert snapshot.rooms == {} and snapshot.graph is None
+    assert snapshot.zones["test"].rooms == ["spawn", "hall"]
+
+    lazy = World(world_root=world_root, snapshot_dir=snapshot_dir, lazy_zones=True)
+    assert lazy.zone_stats().known == 1
+    assert lazy.get_room("hall") is not None
+
+    eager = World(world_root=world_root, snapshot_dir=snapshot_dir)
+    assert set(eager.rooms) == {"spawn", "hall"}
+    snapshot = load_snapshot(snapshot_dir, world_root)
+    assert snapshot is not None and not snapshot.lazy_zones
@@ -0,0 +1,146 @@
+"""Parity tests for the aiosqlite repository layer in ``mud_server.db.async_repo``."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from mud_server.config import config, use_test_database
+from mud_server.db import (
+    async_connection,
+    async_repo,
+    characters_repo,
+    chat_repo,
+    schema,
+    sessions_repo,
+    users_repo,
+)
+from mud_server.db.constants import DEFAULT_WORLD_ID
+from mud_server.db.errors import DatabaseReadError
+from tests.constants import TEST_PASSWORD
+
+
+@pytest.fixture
+async def seeded_db(tmp_path, monkeypatch):
+    """One user with one character, a bound session, and a few chat rows."""
+    monkeypatch.setattr(config.database, "pool_size", 2)
+    with use_test_database(tmp_path / "async.db"):
+        schema.init_database(skip_superuser=True)
+        assert users_repo.create_user_with_password("asyncer", TEST_PASSWORD)
+        user_id = users_repo.get_user_id("asyncer")
+        assert characters_repo.create_character_for_user(
+            user_id, "Async Char", world_id=DEFAULT_WORLD_ID
+        )
+        character = characters_repo.get_character_by_name_in_world("Async Char", DEFAULT_WORLD_ID)
+        assert sessions_repo.create_session(
+            user_id, "async-session", character_id=int(character["id"]), world_id=DEFAULT_WORLD_ID
+        )
+        characters_repo.set_character_room("Async Char", "spawn", world_id=DEFAULT_WORLD_ID)
+        chat_repo.add_chat_message("Async Char", "hello", "spawn", world_id=DEFAULT_WORLD_ID)
+        chat_repo.add_chat_message("Async Char", "again", "spawn", world_id=DEFAULT_WORLD_ID)
+        yield {"user_id": user_id, "character_id": int(character["id"])}
+        await async_connection.close_async_connection_pool()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_session_and_user_lookups_match_sync(seeded_db):
+    assert await async_repo.get_session_by_id_async(
+        "async-session"
+    ) == sessions_repo.get_session_by_id("async-session")
+    assert await async_repo.get_session_by_id_async("missing") is None
+    assert await async_repo.get_session_context_async(
+        "async-session"
+    ) == sessions_repo.get_session_context("async-session")
+    assert await async_repo.get_username_by_id_async(seeded_db["user_id"]) == "asyncer"
+    assert await async_repo.get_user_role_async("asyncer") == users_repo.get_user_role("asyncer")
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_character_lookups_match_sync(seeded_db):
+    character_id = seeded_db["character_id"]
+    assert await async_repo.get_character_by_id_async(
+        character_id
+    ) == characters_repo.get_character_by_id(character_id)
+    assert await async_repo.get_character_name_by_id_async(character_id) == "Async Char"
+    assert (
+        await async_repo.get_character_room_async("Async Char", world_id=DEFAULT_WORLD_ID)
+        == "spawn"
+    )
+    assert await async_repo.get_characters_in_room_async(
+        "spawn", world_id=DEFAULT_WORLD_ID
+    ) == characters_repo.get_characters_in_room("spawn", world_id=DEFAULT_WORLD_ID)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_chat_round_trip_matches_sync(seeded_db):
+    assert await async_repo.add_chat_message_async(
+        "Async Char", "from async", "spawn", world_id=DEFAULT_WORLD_ID
+    )
+    assert not await async_repo.add_chat_message_async(
+        "Nobody", "ghost", "spawn", world_id=DEFAULT_WORLD_ID
+    )
+
+    async_messages = await async_repo.get_room_messages_async(
+        "spawn", character_name="Async Char", world_id=DEFAULT_WORLD_ID
+    )
+    sync_messages = chat_repo.get_room_messages(
+        "spawn", character_name="Async Char", world_id=DEFAULT_WORLD_ID
+    )
+    assert async_messages == sync_messages
+    assert [m["message"] for m in async_messages] == ["hello", "again", "from async"]
+
+    first_id = (
+        await async_repo.get_room_messages_since_async(
+            "spawn",
+            since_id=None,
+            limit=3,
+            character_name="Async Char",
+            world_id=DEFAULT_WORLD_ID,
+        )
+    )[0]["id"]
+    async_since = await async_repo.get_room_messages_since_async(
+        "spawn", since_id=first_id, character_name="Async Char", world_id=DEFAULT_WORLD_ID
+    )
+    assert async_since == chat_repo.get_room_messages_since(
+        "spawn", since_id=first_id, character_name="Async Char", world_id=DEFAULT_WORLD_ID
+    )
+    assert [m["message"] for m in async_since] == ["again", "from async"]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_session_writes_are_visible_to_sync_layer(seeded_db):
+    assert await async_repo.set_session_character_async(
+        "async-session", seeded_db["character_id"], world_id=DEFAULT_WORLD_ID
+    )
+    assert await async_repo.update_session_activity_async("async-session")
+    assert await async_repo.remove_session_by_id_async("async-session")
+    assert sessions_repo.get_session_by_id("async-session") is None
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_async_pool_reuses_connections(seeded_db):
+    for _ in range(3):
+        await async_repo.get_user_role_async("asyncer")
+
+    pool = await async_connection.get_async_connection_pool()
+    assert pool is not None
+    stats = pool.stats()
+    assert stats.created == 1
+    assert stats.reused == 2
+
+
+@pytest.mark.unit
+@pytest.mark.db
+async def test_async_errors_are_wrapped_with_sync_operation_ids(seeded_db):
+    with patch.object(async_connection, "open_async_connection", side_effect=OSError("disk gone")):
+        await async_connection.close_async_connection_pool()
+        with pytest.raises(DatabaseReadError) as exc_info:
+            await async_repo.get_session_by_id_async("async-session")
+
+    assert exc_info.value.context.operation == "sessions.get_session_by_id"
@@ -6,9 +6,10 @@ from unittest.mock import patch
 
 import pytest
 
+from mud_server.config import config
 from mud_server.db import chat_repo, database
 from mud_server.db import connection as db_connection
-from mud_server.db.connection import connection_scope
+from mud_server.db.connection import connection_scope, unit_of_work
 from mud_server.db.errors import DatabaseReadError, DatabaseWriteError
 
 
@@ -81,6 +82,208 @@ def test_get_room_messages_whisper_visibility(test_db, temp_db_path, db_with_use
     assert "Secret message" not in [row["message"] for row in super_rows]
 
 
+def test_get_room_messages_since_returns_only_newer_rows(test_db, temp_db_path, db_with_users):
+    """Cursor reads return ids above ``since_id`` oldest first, or the newest page."""
+    for text in ("one", "two", "three"):
+        assert chat_repo.add_chat_message(
+            "testplayer_char", text, "spawn", world_id="pipeworks_web"
+        )
+    assert chat_repo.add_chat_message(
+        "testplayer_char", "elsewhere", "forest", world_id="pipeworks_web"
+    )
+
+    latest = chat_repo.get_room_messages_since(
+        "spawn", since_id=None, limit=2, character_name="testplayer_char", world_id="pipeworks_web"
+    )
+    assert [row["message"] for row in latest] == ["two", "three"]
+    assert latest[0]["id"] < latest[1]["id"]
+    assert latest[0]["username"] == "testplayer_char"
+
+    newer = chat_repo.get_room_messages_since(
+        "spawn",
+        since_id=latest[0]["id"],
+        character_name="testplayer_char",
+        world_id="pipeworks_web",
+    )
+    assert [row["message"] for row in newer] == ["three"]
+
+    assert (
+        chat_repo.get_room_messages_since(
+            "spawn",
+            since_id=latest[1]["id"],
+            character_name="testplayer_char",
+            world_id="pipeworks_web",
+        )
+        == []
+    )
+
+
+def test_get_room_messages_since_hides_other_peoples_whispers(test_db, temp_db_path, db_with_users):
+    """Cursor reads apply the same whisper visibility as room history."""
+    assert chat_repo.add_chat_message(
+        "testplayer_char",
+        "Secret message",
+        "spawn",
+        recipient="testadmin_char",
+        world_id="pipeworks_web",
+    )
+
+    def visible_to(name: str) -> list[str]:
+        rows = chat_repo.get_room_messages_since(
+            "spawn", since_id=0, character_name=name, world_id="pipeworks_web"
+        )
+        return [row["message"] for row in rows]
+
+    assert visible_to("testadmin_char") == ["Secret message"]
+    assert visible_to("testsuperuser_char") == []
+    assert visible_to("ghost") == []
+
+
+def _insert_behind_buffer(character_name: str, message: str, room: str) -> None:
+    """Write a chat row with raw SQL so the room buffer does not see it."""
+    with connection_scope(write=True) as conn:
+        conn.execute(
+            """
+            INSERT INTO chat_messages (character_id, message, world_id, room)
+            SELECT id, ?, world_id, ? FROM characters WHERE name = ? AND world_id = ?
+            """,
+            (message, room, character_name, "pipeworks_web"),
+        )
+
+
+def _room_text(room: str = "spawn", *, limit: int = 50) -> list[str]:
+    rows = chat_repo.get_room_messages(
+        room, limit=limit, character_name="testplayer_char", world_id="pipeworks_web"
+    )
+    return [row["message"] for row in rows]
+
+
+def test_room_buffer_serves_reads_and_takes_writes_through(test_db, temp_db_path, db_with_users):
+    """After the first read, room history comes from memory plus written-through rows."""
+    assert chat_repo.add_chat_message("testplayer_char", "one", "spawn", world_id="pipeworks_web")
+    assert _room_text() == ["one"]
+
+    _insert_behind_buffer("testplayer_char", "unbuffered", "spawn")
+    assert chat_repo.add_chat_message("testplayer_char", "two", "spawn", world_id="pipeworks_web")
+
+    assert _room_text() == ["one", "two"]
+    newest = chat_repo.get_room_messages_since(
+        "spawn", since_id=None, limit=1, character_name="testplayer_char", world_id="pipeworks_web"
+    )
+    assert newest[0]["message"] == "two"
+    assert newest[0]["timestamp"] is not None
+
+    chat_repo.clear_room_chat_buffers()
+    assert _room_text() == ["one", "unbuffered", "two"]
+
+
+def test_update_chat_messages_rewrites_stored_and_buffered_text(
+    test_db, temp_db_path, db_with_users
+):
+    """Deferred translation rewrites rows in place, keeping their ids."""
+    message_id = chat_repo.insert_chat_message(
+        "testplayer_char", "hello", "spawn", world_id="pipeworks_web"
+    )
+    rows = chat_repo.insert_chat_messages(
+        "testplayer_char", "[YELL] hey", ["spawn", "forest"], world_id="pipeworks_web"
+    )
+    assert message_id is not None and list(rows) == ["spawn", "forest"]
+    assert _room_text() == ["hello", "[YELL] hey"]
+
+    yell_ids = list(rows.values())
+    assert chat_repo.update_chat_messages([message_id], "Well met.", world_id="pipeworks_web") == 1
+    assert chat_repo.update_chat_messages(yell_ids, "[YELL] Hark!", world_id="other") == 0
+    assert chat_repo.update_chat_messages(yell_ids, "[YELL] Hark!", world_id="pipeworks_web") == 2
+
+    assert _room_text() == ["Well met.", "[YELL] Hark!"]
+    assert _room_text("forest") == ["[YELL] Hark!"]
+    newest = chat_repo.get_room_messages_since(
+        "spawn", since_id=0, character_name="testplayer_char", world_id="pipeworks_web"
+    )
+    assert [row["id"] for row in newest] == [message_id, rows["spawn"]]
+    chat_repo.clear_room_chat_buffers()
+    assert _room_text() == ["Well met.", "[YELL] Hark!"]
+
+
+def test_insert_chat_message_returns_none_for_unknown_sender(test_db, temp_db_path, db_with_users):
+    assert chat_repo.insert_chat_message("ghost", "boo", "spawn", world_id="pipeworks_web") is None
+    assert chat_repo.insert_chat_messages("ghost", "boo", ["spawn"], world_id="pipeworks_web") == {}
+
+
+def test_room_buffer_falls_back_to_sqlite_past_its_window(
+    test_db, temp_db_path, db_with_users, monkeypatch
+):
+    """Reads reaching older than the buffered window are answered by SQLite."""
+    monkeypatch.setattr(config.chat, "room_buffer_size", 2)
+    for text in ("m1", "m2", "m3", "m4"):
+        assert chat_repo.add_chat_message(
+            "testplayer_char", text, "spawn", world_id="pipeworks_web"
+        )
+
+    assert _room_text(limit=2) == ["m3", "m4"]
+    assert _room_text(limit=10) == ["m1", "m2", "m3", "m4"]
+    since = chat_repo.get_room_messages_since(
+        "spawn", since_id=0, character_name="testplayer_char", world_id="pipeworks_web"
+    )
+    assert [row["message"] for row in since] == ["m1", "m2", "m3", "m4"]
+
+
+def test_room_buffer_ignores_rolled_back_writes_and_prunes(test_db, temp_db_path, db_with_users):
+    """Only committed rows reach the buffer, and pruning reloads it."""
+    assert chat_repo.add_chat_message("testplayer_char", "kept", "spawn", world_id="pipeworks_web")
+    assert _room_text() == ["kept"]
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            chat_repo.add_chat_message(
+                "testplayer_char", "rolled back", "spawn", world_id="pipeworks_web"
+            )
+            raise RuntimeError("boom")
+    assert _room_text() == ["kept"]
+
+    _age_all_messages(48)
+    assert chat_repo.prune_chat_messages(24, world_id="pipeworks_web", room="spawn") == 1
+    assert _room_text() == []
+
+
+def test_add_chat_messages_writes_each_room_once(test_db, temp_db_path, db_with_users):
+    """Bulk fan-out writes one row per distinct room and updates loaded buffers."""
+    assert _room_text("forest") == []
+
+    reached = chat_repo.add_chat_messages(
+        "testplayer_char",
+        "[YELL] hi",
+        ["spawn", "forest", "spawn", "desert"],
+        world_id="pipeworks_web",
+    )
+
+    assert reached == ["spawn", "forest", "desert"]
+    for room in reached:
+        assert _room_text(room) == ["[YELL] hi"]
+    chat_repo.clear_room_chat_buffers()
+    assert _room_text("forest") == ["[YELL] hi"]
+    assert chat_repo.add_chat_messages("ghost", "boo", ["spawn"], world_id="pipeworks_web") == []
+
+
+def test_add_chat_messages_reports_rooms_that_failed(test_db, temp_db_path, db_with_users):
+    """A failing row is retried alone so the remaining rooms are still written."""
+    with connection_scope(write=True) as conn:
+        conn.execute("""
+            CREATE TRIGGER reject_cellar BEFORE INSERT ON chat_messages
+            WHEN NEW.room = 'cellar'
+            BEGIN SELECT RAISE(ABORT, 'no chat in the cellar'); END
+            """)
+
+    reached = chat_repo.add_chat_messages(
+        "testplayer_char", "[YELL] hi", ["spawn", "cellar", "forest"], world_id="pipeworks_web"
+    )
+
+    assert reached == ["spawn", "forest"]
+    assert _room_text("spawn") == ["[YELL] hi"]
+    assert _room_text("cellar") == []
+    assert _room_text("forest") == ["[YELL] hi"]
+
+
 def test_add_chat_message_missing_sender_returns_false(test_db, temp_db_path):
     """Unknown sender identities should not create chat rows."""
     assert (
@@ -0,0 +1,142 @@
+"""Tests for pooled SQLite connections behind ``connection_scope``."""
+
+from __future__ import annotations
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from mud_server.config import config, use_test_database
+from mud_server.db import connection as db_connection
+
+
+@pytest.fixture
+def pooled_db(tmp_path, monkeypatch):
+    """Point the DB layer at a scratch database with a small pool."""
+    monkeypatch.setattr(config.database, "pool_size", 2)
+    monkeypatch.setattr(config.database, "pool_health_check", True)
+    db_connection.close_connection_pool()
+    with use_test_database(tmp_path / "pool.db") as db_path:
+        with db_connection.connection_scope(write=True) as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        yield db_path
+    db_connection.close_connection_pool()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_connection_scope_reuses_pooled_connection(pooled_db):
+    """Sequential scopes should receive the same configured connection."""
+    with db_connection.connection_scope() as first:
+        first_id = id(first)
+    with db_connection.connection_scope() as second:
+        assert id(second) == first_id
+        assert second.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    pool = db_connection.get_connection_pool()
+    assert pool is not None
+    stats = pool.stats()
+    assert stats.created == 1
+    assert stats.reused >= 2
+    assert stats.idle == 1
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_read_scope_discards_uncommitted_work_on_release(pooled_db):
+    """Uncommitted writes in a read scope must not leak into the next checkout."""
+    with db_connection.connection_scope() as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('ghost')")
+
+    with db_connection.connection_scope() as conn:
+        assert conn.in_transaction is False
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_write_scope_rolls_back_on_error(pooled_db):
+    """Write scopes keep rollback-on-exception semantics with pooled handles."""
+    with pytest.raises(RuntimeError):
+        with db_connection.connection_scope(write=True) as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('doomed')")
+            raise RuntimeError("boom")
+
+    with db_connection.connection_scope(write=True) as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('kept')")
+
+    with db_connection.connection_scope() as conn:
+        rows = conn.execute("SELECT name FROM items").fetchall()
+    assert rows == [("kept",)]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_pool_replaces_connections_that_fail_health_check(pooled_db):
+    """A closed idle connection should be discarded and replaced on checkout."""
+    with db_connection.connection_scope() as conn:
+        broken = conn
+    broken.close()
+
+    with db_connection.connection_scope() as conn:
+        assert conn is not broken
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+
+    pool = db_connection.get_connection_pool()
+    assert pool is not None
+    assert pool.stats().discarded == 1
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_pool_bounds_idle_connections(pooled_db):
+    """Nested checkouts never block; surplus connections close on release."""
+    with db_connection.connection_scope() as a:
+        with db_connection.connection_scope() as b:
+            with db_connection.connection_scope() as c:
+                assert len({id(a), id(b), id(c)}) == 3
+
+    pool = db_connection.get_connection_pool()
+    assert pool is not None
+    assert pool.stats().idle == 2
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_pool_is_replaced_when_database_path_changes(pooled_db, tmp_path):
+    """Swapping the configured database must not hand out stale connections."""
+    first_pool = db_connection.get_connection_pool()
+    with use_test_database(tmp_path / "other.db"):
+        second_pool = db_connection.get_connection_pool()
+        assert second_pool is not first_pool
+        with db_connection.connection_scope() as conn:
+            tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        assert tables == []
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_patched_factory_bypasses_idle_connections(pooled_db):
+    """Patching ``get_connection`` should take effect even with a warm pool."""
+    with db_connection.connection_scope():
+        pass
+
+    with patch.object(db_connection, "get_connection", side_effect=sqlite3.Error("boom")):
+        with pytest.raises(sqlite3.Error):
+            with db_connection.connection_scope():
+                pass
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_pool_size_zero_disables_pooling(pooled_db, monkeypatch):
+    """``pool_size = 0`` restores one fresh connection per scope."""
+    monkeypatch.setattr(config.database, "pool_size", 0)
+
+    with db_connection.connection_scope() as first:
+        pass
+    with db_connection.connection_scope() as second:
+        assert second is not first
+
+    assert db_connection.get_connection_pool() is None
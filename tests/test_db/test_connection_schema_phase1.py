@@ -6,6 +6,7 @@ These tests validate the extracted schema/connection behaviors introduced by the
 - world-scoped character uniqueness
 - boolean-like CHECK constraints
 - hot-path index creation
+- generated session epoch columns on legacy tables
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ import pytest
 
 from mud_server.db import connection as db_connection
 from mud_server.db import database
+from mud_server.db.schema import ensure_session_epoch_columns
 
 
 @pytest.mark.unit
@@ -102,6 +104,8 @@ def test_phase1_hot_path_indexes_exist(temp_db_path):
     assert "idx_sessions_user_id" in sessions_indexes
     assert "idx_sessions_character_id" in sessions_indexes
     assert "idx_sessions_world_id" in sessions_indexes
+    assert "idx_sessions_expires_epoch" in sessions_indexes
+    assert "idx_sessions_activity_epoch" in sessions_indexes
     assert "idx_characters_user_world" in characters_indexes
     assert "idx_characters_user_world_created_at" in characters_indexes
     assert "idx_chat_messages_world_room_timestamp" in chat_indexes
@@ -130,3 +134,43 @@ def test_schema_does_not_install_legacy_global_character_slot_triggers(temp_db_p
 
     assert "enforce_character_limit_insert" not in trigger_names
     assert "enforce_character_limit_update" not in trigger_names
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_legacy_sessions_table_gains_generated_epoch_columns(temp_db_path):
+    """Legacy session tables should gain epoch columns that mirror the timestamps."""
+    conn = sqlite3.connect(str(temp_db_path))
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT UNIQUE NOT NULL,
+            last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            expires_at TIMESTAMP
+        )
+    """)
+    cursor.executemany(
+        "INSERT INTO sessions (session_id, last_activity, expires_at) VALUES (?, ?, ?)",
+        [
+            ("dated", "2026-01-01 00:00:00", "2026-01-01 01:00:00"),
+            ("unbounded", "2026-01-01 00:00:00", None),
+            ("garbled", "2026-01-01 00:00:00", "not-a-timestamp"),
+        ],
+    )
+
+    ensure_session_epoch_columns(cursor)
+    ensure_session_epoch_columns(cursor)
+    conn.commit()
+
+    rows = {
+        row[0]: (row[1], row[2])
+        for row in cursor.execute(
+            "SELECT session_id, last_activity_epoch, expires_at_epoch FROM sessions"
+        )
+    }
+    conn.close()
+
+    assert rows["dated"] == (1767225600, 1767229200)
+    assert rows["unbounded"][1] == 9223372036854775807
+    assert rows["garbled"][1] is None
@@ -0,0 +1,147 @@
+"""Tests for the in-memory room presence index (``mud_server.db.presence``)."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mud_server.db import characters_repo, database, sessions_repo
+from mud_server.db.connection import connection_scope, unit_of_work
+from mud_server.db.presence import RoomPresenceIndex
+
+WORLD = database.DEFAULT_WORLD_ID
+
+
+def _go_online(username: str, session_id: str) -> None:
+    """Create an in-world session for the user's first character."""
+    user_id = database.get_user_id(username)
+    assert user_id is not None
+    character = database.get_user_characters(user_id, world_id=WORLD)[0]
+    assert database.create_session(
+        user_id, session_id, character_id=int(character["id"]), world_id=WORLD
+    )
+
+
+def _no_reload():
+    """Fail the test if presence is re-read from SQLite."""
+    return patch.object(
+        characters_repo,
+        "_read_world_presence",
+        side_effect=AssertionError("presence reloaded from SQLite"),
+    )
+
+
+def test_presence_is_served_from_memory_and_follows_moves(test_db, temp_db_path, db_with_users):
+    """After one load, moves update the index without touching SQLite."""
+    _go_online("testplayer", "s-player")
+    _go_online("testadmin", "s-admin")
+    database.set_character_room("testadmin_char", "forest", world_id=WORLD)
+
+    assert database.get_characters_in_room("spawn", world_id=WORLD) == ["testplayer_char"]
+
+    with _no_reload():
+        database.set_character_room("testplayer_char", "forest", world_id=WORLD)
+        assert database.get_characters_in_room("spawn", world_id=WORLD) == []
+        assert sorted(database.get_characters_in_room("forest", world_id=WORLD)) == [
+            "testadmin_char",
+            "testplayer_char",
+        ]
+
+
+def test_presence_tracks_session_changes_and_sweeps(test_db, temp_db_path, db_with_users):
+    """Login, logout and expiry sweeps are reflected in presence queries."""
+    assert database.get_characters_in_room("spawn", world_id=WORLD) == []
+    assert not database.is_character_active("testplayer_char", world_id=WORLD)
+
+    _go_online("testplayer", "s-player")
+    _go_online("testadmin", "s-admin")
+    assert database.is_character_active("testplayer_char", world_id=WORLD)
+    assert sorted(database.get_active_characters(world_id=WORLD)) == [
+        "testadmin_char",
+        "testplayer_char",
+    ]
+
+    assert database.remove_session_by_id("s-player")
+    assert database.get_characters_in_room("spawn", world_id=WORLD) == ["testadmin_char"]
+    assert not database.is_character_active("testplayer_char", world_id=WORLD)
+
+    with connection_scope(write=True) as conn:
+        conn.execute(
+            "UPDATE sessions SET expires_at = datetime('now', '-1 minutes') WHERE session_id = ?",
+            ("s-admin",),
+        )
+    assert database.cleanup_expired_sessions() == 1
+    assert database.get_active_characters(world_id=WORLD) == []
+
+
+def test_presence_reloads_when_a_cached_session_expires(test_db, temp_db_path, db_with_users):
+    """An occupant past its cached expiry sends the query back to SQLite."""
+    _go_online("testplayer", "s-player")
+    assert database.get_characters_in_room("spawn", world_id=WORLD) == ["testplayer_char"]
+
+    with connection_scope(write=True) as conn:
+        conn.execute(
+            "UPDATE sessions SET expires_at = datetime('now', '-1 minutes') WHERE session_id = ?",
+            ("s-player",),
+        )
+    with patch("mud_server.db.presence.time.time", return_value=time.time() + 10 * 86400):
+        assert database.get_characters_in_room("spawn", world_id=WORLD) == []
+    assert not database.is_character_active("testplayer_char", world_id=WORLD)
+
+
+def test_presence_ignores_rolled_back_moves(test_db, temp_db_path, db_with_users):
+    """Only committed room changes reach the index."""
+    _go_online("testplayer", "s-player")
+    assert database.get_characters_in_room("spawn", world_id=WORLD) == ["testplayer_char"]
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            database.set_character_room("testplayer_char", "forest", world_id=WORLD)
+            raise RuntimeError("abort")
+
+    with _no_reload():
+        assert database.get_characters_in_room("spawn", world_id=WORLD) == ["testplayer_char"]
+        assert database.get_characters_in_room("forest", world_id=WORLD) == []
+
+
+def test_presence_load_racing_a_move_is_not_installed(test_db, temp_db_path):
+    """A load that started before a move answers its caller but is not kept."""
+    index = RoomPresenceIndex()
+    far_future = int(time.time()) + 3600
+
+    token = index.begin_load(WORLD)
+    index.move(WORLD, "Mira", "forest")
+    index.finish_load(WORLD, [("Mira", "spawn", far_future)], token)
+    assert index.characters_in_room(WORLD, "spawn") is None
+
+    index.finish_load(WORLD, [("Mira", "spawn", far_future)], index.begin_load(WORLD))
+    assert index.characters_in_room(WORLD, "spawn") == ["Mira"]
+    assert index.is_active(WORLD, "Kael") is False
+
+    index.clear()
+    assert index.active_characters(WORLD) is None
+
+
+def test_presence_queries_raise_typed_errors_on_load_failure(test_db, temp_db_path):
+    """SQLite failures while loading surface as typed read errors."""
+    from mud_server.db.errors import DatabaseReadError
+
+    with patch.object(sessions_repo, "_read_world_presence", side_effect=Exception("db boom")):
+        with pytest.raises(DatabaseReadError):
+            sessions_repo.get_active_characters(world_id=WORLD)
+        with pytest.raises(DatabaseReadError):
+            sessions_repo.is_character_active("ghost", world_id=WORLD)
+
+
+def test_occupied_rooms_follow_presence(test_db, temp_db_path, db_with_users):
+    """Occupied rooms come from the presence index and follow moves."""
+    assert database.get_occupied_rooms(world_id=WORLD) == set()
+
+    _go_online("testplayer", "s-player")
+    assert database.get_occupied_rooms(world_id=WORLD) == {"spawn"}
+
+    with _no_reload():
+        database.set_character_room("testplayer_char", "forest", world_id=WORLD)
+        assert database.get_occupied_rooms(world_id=WORLD) == {"forest"}
@@ -139,3 +139,46 @@ def test_hot_path_world_admin_count_uses_sessions_world_activity_index(test_db,
         conn.close()
 
         assert any("idx_sessions_world_activity" in detail for detail in details)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.parametrize(
+    ("sql", "params"),
+    [
+        pytest.param(
+            "SELECT COUNT(*) FROM sessions "
+            "WHERE expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER) "
+            "AND last_activity_epoch >= CAST(strftime('%s', 'now', ?) AS INTEGER)",
+            ("-30 minutes",),
+            id="active_session_count",
+        ),
+        pytest.param(
+            "DELETE FROM sessions "
+            "WHERE expires_at_epoch <= CAST(strftime('%s', 'now') AS INTEGER)",
+            (),
+            id="cleanup_expired_sessions",
+        ),
+        pytest.param(
+            "SELECT DISTINCT c.name FROM sessions s "
+            "JOIN characters c ON c.id = s.character_id "
+            "WHERE s.character_id IS NOT NULL AND s.world_id = ? "
+            "AND s.expires_at_epoch > CAST(strftime('%s', 'now') AS INTEGER)",
+            (database.DEFAULT_WORLD_ID,),
+            id="active_characters",
+        ),
+    ],
+)
+def test_hot_path_session_liveness_filters_search_epoch_indexes(test_db, temp_db_path, sql, params):
+    """Session expiry/activity filters must search an index, never scan ``sessions``."""
+    with use_test_database(temp_db_path):
+        _seed_world_scoped_activity()
+        conn = database.get_connection()
+        cursor = conn.cursor()
+        details = _query_plan_details(cursor, sql, params)
+        conn.close()
+
+        session_steps = [detail for detail in details if detail.startswith(("SCAN s", "SEARCH s"))]
+        assert session_steps
+        assert all("_epoch" in detail for detail in session_steps)
+        assert not any(detail.startswith(("SCAN s ", "SCAN sessions")) for detail in details)
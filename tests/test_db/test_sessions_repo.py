@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from mud_server.config import use_test_database
+from mud_server.config import config, use_test_database
 from mud_server.db import connection as db_connection
 from mud_server.db import database, sessions_repo
 from mud_server.db.errors import (
@@ -35,6 +35,9 @@ def test_sessions_repo_read_paths_raise_typed_errors_on_connection_failure():
         with pytest.raises(DatabaseReadError):
             sessions_repo.get_session_by_id("session-x")
 
+        with pytest.raises(DatabaseReadError):
+            sessions_repo.get_session_context("session-x")
+
         with pytest.raises(DatabaseReadError):
             sessions_repo.get_active_characters(world_id="pipeworks_web")
 
@@ -63,6 +66,37 @@ def test_sessions_repo_handles_expected_false_contracts_without_db_errors(
         assert sessions_repo.remove_sessions_for_character(999999) is False
 
 
+def test_get_session_context_joins_user_and_selected_character(
+    test_db, temp_db_path, db_with_users
+):
+    """Session context should carry user, role and character in one lookup."""
+    with use_test_database(temp_db_path):
+        assert sessions_repo.create_session("testplayer", "context-session") is True
+
+        account_only = sessions_repo.get_session_context("context-session")
+        assert account_only is not None
+        assert account_only["username"] == "testplayer"
+        assert account_only["role"] == "player"
+        assert account_only["character_id"] is None
+        assert account_only["character_name"] is None
+        assert account_only["character_world_id"] is None
+
+        character = database.get_character_by_name("testplayer_char")
+        assert character is not None
+        assert sessions_repo.set_session_character(
+            "context-session", int(character["id"]), world_id=character["world_id"]
+        )
+
+        bound = sessions_repo.get_session_context("context-session")
+        assert bound is not None
+        assert bound["character_name"] == "testplayer_char"
+        assert bound["character_world_id"] == character["world_id"]
+        session = sessions_repo.get_session_by_id("context-session")
+        assert session is not None
+        assert {key: bound[key] for key in session} == session
+        assert sessions_repo.get_session_context("missing-session") is None
+
+
 def test_sessions_repo_internal_error_helpers_re_raise_database_errors():
     """Internal helper guards should preserve pre-typed DatabaseError instances."""
     read_exc = DatabaseReadError(context=DatabaseOperationContext(operation="sessions.read"))
@@ -74,3 +108,110 @@ def test_sessions_repo_internal_error_helpers_re_raise_database_errors():
     with pytest.raises(DatabaseWriteError) as write_info:
         sessions_repo._raise_write_error("sessions.write", write_exc)
     assert write_info.value is write_exc
+
+
+def _stored_activity(session_id: str) -> tuple[str, str]:
+    """Read ``(last_activity, expires_at)`` straight from SQLite, bypassing the buffer."""
+    conn = database.get_connection()
+    try:
+        row = conn.execute(
+            "SELECT last_activity, expires_at FROM sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0], row[1]
+
+
+@pytest.fixture
+def activity_write_behind():
+    """Enable write-behind activity with sliding expiry; restore config afterwards."""
+    original = (
+        config.session.activity_flush_seconds,
+        config.session.sliding_expiration,
+        config.session.ttl_minutes,
+    )
+    config.session.activity_flush_seconds = 5
+    config.session.sliding_expiration = True
+    config.session.ttl_minutes = 480
+
+    yield
+
+    (
+        config.session.activity_flush_seconds,
+        config.session.sliding_expiration,
+        config.session.ttl_minutes,
+    ) = original
+
+
+def test_record_session_activity_buffers_until_flush(
+    test_db, temp_db_path, db_with_users, activity_write_behind
+):
+    """Buffered activity is visible to reads immediately and written on flush."""
+    with use_test_database(temp_db_path):
+        assert sessions_repo.create_session("testplayer", "buffered-session") is True
+        stored_before = _stored_activity("buffered-session")
+
+        assert sessions_repo.record_session_activity("buffered-session") is True
+        assert sessions_repo.record_session_activity("buffered-session") is True
+
+        assert _stored_activity("buffered-session") == stored_before
+        assert sessions_repo.get_pending_session_activity_count() == 1
+        pending_view = sessions_repo.get_session_context("buffered-session")
+        assert pending_view is not None
+        assert pending_view["expires_at"] >= stored_before[1]
+
+        assert sessions_repo.flush_session_activity() == 1
+        assert sessions_repo.get_pending_session_activity_count() == 0
+        assert _stored_activity("buffered-session") == (
+            pending_view["last_activity"],
+            pending_view["expires_at"],
+        )
+        assert sessions_repo.flush_session_activity() == 0
+
+
+def test_record_session_activity_write_through_when_disabled(
+    test_db, temp_db_path, db_with_users, activity_write_behind
+):
+    """A zero flush interval asks callers to write activity immediately."""
+    config.session.activity_flush_seconds = 0
+    with use_test_database(temp_db_path):
+        assert sessions_repo.record_session_activity("any-session") is False
+        assert sessions_repo.get_pending_session_activity_count() == 0
+
+
+def test_cleanup_expired_sessions_keeps_sessions_extended_in_buffer(
+    test_db, temp_db_path, db_with_users, activity_write_behind
+):
+    """Sliding expiry recorded inside the flush window must survive the sweeper."""
+    with use_test_database(temp_db_path):
+        assert sessions_repo.create_session("testplayer", "sliding-session") is True
+        conn = database.get_connection()
+        conn.execute(
+            "UPDATE sessions SET expires_at = datetime('now', '-1 minutes') "
+            "WHERE session_id = ?",
+            ("sliding-session",),
+        )
+        conn.commit()
+        conn.close()
+
+        sessions_repo.record_session_activity("sliding-session")
+
+        assert sessions_repo.cleanup_expired_sessions() == 0
+        assert sessions_repo.get_session_by_id("sliding-session") is not None
+
+
+def test_flush_session_activity_requeues_on_failure(
+    test_db, temp_db_path, db_with_users, activity_write_behind
+):
+    """A failed flush keeps the batch for the next attempt."""
+    with use_test_database(temp_db_path):
+        assert sessions_repo.create_session("testplayer", "retry-session") is True
+        sessions_repo.record_session_activity("retry-session")
+
+        with patch.object(db_connection, "get_connection_pool", side_effect=Exception("boom")):
+            with pytest.raises(DatabaseWriteError):
+                sessions_repo.flush_session_activity()
+
+        assert sessions_repo.get_pending_session_activity_count() == 1
+        assert sessions_repo.flush_session_activity() == 1
@@ -0,0 +1,97 @@
+"""Tests for the configurable SQLite durability/concurrency profile."""
+
+from __future__ import annotations
+
+import pytest
+
+from mud_server.config import config, use_test_database
+from mud_server.db import connection as db_connection
+from mud_server.db import schema
+
+
+@pytest.fixture
+def profile_db(tmp_path, monkeypatch):
+    """Scratch database with pooling disabled so each call sees fresh pragmas."""
+    monkeypatch.setattr(config.database, "pool_size", 0)
+    with use_test_database(tmp_path / "profile.db") as db_path:
+        yield db_path
+    db_connection.close_connection_pool()
+
+
+@pytest.mark.unit
+def test_resolve_profile_applies_overrides(monkeypatch):
+    """Per-pragma settings should override the selected preset only where set."""
+    monkeypatch.setattr(config.database, "profile", "throughput")
+    monkeypatch.setattr(config.database, "synchronous", "full")
+
+    profile = db_connection.resolve_sqlite_profile()
+
+    assert profile.synchronous == "full"
+    assert profile.journal_mode == "wal"
+    assert profile.temp_store == db_connection.SQLITE_PROFILES["throughput"].temp_store
+    assert profile.cache_size == db_connection.SQLITE_PROFILES["throughput"].cache_size
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.parametrize("profile_name", ["durable", "throughput"])
+def test_init_database_applies_and_verifies_profile(profile_db, monkeypatch, profile_name):
+    """After bootstrap, a fresh connection should run every preset pragma."""
+    monkeypatch.setattr(config.database, "profile", profile_name)
+    schema.init_database(skip_superuser=True)
+
+    profile = db_connection.resolve_sqlite_profile()
+    conn = db_connection.get_connection()
+    try:
+        mismatches = db_connection.verify_sqlite_profile(conn.cursor(), profile)
+    finally:
+        conn.close()
+
+    # Some builds cap mmap below the preset; everything else must match exactly.
+    mismatches.pop("mmap_size", None)
+    assert mismatches == {}
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_journal_mode_override_is_honoured(profile_db, monkeypatch):
+    """A ``journal_mode`` override should win over the WAL presets."""
+    monkeypatch.setattr(config.database, "journal_mode", "delete")
+    schema.init_database(skip_superuser=True)
+
+    conn = db_connection.get_connection()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    finally:
+        conn.close()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_checkpoint_wal_reports_frames(profile_db):
+    """A checkpoint in WAL mode should copy committed frames back to the file."""
+    schema.init_database(skip_superuser=True)
+    # Hold a handle open: SQLite checkpoints and removes the WAL when the last
+    # connection closes, which would leave nothing for the explicit call.
+    holder = db_connection.get_connection()
+    try:
+        with db_connection.connection_scope(write=True) as conn:
+            conn.execute("CREATE TABLE scratch (id INTEGER PRIMARY KEY)")
+            conn.executemany("INSERT INTO scratch (id) VALUES (?)", [(i,) for i in range(50)])
+
+        result = db_connection.checkpoint_wal("PASSIVE")
+
+        assert result.busy is False
+        assert result.log_frames > 0
+        assert result.checkpointed_frames == result.log_frames
+
+        truncated = db_connection.checkpoint_wal("TRUNCATE")
+        assert truncated.log_frames == 0
+    finally:
+        holder.close()
+
+
+@pytest.mark.unit
+def test_checkpoint_wal_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        db_connection.checkpoint_wal("EVERYTHING")
@@ -0,0 +1,149 @@
+"""Tests for the request-scoped unit of work in ``mud_server.db.connection``."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from mud_server.config import config, use_test_database
+from mud_server.db import connection as db_connection
+
+
+@pytest.fixture
+def uow_db(tmp_path, monkeypatch):
+    """Scratch database with an ``items`` table and a small connection pool."""
+    monkeypatch.setattr(config.database, "pool_size", 2)
+    db_connection.close_connection_pool()
+    with use_test_database(tmp_path / "uow.db") as db_path:
+        with db_connection.connection_scope(write=True) as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        yield db_path
+    db_connection.close_connection_pool()
+
+
+def _committed_names(db_path) -> list[str]:
+    """Read item names through an independent connection (committed data only)."""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return [row[0] for row in conn.execute("SELECT name FROM items ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def _insert(name: str) -> None:
+    with db_connection.connection_scope(write=True) as conn:
+        conn.execute("INSERT INTO items (name) VALUES (?)", (name,))
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_scopes_share_one_connection_and_commit_at_exit(uow_db):
+    """Repository scopes inside a unit of work join one connection and defer commit."""
+    seen: set[int] = set()
+    with db_connection.unit_of_work():
+        for name in ("a", "b"):
+            with db_connection.connection_scope(write=True) as conn:
+                seen.add(id(conn))
+                conn.execute("INSERT INTO items (name) VALUES (?)", (name,))
+        with db_connection.connection_scope() as conn:
+            seen.add(id(conn))
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+        assert _committed_names(uow_db) == []
+
+    assert len(seen) == 1
+    assert _committed_names(uow_db) == ["a", "b"]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_exception_rolls_back_whole_unit(uow_db):
+    with pytest.raises(RuntimeError):
+        with db_connection.unit_of_work():
+            _insert("a")
+            raise RuntimeError("boom")
+
+    assert _committed_names(uow_db) == []
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_failed_write_scope_only_rolls_back_its_savepoint(uow_db):
+    """A repository that swallows its own failure must not undo earlier writes."""
+    with db_connection.unit_of_work():
+        _insert("kept")
+        with pytest.raises(sqlite3.IntegrityError):
+            with db_connection.connection_scope(write=True) as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('doomed')")
+                conn.execute("INSERT INTO items (name) VALUES (NULL)")
+        _insert("after")
+
+    assert _committed_names(uow_db) == ["kept", "after"]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_nested_unit_joins_outer_and_commit_flushes_early(uow_db):
+    with db_connection.unit_of_work() as outer:
+        with db_connection.unit_of_work() as inner:
+            assert inner is outer
+            _insert("a")
+        assert _committed_names(uow_db) == []
+
+        db_connection.commit_unit_of_work()
+        assert _committed_names(uow_db) == ["a"]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_after_commit_callbacks_wait_for_commit_and_drop_on_rollback(uow_db):
+    ran: list[str] = []
+
+    db_connection.run_after_commit(lambda: ran.append("standalone"))
+    assert ran == ["standalone"]
+
+    with db_connection.unit_of_work():
+        _insert("a")
+        db_connection.run_after_commit(lambda: ran.append("early"))
+        assert ran == ["standalone"]
+        db_connection.commit_unit_of_work()
+        assert ran == ["standalone", "early"]
+        _insert("b")
+        db_connection.run_after_commit(lambda: ran.append("final"))
+    assert ran == ["standalone", "early", "final"]
+
+    with pytest.raises(RuntimeError):
+        with db_connection.unit_of_work():
+            _insert("c")
+            db_connection.run_after_commit(lambda: ran.append("rolled back"))
+            raise RuntimeError("boom")
+    assert ran == ["standalone", "early", "final"]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_immediate_unit_holds_write_lock_from_first_read(uow_db):
+    """``immediate=True`` must block other writers before the unit writes anything."""
+    with db_connection.unit_of_work(immediate=True):
+        with db_connection.connection_scope() as conn:
+            conn.execute("SELECT COUNT(*) FROM items").fetchone()
+            assert conn.in_transaction is True
+
+        other = sqlite3.connect(str(uow_db), timeout=0)
+        try:
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("INSERT INTO items (name) VALUES ('racer')")
+        finally:
+            other.close()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_unit_without_db_work_never_checks_out_a_connection(uow_db):
+    with db_connection.unit_of_work() as unit:
+        pass
+    assert unit.connection is None
+
+    pool = db_connection.get_connection_pool()
+    assert pool is not None
+    assert pool.stats().reused == 0
@@ -0,0 +1,98 @@
+"""Unit tests for the deterministic translation result cache."""
+
+from mud_server.translation.cache import TranslationCache, cache_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _key(seed: int = 1, **overrides) -> str:
+    fields = {
+        "system_prompt": "Translate: hello",
+        "ooc_message": "hello",
+        "model": "gemma2:2b",
+        "temperature": 0.0,
+        "seed": seed,
+        **overrides,
+    }
+    return cache_key(**fields)
+
+
+class TestCacheKey:
+    def test_stable_for_same_inputs(self):
+        assert _key() == _key()
+
+    def test_changes_with_each_input(self):
+        base = _key()
+        assert _key(seed=2) != base
+        assert _key(model="llama3.2") != base
+        assert _key(temperature=0.7) != base
+        assert _key(system_prompt="Translate: hi") != base
+        assert _key(ooc_message="hi") != base
+
+
+class TestTranslationCache:
+    def test_miss_then_hit(self):
+        cache = TranslationCache(max_entries=4, ttl_seconds=0)
+        assert cache.get("k") is None
+        cache.put("k", "Well met.")
+        assert cache.get("k") == "Well met."
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        cache = TranslationCache(max_entries=2, ttl_seconds=0)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"  # "b" is now least recently used
+        cache.put("c", "C")
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert cache.stats().evictions == 1
+
+    def test_ttl_expiry(self):
+        clock = _Clock()
+        cache = TranslationCache(max_entries=4, ttl_seconds=60, clock=clock)
+        cache.put("k", "Well met.")
+        clock.now += 59
+        assert cache.get("k") == "Well met."
+        clock.now += 2
+        assert cache.get("k") is None
+        assert cache.stats().entries == 0
+
+    def test_disk_persistence_across_instances(self, tmp_path):
+        path = tmp_path / "cache" / "translations.db"
+        first = TranslationCache(max_entries=4, ttl_seconds=0, path=path)
+        first.put("k", "Well met.")
+        first.close()
+
+        second = TranslationCache(max_entries=4, ttl_seconds=0, path=path)
+        assert second.get("k") == "Well met."
+        assert second.stats().hits == 1
+        second.close()
+
+    def test_disk_entries_expire(self, tmp_path):
+        clock = _Clock()
+        path = tmp_path / "translations.db"
+        first = TranslationCache(max_entries=4, ttl_seconds=60, path=path, clock=clock)
+        first.put("k", "Well met.")
+        first.close()
+
+        clock.now += 120
+        second = TranslationCache(max_entries=4, ttl_seconds=60, path=path, clock=clock)
+        assert second.get("k") is None
+        second.close()
+
+    def test_unwritable_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        cache = TranslationCache(max_entries=4, ttl_seconds=0, path=blocker / "cache.db")
+        cache.put("k", "Well met.")
+        assert cache.get("k") == "Well met."
@@ -47,6 +47,31 @@ class TestTranslationLayerConfigFromDict:
         assert cfg.active_axes == []
         assert cfg.deterministic is False
 
+    def test_pool_and_connect_timeout_defaults_and_overrides(self, tmp_path):
+        cfg = TranslationLayerConfig.from_dict({"enabled": True}, world_root=tmp_path)
+        assert cfg.connect_timeout_seconds == 3.0
+        assert cfg.pool_size == 4
+
+        cfg = TranslationLayerConfig.from_dict(
+            {"enabled": True, "connect_timeout_seconds": 1.5, "pool_size": 0},
+            world_root=tmp_path,
+        )
+        assert cfg.connect_timeout_seconds == 1.5
+        assert cfg.pool_size == 1
+
+    def test_cache_defaults_and_relative_path(self, tmp_path):
+        cfg = TranslationLayerConfig.from_dict({"enabled": True}, world_root=tmp_path)
+        assert cfg.cache_size == 256
+        assert cfg.cache_ttl_seconds == 3600.0
+        assert cfg.cache_path is None
+
+        cfg = TranslationLayerConfig.from_dict(
+            {"enabled": True, "cache_size": -1, "cache_path": "cache/translations.db"},
+            world_root=tmp_path,
+        )
+        assert cfg.cache_size == 0
+        assert cfg.cache_path == tmp_path / "cache" / "translations.db"
+
     def test_keep_alive_custom_value(self, tmp_path):
         """Custom keep_alive value from dict is preserved."""
         cfg = TranslationLayerConfig.from_dict(
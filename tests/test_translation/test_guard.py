@@ -0,0 +1,155 @@
+"""Unit tests for the per-endpoint concurrency limit and circuit breaker."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mud_server.translation.guard import EndpointGuard
+
+ENDPOINT = "http://localhost:11434/api/chat"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _guard(**overrides) -> EndpointGuard:
+    settings = {
+        "max_concurrency": 1,
+        "queue_size": 1,
+        "queue_timeout_seconds": 5.0,
+        "failure_threshold": 2,
+        "reset_seconds": 30.0,
+        **overrides,
+    }
+    return EndpointGuard(ENDPOINT, **settings)
+
+
+def _wait_for_queue(guard: EndpointGuard, depth: int) -> None:
+    deadline = time.monotonic() + 2.0
+    while guard.stats().queue_depth != depth:
+        assert time.monotonic() < deadline, "waiter never queued"
+        time.sleep(0.001)
+
+
+def _acquire_in_thread(guard: EndpointGuard) -> tuple[threading.Thread, list[bool]]:
+    result: list[bool] = []
+    thread = threading.Thread(target=lambda: result.append(guard.acquire()))
+    thread.start()
+    return thread, result
+
+
+class TestConcurrencyLimit:
+    def test_full_queue_sheds_immediately(self):
+        guard = _guard(queue_size=0)
+        assert guard.acquire() is True
+        assert guard.acquire() is False
+        stats = guard.stats()
+        assert (stats.in_flight, stats.shed) == (1, 1)
+
+    def test_queued_caller_gets_released_slot(self):
+        guard = _guard()
+        assert guard.acquire() is True
+        thread, result = _acquire_in_thread(guard)
+        _wait_for_queue(guard, 1)
+        guard.release(healthy=True)
+        thread.join(2.0)
+        assert result == [True]
+        assert guard.stats().in_flight == 1
+
+    def test_wait_timeout_sheds(self):
+        guard = _guard(queue_timeout_seconds=0.01)
+        assert guard.acquire() is True
+        assert guard.acquire() is False
+        stats = guard.stats()
+        assert (stats.queue_depth, stats.shed) == (0, 1)
+
+    async def test_async_waiter_gets_released_slot(self):
+        guard = _guard()
+        assert await guard.acquire_async() is True
+        waiter = asyncio.create_task(guard.acquire_async())
+        await asyncio.sleep(0)
+        assert guard.stats().queue_depth == 1
+        guard.release(healthy=True)
+        assert await asyncio.wait_for(waiter, 1.0) is True
+
+    async def test_cancelled_async_waiter_leaves_queue(self):
+        guard = _guard()
+        assert await guard.acquire_async() is True
+        waiter = asyncio.create_task(guard.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        guard.release(healthy=True)
+        stats = guard.stats()
+        assert (stats.in_flight, stats.queue_depth, stats.shed) == (0, 0, 0)
+
+
+class TestCircuitBreaker:
+    def _fail(self, guard: EndpointGuard, times: int) -> None:
+        for _ in range(times):
+            assert guard.acquire() is True
+            guard.release(healthy=False)
+
+    def test_opens_after_consecutive_failures(self):
+        guard = _guard()
+        self._fail(guard, 1)
+        assert guard.stats().state == "closed"
+        self._fail(guard, 1)
+        assert guard.stats().state == "open"
+        assert guard.acquire() is False
+        stats = guard.stats()
+        assert (stats.rejected, stats.trips) == (1, 1)
+
+    def test_answered_call_resets_failure_streak(self):
+        guard = _guard()
+        self._fail(guard, 1)
+        assert guard.acquire() is True
+        guard.release(healthy=True)
+        self._fail(guard, 1)
+        assert guard.stats().state == "closed"
+
+    def test_half_open_probe_success_closes(self):
+        clock = _Clock()
+        guard = _guard(clock=clock)
+        self._fail(guard, 2)
+        clock.now += 30
+        assert guard.stats().state == "half_open"
+        assert guard.acquire() is True  # the probe
+        assert guard.acquire() is False  # probes busy → fail fast
+        guard.release(healthy=True)
+        assert guard.stats().state == "closed"
+        assert guard.acquire() is True
+
+    def test_half_open_probe_failure_reopens(self):
+        clock = _Clock()
+        guard = _guard(clock=clock)
+        self._fail(guard, 2)
+        clock.now += 30
+        self._fail(guard, 1)
+        stats = guard.stats()
+        assert (stats.state, stats.trips) == ("open", 2)
+
+    def test_opening_rejects_queued_callers(self):
+        guard = _guard(failure_threshold=1)
+        assert guard.acquire() is True
+        thread, result = _acquire_in_thread(guard)
+        _wait_for_queue(guard, 1)
+        guard.release(healthy=False)
+        thread.join(2.0)
+        assert result == [False]
+        assert guard.stats().queue_depth == 0
+
+    def test_cancelled_call_is_neutral(self):
+        guard = _guard(failure_threshold=1)
+        assert guard.acquire() is True
+        guard.release(healthy=None)
+        stats = guard.stats()
+        assert (stats.state, stats.consecutive_failures) == ("closed", 0)
@@ -1,11 +1,13 @@
-"""Unit tests for OllamaRenderer."""
+"""Unit tests for OllamaRenderer and AsyncOllamaRenderer."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 import requests
 
-from mud_server.translation.renderer import OllamaRenderer
+from mud_server.translation.guard import EndpointGuard
+from mud_server.translation.renderer import AsyncOllamaRenderer, OllamaRenderer
 
 ENDPOINT = "http://localhost:11434/api/chat"
 MODEL = "gemma2:2b"
@@ -30,61 +32,61 @@ def _mock_ollama_response(content: str) -> MagicMock:
 
 class TestRenderSuccess:
     def test_returns_content_string(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("Got any bread?")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("Got any bread?")) as mock:
             result = renderer.render("system prompt", "I want bread")
         assert result == "Got any bread?"
         mock.assert_called_once()
 
     def test_passes_correct_model(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("prompt", "msg")
         payload = mock.call_args[1]["json"]
         assert payload["model"] == MODEL
 
     def test_stream_is_false(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("prompt", "msg")
         payload = mock.call_args[1]["json"]
         assert payload["stream"] is False
 
     def test_messages_contain_system_and_user(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("my system prompt", "my user message")
         messages = mock.call_args[1]["json"]["messages"]
         assert messages[0] == {"role": "system", "content": "my system prompt"}
         assert messages[1] == {"role": "user", "content": "my user message"}
 
     def test_empty_content_returns_none(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("")):
+        with patch("requests.Session.post", return_value=_mock_ollama_response("")):
             result = renderer.render("prompt", "msg")
         assert result is None
 
     def test_whitespace_only_content_returns_none(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("   \n  ")):
+        with patch("requests.Session.post", return_value=_mock_ollama_response("   \n  ")):
             result = renderer.render("prompt", "msg")
         assert result is None
 
 
 class TestRenderNetworkFailures:
     def test_timeout_returns_none(self, renderer):
-        with patch("requests.post", side_effect=requests.exceptions.Timeout):
+        with patch("requests.Session.post", side_effect=requests.exceptions.Timeout):
             result = renderer.render("prompt", "msg")
         assert result is None
 
     def test_connection_error_returns_none(self, renderer):
-        with patch("requests.post", side_effect=requests.exceptions.ConnectionError):
+        with patch("requests.Session.post", side_effect=requests.exceptions.ConnectionError):
             result = renderer.render("prompt", "msg")
         assert result is None
 
     def test_generic_request_exception_returns_none(self, renderer):
-        with patch("requests.post", side_effect=requests.exceptions.RequestException("boom")):
+        with patch("requests.Session.post", side_effect=requests.exceptions.RequestException("boom")):
             result = renderer.render("prompt", "msg")
         assert result is None
 
     def test_http_error_returns_none(self, renderer):
         mock_resp = MagicMock()
         mock_resp.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
-        with patch("requests.post", return_value=mock_resp):
+        with patch("requests.Session.post", return_value=mock_resp):
             result = renderer.render("prompt", "msg")
         assert result is None
 
@@ -92,26 +94,26 @@ class TestRenderNetworkFailures:
 class TestDeterministicMode:
     def test_set_deterministic_clamps_temperature(self, renderer):
         renderer.set_deterministic(42)
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("prompt", "msg")
         options = mock.call_args[1]["json"]["options"]
         assert options["temperature"] == 0.0
 
     def test_set_deterministic_includes_seed(self, renderer):
         renderer.set_deterministic(99999)
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("prompt", "msg")
         options = mock.call_args[1]["json"]["options"]
         assert options["seed"] == 99999
 
     def test_no_seed_without_set_deterministic(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("prompt", "msg")
         options = mock.call_args[1]["json"]["options"]
         assert "seed" not in options
 
     def test_default_temperature_used_without_deterministic(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("prompt", "msg")
         options = mock.call_args[1]["json"]["options"]
         # Default temperature is 0.7 (from renderer.py constant)
@@ -120,7 +122,7 @@ class TestDeterministicMode:
 
 class TestKeepAlive:
     def test_default_keep_alive_is_5m(self, renderer):
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             renderer.render("prompt", "msg")
         payload = mock.call_args[1]["json"]
         assert payload["keep_alive"] == "5m"
@@ -132,7 +134,7 @@ class TestKeepAlive:
             timeout_seconds=10.0,
             keep_alive="10m",
         )
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             r.render("prompt", "msg")
         payload = mock.call_args[1]["json"]
         assert payload["keep_alive"] == "10m"
@@ -144,7 +146,197 @@ class TestKeepAlive:
             timeout_seconds=10.0,
             keep_alive="0",
         )
-        with patch("requests.post", return_value=_mock_ollama_response("ok")) as mock:
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
             r.render("prompt", "msg")
         payload = mock.call_args[1]["json"]
         assert payload["keep_alive"] == "0"
+
+
+class TestConnectionPooling:
+    def test_renders_reuse_one_session(self, renderer):
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
+            renderer.render("prompt", "one")
+            renderer.render("prompt", "two")
+        assert mock.call_count == 2
+        assert isinstance(renderer.session, requests.Session)
+
+    def test_pool_size_sets_adapter_maxsize(self):
+        r = OllamaRenderer(api_endpoint=ENDPOINT, model=MODEL, timeout_seconds=10.0, pool_size=8)
+        adapter = r.session.get_adapter(ENDPOINT)
+        assert adapter._pool_maxsize == 8
+
+    def test_separate_connect_and_read_timeouts(self):
+        r = OllamaRenderer(
+            api_endpoint=ENDPOINT,
+            model=MODEL,
+            timeout_seconds=30.0,
+            connect_timeout_seconds=2.0,
+        )
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
+            r.render("prompt", "msg")
+        assert mock.call_args[1]["timeout"] == (2.0, 30.0)
+
+    def test_connect_timeout_capped_at_read_timeout(self):
+        r = OllamaRenderer(
+            api_endpoint=ENDPOINT,
+            model=MODEL,
+            timeout_seconds=1.0,
+            connect_timeout_seconds=5.0,
+        )
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")) as mock:
+            r.render("prompt", "msg")
+        assert mock.call_args[1]["timeout"] == (1.0, 1.0)
+
+    def test_shared_session_is_used(self, renderer):
+        other = OllamaRenderer(
+            api_endpoint=ENDPOINT,
+            model=MODEL,
+            timeout_seconds=10.0,
+            session=renderer.session,
+        )
+        assert other.session is renderer.session
+
+
+class TestRendererStats:
+    def test_counts_requests_failures_and_latency(self, renderer):
+        with patch("requests.Session.post", return_value=_mock_ollama_response("ok")):
+            renderer.render("prompt", "msg")
+        with patch("requests.Session.post", side_effect=requests.exceptions.Timeout):
+            renderer.render("prompt", "msg")
+
+        stats = renderer.stats()
+        assert stats.requests == 2
+        assert stats.failures == 1
+        assert stats.max_latency_seconds >= 0.0
+        assert stats.mean_latency_seconds == pytest.approx(stats.total_latency_seconds / 2)
+
+    def test_connection_counters_come_from_pool(self, renderer):
+        pool = renderer.session.get_adapter(ENDPOINT).poolmanager.connection_from_url(ENDPOINT)
+        pool.num_connections = 1
+        pool.num_requests = 5
+
+        stats = renderer.stats()
+        assert stats.connections_opened == 1
+        assert stats.connections_reused == 4
+
+    def test_stats_start_empty(self, renderer):
+        stats = renderer.stats()
+        assert stats.requests == 0
+        assert stats.mean_latency_seconds == 0.0
+
+
+class TestAsyncRenderer:
+    @pytest.fixture
+    def async_renderer(self):
+        return AsyncOllamaRenderer(api_endpoint=ENDPOINT, model=MODEL, timeout_seconds=10.0)
+
+    @staticmethod
+    def _response(content: str) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"message": {"content": content}},
+            request=httpx.Request("POST", ENDPOINT),
+        )
+
+    async def test_returns_content_string(self, async_renderer):
+        mock = AsyncMock(return_value=self._response("Got any bread?"))
+        with patch("httpx.AsyncClient.post", mock):
+            result = await async_renderer.render("prompt", "I want bread")
+        assert result == "Got any bread?"
+        assert mock.call_args.kwargs["json"]["model"] == MODEL
+        await async_renderer.aclose()
+
+    async def test_seed_applies_to_single_call(self, async_renderer):
+        mock = AsyncMock(return_value=self._response("ok"))
+        with patch("httpx.AsyncClient.post", mock):
+            await async_renderer.render("prompt", "msg", seed=42)
+            await async_renderer.render("prompt", "msg")
+        seeded, plain = (call.kwargs["json"]["options"] for call in mock.call_args_list)
+        assert seeded["seed"] == 42 and seeded["temperature"] == 0.0
+        assert "seed" not in plain and plain["temperature"] == 0.7
+        await async_renderer.aclose()
+
+    async def test_timeout_returns_none_and_counts_failure(self, async_renderer):
+        mock = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+        with patch("httpx.AsyncClient.post", mock):
+            assert await async_renderer.render("prompt", "msg") is None
+        stats = async_renderer.stats()
+        assert stats.requests == 1 and stats.failures == 1
+        await async_renderer.aclose()
+
+    async def test_connect_error_returns_none(self, async_renderer):
+        mock = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        with patch("httpx.AsyncClient.post", mock):
+            assert await async_renderer.render("prompt", "msg") is None
+        await async_renderer.aclose()
+
+    async def test_http_error_status_returns_none(self, async_renderer):
+        response = httpx.Response(500, request=httpx.Request("POST", ENDPOINT))
+        with patch("httpx.AsyncClient.post", AsyncMock(return_value=response)):
+            assert await async_renderer.render("prompt", "msg") is None
+        await async_renderer.aclose()
+
+    async def test_client_built_with_pool_limits_and_split_timeouts(self):
+        renderer = AsyncOllamaRenderer(
+            api_endpoint=ENDPOINT,
+            model=MODEL,
+            timeout_seconds=10.0,
+            connect_timeout_seconds=2.0,
+            pool_size=3,
+        )
+        client = renderer._get_client()
+        assert client.timeout.connect == 2.0 and client.timeout.read == 10.0
+        assert renderer._get_client() is client
+        await renderer.aclose()
+        assert renderer._client is None
+
+
+class TestEndpointGuard:
+    @staticmethod
+    def _guard() -> EndpointGuard:
+        return EndpointGuard(
+            ENDPOINT,
+            max_concurrency=1,
+            queue_size=0,
+            queue_timeout_seconds=0.0,
+            failure_threshold=2,
+            reset_seconds=30.0,
+        )
+
+    def test_timeouts_open_breaker_and_skip_requests(self):
+        guard = self._guard()
+        renderer = OllamaRenderer(
+            api_endpoint=ENDPOINT, model=MODEL, timeout_seconds=10.0, guard=guard
+        )
+        with patch("requests.Session.post", side_effect=requests.exceptions.Timeout) as mock:
+            for _ in range(3):
+                assert renderer.render("prompt", "msg") is None
+        assert mock.call_count == 2
+        stats = guard.stats()
+        assert (stats.state, stats.rejected, stats.in_flight) == ("open", 1, 0)
+
+    def test_http_error_status_does_not_count_as_failure(self):
+        guard = self._guard()
+        renderer = OllamaRenderer(
+            api_endpoint=ENDPOINT, model=MODEL, timeout_seconds=10.0, guard=guard
+        )
+        mock_resp = MagicMock()
+        mock_resp.raise_for_status.side_effect = requests.exceptions.HTTPError("500")
+        with patch("requests.Session.post", return_value=mock_resp):
+            for _ in range(3):
+                assert renderer.render("prompt", "msg") is None
+        assert guard.stats().state == "closed"
+
+    async def test_async_renderer_sheds_when_slot_busy(self):
+        guard = self._guard()
+        renderer = AsyncOllamaRenderer(
+            api_endpoint=ENDPOINT, model=MODEL, timeout_seconds=10.0, guard=guard
+        )
+        assert guard.acquire() is True
+        mock = AsyncMock()
+        with patch("httpx.AsyncClient.post", mock):
+            assert await renderer.render("prompt", "msg") is None
+        mock.assert_not_called()
+        assert guard.stats().shed == 1
+        guard.release(healthy=True)
+        await renderer.aclose()
@@ -38,10 +38,16 @@ Test organisation
     End-to-end tests confirming translate() emits the correct ledger
     events through the full call stack (profile builder and renderer
     mocked; ledger append function patched at the module level).
+
+``TestAsyncPhases``
+    The split prepare → render_async → finish path used in async mode.
+
+``TestResultCache``
+    Seeded translations are served from the result cache on repeat.
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -1158,6 +1164,8 @@ class TestTranslateWithAxes:
         assert call_kwargs["model"] == svc.config.model
         assert call_kwargs["timeout_seconds"] == svc.config.timeout_seconds
         assert call_kwargs["keep_alive"] == svc.config.keep_alive
+        assert call_kwargs["connect_timeout_seconds"] == svc.config.connect_timeout_seconds
+        assert call_kwargs["session"] is svc._renderer.session
 
     # ── Seed / deterministic mode ─────────────────────────────────────────────
 
@@ -1291,3 +1299,98 @@ class TestTranslateWithAxes:
 
         assert result.status == "fallback.validation_failed"
         assert result.prompt_template == raw
+
+
+# ── TestAsyncPhases ───────────────────────────────────────────────────────────
+
+
+class TestAsyncPhases:
+    """prepare_translation → render_async → finish_translation (async mode)."""
+
+    _PROFILE = {"character_name": "Mira", "demeanor_label": "proud"}
+
+    def test_prepare_returns_none_when_profile_missing(self, tmp_path):
+        svc = _make_service(tmp_path)
+        with patch.object(svc._profile_builder, "build", return_value=None):
+            assert svc.prepare_translation("Unknown", "hello") is None
+
+    def test_prepare_renders_prompt_and_seed(self, tmp_path):
+        svc = _make_service(tmp_path, deterministic=True)
+        ipc_hash = "a3f91c9e4b12f2d8baf0000000000000"
+        with patch.object(svc._profile_builder, "build", return_value=dict(self._PROFILE)):
+            prepared = svc.prepare_translation("Mira", "hello", channel="yell", ipc_hash=ipc_hash)
+        assert prepared is not None
+        assert "yell" in prepared.system_prompt
+        assert prepared.seed == int(ipc_hash[:16], 16)
+
+    async def test_render_async_passes_seed_per_call(self, tmp_path):
+        svc = _make_service(tmp_path, deterministic=True)
+        with patch.object(svc._profile_builder, "build", return_value=dict(self._PROFILE)):
+            prepared = svc.prepare_translation("Mira", "hello", ipc_hash="ff" * 16)
+        assert prepared is not None
+        with patch(
+            "mud_server.translation.service.AsyncOllamaRenderer.render",
+            new=AsyncMock(return_value="Well met."),
+        ) as mock_render:
+            assert await svc.render_async(prepared) == "Well met."
+        mock_render.assert_awaited_once_with(
+            prepared.system_prompt, "hello", seed=int("ff" * 8, 16)
+        )
+        await svc.aclose()
+
+    def test_finish_emits_same_ledger_events_as_translate(self, tmp_path):
+        svc = _make_service(tmp_path)
+        with patch.object(svc._profile_builder, "build", return_value=dict(self._PROFILE)):
+            prepared = svc.prepare_translation("Mira", "hello")
+        assert prepared is not None
+        with patch("mud_server.translation.service._ledger_append") as mock_append:
+            assert svc.finish_translation(prepared, "Well met.") == "Well met."
+            assert svc.finish_translation(prepared, None) is None
+        statuses = [call.kwargs["data"]["status"] for call in mock_append.call_args_list]
+        assert statuses == ["success", "fallback.api_error"]
+
+
+class TestResultCache:
+    """Deterministic translations are cached; sampled ones are not."""
+
+    _PROFILE = {"character_name": "Mira", "demeanor_label": "proud"}
+    _IPC_HASH = "a3f91c9e4b12f2d8baf0000000000000"
+
+    def _profile(self, *_args, **_kwargs):
+        return dict(self._PROFILE)
+
+    def _translate_twice(self, svc, ipc_hash):
+        with (
+            patch.object(svc._profile_builder, "build", side_effect=self._profile),
+            patch.object(svc._renderer, "render", return_value="Well met.") as mock_render,
+            patch("mud_server.translation.service._ledger_append") as mock_append,
+        ):
+            results = [svc.translate("Mira", "hello", ipc_hash=ipc_hash) for _ in range(2)]
+        cached = [call.kwargs["data"]["cached"] for call in mock_append.call_args_list]
+        return results, mock_render.call_count, cached
+
+    def test_repeat_seeded_translation_skips_renderer(self, tmp_path):
+        svc = _make_service(tmp_path, deterministic=True)
+        results, renders, cached = self._translate_twice(svc, self._IPC_HASH)
+        assert results == ["Well met.", "Well met."]
+        assert renders == 1
+        assert cached == [False, True]
+        stats = svc.stats().cache
+        assert stats is not None
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_unseeded_translation_not_cached(self, tmp_path):
+        svc = _make_service(tmp_path, deterministic=True)
+        _, renders, cached = self._translate_twice(svc, None)
+        assert renders == 2
+        assert cached == [False, False]
+
+    def test_failed_validation_not_cached(self, tmp_path):
+        svc = _make_service(tmp_path, deterministic=True)
+        with (
+            patch.object(svc._profile_builder, "build", side_effect=self._profile),
+            patch.object(svc._renderer, "render", return_value="PASSTHROUGH") as mock_render,
+        ):
+            for _ in range(2):
+                assert svc.translate("Mira", "hello", ipc_hash=self._IPC_HASH) is None
+        assert mock_render.call_count == 2